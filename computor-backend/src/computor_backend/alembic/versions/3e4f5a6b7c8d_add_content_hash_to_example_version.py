@@ -0,0 +1,33 @@
+"""add content_hash to example_version
+
+Revision ID: 3e4f5a6b7c8d
+Revises: cc1d2e3f4a5b
+Create Date: 2026-10-18 12:00:00.000000
+
+SHA-256 over a version's stored files, written by the upload endpoint.
+Deployment tooling compares it with a locally computed hash to skip
+re-uploading unchanged examples. Existing rows stay NULL and are simply
+treated as changed on their next upload.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e4f5a6b7c8d'
+down_revision: Union[str, None] = 'cc1d2e3f4a5b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'example_version',
+        sa.Column('content_hash', sa.String(64), nullable=True, comment="SHA-256 of the version's files"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('example_version', 'content_hash')
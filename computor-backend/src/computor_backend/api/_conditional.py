@@ -0,0 +1,70 @@
+"""Conditional GET (``ETag`` / ``If-None-Match``) for cached user views.
+
+The student, tutor and lecturer view endpoints are polled constantly by
+the VS Code extension. Each cached view carries a strong ETag (the digest
+of its cached payload, see ``Cache.set_user_view``); when the client's
+``If-None-Match`` still matches, the view repository raises
+``ViewNotModified`` before loading the payload and this helper answers
+``304 Not Modified`` — no mapper, no serialization, no body.
+"""
+import hashlib
+import inspect
+import json
+from typing import Any, Callable, Optional
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from starlette.concurrency import run_in_threadpool
+
+from computor_backend.repositories.view_base import (
+    ViewNotModified,
+    ViewValidation,
+    if_none_match_hits,
+    view_validation,
+)
+
+
+def _payload_etag(result: Any) -> str:
+    """Fallback ETag when the view was not cached (cache disabled/failed)."""
+    raw = json.dumps(jsonable_encoder(result), sort_keys=True, separators=(",", ":"))
+    return '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+async def conditional_view(
+    response: Response,
+    if_none_match: Optional[str],
+    produce: Callable[[], Any],
+) -> Any:
+    """Run a view producer under conditional-GET semantics.
+
+    Args:
+        response: FastAPI's per-request ``Response``; receives the ``ETag``.
+        if_none_match: The request's ``If-None-Match`` header, if any.
+        produce: Zero-arg callable returning the view (sync callables run
+            in the threadpool, coroutines are awaited). It must read at
+            most one cached user view, otherwise an early match could
+            short-circuit data the response also depends on.
+
+    Returns:
+        The view payload, or a bare ``304`` ``Response`` when unchanged.
+    """
+    state = ViewValidation(if_none_match=if_none_match)
+    token = view_validation.set(state)
+    try:
+        if inspect.iscoroutinefunction(produce):
+            result = await produce()
+        else:
+            result = await run_in_threadpool(produce)
+            if inspect.isawaitable(result):
+                result = await result
+    except ViewNotModified as e:
+        return Response(status_code=304, headers={"ETag": e.etag})
+    finally:
+        view_validation.reset(token)
+
+    etag = state.etag or _payload_etag(result)
+    if if_none_match and if_none_match_hits(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return result
@@ -4,6 +4,11 @@ Centralises the repeated pattern of stamping ``X-Total-Count`` and
 optionally serialising rows into a list-DTO. Web clients read the
 total from the response header (it's exposed via CORS in
 ``server.py``).
+
+Keyset-paginated listings additionally carry ``X-Next-Cursor``: the
+``after`` token for the next page, or an empty value on the last page.
+The header is absent for offset-paginated responses, which lets clients
+tell the two modes apart.
 """
 from typing import Iterable, List, Optional, Type, TypeVar
 
@@ -14,14 +19,16 @@ T = TypeVar("T", bound=BaseModel)
 
 
 _TOTAL_COUNT_HEADER = "X-Total-Count"
+_NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 
 def paginated_list(
     items: Iterable,
-    total: int,
+    total: Optional[int],
     *,
     response: Response,
     schema: Optional[Type[T]] = None,
+    next_cursor: Optional[str] = None,
 ) -> List:
     """Stamp ``X-Total-Count`` and return the list payload.
 
@@ -29,17 +36,23 @@ def paginated_list(
         items: Rows to return — either ORM instances (with ``schema=``)
             or already-validated DTOs (``schema=None``).
         total: Total row count for pagination metadata; not necessarily
-            ``len(items)`` when the caller is paginating.
+            ``len(items)`` when the caller is paginating. ``None`` (count
+            mode ``none``) omits the header.
         response: FastAPI's per-request ``Response`` (inject via the
             endpoint signature).
         schema: Optional list-DTO class. When provided, each item is
             run through ``schema.model_validate(item, from_attributes=True)``.
             Skip when items are already validated.
+        next_cursor: Keyset cursor for the next page (``""`` on the last
+            page). ``None`` for offset pagination — no header is sent.
 
     Returns:
         The list payload, suitable for direct return from the endpoint.
     """
-    response.headers[_TOTAL_COUNT_HEADER] = str(total)
+    if total is not None:
+        response.headers[_TOTAL_COUNT_HEADER] = str(total)
+    if next_cursor is not None:
+        response.headers[_NEXT_CURSOR_HEADER] = next_cursor
     if schema is None:
         return list(items)
     return [schema.model_validate(item, from_attributes=True) for item in items]
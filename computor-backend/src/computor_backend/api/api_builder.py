@@ -8,7 +8,7 @@ from computor_backend.business_logic.crud import (
     create_entity as create_db,
     filter_entities as filter_db,
     get_entity_by_id as get_id_db,
-    list_entities as list_db,
+    list_entities_page as list_page_db,
     update_entity as update_db,
     delete_entity as delete_db
 )
@@ -79,8 +79,8 @@ class CrudRouter:
                 params: Annotated[self.dto.query, Depends()],
                 db: Session = Depends(get_db)
         ) -> list[self.dto.list]:
-            list_result, total = await list_db(permissions, db, params, self.dto)
-            return paginated_list(list_result, total, response=response)
+            page = await list_page_db(permissions, db, params, self.dto)
+            return paginated_list(page.items, page.total, response=response, next_cursor=page.next_cursor)
         return route
 
     def update(self):
@@ -260,8 +260,8 @@ class LookUpRouter:
     
     def list(self):
         async def route(permissions: Annotated[Principal, Depends(get_current_principal)], response: Response, params: self.dto.query = Depends(), db: Session = Depends(get_db)) -> list[self.dto.list]:
-            list_result, total = await list_db(permissions, db, params, self.dto)
-            return paginated_list(list_result, total, response=response)
+            page = await list_page_db(permissions, db, params, self.dto)
+            return paginated_list(page.items, page.total, response=response, next_cursor=page.next_cursor)
         return route
 
     def register_routes(self, app: FastAPI):
@@ -30,6 +30,10 @@ from computor_backend.exceptions import (
     ServiceUnavailableException,
 )
 from computor_backend.coder.schemas import (
+    BulkProvisionItem,
+    BulkProvisionOutcome,
+    BulkProvisionRequest,
+    BulkProvisionResponse,
     CoderAdminTaskResponse,
     CoderHealthResponse,
     ImageBuildRequest,
@@ -222,6 +226,69 @@ async def provision_workspace(
         raise _handle_coder_error(e) from e
 
 
+@router.post(
+    "/workspaces/provision/bulk",
+    response_model=BulkProvisionResponse,
+    summary="Provision workspaces for several users",
+)
+async def provision_workspaces_bulk(
+    request: BulkProvisionRequest,
+    permissions: Annotated[Principal, Depends(get_current_principal)],
+    settings: Annotated[CoderSettings, Depends(require_coder_enabled)],
+    client: Annotated[CoderClient, Depends(get_coder_client)],
+    db: Annotated[Session, Depends(get_db)],
+    cache: Annotated[object, Depends(get_cache)],
+) -> BulkProvisionResponse:
+    """
+    Provision workspaces for a list of users, e.g. before a lab session.
+
+    Requires workspace:provision permission. Users are provisioned with
+    bounded concurrency (CODER_BULK_PROVISION_CONCURRENCY); failures are
+    reported per user instead of failing the whole request.
+    """
+    _check_workspace_access(permissions, "provision")
+    try:
+        try:
+            await client.get_template_id(request.template.value)
+        except CoderTemplateNotFoundError as e:
+            raise ServiceUnavailableException(
+                detail=f"Template '{request.template.value}' is not yet available. Coder may still be initializing.",
+            ) from e
+
+        outcomes: dict[str, BulkProvisionOutcome] = {}
+        requested: list[str] = []
+        items: list[BulkProvisionItem] = []
+        for email in dict.fromkeys(request.emails):
+            target_user = get_user_by_email(db, cache, email)
+            if not target_user:
+                outcomes[email] = BulkProvisionOutcome(user_email=email, error=f"User with email {email} not found")
+                continue
+            requested.append(email)
+            items.append(BulkProvisionItem(
+                user_email=get_user_email(target_user),
+                username=str(target_user.id),
+                full_name=get_user_fullname(target_user),
+                template=request.template,
+                workspace_name=request.workspace_name,
+                computor_auth_token=mint_workspace_token(db, cache, str(target_user.id), str(permissions.user_id)),
+            ))
+
+        provisioned = await client.provision_workspaces(
+            items,
+            max_concurrency=settings.bulk_provision_concurrency,
+            wait_until_running=request.wait_until_running,
+        )
+        outcomes.update(zip(requested, provisioned))
+    except ComputorException:
+        raise
+    except Exception as e:
+        raise _handle_coder_error(e) from e
+
+    results = list(outcomes.values())
+    failed = sum(1 for outcome in results if outcome.error)
+    return BulkProvisionResponse(results=results, succeeded=len(results) - failed, failed=failed)
+
+
 # -----------------------------------------------------------------------------
 # Workspace listing
 # -----------------------------------------------------------------------------
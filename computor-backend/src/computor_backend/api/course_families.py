@@ -11,7 +11,7 @@ from computor_backend.exceptions import ForbiddenException, NotFoundException
 from computor_backend.interfaces import CourseFamilyInterface
 from computor_backend.model import CourseFamily
 from computor_backend.services.storage_service import get_storage_service
-from computor_backend.business_logic.cascade_deletion import delete_course_family_cascade
+from computor_backend.business_logic.cascade_deletion import delete_course_family_cascade, submit_cascade_deletion
 from computor_types.cascade_deletion import CascadeDeleteResult
 
 course_family_router = CrudRouter(CourseFamilyInterface)
@@ -28,6 +28,10 @@ course_family_router = CrudRouter(CourseFamilyInterface)
     - All messages targeted to the family or its courses
 
     **WARNING**: This is a destructive operation. Use dry_run=true to preview.
+
+    By default the deletion runs as a background task in short chunks; the
+    response carries the task's `workflow_id` and the deleted counts are
+    reported by the task's progress. Pass background=false to delete inline.
     """
 )
 async def delete_course_family_endpoint(
@@ -38,6 +42,10 @@ async def delete_course_family_endpoint(
         default=False,
         description="If true, only returns preview without deleting"
     ),
+    background: bool = Query(
+        default=True,
+        description="If true, delete in a background task and return its workflow_id"
+    ),
 ) -> CascadeDeleteResult:
     """Delete course family and all descendant courses."""
     if not permissions.is_admin:
@@ -48,6 +56,14 @@ async def delete_course_family_endpoint(
     if not family:
         raise NotFoundException(f"Course family not found: {course_family_id}")
 
+    if background and not dry_run:
+        return await submit_cascade_deletion(
+            "course_family",
+            str(course_family_id),
+            created_by=permissions.user_id,
+            organization_id=str(family.organization_id),
+        )
+
     storage = get_storage_service()
     result = await delete_course_family_cascade(
         db=db,
@@ -1,16 +1,23 @@
 """API endpoints for course member import."""
 import logging
 from typing import Annotated
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from computor_backend.database import get_db
+from computor_backend.database import get_db, get_db_session
 from computor_backend.permissions.auth import get_current_principal
 from computor_backend.permissions.principal import Principal
-from computor_backend.business_logic.course_member_import import import_course_member
-from computor_backend.exceptions import ForbiddenException
+from computor_backend.business_logic.course_member_import import (
+    get_importable_course,
+    import_course_member,
+    import_course_members_bulk,
+)
+from computor_backend.exceptions import BadRequestException, ForbiddenException
+from computor_backend.utils.roster_csv import iter_roster_csv
 
 from computor_types.course_member_import import (
+    CourseMemberBulkImportRequest,
     CourseMemberImportRequest,
     CourseMemberImportResponse,
 )
@@ -110,3 +117,87 @@ async def import_member(
         db.rollback()
         logger.error(f"Member import failed: {e}", exc_info=True)
         raise
+
+
+_CSV_CONTENT_TYPES = ("text/csv", "application/csv", "text/plain")
+
+
+@course_member_import_router.post(
+    "/{course_id}/bulk",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": (
+                "NDJSON stream: one CourseMemberImportRowResult per roster row, "
+                "then a final CourseMemberBulkImportSummary line"
+            ),
+            "content": {"application/x-ndjson": {}},
+        }
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": CourseMemberBulkImportRequest.model_json_schema(ref_template="#/components/schemas/{model}"),
+                },
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_members_bulk(
+    course_id: str,
+    request: Request,
+    permissions: Annotated[Principal, Depends(get_current_principal)] = None,
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Import a whole roster into a course.
+
+    Accepts either a JSON body (``{"members": [...]}``, rows shaped like the
+    single-member import) or a CSV upload (``Content-Type: text/csv``) with a
+    header row using the same column names; common university export headers
+    (``E-Mail``, ``Vorname``, ``Familienname``, ``Gruppe``) are recognized.
+    CSV uploads are parsed while they stream in.
+
+    Rows are imported in chunked transactions and each row's outcome is
+    streamed back as it commits. Repository provisioning for all new members
+    runs as one batched workflow; its ID is in the final summary line.
+
+    **Required Permissions**: Lecturer role or higher (_lecturer, _maintainer, _owner)
+
+    Raises:
+        ForbiddenException: If user lacks lecturer role or higher
+        BadRequestException: If the body is neither a JSON roster nor CSV
+    """
+    course, user_role = get_importable_course(course_id, permissions, db)
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in _CSV_CONTENT_TYPES:
+        rows = iter_roster_csv(request.stream())
+    else:
+        try:
+            body = await request.json()
+        except (ValueError, UnicodeDecodeError):
+            raise BadRequestException(detail="Expected a JSON roster or a text/csv upload")
+        if not isinstance(body, dict) or not isinstance(body.get("members"), list):
+            raise BadRequestException(detail="JSON roster must be an object with a 'members' list")
+        rows = [row if isinstance(row, dict) else {} for row in body["members"]]
+
+    logger.info(f"Bulk importing members into course {course_id} ({content_type or 'unknown'})")
+
+    async def stream():
+        # The request-scoped session is closed once the endpoint returns,
+        # so the import runs on its own session for the lifetime of the stream.
+        with get_db_session(permissions.user_id) as import_db:
+            async for result in import_course_members_bulk(
+                course=course,
+                user_role=user_role,
+                rows=rows,
+                permissions=permissions,
+                db=import_db,
+                username_strategy="name",
+            ):
+                yield result.model_dump_json() + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
@@ -11,7 +11,7 @@ from computor_backend.exceptions import ForbiddenException, NotFoundException
 from computor_backend.interfaces import CourseInterface
 from computor_backend.model import Course
 from computor_backend.services.storage_service import get_storage_service
-from computor_backend.business_logic.cascade_deletion import delete_course_cascade
+from computor_backend.business_logic.cascade_deletion import delete_course_cascade, submit_cascade_deletion
 from computor_types.cascade_deletion import CascadeDeleteResult
 
 course_router = CrudRouter(CourseInterface)
@@ -31,6 +31,10 @@ course_router = CrudRouter(CourseInterface)
     - All messages targeted to the course
 
     **WARNING**: This is a destructive operation. Use dry_run=true to preview.
+
+    By default the deletion runs as a background task in short chunks; the
+    response carries the task's `workflow_id` and the deleted counts are
+    reported by the task's progress. Pass background=false to delete inline.
     """
 )
 async def delete_course_endpoint(
@@ -41,6 +45,10 @@ async def delete_course_endpoint(
         default=False,
         description="If true, only returns preview without deleting"
     ),
+    background: bool = Query(
+        default=True,
+        description="If true, delete in a background task and return its workflow_id"
+    ),
 ) -> CascadeDeleteResult:
     """Delete course and all course-specific data."""
     if not permissions.is_admin:
@@ -51,6 +59,15 @@ async def delete_course_endpoint(
     if not course:
         raise NotFoundException(f"Course not found: {course_id}")
 
+    if background and not dry_run:
+        return await submit_cascade_deletion(
+            "course",
+            str(course_id),
+            created_by=permissions.user_id,
+            organization_id=str(course.organization_id),
+            course_id=str(course_id),
+        )
+
     storage = get_storage_service()
     result = await delete_course_cascade(
         db=db,
@@ -9,9 +9,8 @@ organization, course_family, course) and the relative path inside
 that scope's documents area.
 """
 import logging
-import os
 import shutil
-from datetime import datetime, timezone
+import stat as stat_module
 from email.utils import formatdate
 from typing import Annotated, Optional
 from uuid import UUID
@@ -29,7 +28,13 @@ from fastapi import (
 )
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from computor_backend.business_logic.document_listing import (
+    listing_cache,
+    stat_etag,
+    stat_or_none,
+)
 from computor_backend.business_logic.documents import (
     check_documents_write_permission,
     check_reserved_name_collision,
@@ -47,6 +52,7 @@ from computor_backend.exceptions import (
 )
 from computor_backend.permissions.auth import get_current_principal
 from computor_backend.permissions.principal import Principal
+from computor_backend.repositories.view_base import if_none_match_hits
 from computor_backend.settings import settings
 from computor_types.documents import (
     DocumentCreate,
@@ -70,40 +76,6 @@ _UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB — read in chunks so a malicious
                                   # before we hit the configured limit.
 
 
-def _stat_etag(stat: os.stat_result) -> str:
-    """Quoted ETag derived from mtime+size.
-
-    Same format Starlette's ``FileResponse`` uses by default, so the
-    values returned by the listing endpoint match the ``ETag`` header
-    the file GET endpoint emits — clients can compare without
-    normalizing.
-    """
-    return f'"{stat.st_mtime}-{stat.st_size}"'
-
-
-def _if_none_match_hits(header: str, etag: str) -> bool:
-    """Compare a client's ``If-None-Match`` header against ``etag``.
-
-    Accepts a comma-separated list and the wildcard ``*``; ``W/``
-    weak prefixes on either side are stripped before comparison so a
-    client that re-quotes the etag as weak still matches.
-    """
-    def normalize(s: str) -> str:
-        s = s.strip()
-        if s.startswith("W/"):
-            s = s[2:]
-        return s
-
-    target = normalize(etag)
-    for raw in header.split(","):
-        candidate = raw.strip()
-        if candidate == "*":
-            return True
-        if normalize(candidate) == target:
-            return True
-    return False
-
-
 async def _read_upload_with_limit(file: UploadFile, max_bytes: int) -> bytes:
     """Read an ``UploadFile`` in chunks, aborting if it exceeds ``max_bytes``.
 
@@ -421,6 +393,7 @@ async def list_documents_directory(
     scope: Annotated[DocumentScope, Query()],
     scope_id: Annotated[Optional[UUID], Query()] = None,
     path: Annotated[Optional[str], Query()] = None,
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
     db: Session = Depends(get_db),
 ) -> list[DocumentList]:
     """List entries in a documents directory.
@@ -428,54 +401,38 @@ async def list_documents_directory(
     Available to any authenticated user. An unwritten scope root
     returns an empty list (so a fresh course/family/org does not 404);
     a missing non-root path is a 404.
+
+    Listings are served from a per-directory cache validated against
+    the directory's stat (see ``business_logic.document_listing``).
+    The response carries an aggregate ``ETag`` over all entries;
+    ``If-None-Match`` with the current value gets ``304 Not Modified``.
     """
-    target = resolve_listing_target(scope, scope_id, path, db)
+    target = await run_in_threadpool(resolve_listing_target, scope, scope_id, path, db)
+    dir_stat = await run_in_threadpool(stat_or_none, target)
 
-    if not target.exists():
+    if dir_stat is None:
         if not path:
             return []
         raise NotFoundException(
             detail="Directory not found", context={"path": path}
         )
-    if not target.is_dir():
+    if not stat_module.S_ISDIR(dir_stat.st_mode):
         raise ConflictException(
             detail="Target is not a directory", context={"path": path}
         )
 
-    entries: list[DocumentList] = []
-    for child in sorted(target.iterdir(), key=lambda p: p.name):
-        # Skip symlinks (and broken ones) — writes refuse to create
-        # them, and following them would defeat the scope-root
-        # containment guarantee from resolve_absolute_path.
-        if child.is_symlink():
-            continue
-        try:
-            stat = child.stat()
-        except OSError:
-            continue
-        last_modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
-        etag = _stat_etag(stat)
-        if child.is_dir():
-            entries.append(
-                DocumentList(
-                    name=child.name,
-                    type="directory",
-                    etag=etag,
-                    last_modified=last_modified,
-                )
-            )
-        elif child.is_file():
-            entries.append(
-                DocumentList(
-                    name=child.name,
-                    type="file",
-                    size=stat.st_size,
-                    etag=etag,
-                    last_modified=last_modified,
-                )
-            )
+    try:
+        listing = await listing_cache.get(target, dir_stat)
+    except FileNotFoundError:
+        # Removed between the stat and the scan
+        raise NotFoundException(
+            detail="Directory not found", context={"path": path}
+        )
 
-    return entries
+    headers = {"ETag": listing.etag}
+    if if_none_match and if_none_match_hits(if_none_match, listing.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=listing.body, media_type="application/json", headers=headers)
 
 
 @documents_router.get("/files", response_class=FileResponse)
@@ -499,22 +456,22 @@ async def get_document_file(
     the 200 response would carry.
     """
     segments = validate_relative_path(path)
-    scope_root = resolve_scope_root(scope, scope_id, db)
-    target = resolve_absolute_path(scope_root, segments)
+    scope_root = await run_in_threadpool(resolve_scope_root, scope, scope_id, db)
+    target = await run_in_threadpool(resolve_absolute_path, scope_root, segments)
+    stat = await run_in_threadpool(stat_or_none, target)
 
-    if not target.exists():
+    if stat is None:
         raise NotFoundException(detail="File not found", context={"path": path})
-    if not target.is_file():
+    if not stat_module.S_ISREG(stat.st_mode):
         raise ConflictException(
             detail="Target is not a file", context={"path": path}
         )
 
-    stat = target.stat()
-    etag = _stat_etag(stat)
+    etag = stat_etag(stat)
     last_modified = formatdate(stat.st_mtime, usegmt=True)
     cache_headers = {"ETag": etag, "Last-Modified": last_modified}
 
-    if if_none_match and _if_none_match_hits(if_none_match, etag):
+    if if_none_match and if_none_match_hits(if_none_match, etag):
         return Response(status_code=304, headers=cache_headers)
 
     return FileResponse(
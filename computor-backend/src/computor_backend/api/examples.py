@@ -4,18 +4,23 @@ FastAPI endpoints for Example Library management.
 
 import base64
 import binascii
+import hashlib
 import zipfile
 import mimetypes
 import io
 import json
 import logging
+import os
 import re
+import tempfile
 import yaml
-from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Annotated, BinaryIO, Dict, List, Optional, Tuple, Union
 # UUID type removed - using str for all IDs
 from datetime import datetime, timezone
 from ..custom_types import Ltree
-from fastapi import APIRouter, Depends, Query, HTTPException, Response
+from fastapi import APIRouter, Depends, File, Form, Query, HTTPException, Response, UploadFile
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func
 
@@ -51,7 +56,7 @@ from ..permissions.auth import get_current_principal
 from computor_backend.api._pagination import paginated_list
 from computor_backend.business_logic.crud import (
     get_entity_by_id as get_id_db,
-    list_entities as list_db
+    list_entities_page as list_page_db
 )
 from computor_backend.business_logic.cascade_deletion import delete_examples_by_pattern
 from ..exceptions import (
@@ -66,6 +71,7 @@ from ..services.version_resolver import VersionResolver
 from ..services.dependency_sync import DependencySyncService
 from ..repositories import ExampleVersionRepository, ExampleDependencyRepository
 from computor_types.validation import SemanticVersion, normalize_version
+from computor_utils import compute_example_content_hash_from_digests
 
 logger = logging.getLogger(__name__)
 
@@ -353,6 +359,131 @@ def _extract_file_bytes(filename: str, content: object) -> Tuple[io.BytesIO, boo
     # Default: treat as UTF-8 text
     return io.BytesIO(text.encode('utf-8')), False
 
+# Chunk size for streaming archive members to disk
+ARCHIVE_CHUNK_SIZE = 1024 * 1024
+
+# User metadata key holding the SHA-256 of an uploaded example file
+FILE_HASH_METADATA_KEY = 'sha256'
+
+@dataclass
+class _ExampleFile:
+    """One file of an uploaded example, held in memory or spooled to disk."""
+    sha256: bytes
+    is_binary: bool
+    data: Optional[bytes] = None
+    path: Optional[str] = None
+
+    def read(self) -> bytes:
+        if self.data is not None:
+            return self.data
+        with open(self.path, 'rb') as fp:
+            return fp.read()
+
+    def source(self) -> Union[io.BytesIO, str]:
+        """File object or local path, as accepted by ``StorageService.upload_files``."""
+        return io.BytesIO(self.data) if self.data is not None else self.path
+
+def _safe_archive_name(raw_name: str) -> Optional[str]:
+    """Normalize a zip member name, or None for entries that are not stored.
+
+    Skips MacOS resource forks, hidden dot entries and ``.meta.yaml``
+    files, and rejects absolute or ``..`` paths (zip slip).
+    """
+    # Exclude MacOS and hidden dot entries
+    if raw_name.startswith('__MACOSX/') or '/.' in raw_name or raw_name.endswith('.meta.yaml'):
+        return None
+    # Normalize to avoid zip slip
+    norm_name = raw_name.replace('\\', '/').lstrip('/')
+    parts = []
+    for part in norm_name.split('/'):
+        if part in ('', '.'):
+            continue
+        if part == '..':
+            # Unsafe path
+            return None
+        parts.append(part)
+    return '/'.join(parts) or None
+
+def _extract_archive(fileobj: BinaryIO, dest_dir: str) -> Dict[str, _ExampleFile]:
+    """Extract an example zip into ``dest_dir`` and hash every file on the way.
+
+    Members are streamed in ``ARCHIVE_CHUNK_SIZE`` chunks, so memory use
+    does not depend on file or archive size. Files are written under
+    numbered names; the archive paths are only used as mapping keys.
+    Blocking, run it in the threadpool.
+    """
+    files: Dict[str, _ExampleFile] = {}
+    with zipfile.ZipFile(fileobj, 'r') as zf:
+        for index, info in enumerate(zf.infolist()):
+            name = None if info.is_dir() else _safe_archive_name(info.filename)
+            if name is None or name.lower().endswith('.zip'):
+                continue
+            path = os.path.join(dest_dir, str(index))
+            digest = hashlib.sha256()
+            with zf.open(info, 'r') as src, open(path, 'wb') as dst:
+                while chunk := src.read(ARCHIVE_CHUNK_SIZE):
+                    digest.update(chunk)
+                    dst.write(chunk)
+            files[name] = _ExampleFile(sha256=digest.digest(), is_binary=True, path=path)
+    return files
+
+async def _stored_file_digests(storage_service, bucket_name: str, storage_path: str) -> Dict[str, Optional[str]]:
+    """Map each file stored under a version's storage path to its recorded SHA-256 (hex).
+
+    Files uploaded before hashes were recorded map to None.
+    """
+    prefix = f"{storage_path}/"
+    objects = await storage_service.list_objects(
+        bucket_name=bucket_name, prefix=prefix, include_user_metadata=True
+    )
+    digests: Dict[str, Optional[str]] = {}
+    for obj in objects:
+        metadata = {key.lower(): value for key, value in (obj.metadata or {}).items()}
+        digests[obj.object_name[len(prefix):]] = metadata.get(f"x-amz-meta-{FILE_HASH_METADATA_KEY}")
+    return digests
+
+async def _sync_version_files(
+    storage_service,
+    bucket_name: str,
+    storage_path: str,
+    files: Dict[str, _ExampleFile],
+    baseline_path: Optional[str],
+) -> None:
+    """Store an example version's files, skipping unchanged ones.
+
+    Files whose hash matches the copy under ``baseline_path`` (the version
+    being updated, or the previous version) are left alone or copied
+    server-side; only the others are uploaded, concurrently.
+    """
+    baseline: Dict[str, Optional[str]] = {}
+    if baseline_path:
+        try:
+            baseline = await _stored_file_digests(storage_service, bucket_name, baseline_path)
+        except NotFoundException:
+            baseline = {}
+
+    uploads = []
+    copies = []
+    for filename, example_file in files.items():
+        digest = example_file.sha256.hex()
+        if baseline.get(filename) == digest:
+            if baseline_path != storage_path:
+                copies.append((f"{baseline_path}/{filename}", f"{storage_path}/{filename}"))
+            continue
+        uploads.append((
+            f"{storage_path}/{filename}",
+            example_file.source(),
+            _guess_content_type(filename, example_file.is_binary),
+            {FILE_HASH_METADATA_KEY: digest},
+        ))
+
+    logger.info(
+        f"Storing {storage_path}: {len(uploads)} uploaded, {len(copies)} copied, "
+        f"{len(files) - len(uploads) - len(copies)} unchanged"
+    )
+    await storage_service.upload_files(uploads, bucket_name=bucket_name)
+    await storage_service.copy_objects(copies, bucket_name=bucket_name)
+
 _TEXT_CONTENT_TYPES = {
     'application/json',
     'application/xml',
@@ -449,8 +580,8 @@ async def list_examples(
     redis_client=Depends(get_redis_client),
 ):
     """List all examples."""
-    list_result, total = await list_db(permissions, db, params, ExampleInterface)
-    return paginated_list(list_result, total, response=response)
+    page = await list_page_db(permissions, db, params, ExampleInterface)
+    return paginated_list(page.items, page.total, response=response, next_cursor=page.next_cursor)
 
 @examples_router.get("/{example_id}", response_model=ExampleGet)
 async def get_example(
@@ -798,97 +929,143 @@ async def upload_example(
     permissions: Principal = Depends(get_current_principal),
     storage_service=Depends(get_storage_service),
 ):
-    """Upload an example to storage (MinIO)."""
-    from computor_backend.database import set_db_user
+    """Upload an example to storage (MinIO).
 
-    # Check permissions
-    if not permissions.permitted("example", "upload"):
-        raise ForbiddenException("You don't have permission to upload examples")
-
-    # Set user context for audit tracking
-    set_db_user(db, permissions.user_id)
+    The whole example travels base64-encoded inside the JSON body; prefer
+    ``POST /examples/upload/archive`` for large examples.
+    """
+    repository = _get_upload_repository(db, permissions, request.repository_id)
 
-    # Verify repository exists and is MinIO type
-    repository = db.query(ExampleRepository).filter(
-        ExampleRepository.id == request.repository_id
-    ).first()
-    
-    if not repository:
-        raise NotFoundException(f"Repository {request.repository_id} not found")
-    
-    if repository.source_type == "git":
-        raise NotImplementedException("Git upload not implemented - use git push instead")
-    
-    if repository.source_type not in ["minio", "s3"]:
-        raise BadRequestException(f"Upload not supported for {repository.source_type} repositories")
-    
     # Support two input modes:
     # 1) Classic: request.files contains all files including 'meta.yaml'
     # 2) Zipped:  request.files contains a single .zip which we extract here
 
     # Detect zipped upload (first .zip file wins)
-    extracted_files = None
     zip_entry_name = next((name for name in request.files.keys() if name.lower().endswith('.zip')), None)
     if zip_entry_name is not None:
         try:
             zip_bytes_io, _ = _extract_file_bytes(zip_entry_name, request.files[zip_entry_name])
             with zipfile.ZipFile(zip_bytes_io, 'r') as zf:
-                files: dict[str, bytes] = {}
+                incoming_files: dict = {}
                 for info in zf.infolist():
-                    if info.is_dir():
+                    safe_name = None if info.is_dir() else _safe_archive_name(info.filename)
+                    if safe_name is None:
                         continue
-                    # Normalize arcname and skip any unsafe paths
-                    raw_name = info.filename
-                    # Exclude MacOS and hidden dot entries
-                    if raw_name.startswith('__MACOSX/') or '/.' in raw_name or raw_name.endswith('.meta.yaml'):
-                        continue
-                    # Normalize to avoid zip slip
-                    norm_name = raw_name.replace('\\', '/')
-                    norm_name = norm_name.lstrip('/')
-                    # Collapse .. segments
-                    parts = []
-                    for part in norm_name.split('/'):
-                        if part in ('', '.'):
-                            continue
-                        if part == '..':
-                            # Unsafe path
-                            parts = []
-                            break
-                        parts.append(part)
-                    if not parts:
-                        continue
-                    safe_name = '/'.join(parts)
                     # Read raw bytes; text/binary handled later
                     with zf.open(info, 'r') as fp:
-                        data = fp.read()
-                        files[safe_name] = data
-                extracted_files = files
+                        incoming_files[safe_name] = fp.read()
         except Exception as e:
             logger.exception("Failed to extract uploaded zip for example")
             raise BadRequestException(f"Invalid zip upload: {e}") from e
+    else:
+        incoming_files = request.files
+
+    # Convert incoming content to bytes once
+    files: Dict[str, _ExampleFile] = {}
+    for filename, content in incoming_files.items():
+        if filename.lower().endswith('.zip'):
+            # Do not store the container zip itself
+            continue
+        file_data, is_binary = _extract_file_bytes(filename, content)
+        if file_data is None:
+            logger.error(f"Could not process content for {filename}")
+            continue
+        data = file_data.getvalue()
+        files[filename] = _ExampleFile(
+            sha256=hashlib.sha256(data).digest(), is_binary=is_binary, data=data
+        )
 
-    # Choose file source
-    incoming_files = extracted_files if extracted_files is not None else request.files
+    return await _store_example_version(
+        db, permissions, storage_service, repository, request.directory, files
+    )
 
+@examples_router.post("/upload/archive", response_model=ExampleVersionGet)
+async def upload_example_archive(
+    repository_id: Annotated[str, Form()],
+    directory: Annotated[str, Form(pattern="^[a-zA-Z0-9._-]+$")],
+    file: Annotated[UploadFile, File(description="Zip archive of the example directory")],
+    db: Session = Depends(get_db),
+    permissions: Principal = Depends(get_current_principal),
+    storage_service=Depends(get_storage_service),
+):
+    """Upload an example to storage (MinIO) as a multipart zip archive.
+
+    The archive is spooled to disk by the multipart parser and extracted
+    member by member into a temporary directory, hashing each file while
+    it is written, so neither the archive nor its files are held in
+    memory. Only files whose hash differs from the stored copy are
+    uploaded.
+    """
+    repository = _get_upload_repository(db, permissions, repository_id)
+
+    with tempfile.TemporaryDirectory(prefix="example-upload-") as work_dir:
+        try:
+            files = await run_in_threadpool(_extract_archive, file.file, work_dir)
+        except (zipfile.BadZipFile, zipfile.LargeZipFile, OSError, EOFError) as e:
+            logger.exception("Failed to extract uploaded archive for example")
+            raise BadRequestException(f"Invalid zip upload: {e}") from e
+        finally:
+            await file.close()
+
+        return await _store_example_version(
+            db, permissions, storage_service, repository, directory, files
+        )
+
+def _get_upload_repository(db: Session, permissions: Principal, repository_id: str) -> ExampleRepository:
+    """Check upload permission and return the (MinIO/S3) target repository."""
+    from computor_backend.database import set_db_user
+
+    # Check permissions
+    if not permissions.permitted("example", "upload"):
+        raise ForbiddenException("You don't have permission to upload examples")
+
+    # Set user context for audit tracking
+    set_db_user(db, permissions.user_id)
+
+    # Verify repository exists and is MinIO type
+    repository = db.query(ExampleRepository).filter(
+        ExampleRepository.id == repository_id
+    ).first()
+
+    if not repository:
+        raise NotFoundException(f"Repository {repository_id} not found")
+
+    if repository.source_type == "git":
+        raise NotImplementedException("Git upload not implemented - use git push instead")
+
+    if repository.source_type not in ["minio", "s3"]:
+        raise BadRequestException(f"Upload not supported for {repository.source_type} repositories")
+
+    return repository
+
+async def _store_example_version(
+    db: Session,
+    permissions: Principal,
+    storage_service,
+    repository: ExampleRepository,
+    directory: str,
+    files: Dict[str, _ExampleFile],
+) -> ExampleVersion:
+    """Create or update the example and version described by ``files``.
+
+    Shared by the JSON and archive upload endpoints: parses meta.yaml,
+    stores the files in MinIO and records the version in the database.
+    """
     # Validate that meta.yaml is included
-    if 'meta.yaml' not in incoming_files:
+    if 'meta.yaml' not in files:
         raise BadRequestException("meta.yaml file is required")
     
     # Parse meta.yaml to extract example metadata
     try:
-        meta_content = incoming_files['meta.yaml']
-        if isinstance(meta_content, (bytes, bytearray)):
-            meta_str = meta_content.decode('utf-8', errors='replace')
-        else:
-            meta_str = str(meta_content)
+        meta_str = files['meta.yaml'].read().decode('utf-8', errors='replace')
         meta_data = yaml.safe_load(meta_str)
     except yaml.YAMLError as e:
         raise BadRequestException(f"Invalid meta.yaml format: {str(e)}") from e
     
     # Extract metadata from meta.yaml
-    title = meta_data.get('title', request.directory.replace('-', ' ').replace('_', ' ').title())
+    title = meta_data.get('title', directory.replace('-', ' ').replace('_', ' ').title())
     description = meta_data.get('description', '')
-    slug = meta_data.get('slug', request.directory.replace('-', '.').replace('_', '.'))
+    slug = meta_data.get('slug', directory.replace('-', '.').replace('_', '.'))
 
     # Extract version from meta.yaml and normalize to semver format
     version_tag_raw = meta_data.get('version', '1.0.0')
@@ -909,15 +1086,15 @@ async def upload_example(
     
     # Check if example exists
     example = db.query(Example).filter(
-        Example.example_repository_id == request.repository_id,
-        Example.directory == request.directory
+        Example.example_repository_id == repository.id,
+        Example.directory == directory
     ).first()
     
     # Create or update example
     if not example:
         example = Example(
-            example_repository_id=request.repository_id,
-            directory=request.directory,
+            example_repository_id=repository.id,
+            directory=directory,
             identifier=Ltree(slug),
             title=title,
             description=description,
@@ -940,7 +1117,17 @@ async def upload_example(
 
     # Check if this version already exists
     existing_version = version_repo.find_by_version_tag(example.id, version_tag)
-    
+
+    # The content hash covers exactly the files stored below
+    content_hash = compute_example_content_hash_from_digests(
+        {filename: example_file.sha256 for filename, example_file in files.items()}
+    )
+
+    # Re-uploading identical content (e.g. re-applying a deployment) is a no-op
+    if existing_version and existing_version.content_hash == content_hash:
+        logger.info(f"Example {example.directory} {version_tag} unchanged, skipping upload")
+        return existing_version
+
     # Check if meta.yaml indicates this should update an existing version
     should_update = meta_data.get('update_existing', False) or meta_data.get('overwrite', False)
     
@@ -961,10 +1148,14 @@ async def upload_example(
         # Updating existing version
         version_number = existing_version.version_number
         storage_path = existing_version.storage_path
+        baseline_path = storage_path
     else:
         # Creating new version - use repository method
         version_number = version_repo.get_next_version_number(example.id)
         storage_path = f"examples/{repository.id}/{example.directory}/v{version_number}"
+        # Unchanged files are copied over from the latest version
+        latest_version = version_repo.find_latest_version(example.id)
+        baseline_path = latest_version.storage_path if latest_version else None
     
     # Upload files to MinIO. meta.yaml and test.yaml ride inside this
     # loop alongside the rest — the DB no longer carries a separate
@@ -972,28 +1163,7 @@ async def upload_example(
     # ``_get_version_yaml_dict`` (Redis-cached).
     bucket_name = repository.source_url.split('/')[0]  # First part is bucket
 
-    for filename, content in incoming_files.items():
-        if filename.lower().endswith('.zip'):
-            # Do not store the container zip itself
-            continue
-        object_key = f"{storage_path}/{filename}"
-        
-        # Convert incoming content to bytes and determine if it's binary
-        file_data, is_binary = _extract_file_bytes(filename, content)
-        if file_data is None:
-            logger.error(f"Could not process content for {filename}")
-            continue
-        
-        # Determine content type based on filename and whether it is binary
-        content_type = _guess_content_type(filename, is_binary)
-        
-        # Upload file
-        await storage_service.upload_file(
-            file_data=file_data,
-            object_key=object_key,
-            bucket_name=bucket_name,
-            content_type=content_type,
-        )
+    await _sync_version_files(storage_service, bucket_name, storage_path, files, baseline_path)
     
     # Resolve testing service from meta.yaml — applies to both create
     # and update branches, since updating an existing version may swap
@@ -1016,6 +1186,7 @@ async def upload_example(
         for field, value in promoted.items():
             setattr(existing_version, field, value)
         existing_version.testing_service_id = testing_service_id
+        existing_version.content_hash = content_hash
         existing_version.updated_at = func.now()
         version = version_repo.update(existing_version)
         cache.invalidate_tags(f"example_version:{version.id}")
@@ -1027,6 +1198,7 @@ async def upload_example(
             version_number=version_number,
             storage_path=storage_path,
             testing_service_id=testing_service_id,
+            content_hash=content_hash,
             created_by=permissions.user_id,
             **promoted,
         )
@@ -1,12 +1,13 @@
 from uuid import UUID
-from typing import Annotated
+from typing import Annotated, Optional
 from sqlalchemy.orm import Session
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Response, status
 
 from computor_backend.database import get_db
 from computor_backend.exceptions import NotFoundException
 from computor_backend.redis_cache import get_cache
 from computor_backend.cache import Cache
+from computor_backend.api._conditional import conditional_view
 from computor_types.courses import CourseGet, CourseList, CourseQuery
 from computor_types.lecturer_course_contents import (
     CourseContentLecturerGet,
@@ -56,41 +57,56 @@ from computor_backend.websocket.broadcast import ws_broadcast
 lecturer_router = APIRouter()
 
 @lecturer_router.get("/courses/{course_id}", response_model=CourseGet)
-def lecturer_get_courses_endpoint(
+async def lecturer_get_courses_endpoint(
     course_id: UUID | str,
     permissions: Annotated[Principal, Depends(get_current_principal)],
-    cache: Cache = Depends(get_cache)
+    response: Response,
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
     """Get a specific course for lecturers."""
-    return get_lecturer_course(course_id, permissions, cache)
+    return await conditional_view(
+        response, if_none_match, lambda: get_lecturer_course(course_id, permissions, cache)
+    )
 
 @lecturer_router.get("/courses", response_model=list[CourseList])
-def lecturer_list_courses_endpoint(
+async def lecturer_list_courses_endpoint(
     permissions: Annotated[Principal, Depends(get_current_principal)],
+    response: Response,
     params: CourseQuery = Depends(),
-    cache: Cache = Depends(get_cache)
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
     """List courses accessible to lecturers."""
-    return list_lecturer_courses(permissions, params, cache)
+    return await conditional_view(
+        response, if_none_match, lambda: list_lecturer_courses(permissions, params, cache)
+    )
 
 @lecturer_router.get("/course-contents/{course_content_id}", response_model=CourseContentLecturerGet)
-def lecturer_get_course_contents_endpoint(
+async def lecturer_get_course_contents_endpoint(
     course_content_id: UUID | str,
     permissions: Annotated[Principal, Depends(get_current_principal)],
-    cache: Cache = Depends(get_cache)
+    response: Response,
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
     """Get a specific course content with course repository information."""
-    return get_lecturer_course_content(course_content_id, permissions, cache)
+    return await conditional_view(
+        response, if_none_match, lambda: get_lecturer_course_content(course_content_id, permissions, cache)
+    )
 
 @lecturer_router.get("/course-contents", response_model=list[CourseContentLecturerList])
-def lecturer_list_course_contents_endpoint(
+async def lecturer_list_course_contents_endpoint(
     permissions: Annotated[Principal, Depends(get_current_principal)],
+    response: Response,
     params: CourseContentLecturerQuery = Depends(),
-    cache: Cache = Depends(get_cache)
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
     """List course contents with course repository information."""
-    return list_lecturer_course_contents(permissions, params, cache)
-
+    return await conditional_view(
+        response, if_none_match, lambda: list_lecturer_course_contents(permissions, params, cache)
+    )
 
 # ============================================================================
 # Deployment Management Endpoints (Example Assignment)
@@ -11,7 +11,7 @@ from computor_backend.exceptions import ForbiddenException, NotFoundException
 
 # Import business logic
 from computor_backend.business_logic.organizations import update_organization_token
-from computor_backend.business_logic.cascade_deletion import delete_organization_cascade
+from computor_backend.business_logic.cascade_deletion import delete_organization_cascade, submit_cascade_deletion
 from computor_backend.interfaces import OrganizationInterface
 from computor_backend.model import Organization
 from computor_backend.services.storage_service import get_storage_service
@@ -57,6 +57,10 @@ def patch_organizations_token(
 
     **WARNING**: This is a destructive operation. Use dry_run=true to preview.
 
+    By default the deletion runs as a background task in short chunks; the
+    response carries the task's `workflow_id` and the deleted counts are
+    reported by the task's progress. Pass background=false to delete inline.
+
     Users and accounts are NOT deleted - only organization-specific data.
     """
 )
@@ -68,6 +72,10 @@ async def delete_organization_endpoint(
         default=False,
         description="If true, only returns preview without deleting"
     ),
+    background: bool = Query(
+        default=True,
+        description="If true, delete in a background task and return its workflow_id"
+    ),
 ) -> CascadeDeleteResult:
     """Delete organization and all descendant data."""
     if not permissions.is_admin:
@@ -78,6 +86,14 @@ async def delete_organization_endpoint(
     if not org:
         raise NotFoundException(f"Organization not found: {organization_id}")
 
+    if background and not dry_run:
+        return await submit_cascade_deletion(
+            "organization",
+            str(organization_id),
+            created_by=permissions.user_id,
+            organization_id=str(organization_id),
+        )
+
     storage = get_storage_service()
     result = await delete_organization_cascade(
         db=db,
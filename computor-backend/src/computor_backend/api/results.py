@@ -9,7 +9,7 @@ from computor_backend.business_logic.crud import (
     create_entity as create_db,
     delete_entity as delete_db,
     get_entity_by_id as get_id_db,
-    list_entities as list_db,
+    list_entities_page as list_page_db,
     update_entity as update_db
 )
 from computor_backend.database import get_db
@@ -40,8 +40,8 @@ async def list_results(
     params: ResultQuery = Depends(),
     db: Session = Depends(get_db),
 ) -> list[ResultList]:
-    results, total = await list_db(permissions, db, params, ResultInterface)
-    return paginated_list(results, total, response=response)
+    page = await list_page_db(permissions, db, params, ResultInterface)
+    return paginated_list(page.items, page.total, response=response, next_cursor=page.next_cursor)
 
 @result_router.get("/{result_id}", response_model=ResultGet)
 async def get_result(
@@ -52,12 +52,9 @@ async def get_result(
     # Get the base result from database
     result = await get_id_db(permissions, db, result_id, ResultInterface)
 
-    # Fetch result_json from MinIO
-    from computor_backend.services.result_storage import retrieve_result_json, list_result_artifacts
-    result_json = await retrieve_result_json(result_id)
-
-    # Fetch artifact information
-    artifacts = await list_result_artifacts(result_id)
+    # Fetch result_json and artifact information from MinIO (concurrently)
+    from computor_backend.services.result_storage import retrieve_result_details
+    result_json, artifacts = (await retrieve_result_details([result_id]))[str(result_id)]
 
     # Build result_artifacts list
     result_artifacts = [
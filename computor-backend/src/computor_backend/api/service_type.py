@@ -14,7 +14,7 @@ from computor_backend.api._pagination import paginated_list
 from computor_backend.business_logic.crud import (
     create_entity as create_db,
     get_entity_by_id as get_id_db,
-    list_entities as list_db,
+    list_entities_page as list_page_db,
     update_entity as update_db,
 )
 from computor_backend.permissions.auth import get_current_principal
@@ -103,8 +103,8 @@ async def list_service_types(
         GET /service-types?path_descendant=testing
         GET /service-types?enabled=true
     """
-    data, total = await list_db(permissions, db, params, ServiceTypeInterface)
-    return paginated_list(data, total, response=response)
+    page = await list_page_db(permissions, db, params, ServiceTypeInterface)
+    return paginated_list(page.items, page.total, response=response, next_cursor=page.next_cursor)
 
 
 @service_type_router.patch("/{entity_id}", response_model=ServiceTypeGet)
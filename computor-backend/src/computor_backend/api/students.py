@@ -1,12 +1,13 @@
 import logging
 from uuid import UUID
-from typing import Annotated
-from fastapi import APIRouter, Depends
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, Header, Response
 
 from computor_backend.permissions.principal import Principal
 from computor_backend.permissions.auth import get_current_principal
 from computor_backend.redis_cache import get_cache
 from computor_backend.cache import Cache
+from computor_backend.api._conditional import conditional_view
 from computor_types.student_course_contents import (
     CourseContentStudentList,
     CourseContentStudentQuery,
@@ -27,50 +28,61 @@ logger = logging.getLogger(__name__)
 
 ## MR-based course-content messages removed (deprecated)
 
+# The view endpoints below answer ``If-None-Match`` with ``304`` when the
+# cached view is unchanged (see ``api._conditional``).
+
 @student_router.get("/course-contents/{course_content_id}", response_model=CourseContentStudentGet)
 async def student_get_course_content_endpoint(
     course_content_id: UUID | str,
     permissions: Annotated[Principal, Depends(get_current_principal)],
-    cache: Cache = Depends(get_cache)
+    response: Response,
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
-    return await get_student_course_content(
+    return await conditional_view(response, if_none_match, lambda: get_student_course_content(
         course_content_id=course_content_id,
         user_id=permissions.get_user_id_or_throw(),
         cache=cache,
-    )
+    ))
 
 @student_router.get("/course-contents", response_model=list[CourseContentStudentList])
 async def student_list_course_contents_endpoint(
     permissions: Annotated[Principal, Depends(get_current_principal)],
+    response: Response,
     params: CourseContentStudentQuery = Depends(),
-    cache: Cache = Depends(get_cache)
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
-    return await list_student_course_contents(
+    return await conditional_view(response, if_none_match, lambda: list_student_course_contents(
         user_id=permissions.get_user_id_or_throw(),
         params=params,
         cache=cache,
-    )
+    ))
 
 @student_router.get("/courses", response_model=list[CourseStudentList])
-def student_list_courses_endpoint(
+async def student_list_courses_endpoint(
     permissions: Annotated[Principal, Depends(get_current_principal)],
+    response: Response,
     params: CourseStudentQuery = Depends(),
-    cache: Cache = Depends(get_cache)
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
-    return list_student_courses(
+    return await conditional_view(response, if_none_match, lambda: list_student_courses(
         permissions=permissions,
         params=params,
         cache=cache,
-    )
+    ))
 
 @student_router.get("/courses/{course_id}", response_model=CourseStudentGet)
-def student_get_course_endpoint(
+async def student_get_course_endpoint(
     course_id: UUID | str,
     permissions: Annotated[Principal, Depends(get_current_principal)],
-    cache: Cache = Depends(get_cache)
+    response: Response,
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
-    return get_student_course(
+    return await conditional_view(response, if_none_match, lambda: get_student_course(
         course_id=course_id,
         permissions=permissions,
         cache=cache,
-    )
\ No newline at end of file
+    ))
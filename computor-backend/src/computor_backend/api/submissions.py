@@ -1147,7 +1147,7 @@ async def list_artifact_test_results(
     Use include_failed=true to also include failed/cancelled/crashed results.
     Students see their own, tutors/instructors see all.
     """
-    from computor_backend.services.result_storage import retrieve_result_json, list_result_artifacts
+    from computor_backend.services.result_storage import retrieve_result_details
 
     # Verify artifact exists and get course info
     artifact = db.query(SubmissionArtifact).options(
@@ -1192,12 +1192,13 @@ async def list_artifact_test_results(
 
     results = query.order_by(Result.created_at.desc()).all()
 
+    # Fetch result_json and artifacts for all results in one batch
+    details = await retrieve_result_details(result.id for result in results)
+
     # Build ResultGet responses with full details
     result_list = []
     for result in results:
-        # Fetch result_json and artifacts from MinIO
-        result_json_data = await retrieve_result_json(result.id)
-        artifacts = await list_result_artifacts(result.id)
+        result_json_data, artifacts = details[str(result.id)]
 
         result_artifacts = [
             ResultArtifactInfo(
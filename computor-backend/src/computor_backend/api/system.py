@@ -560,10 +560,10 @@ async def sync_documents_repository(
     Sync the documents repository from GitLab to shared filesystem.
 
     This endpoint triggers a Temporal workflow that:
-    1. Clones the documents repository from the course family's GitLab group
-    2. Removes the .git directory
-    3. Syncs files to ${SYSTEM_DEPLOYMENT_PATH}/shared/documents/{org}/{family}/
-    4. Files become accessible via the static-server at /docs/{org}/{family}/
+    1. Fetches new commits of the course family's documents repository
+    2. Applies the changed files (without .git) to
+       ${SYSTEM_DEPLOYMENT_PATH}/shared/documents/{org}/{family}/ in one atomic swap
+    3. Files become accessible via the static-server at /docs/{org}/{family}/
 
     Args:
         course_family_id: The CourseFamily ID
@@ -24,7 +24,8 @@ from computor_backend.tasks import (
     TaskSubmission,
     TaskInfo,
     TaskResult,
-    task_registry
+    task_registry,
+    list_accessible_task_page
 )
 from computor_backend.task_tracker import get_task_tracker
 from computor_types.tasks import TaskTrackerEntry
@@ -55,7 +56,9 @@ async def list_tasks(
     Returns:
         Dictionary containing:
         - tasks: List of task information
-        - total: Total number of tasks
+        - total: Total number of tasks (with a status filter, only the
+          newest tracked tasks are examined and ``total_is_estimate`` is
+          set when older ones were skipped)
         - limit: Applied limit
         - offset: Applied offset
         - has_more: Whether more tasks are available
@@ -65,35 +68,21 @@ async def list_tasks(
     """
     try:
         task_executor = get_task_executor()
-        task_tracker = await get_task_tracker()
-
-        # Get workflow IDs the user can access
-        accessible_ids = await task_tracker.get_accessible_task_ids(permissions)
 
-        if not accessible_ids:
-            return {
-                "tasks": [],
-                "total": 0,
-                "limit": limit,
-                "offset": offset,
-                "has_more": False
-            }
+        # Admins see every workflow in Temporal, including untracked ones
+        if permissions.is_admin:
+            return await task_executor.list_tasks(limit=limit, offset=offset, status=status)
 
-        # Get full task info from Temporal for accessible tasks
-        result = await task_executor.list_tasks(limit=limit, offset=offset, status=status)
-
-        # Filter to only accessible tasks
-        if not permissions.is_admin:
-            accessible_tasks = [
-                task for task in result.get("tasks", [])
-                if task.get("task_id") in accessible_ids or task.get("workflow_id") in accessible_ids
-            ]
-            total_accessible = len(accessible_tasks)
-            result["tasks"] = accessible_tasks[offset:offset + limit]
-            result["total"] = total_accessible
-            result["has_more"] = (offset + limit) < total_accessible
-
-        return result
+        # Everyone else pages through the tasks the tracker lists for them
+        task_tracker = await get_task_tracker()
+        return await list_accessible_task_page(
+            task_tracker,
+            task_executor,
+            permissions,
+            limit=limit,
+            offset=offset,
+            status=status
+        )
 
     except Exception as e:
         raise InternalServerException(
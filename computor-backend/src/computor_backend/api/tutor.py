@@ -3,13 +3,14 @@ import logging
 import uuid as uuid_module
 from uuid import UUID
 from typing import Annotated, Optional
-from fastapi import APIRouter, Depends, Query, File, UploadFile, Form
+from fastapi import APIRouter, Depends, Query, File, UploadFile, Form, Header, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from computor_backend.database import get_db
 from computor_backend.redis_cache import get_cache, get_redis_client
 from computor_backend.cache import Cache
+from computor_backend.api._conditional import conditional_view
 from computor_backend.permissions.principal import Principal
 from computor_backend.permissions.auth import get_current_principal
 from computor_backend.exceptions import NotFoundException, ForbiddenException, NotImplementedException, BadRequestException
@@ -61,20 +62,30 @@ async def tutor_get_course_contents_endpoint(
     course_content_id: UUID | str,
     course_member_id: UUID | str,
     permissions: Annotated[Principal, Depends(get_current_principal)],
-    cache: Cache = Depends(get_cache)
+    response: Response,
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
     """Get course content for a course member as a tutor."""
-    return await get_tutor_course_content(course_member_id, course_content_id, permissions, cache)
+    return await conditional_view(
+        response, if_none_match,
+        lambda: get_tutor_course_content(course_member_id, course_content_id, permissions, cache),
+    )
 
 @tutor_router.get("/course-members/{course_member_id}/course-contents", response_model=list[CourseContentStudentList])
 async def tutor_list_course_contents_endpoint(
     course_member_id: UUID | str,
     permissions: Annotated[Principal, Depends(get_current_principal)],
+    response: Response,
     params: CourseContentStudentQuery = Depends(),
-    cache: Cache = Depends(get_cache)
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
     """List course contents for a course member as a tutor."""
-    return await list_tutor_course_contents(course_member_id, permissions, params, cache)
+    return await conditional_view(
+        response, if_none_match,
+        lambda: list_tutor_course_contents(course_member_id, permissions, params, cache),
+    )
 
 @tutor_router.patch("/course-members/{course_member_id}/course-contents/{course_content_id}", response_model=TutorGradeResponse)
 async def tutor_update_course_contents_endpoint(
@@ -99,22 +110,30 @@ async def tutor_update_course_contents_endpoint(
     )
 
 @tutor_router.get("/courses/{course_id}", response_model=CourseTutorGet)
-def tutor_get_courses_endpoint(
+async def tutor_get_courses_endpoint(
     course_id: UUID | str,
     permissions: Annotated[Principal, Depends(get_current_principal)],
-    cache: Cache = Depends(get_cache)
+    response: Response,
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
     """Get a course for tutors."""
-    return get_tutor_course(course_id, permissions, cache)
+    return await conditional_view(
+        response, if_none_match, lambda: get_tutor_course(course_id, permissions, cache)
+    )
 
 @tutor_router.get("/courses", response_model=list[CourseTutorList])
-def tutor_list_courses_endpoint(
+async def tutor_list_courses_endpoint(
     permissions: Annotated[Principal, Depends(get_current_principal)],
+    response: Response,
     params: CourseStudentQuery = Depends(),
-    cache: Cache = Depends(get_cache)
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
     """List courses for tutors."""
-    return list_tutor_courses(permissions, params, cache)
+    return await conditional_view(
+        response, if_none_match, lambda: list_tutor_courses(permissions, params, cache)
+    )
 
 @tutor_router.get("/course-members/{course_member_id}", response_model=TutorCourseMemberGet)
 def tutor_get_course_members_endpoint(
@@ -127,14 +146,18 @@ def tutor_get_course_members_endpoint(
     return get_tutor_course_member(course_member_id, permissions, db, cache)
 
 @tutor_router.get("/course-members", response_model=list[TutorCourseMemberList])
-def tutor_list_course_members_endpoint(
+async def tutor_list_course_members_endpoint(
     permissions: Annotated[Principal, Depends(get_current_principal)],
+    response: Response,
     params: CourseMemberQuery = Depends(),
     db: Session = Depends(get_db),
-    cache: Cache = Depends(get_cache)
+    cache: Cache = Depends(get_cache),
+    if_none_match: Annotated[Optional[str], Header(alias="if-none-match")] = None,
 ):
     """List course members for tutors."""
-    return list_tutor_course_members(permissions, params, db, cache)
+    return await conditional_view(
+        response, if_none_match, lambda: list_tutor_course_members(permissions, params, db, cache)
+    )
 
 ## Submission Groups Endpoints
 
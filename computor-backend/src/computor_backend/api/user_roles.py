@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 from computor_backend.api._pagination import paginated_list
 from computor_backend.business_logic.crud import (
     create_entity as create_db,
-    list_entities as list_db
+    list_entities_page as list_page_db
 )
 from computor_backend.permissions.auth import get_current_principal
 from computor_backend.permissions.principal import Principal
@@ -33,8 +33,8 @@ async def list_user_roles(
 ):
     """List user roles."""
 
-    list_result, total = await list_db(permissions, db, params, UserRoleInterface)
-    return paginated_list(list_result, total, response=response)
+    page = await list_page_db(permissions, db, params, UserRoleInterface)
+    return paginated_list(page.items, page.total, response=response, next_cursor=page.next_cursor)
 
 @user_roles_router.get("/users/{user_id}/roles/{role_id}", response_model=UserRoleGet)
 async def get_user_role_endpoint(
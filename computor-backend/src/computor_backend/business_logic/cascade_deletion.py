@@ -4,14 +4,25 @@ Business logic for cascade deletion of organizations, course families, courses,
 This module provides functions to delete entities and all their descendants,
 including proper handling of RESTRICT constraints and MinIO storage cleanup.
 
+Deletion runs as an ordered list of steps (one table each, bottom-up). Each
+step deletes at most ``CASCADE_CHUNK_SIZE`` rows per transaction, picking
+rows by primary key and removing their MinIO objects before the rows
+themselves. Every chunk is therefore short and safe to repeat: an
+interrupted deletion resumes by simply running the plan again. The
+blocking queries of a chunk run in a worker thread, so chunks never stall
+the event loop of the API or the Temporal worker. Large deletions run in
+the background via ``CascadeDeletionWorkflow``.
+
 IMPORTANT: These operations permanently delete data. Use dry_run=True to preview.
 """
 
+import asyncio
 import logging
-from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, or_, literal, text, cast
+from sqlalchemy import and_, or_, literal, text, cast, select, func
 from sqlalchemy.orm import Session
 from sqlalchemy.types import String
 
@@ -53,78 +64,222 @@ from ..model.artifact import (
 )
 from ..services.storage_service import StorageService, get_storage_service
 from ..services.cascade_cleanup import (
-    cleanup_submission_artifacts_batch,
-    cleanup_results_batch,
-    collect_artifact_storage_info,
-    collect_result_artifact_storage_info,
     cleanup_example_versions_batch,
+    remove_objects_by_bucket,
+    remove_objects_by_prefix,
 )
+from ..services.result_storage import RESULTS_BUCKET, get_result_json_key
 
 logger = logging.getLogger(__name__)
 
 
-class CourseEntityIds:
-    """Container for collected entity IDs within a course."""
+# ---------------------------------------------------------------------------
+# Chunked deletion engine
+# ---------------------------------------------------------------------------
 
-    def __init__(self):
-        self.course_member_ids: List[str] = []
-        self.course_group_ids: List[str] = []
-        self.course_content_type_ids: List[str] = []
-        self.course_content_ids: List[str] = []
-        self.submission_group_ids: List[str] = []
-        self.result_ids: List[str] = []
+CASCADE_CHUNK_SIZE = 500
 
+# (db, row ids) -> ([(bucket, key)], [(bucket, prefix)]) to remove before the rows
+ObjectCollector = Callable[[Session, List[Any]], Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]]
 
-def collect_course_entity_ids(db: Session, course_id: str) -> CourseEntityIds:
-    """
-    Collect all entity IDs for a course for deletion and MinIO cleanup.
 
-    Args:
-        db: Database session
-        course_id: The course ID
+@dataclass(frozen=True)
+class CascadeStep:
+    """One table of a cascade plan.
 
-    Returns:
-        CourseEntityIds with all related entity IDs
+    Attributes:
+        name: EntityDeleteCount field the deleted rows are counted under
+        model: Mapped class; rows are deleted by its ``id`` column
+        where: Builds the filter selecting the rows of a scope (course id, ...)
+        objects: Optional collector of MinIO objects owned by a chunk of rows
     """
-    ids = CourseEntityIds()
+    name: str
+    model: Any
+    where: Callable[[str], Any]
+    objects: Optional[ObjectCollector] = None
 
-    # Collect course members
-    members = db.query(CourseMember.id).filter(
-        CourseMember.course_id == course_id
-    ).all()
-    ids.course_member_ids = [str(m.id) for m in members]
 
-    # Collect course groups
-    groups = db.query(CourseGroup.id).filter(
-        CourseGroup.course_id == course_id
-    ).all()
-    ids.course_group_ids = [str(g.id) for g in groups]
+def _course_content_ids(course_id: str):
+    return select(CourseContent.id).where(CourseContent.course_id == course_id)
 
-    # Collect course content types
-    content_types = db.query(CourseContentType.id).filter(
-        CourseContentType.course_id == course_id
-    ).all()
-    ids.course_content_type_ids = [str(ct.id) for ct in content_types]
 
-    # Collect course contents
-    contents = db.query(CourseContent.id).filter(
-        CourseContent.course_id == course_id
-    ).all()
-    ids.course_content_ids = [str(c.id) for c in contents]
+def _course_member_ids(course_id: str):
+    return select(CourseMember.id).where(CourseMember.course_id == course_id)
+
+
+def _course_submission_group_ids(course_id: str):
+    return select(SubmissionGroup.id).where(SubmissionGroup.course_id == course_id)
+
+
+def _course_artifact_ids(course_id: str):
+    return select(SubmissionArtifact.id).where(
+        SubmissionArtifact.submission_group_id.in_(_course_submission_group_ids(course_id))
+    )
+
+
+def _course_result_ids(course_id: str):
+    return select(Result.id).where(Result.course_content_id.in_(_course_content_ids(course_id)))
+
+
+def _course_deployment_ids(course_id: str):
+    return select(CourseContentDeployment.id).where(
+        CourseContentDeployment.course_content_id.in_(_course_content_ids(course_id))
+    )
+
+
+def _organization_example_ids(organization_id: str):
+    return select(Example.id).where(
+        Example.example_repository_id.in_(
+            select(ExampleRepository.id).where(ExampleRepository.organization_id == organization_id)
+        )
+    )
 
-    # Collect submission groups
-    submission_groups = db.query(SubmissionGroup.id).filter(
-        SubmissionGroup.course_id == course_id
-    ).all()
-    ids.submission_group_ids = [str(sg.id) for sg in submission_groups]
 
-    # Collect results (for MinIO cleanup)
-    results = db.query(Result.id).filter(
-        Result.course_content_id.in_(ids.course_content_ids) if ids.course_content_ids else False
+def _stored_artifact_objects(model) -> ObjectCollector:
+    def collect(db: Session, ids: List[Any]):
+        rows = db.query(model.bucket_name, model.object_key).filter(model.id.in_(ids)).all()
+        return [(row.bucket_name, row.object_key) for row in rows], []
+    return collect
+
+
+def _result_objects(db: Session, ids: List[Any]):
+    # Artifact folders are listed too: ResultArtifact rows may be missing.
+    keys = [(RESULTS_BUCKET, get_result_json_key(result_id)) for result_id in ids]
+    prefixes = [(RESULTS_BUCKET, f"{str(result_id)}/artifacts/") for result_id in ids]
+    return keys, prefixes
+
+
+def _example_version_objects(db: Session, ids: List[Any]):
+    # Example repositories use source_url as their bucket name
+    rows = db.query(ExampleVersion.storage_path, ExampleRepository.source_url).join(
+        Example, Example.id == ExampleVersion.example_id
+    ).join(
+        ExampleRepository, ExampleRepository.id == Example.example_repository_id
+    ).filter(
+        ExampleVersion.id.in_(ids),
+        ExampleVersion.storage_path.isnot(None),
     ).all()
-    ids.result_ids = [str(r.id) for r in results]
+    return [], [(row.source_url, row.storage_path) for row in rows]
+
+
+# Bottom-up order, so RESTRICT constraints never block a step.
+COURSE_CASCADE_STEPS: List[CascadeStep] = [
+    CascadeStep("submission_grades", SubmissionGrade,
+                lambda cid: SubmissionGrade.artifact_id.in_(_course_artifact_ids(cid))),
+    CascadeStep("submission_reviews", SubmissionReview,
+                lambda cid: SubmissionReview.artifact_id.in_(_course_artifact_ids(cid))),
+    CascadeStep("result_artifacts", ResultArtifact,
+                lambda cid: ResultArtifact.result_id.in_(_course_result_ids(cid)),
+                _stored_artifact_objects(ResultArtifact)),
+    CascadeStep("results", Result,
+                lambda cid: Result.course_content_id.in_(_course_content_ids(cid)),
+                _result_objects),
+    CascadeStep("submission_artifacts", SubmissionArtifact,
+                lambda cid: SubmissionArtifact.submission_group_id.in_(_course_submission_group_ids(cid)),
+                _stored_artifact_objects(SubmissionArtifact)),
+    CascadeStep("submission_group_members", SubmissionGroupMember,
+                lambda cid: SubmissionGroupMember.submission_group_id.in_(_course_submission_group_ids(cid))),
+    CascadeStep("submission_groups", SubmissionGroup,
+                lambda cid: SubmissionGroup.course_id == cid),
+    CascadeStep("deployment_histories", DeploymentHistory,
+                lambda cid: DeploymentHistory.deployment_id.in_(_course_deployment_ids(cid))),
+    CascadeStep("course_content_deployments", CourseContentDeployment,
+                lambda cid: CourseContentDeployment.course_content_id.in_(_course_content_ids(cid))),
+    CascadeStep("course_contents", CourseContent,
+                lambda cid: CourseContent.course_id == cid),
+    CascadeStep("course_content_types", CourseContentType,
+                lambda cid: CourseContentType.course_id == cid),
+    CascadeStep("course_member_comments", CourseMemberComment,
+                lambda cid: or_(
+                    CourseMemberComment.transmitter_id.in_(_course_member_ids(cid)),
+                    CourseMemberComment.course_member_id.in_(_course_member_ids(cid)),
+                )),
+    CascadeStep("course_members", CourseMember,
+                lambda cid: CourseMember.course_id == cid),
+    CascadeStep("course_groups", CourseGroup,
+                lambda cid: CourseGroup.course_id == cid),
+    CascadeStep("messages", Message,
+                lambda cid: Message.course_id == cid),
+    CascadeStep("courses", Course,
+                lambda cid: Course.id == cid),
+]
+
+COURSE_FAMILY_CASCADE_STEPS: List[CascadeStep] = [
+    CascadeStep("messages", Message,
+                lambda fid: Message.course_family_id == fid),
+    CascadeStep("course_families", CourseFamily,
+                lambda fid: CourseFamily.id == fid),
+]
+
+ORGANIZATION_CASCADE_STEPS: List[CascadeStep] = [
+    CascadeStep("example_dependencies", ExampleDependency,
+                lambda oid: or_(
+                    ExampleDependency.example_id.in_(_organization_example_ids(oid)),
+                    ExampleDependency.depends_id.in_(_organization_example_ids(oid)),
+                )),
+    CascadeStep("example_versions", ExampleVersion,
+                lambda oid: ExampleVersion.example_id.in_(_organization_example_ids(oid)),
+                _example_version_objects),
+    CascadeStep("examples", Example,
+                lambda oid: Example.id.in_(_organization_example_ids(oid))),
+    CascadeStep("example_repositories", ExampleRepository,
+                lambda oid: ExampleRepository.organization_id == oid),
+    CascadeStep("student_profiles", StudentProfile,
+                lambda oid: StudentProfile.organization_id == oid),
+    CascadeStep("messages", Message,
+                lambda oid: Message.organization_id == oid),
+    CascadeStep("organizations", Organization,
+                lambda oid: Organization.id == oid),
+]
+
+CASCADE_STEPS: Dict[str, List[CascadeStep]] = {
+    "course": COURSE_CASCADE_STEPS,
+    "course_family": COURSE_FAMILY_CASCADE_STEPS,
+    "organization": ORGANIZATION_CASCADE_STEPS,
+}
+
+
+def get_cascade_step(scope: str, name: str) -> CascadeStep:
+    """Look up a step of a scope by its count field name."""
+    for step in CASCADE_STEPS[scope]:
+        if step.name == name:
+            return step
+    raise ValueError(f"Unknown cascade step '{name}' for {scope}")
+
+
+def count_cascade_scope(db: Session, scope: str, scope_id: str) -> EntityDeleteCount:
+    """
+    Count the rows each step of a scope would delete.
+
+    Every count is one ``COUNT(*)`` with the step's own filter, so the
+    descendant ids are resolved by subqueries in the database instead of
+    being loaded into Python.
+
+    Args:
+        db: Database session
+        scope: "course", "course_family" or "organization"
+        scope_id: ID of the scope's root entity
+
+    Returns:
+        EntityDeleteCount with one field per step
+    """
+    counts = EntityDeleteCount()
+    for step in CASCADE_STEPS[scope]:
+        count = db.execute(
+            select(func.count()).select_from(step.model).where(step.where(scope_id))
+        ).scalar()
+        setattr(counts, step.name, count or 0)
+    return counts
+
 
-    return ids
+def count_cascade_plan(db: Session, plan: List[Tuple[str, str]]) -> EntityDeleteCount:
+    """Sum ``count_cascade_scope`` over all scopes of a plan."""
+    total = EntityDeleteCount()
+    for scope, scope_id in plan:
+        counts = count_cascade_scope(db, scope, scope_id)
+        for step in CASCADE_STEPS[scope]:
+            setattr(total, step.name, getattr(total, step.name) + getattr(counts, step.name))
+    return total
 
 
 def count_course_entities(db: Session, course_id: str) -> EntityDeleteCount:
@@ -138,95 +293,231 @@ def count_course_entities(db: Session, course_id: str) -> EntityDeleteCount:
     Returns:
         EntityDeleteCount with counts of each entity type
     """
-    counts = EntityDeleteCount()
+    return count_cascade_scope(db, "course", str(course_id))
 
-    # Count course members
-    counts.course_members = db.query(CourseMember).filter(
-        CourseMember.course_id == course_id
-    ).count()
 
-    # Count course groups
-    counts.course_groups = db.query(CourseGroup).filter(
-        CourseGroup.course_id == course_id
-    ).count()
+def plan_cascade_deletion(db: Session, entity_type: str, entity_id: str) -> List[Tuple[str, str]]:
+    """
+    Resolve the scopes to delete, in order, for a root entity.
 
-    # Count course content types
-    counts.course_content_types = db.query(CourseContentType).filter(
-        CourseContentType.course_id == course_id
-    ).count()
+    Courses come first, then course families, then the organization, so
+    each scope's steps only ever find rows that nothing else references.
 
-    # Count course contents
-    course_content_ids = [
-        str(c.id) for c in
-        db.query(CourseContent.id).filter(CourseContent.course_id == course_id).all()
-    ]
-    counts.course_contents = len(course_content_ids)
+    Args:
+        db: Database session
+        entity_type: "course", "course_family" or "organization"
+        entity_id: ID of the root entity
 
-    # Count submission groups
-    counts.submission_groups = db.query(SubmissionGroup).filter(
-        SubmissionGroup.course_id == course_id
-    ).count()
+    Returns:
+        List of (scope, scope_id) tuples
+    """
+    entity_id = str(entity_id)
 
-    if course_content_ids:
-        # Count results
-        counts.results = db.query(Result).filter(
-            Result.course_content_id.in_(course_content_ids)
-        ).count()
+    if entity_type == "course":
+        return [("course", entity_id)]
 
-        # Count course content deployments
-        counts.course_content_deployments = db.query(CourseContentDeployment).filter(
-            CourseContentDeployment.course_content_id.in_(course_content_ids)
-        ).count()
+    if entity_type == "course_family":
+        course_ids = db.query(Course.id).filter(
+            Course.course_family_id == entity_id
+        ).order_by(Course.id).all()
+        return [("course", str(c.id)) for c in course_ids] + [("course_family", entity_id)]
 
-    # Count submission group members
-    submission_group_ids = [
-        str(sg.id) for sg in
-        db.query(SubmissionGroup.id).filter(SubmissionGroup.course_id == course_id).all()
-    ]
-    if submission_group_ids:
-        counts.submission_group_members = db.query(SubmissionGroupMember).filter(
-            SubmissionGroupMember.submission_group_id.in_(submission_group_ids)
-        ).count()
+    if entity_type == "organization":
+        family_ids = select(CourseFamily.id).where(CourseFamily.organization_id == entity_id)
+        course_ids = db.query(Course.id).filter(
+            or_(
+                Course.organization_id == entity_id,
+                Course.course_family_id.in_(family_ids),
+            )
+        ).order_by(Course.id).all()
+        families = db.query(CourseFamily.id).filter(
+            CourseFamily.organization_id == entity_id
+        ).order_by(CourseFamily.id).all()
+        return (
+            [("course", str(c.id)) for c in course_ids]
+            + [("course_family", str(f.id)) for f in families]
+            + [("organization", entity_id)]
+        )
 
-        # Count submission artifacts
-        counts.submission_artifacts = db.query(SubmissionArtifact).filter(
-            SubmissionArtifact.submission_group_id.in_(submission_group_ids)
-        ).count()
+    raise ValueError(f"Unsupported cascade entity type: {entity_type}")
 
-        # Count submission grades and reviews
-        artifact_ids = [
-            str(a.id) for a in
-            db.query(SubmissionArtifact.id).filter(
-                SubmissionArtifact.submission_group_id.in_(submission_group_ids)
-            ).all()
-        ]
-        if artifact_ids:
-            counts.submission_grades = db.query(SubmissionGrade).filter(
-                SubmissionGrade.artifact_id.in_(artifact_ids)
-            ).count()
-            counts.submission_reviews = db.query(SubmissionReview).filter(
-                SubmissionReview.artifact_id.in_(artifact_ids)
-            ).count()
 
-    # Count course member comments
-    course_member_ids = [
-        str(m.id) for m in
-        db.query(CourseMember.id).filter(CourseMember.course_id == course_id).all()
+def _select_chunk(
+    db: Session,
+    step: CascadeStep,
+    scope_id: str,
+    chunk_size: int,
+) -> Tuple[List[Any], List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """Pick the next chunk of a step and the storage objects its rows own (blocking)."""
+    model = step.model
+    ids = [
+        row[0] for row in db.execute(
+            select(model.id).where(step.where(scope_id)).order_by(model.id).limit(chunk_size)
+        ).all()
     ]
-    if course_member_ids:
-        counts.course_member_comments = db.query(CourseMemberComment).filter(
-            or_(
-                CourseMemberComment.transmitter_id.in_(course_member_ids),
-                CourseMemberComment.course_member_id.in_(course_member_ids)
-            )
-        ).count()
+    if not ids:
+        db.rollback()
+        return [], [], []
+    if step.objects is None:
+        return ids, [], []
+    keys, prefixes = step.objects(db, ids)
+    return ids, keys, prefixes
 
-    # Count messages targeted to this course
-    counts.messages = db.query(Message).filter(
-        Message.course_id == course_id
-    ).count()
 
-    return counts
+def _delete_chunk_rows(db: Session, model, ids: List[Any]) -> int:
+    """Delete the rows of a chunk and commit (blocking)."""
+    try:
+        deleted = db.query(model).filter(model.id.in_(ids)).delete(synchronize_session=False)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return deleted
+
+
+async def delete_cascade_chunk(
+    db: Session,
+    step: CascadeStep,
+    scope_id: str,
+    storage: StorageService,
+    chunk_size: int = CASCADE_CHUNK_SIZE,
+) -> Tuple[int, int]:
+    """
+    Delete one chunk of a step in its own short transaction.
+
+    Storage objects are removed before the rows: if the process dies in
+    between, the rows (and therefore the object references) are still
+    there and the next run removes the objects again, which is a no-op.
+
+    Returns:
+        (rows_deleted, objects_deleted)
+    """
+    ids, keys, prefixes = await asyncio.to_thread(_select_chunk, db, step, scope_id, chunk_size)
+    if not ids:
+        return 0, 0
+
+    objects_deleted = 0
+    if step.objects is not None:
+        objects_deleted += await remove_objects_by_bucket(keys, storage)
+        objects_deleted += await remove_objects_by_prefix(prefixes, storage)
+
+    deleted = await asyncio.to_thread(_delete_chunk_rows, db, step.model, ids)
+    return deleted, objects_deleted
+
+
+async def run_cascade_step(
+    db: Session,
+    step: CascadeStep,
+    scope_id: str,
+    storage: StorageService,
+    chunk_size: int = CASCADE_CHUNK_SIZE,
+    max_chunks: Optional[int] = None,
+) -> Tuple[int, int, bool]:
+    """
+    Delete a step chunk by chunk until no rows are left (or max_chunks ran).
+
+    Returns:
+        (rows_deleted, objects_deleted, done)
+    """
+    rows_deleted = 0
+    objects_deleted = 0
+    chunks = 0
+
+    while max_chunks is None or chunks < max_chunks:
+        deleted, removed = await delete_cascade_chunk(db, step, scope_id, storage, chunk_size)
+        chunks += 1
+        rows_deleted += deleted
+        objects_deleted += removed
+        if deleted < chunk_size:
+            return rows_deleted, objects_deleted, True
+
+    return rows_deleted, objects_deleted, False
+
+
+async def execute_cascade_plan(
+    db: Session,
+    plan: List[Tuple[str, str]],
+    storage: StorageService,
+    chunk_size: int = CASCADE_CHUNK_SIZE,
+) -> Tuple[EntityDeleteCount, int, List[str]]:
+    """
+    Run all steps of a plan inline.
+
+    Stops at the first failing chunk. Chunks committed before the failure
+    stay deleted; running the plan again resumes where it stopped.
+
+    Returns:
+        (deleted counts, MinIO objects deleted, errors)
+    """
+    counts = EntityDeleteCount()
+    minio_deleted = 0
+
+    for scope, scope_id in plan:
+        for step in CASCADE_STEPS[scope]:
+            try:
+                rows, objects, _ = await run_cascade_step(db, step, scope_id, storage, chunk_size)
+            except Exception as e:
+                logger.error(f"Error deleting {step.name} of {scope} {scope_id}: {e}")
+                return counts, minio_deleted, [f"Database error: {str(e)}"]
+            setattr(counts, step.name, getattr(counts, step.name) + rows)
+            minio_deleted += objects
+
+    return counts, minio_deleted, []
+
+
+async def submit_cascade_deletion(
+    entity_type: str,
+    entity_id: str,
+    created_by: str,
+    organization_id: Optional[str] = None,
+    course_id: Optional[str] = None,
+) -> CascadeDeleteResult:
+    """
+    Start a background ``CascadeDeletionWorkflow``.
+
+    Nothing is counted up front: the workflow plans the deletion and
+    reports per-entity counts through its ``progress`` query.
+
+    Args:
+        entity_type: "course", "course_family" or "organization"
+        entity_id: ID of the root entity
+        created_by: User ID submitting the deletion
+        organization_id: Organization the entity belongs to (for task listing)
+        course_id: Course being deleted, if any (for task listing)
+
+    Returns:
+        A result carrying the workflow ID and empty counts
+    """
+    from ..task_tracker import get_task_tracker
+    from computor_types.tasks import TaskSubmission
+
+    entity_id = str(entity_id)
+    task_tracker = await get_task_tracker()
+    workflow_id = await task_tracker.submit_and_track_task(
+        task_submission=TaskSubmission(
+            task_name="CascadeDeletionWorkflow",
+            parameters={
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+            },
+            queue="computor-tasks",
+        ),
+        created_by=created_by,
+        course_id=course_id,
+        organization_id=organization_id,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        description=f"Deleting {entity_type.replace('_', ' ')} {entity_id}",
+    )
+    logger.info(f"Submitted cascade deletion of {entity_type} {entity_id}: {workflow_id}")
+
+    return CascadeDeleteResult(
+        dry_run=False,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        deleted_counts=EntityDeleteCount(),
+        workflow_id=workflow_id,
+    )
 
 
 async def delete_course_cascade(
@@ -255,6 +546,10 @@ async def delete_course_cascade(
     14. Message
     15. Course
 
+    Each step runs in chunks of ``CASCADE_CHUNK_SIZE`` rows (see
+    ``COURSE_CASCADE_STEPS``); for large courses prefer the background
+    ``CascadeDeletionWorkflow``.
+
     Args:
         db: Database session
         course_id: The course ID to delete
@@ -278,159 +573,27 @@ async def delete_course_cascade(
             errors=[f"Course not found: {course_id}"]
         )
 
-    # Count entities
-    counts = count_course_entities(db, course_id)
+    plan = plan_cascade_deletion(db, "course", course_id)
 
     if dry_run:
         return CascadeDeleteResult(
             dry_run=True,
             entity_type="course",
             entity_id=str(course_id),
-            deleted_counts=counts,
+            deleted_counts=count_cascade_plan(db, plan),
             minio_objects_deleted=0,
             errors=[]
         )
 
-    # Collect IDs for MinIO cleanup before deletion
-    entity_ids = collect_course_entity_ids(db, course_id)
-    artifact_storage_info = collect_artifact_storage_info(db, entity_ids.submission_group_ids)
-
-    errors = []
-    minio_deleted = 0
-
-    try:
-        # Get all submission artifact IDs for this course
-        submission_artifact_ids = [
-            str(a.id) for a in
-            db.query(SubmissionArtifact.id).filter(
-                SubmissionArtifact.submission_group_id.in_(entity_ids.submission_group_ids)
-            ).all()
-        ] if entity_ids.submission_group_ids else []
-
-        # 1. Delete SubmissionGrade (RESTRICT on CourseMember)
-        if submission_artifact_ids:
-            db.query(SubmissionGrade).filter(
-                SubmissionGrade.artifact_id.in_(submission_artifact_ids)
-            ).delete(synchronize_session=False)
-
-            # 2. Delete SubmissionReview (RESTRICT on CourseMember)
-            db.query(SubmissionReview).filter(
-                SubmissionReview.artifact_id.in_(submission_artifact_ids)
-            ).delete(synchronize_session=False)
-
-        # 3. Delete ResultArtifact and Result (RESTRICT on CourseMember, CourseContentType)
-        if entity_ids.result_ids:
-            db.query(ResultArtifact).filter(
-                ResultArtifact.result_id.in_(entity_ids.result_ids)
-            ).delete(synchronize_session=False)
-
-            db.query(Result).filter(
-                Result.id.in_(entity_ids.result_ids)
-            ).delete(synchronize_session=False)
-
-        # 4. Delete SubmissionArtifact
-        if entity_ids.submission_group_ids:
-            db.query(SubmissionArtifact).filter(
-                SubmissionArtifact.submission_group_id.in_(entity_ids.submission_group_ids)
-            ).delete(synchronize_session=False)
-
-            # 5. Delete SubmissionGroupMember (RESTRICT on CourseMember)
-            db.query(SubmissionGroupMember).filter(
-                SubmissionGroupMember.submission_group_id.in_(entity_ids.submission_group_ids)
-            ).delete(synchronize_session=False)
-
-            # 6. Delete SubmissionGroup
-            db.query(SubmissionGroup).filter(
-                SubmissionGroup.id.in_(entity_ids.submission_group_ids)
-            ).delete(synchronize_session=False)
-
-        # 7-8. Delete DeploymentHistory and CourseContentDeployment
-        if entity_ids.course_content_ids:
-            deployment_ids = [
-                str(d.id) for d in
-                db.query(CourseContentDeployment.id).filter(
-                    CourseContentDeployment.course_content_id.in_(entity_ids.course_content_ids)
-                ).all()
-            ]
-            if deployment_ids:
-                db.query(DeploymentHistory).filter(
-                    DeploymentHistory.deployment_id.in_(deployment_ids)
-                ).delete(synchronize_session=False)
-
-                db.query(CourseContentDeployment).filter(
-                    CourseContentDeployment.id.in_(deployment_ids)
-                ).delete(synchronize_session=False)
-
-            # 9. Delete CourseContent
-            db.query(CourseContent).filter(
-                CourseContent.id.in_(entity_ids.course_content_ids)
-            ).delete(synchronize_session=False)
-
-        # 10. Delete CourseContentType
-        if entity_ids.course_content_type_ids:
-            db.query(CourseContentType).filter(
-                CourseContentType.id.in_(entity_ids.course_content_type_ids)
-            ).delete(synchronize_session=False)
-
-        # 11. Delete CourseMemberComment
-        if entity_ids.course_member_ids:
-            db.query(CourseMemberComment).filter(
-                or_(
-                    CourseMemberComment.transmitter_id.in_(entity_ids.course_member_ids),
-                    CourseMemberComment.course_member_id.in_(entity_ids.course_member_ids)
-                )
-            ).delete(synchronize_session=False)
-
-            # 12. Delete CourseMember
-            db.query(CourseMember).filter(
-                CourseMember.id.in_(entity_ids.course_member_ids)
-            ).delete(synchronize_session=False)
-
-        # 13. Delete CourseGroup
-        if entity_ids.course_group_ids:
-            db.query(CourseGroup).filter(
-                CourseGroup.id.in_(entity_ids.course_group_ids)
-            ).delete(synchronize_session=False)
-
-        # 14. Delete Message (targeted to course)
-        db.query(Message).filter(
-            Message.course_id == course_id
-        ).delete(synchronize_session=False)
-
-        # 15. Delete Course
-        db.query(Course).filter(Course.id == course_id).delete(synchronize_session=False)
-
-        # Commit database changes
-        db.commit()
-        counts.courses = 1
-
+    deleted_counts, minio_deleted, errors = await execute_cascade_plan(db, plan, storage)
+    if not errors:
         logger.info(f"Deleted course {course_id} and all descendant data")
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Error deleting course {course_id}: {e}")
-        errors.append(f"Database error: {str(e)}")
-        return CascadeDeleteResult(
-            dry_run=False,
-            entity_type="course",
-            entity_id=str(course_id),
-            deleted_counts=EntityDeleteCount(),
-            errors=errors
-        )
-
-    # Clean up MinIO storage (after successful DB commit)
-    try:
-        minio_deleted += await cleanup_submission_artifacts_batch(artifact_storage_info, storage)
-        minio_deleted += await cleanup_results_batch(entity_ids.result_ids, storage)
-    except Exception as e:
-        logger.warning(f"MinIO cleanup error for course {course_id}: {e}")
-        errors.append(f"MinIO cleanup error: {str(e)}")
-
     return CascadeDeleteResult(
         dry_run=False,
         entity_type="course",
         entity_id=str(course_id),
-        deleted_counts=counts,
+        deleted_counts=deleted_counts,
         minio_objects_deleted=minio_deleted,
         errors=errors
     )
@@ -468,81 +631,28 @@ async def delete_course_family_cascade(
             errors=[f"Course family not found: {course_family_id}"]
         )
 
-    # Get all courses in this family
-    courses = db.query(Course).filter(Course.course_family_id == course_family_id).all()
-    course_ids = [str(c.id) for c in courses]
-
-    # Aggregate counts from all courses
-    total_counts = EntityDeleteCount()
-    total_counts.course_families = 1
-    total_counts.courses = len(course_ids)
-
-    for course_id in course_ids:
-        course_counts = count_course_entities(db, course_id)
-        total_counts.course_members += course_counts.course_members
-        total_counts.course_groups += course_counts.course_groups
-        total_counts.course_content_types += course_counts.course_content_types
-        total_counts.course_contents += course_counts.course_contents
-        total_counts.submission_groups += course_counts.submission_groups
-        total_counts.submission_group_members += course_counts.submission_group_members
-        total_counts.submission_artifacts += course_counts.submission_artifacts
-        total_counts.submission_grades += course_counts.submission_grades
-        total_counts.submission_reviews += course_counts.submission_reviews
-        total_counts.results += course_counts.results
-        total_counts.course_content_deployments += course_counts.course_content_deployments
-        total_counts.course_member_comments += course_counts.course_member_comments
-        total_counts.messages += course_counts.messages
-
-    # Count messages targeted to the family
-    family_messages = db.query(Message).filter(
-        Message.course_family_id == course_family_id
-    ).count()
-    total_counts.messages += family_messages
+    plan = plan_cascade_deletion(db, "course_family", course_family_id)
 
     if dry_run:
         return CascadeDeleteResult(
             dry_run=True,
             entity_type="course_family",
             entity_id=str(course_family_id),
-            deleted_counts=total_counts,
+            deleted_counts=count_cascade_plan(db, plan),
             minio_objects_deleted=0,
             errors=[]
         )
 
-    errors = []
-    total_minio_deleted = 0
-
-    # Delete all courses first
-    for course_id in course_ids:
-        result = await delete_course_cascade(db, course_id, storage, dry_run=False)
-        total_minio_deleted += result.minio_objects_deleted
-        errors.extend(result.errors)
-
-    # Delete family-scoped messages
-    try:
-        db.query(Message).filter(
-            Message.course_family_id == course_family_id
-        ).delete(synchronize_session=False)
-
-        # Delete the course family
-        db.query(CourseFamily).filter(
-            CourseFamily.id == course_family_id
-        ).delete(synchronize_session=False)
-
-        db.commit()
+    deleted_counts, minio_deleted, errors = await execute_cascade_plan(db, plan, storage)
+    if not errors:
         logger.info(f"Deleted course family {course_family_id}")
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Error deleting course family {course_family_id}: {e}")
-        errors.append(f"Database error: {str(e)}")
-
     return CascadeDeleteResult(
         dry_run=False,
         entity_type="course_family",
         entity_id=str(course_family_id),
-        deleted_counts=total_counts,
-        minio_objects_deleted=total_minio_deleted,
+        deleted_counts=deleted_counts,
+        minio_objects_deleted=minio_deleted,
         errors=errors
     )
 
@@ -585,174 +695,28 @@ async def delete_organization_cascade(
             errors=[f"Organization not found: {organization_id}"]
         )
 
-    # Get all course families
-    families = db.query(CourseFamily).filter(
-        CourseFamily.organization_id == organization_id
-    ).all()
-    family_ids = [str(f.id) for f in families]
-
-    # Get all courses directly under organization (shouldn't happen normally, but safe)
-    direct_courses = db.query(Course).filter(
-        Course.organization_id == organization_id,
-        ~Course.course_family_id.in_(family_ids) if family_ids else True
-    ).all()
-
-    # Get example repositories
-    example_repos = db.query(ExampleRepository).filter(
-        ExampleRepository.organization_id == organization_id
-    ).all()
-
-    # Initialize total counts
-    total_counts = EntityDeleteCount()
-
-    # Count course family data
-    for family_id in family_ids:
-        family_result = await delete_course_family_cascade(
-            db, family_id, storage, dry_run=True
-        )
-        total_counts.course_families += 1
-        total_counts.courses += family_result.deleted_counts.courses
-        total_counts.course_members += family_result.deleted_counts.course_members
-        total_counts.course_groups += family_result.deleted_counts.course_groups
-        total_counts.course_content_types += family_result.deleted_counts.course_content_types
-        total_counts.course_contents += family_result.deleted_counts.course_contents
-        total_counts.submission_groups += family_result.deleted_counts.submission_groups
-        total_counts.submission_group_members += family_result.deleted_counts.submission_group_members
-        total_counts.submission_artifacts += family_result.deleted_counts.submission_artifacts
-        total_counts.submission_grades += family_result.deleted_counts.submission_grades
-        total_counts.submission_reviews += family_result.deleted_counts.submission_reviews
-        total_counts.results += family_result.deleted_counts.results
-        total_counts.course_content_deployments += family_result.deleted_counts.course_content_deployments
-        total_counts.course_member_comments += family_result.deleted_counts.course_member_comments
-        total_counts.messages += family_result.deleted_counts.messages
-
-    # Count example repositories and their examples
-    total_counts.example_repositories = len(example_repos)
-    for repo in example_repos:
-        examples = db.query(Example).filter(Example.example_repository_id == repo.id).all()
-        total_counts.examples += len(examples)
-        for ex in examples:
-            versions = db.query(ExampleVersion).filter(ExampleVersion.example_id == ex.id).all()
-            total_counts.example_versions += len(versions)
-            deps = db.query(ExampleDependency).filter(ExampleDependency.example_id == ex.id).count()
-            total_counts.example_dependencies += deps
-
-    # Count student profiles
-    total_counts.student_profiles = db.query(StudentProfile).filter(
-        StudentProfile.organization_id == organization_id
-    ).count()
-
-    # Count org-level messages
-    org_messages = db.query(Message).filter(
-        Message.organization_id == organization_id
-    ).count()
-    total_counts.messages += org_messages
+    plan = plan_cascade_deletion(db, "organization", organization_id)
 
     if dry_run:
         return CascadeDeleteResult(
             dry_run=True,
             entity_type="organization",
             entity_id=str(organization_id),
-            deleted_counts=total_counts,
+            deleted_counts=count_cascade_plan(db, plan),
             minio_objects_deleted=0,
             errors=[]
         )
 
-    errors = []
-    total_minio_deleted = 0
-
-    # Delete all course families (which deletes all courses)
-    for family_id in family_ids:
-        result = await delete_course_family_cascade(db, family_id, storage, dry_run=False)
-        total_minio_deleted += result.minio_objects_deleted
-        errors.extend(result.errors)
-
-    # Delete any direct courses (edge case)
-    for course in direct_courses:
-        result = await delete_course_cascade(db, str(course.id), storage, dry_run=False)
-        total_minio_deleted += result.minio_objects_deleted
-        errors.extend(result.errors)
-
-    try:
-        # Delete example versions and their storage, then examples and repos
-        for repo in example_repos:
-            # Use source_url as bucket name
-            if not repo.source_url:
-                raise ValueError(f"Repository {repo.id} has no source_url (bucket name)")
-            bucket = repo.source_url
-
-            examples = db.query(Example).filter(Example.example_repository_id == repo.id).all()
-            for ex in examples:
-                versions = db.query(ExampleVersion).filter(ExampleVersion.example_id == ex.id).all()
-                version_storage = []
-                for v in versions:
-                    if v.storage_path:
-                        version_storage.append((v.storage_path, bucket))
-
-                # Clean up storage for versions
-                if version_storage:
-                    minio_deleted = await cleanup_example_versions_batch(version_storage, storage)
-                    total_minio_deleted += minio_deleted
-
-        # Delete example dependencies first (CASCADE on both sides)
-        example_ids = [
-            str(ex.id) for repo in example_repos
-            for ex in db.query(Example.id).filter(Example.example_repository_id == repo.id).all()
-        ]
-        if example_ids:
-            db.query(ExampleDependency).filter(
-                or_(
-                    ExampleDependency.example_id.in_(example_ids),
-                    ExampleDependency.depends_id.in_(example_ids)
-                )
-            ).delete(synchronize_session=False)
-
-            # Delete example versions
-            db.query(ExampleVersion).filter(
-                ExampleVersion.example_id.in_(example_ids)
-            ).delete(synchronize_session=False)
-
-            # Delete examples
-            db.query(Example).filter(
-                Example.id.in_(example_ids)
-            ).delete(synchronize_session=False)
-
-        # Delete example repositories
-        repo_ids = [str(r.id) for r in example_repos]
-        if repo_ids:
-            db.query(ExampleRepository).filter(
-                ExampleRepository.id.in_(repo_ids)
-            ).delete(synchronize_session=False)
-
-        # Delete student profiles
-        db.query(StudentProfile).filter(
-            StudentProfile.organization_id == organization_id
-        ).delete(synchronize_session=False)
-
-        # Delete organization-level messages
-        db.query(Message).filter(
-            Message.organization_id == organization_id
-        ).delete(synchronize_session=False)
-
-        # Delete the organization
-        db.query(Organization).filter(
-            Organization.id == organization_id
-        ).delete(synchronize_session=False)
-
-        db.commit()
+    deleted_counts, minio_deleted, errors = await execute_cascade_plan(db, plan, storage)
+    if not errors:
         logger.info(f"Deleted organization {organization_id} and all descendant data")
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Error deleting organization {organization_id}: {e}")
-        errors.append(f"Database error: {str(e)}")
-
     return CascadeDeleteResult(
         dry_run=False,
         entity_type="organization",
         entity_id=str(organization_id),
-        deleted_counts=total_counts,
-        minio_objects_deleted=total_minio_deleted,
+        deleted_counts=deleted_counts,
+        minio_objects_deleted=minio_deleted,
         errors=errors
     )
 
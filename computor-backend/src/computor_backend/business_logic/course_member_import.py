@@ -1,9 +1,13 @@
 """Business logic for course member import."""
 import logging
-from typing import Optional, Tuple
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple, Union
 from uuid import UUID
+from pydantic import ValidationError
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
+from starlette.concurrency import run_in_threadpool
 
 from computor_backend.model.auth import User, StudentProfile
 from computor_backend.model.course import Course, CourseMember, CourseGroup
@@ -12,8 +16,11 @@ from computor_backend.permissions.core import check_course_permissions
 from computor_backend.exceptions import ForbiddenException, BadRequestException
 
 from computor_types.course_member_import import (
+    CourseMemberBulkImportSummary,
     CourseMemberImportRequest,
     CourseMemberImportResponse,
+    CourseMemberImportRowResult,
+    ImportStatus,
 )
 from computor_types.course_members import CourseMemberGet
 from computor_types.course_groups import CourseGroupGet
@@ -35,6 +42,37 @@ async def trigger_post_create_for_member(
     return await course_member_post_create(course_member, db, permissions)
 
 
+def get_importable_course(
+    course_id: str | UUID,
+    permissions: Principal,
+    db: Session,
+) -> Tuple[Course, str]:
+    """Load the target course of an import and the importer's course role.
+
+    Raises:
+        ForbiddenException: If the user is not lecturer or higher in the course
+    """
+    # Validate course exists and user has permissions (lecturer role or higher)
+    course = check_course_permissions(permissions, Course, "_lecturer", db).filter(
+        Course.id == course_id
+    ).first()
+
+    if not course:
+        raise ForbiddenException(
+            "You don't have permission to import course members. "
+            "Lecturer role or higher is required."
+        )
+
+    user_role = permissions.get_highest_course_role(str(course_id))
+
+    if not user_role:
+        raise ForbiddenException(
+            "You don't have a role in this course"
+        )
+
+    return course, user_role
+
+
 async def import_course_member(
     course_id: str | UUID,
     member_request: CourseMemberImportRequest,
@@ -57,26 +95,11 @@ async def import_course_member(
     Raises:
         ForbiddenException: If user lacks permissions
     """
-    # Validate course exists and user has permissions (lecturer role or higher)
-    course = check_course_permissions(permissions, Course, "_lecturer", db).filter(
-        Course.id == course_id
-    ).first()
-
-    if not course:
-        raise ForbiddenException(
-            "You don't have permission to import course members. "
-            "Lecturer role or higher is required."
-        )
+    course, user_role = get_importable_course(course_id, permissions, db)
 
     # Validate role assignment - user can only assign roles at or below their own level
-    user_role = permissions.get_highest_course_role(str(course_id))
     target_role = member_request.course_role_id
 
-    if not user_role:
-        raise ForbiddenException(
-            "You don't have a role in this course"
-        )
-
     if not course_role_hierarchy.can_assign_role(user_role, target_role):
         raise ForbiddenException(
             error_code="AUTHZ_005",
@@ -371,3 +394,418 @@ def _get_or_create_course_group(
     logger.info(f"Created course group: {group_title}")
 
     return new_group
+
+
+# ---------------------------------------------------------------------------
+# Bulk import
+# ---------------------------------------------------------------------------
+
+# Roster rows per transaction. Each chunk resolves users, groups and
+# existing members with a handful of IN queries and commits once.
+BULK_IMPORT_CHUNK_SIZE = 200
+
+
+@dataclass
+class _BulkImportState:
+    """State carried across the chunks of one bulk import."""
+    course_id: str
+    user_role: str
+    permissions: Principal
+    username_strategy: str
+    seen_emails: Set[str] = field(default_factory=set)
+    group_ids: Dict[str, str] = field(default_factory=dict)
+    to_provision: List[str] = field(default_factory=list)
+    summary: CourseMemberBulkImportSummary = field(default_factory=CourseMemberBulkImportSummary)
+
+
+def _failed_row(index: int, email: Optional[str], message: str) -> CourseMemberImportRowResult:
+    return CourseMemberImportRowResult(
+        row=index, email=email, status=ImportStatus.FAILED, message=message
+    )
+
+
+def _parse_row(raw: Any) -> CourseMemberImportRequest:
+    """Validate a roster row; blank CSV cells fall back to the field defaults."""
+    if isinstance(raw, CourseMemberImportRequest):
+        return raw
+    return CourseMemberImportRequest.model_validate(
+        {k: v for k, v in raw.items() if v not in ("", None)}
+    )
+
+
+def _resolve_users(
+    rows: List[Tuple[int, CourseMemberImportRequest, str]],
+    username_strategy: str,
+    db: Session,
+) -> Dict[str, User]:
+    """Find or create the users of a chunk with set-based lookups.
+
+    Mirrors ``_find_or_create_user``: users are matched case-insensitively
+    by ``User.email``, then by ``StudentProfile.student_email``; the rest
+    are created.
+
+    Returns:
+        Mapping of normalized email to User
+    """
+    from computor_backend.utils.username_generation import generate_usernames_from_names
+
+    emails = [email for _, _, email in rows]
+    users: Dict[str, User] = {
+        user.email.lower(): user
+        for user in db.query(User).filter(func.lower(User.email).in_(emails)).all()
+    }
+
+    missing = [email for email in emails if email not in users]
+    if missing:
+        profiles = (
+            db.query(StudentProfile)
+            .options(joinedload(StudentProfile.user))
+            .filter(func.lower(StudentProfile.student_email).in_(missing))
+            .all()
+        )
+        for profile in profiles:
+            users.setdefault(profile.student_email.lower(), profile.user)
+
+    new_rows = [(request, email) for _, request, email in rows if email not in users]
+    if not new_rows:
+        return users
+
+    if username_strategy == "name":
+        usernames = generate_usernames_from_names(
+            [(request.given_name, request.family_name) for request, _ in new_rows], db
+        )
+        for (request, email), username in zip(new_rows, usernames):
+            users[email] = _new_user(request, email, username)
+            db.add(users[email])
+        db.flush()
+    else:
+        # Email-based names are probed against the DB, so flush each user
+        # before generating the next one.
+        for request, email in new_rows:
+            users[email] = _new_user(request, email, _generate_username_from_email(email, db))
+            db.add(users[email])
+            db.flush()
+
+    logger.info(f"Created {len(new_rows)} users during bulk import")
+    return users
+
+
+def _new_user(request: CourseMemberImportRequest, email: str, username: str) -> User:
+    return User(
+        email=email,
+        username=username,
+        given_name=request.given_name.strip() if request.given_name else None,
+        family_name=request.family_name.strip() if request.family_name else None,
+    )
+
+
+def _import_chunk(
+    state: _BulkImportState,
+    chunk: List[Tuple[int, Any]],
+    db: Session,
+) -> Tuple[List[CourseMemberImportRowResult], List[str], Set[str]]:
+    """Import one chunk of roster rows (flushes, does not commit).
+
+    Returns:
+        ``(row_results, course_member_ids_to_provision, touched_user_ids)``
+    """
+    course_id = state.course_id
+    permissions = state.permissions
+    results: Dict[int, CourseMemberImportRowResult] = {}
+    rows: List[Tuple[int, CourseMemberImportRequest, str]] = []
+
+    for index, raw in chunk:
+        raw_email = raw.get("email") if isinstance(raw, Mapping) else getattr(raw, "email", None)
+        if not isinstance(raw_email, str) or not raw_email.strip():
+            results[index] = _failed_row(index, None, "Email is required")
+            continue
+        try:
+            request = _parse_row(raw)
+        except ValidationError as e:
+            fields = ", ".join(".".join(str(p) for p in err["loc"]) for err in e.errors())
+            results[index] = _failed_row(index, raw_email, f"Invalid row: {fields}")
+            continue
+
+        email = request.email.strip().lower()
+        if email in state.seen_emails:
+            results[index] = _failed_row(index, email, "Duplicate email in roster")
+        elif not course_role_hierarchy.can_assign_role(state.user_role, request.course_role_id):
+            results[index] = _failed_row(
+                index, email,
+                f"You cannot assign the role '{request.course_role_id}'. "
+                f"Your role '{state.user_role}' can only assign roles at or below your privilege level.",
+            )
+        else:
+            state.seen_emails.add(email)
+            rows.append((index, request, email))
+
+    users = _resolve_users(rows, state.username_strategy, db) if rows else {}
+
+    # Resolve all group titles of the chunk at once
+    titles = {
+        request.course_group_title for _, request, _ in rows if request.course_group_title
+    } - state.group_ids.keys()
+    if titles:
+        for group in db.query(CourseGroup).filter(
+            CourseGroup.course_id == course_id,
+            CourseGroup.title.in_(titles),
+        ).all():
+            state.group_ids[group.title] = str(group.id)
+
+    existing_members: Dict[str, CourseMember] = {}
+    if users:
+        existing_members = {
+            str(member.user_id): member
+            for member in db.query(CourseMember).filter(
+                CourseMember.course_id == course_id,
+                CourseMember.user_id.in_([user.id for user in users.values()]),
+            ).all()
+        }
+
+    user_level = course_role_hierarchy.get_role_level(state.user_role)
+    touched: List[Tuple[int, str, CourseMember, ImportStatus, str, Optional[str]]] = []
+    provision: List[CourseMember] = []
+
+    for index, request, email in rows:
+        user = users[email]
+
+        if str(user.id) == permissions.user_id and not permissions.is_admin:
+            results[index] = _failed_row(
+                index, email,
+                "You cannot modify your own course role. Please contact an administrator.",
+            )
+            continue
+
+        if request.given_name and user.given_name != request.given_name:
+            user.given_name = request.given_name
+        if request.family_name and user.family_name != request.family_name:
+            user.family_name = request.family_name
+
+        created_group = None
+        course_group_id = None
+        if request.course_group_title:
+            course_group_id = state.group_ids.get(request.course_group_title)
+            if course_group_id is None and request.create_missing_group:
+                group = CourseGroup(
+                    course_id=course_id,
+                    title=request.course_group_title,
+                    description="Auto-created group during import",
+                    created_by=permissions.user_id,
+                    updated_by=permissions.user_id,
+                )
+                db.add(group)
+                db.flush()
+                course_group_id = state.group_ids[group.title] = str(group.id)
+                created_group = group.title
+                logger.info(f"Created course group: {group.title}")
+
+        member = existing_members.get(str(user.id))
+        if member:
+            current_role = member.course_role_id
+            if current_role and not permissions.is_admin:
+                if course_role_hierarchy.get_role_level(current_role) >= user_level:
+                    results[index] = _failed_row(
+                        index, email,
+                        f"You cannot modify a course member with role '{current_role}'. "
+                        f"Your role '{state.user_role}' can only modify members with lower privilege levels.",
+                    )
+                    continue
+
+            member.course_role_id = request.course_role_id
+            if course_group_id:
+                member.course_group_id = course_group_id
+            member.updated_by = permissions.user_id
+
+            if not (member.properties or {}).get('gitlab'):
+                provision.append(member)
+                message = "Course member updated and GitLab setup triggered"
+            else:
+                message = "Course member updated successfully"
+            touched.append((index, email, member, ImportStatus.UPDATED, message, created_group))
+        else:
+            member = CourseMember(
+                user_id=user.id,
+                course_id=course_id,
+                course_role_id=request.course_role_id,
+                course_group_id=course_group_id,
+                created_by=permissions.user_id,
+                updated_by=permissions.user_id,
+            )
+            db.add(member)
+            existing_members[str(user.id)] = member
+            provision.append(member)
+            touched.append((
+                index, email, member, ImportStatus.CREATED,
+                "Course member created successfully", created_group,
+            ))
+
+    db.flush()
+
+    for index, email, member, status, message, created_group in touched:
+        results[index] = CourseMemberImportRowResult(
+            row=index,
+            email=email,
+            status=status,
+            message=message,
+            course_member_id=str(member.id),
+            created_group=created_group,
+        )
+
+    return (
+        [results[index] for index in sorted(results)],
+        [str(m.id) for m in provision],
+        {str(member.user_id) for _, _, member, _, _, _ in touched},
+    )
+
+
+def _import_and_commit_chunk(
+    state: _BulkImportState,
+    chunk: List[Tuple[int, Any]],
+    db: Session,
+) -> List[CourseMemberImportRowResult]:
+    """Run ``_import_chunk`` in its own transaction.
+
+    A failing chunk is rolled back and retried row by row, each row in its
+    own transaction, so only the rows that fail on their own are reported
+    as failed; earlier chunks stay committed.
+    """
+    seen_emails = set(state.seen_emails)
+    try:
+        results, provision_ids, user_ids = _import_chunk(state, chunk, db)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        # Groups created in the rolled-back transaction no longer exist,
+        # and its rows have to be seen again by the retry.
+        state.group_ids.clear()
+        state.seen_emails = seen_emails
+        if len(chunk) > 1:
+            logger.warning(f"Bulk import chunk failed, retrying row by row: {e}")
+            return [
+                result
+                for row in chunk
+                for result in _import_and_commit_chunk(state, [row], db)
+            ]
+        index, raw = chunk[0]
+        logger.error(f"Bulk import row {index} failed: {e}", exc_info=True)
+        return [
+            _failed_row(index, raw.get("email") if isinstance(raw, Mapping) else getattr(raw, "email", None),
+                        f"Error: {e}")
+        ]
+
+    state.to_provision.extend(provision_ids)
+    _invalidate_import_views(state.course_id, user_ids)
+    return results
+
+
+def _invalidate_import_views(course_id: str, user_ids: Set[str]) -> None:
+    """Drop cached student/tutor/lecturer views affected by imported members."""
+    try:
+        from computor_backend.cache import get_cache
+
+        cache = get_cache()
+        for user_id in user_ids:
+            cache.invalidate_user_views(user_id=user_id)
+        cache.invalidate_user_views(entity_type="course_id", entity_id=course_id)
+        for view_tag in ("student_view", "tutor_view", "lecturer_view"):
+            cache.invalidate_user_views(entity_type=view_tag, entity_id=course_id)
+    except Exception as cache_err:
+        logger.warning(f"View cache invalidation after bulk import failed: {cache_err}")
+
+
+async def _aiter_rows(rows: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    if hasattr(rows, "__aiter__"):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+
+async def import_course_members_bulk(
+    course: Course,
+    user_role: str,
+    rows: Union[Iterable[Any], AsyncIterable[Any]],
+    permissions: Principal,
+    db: Session,
+    username_strategy: str = "name",
+    chunk_size: int = BULK_IMPORT_CHUNK_SIZE,
+) -> AsyncIterator[Union[CourseMemberImportRowResult, CourseMemberBulkImportSummary]]:
+    """Import a roster into a course, yielding per-row results as they commit.
+
+    Rows are consumed lazily (a streamed CSV upload is imported while it is
+    still arriving) and imported in chunks of ``chunk_size``, one
+    transaction each; a chunk that fails is retried row by row. Once all rows are in, post-create work for every new
+    or not-yet-provisioned member runs as a single batch and starts one
+    ``StudentRepositoryBatchCreationWorkflow`` for the course.
+
+    Args:
+        course: Target course, from ``get_importable_course``
+        user_role: Importer's course role, from ``get_importable_course``
+        rows: ``CourseMemberImportRequest`` objects or raw column dicts
+        permissions: Current user's permissions
+        db: Database session
+        username_strategy: Strategy for username generation ("name" or "email")
+        chunk_size: Rows per transaction
+
+    Yields:
+        One ``CourseMemberImportRowResult`` per row, then a final
+        ``CourseMemberBulkImportSummary``
+    """
+    state = _BulkImportState(
+        course_id=str(course.id),
+        user_role=user_role,
+        permissions=permissions,
+        username_strategy=username_strategy,
+    )
+    summary = state.summary
+
+    async def run_chunk(chunk):
+        for result in await run_in_threadpool(_import_and_commit_chunk, state, chunk, db):
+            summary.total += 1
+            if result.status == ImportStatus.CREATED:
+                summary.created += 1
+            elif result.status == ImportStatus.UPDATED:
+                summary.updated += 1
+            else:
+                summary.failed += 1
+            yield result
+
+    chunk: List[Tuple[int, Any]] = []
+    index = 0
+    async for raw in _aiter_rows(rows):
+        chunk.append((index, raw))
+        index += 1
+        if len(chunk) >= chunk_size:
+            async for result in run_chunk(chunk):
+                yield result
+            chunk = []
+    if chunk:
+        async for result in run_chunk(chunk):
+            yield result
+
+    if state.to_provision:
+        from computor_backend.business_logic.course_member_post_create import (
+            course_members_post_create_bulk,
+        )
+
+        try:
+            members = await run_in_threadpool(
+                lambda: db.query(CourseMember).filter(
+                    CourseMember.id.in_(state.to_provision)
+                ).all()
+            )
+            summary.workflow_id = await course_members_post_create_bulk(
+                state.course_id, members, db, permissions
+            )
+            await run_in_threadpool(db.commit)
+        except Exception as e:
+            await run_in_threadpool(db.rollback)
+            logger.error(f"Bulk post-create for course {state.course_id} failed: {e}", exc_info=True)
+            # Don't fail the import if post-create hooks fail
+
+    logger.info(
+        f"Bulk import into course {state.course_id}: {summary.created} created, "
+        f"{summary.updated} updated, {summary.failed} failed"
+    )
+    yield summary
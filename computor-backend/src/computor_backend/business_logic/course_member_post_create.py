@@ -7,8 +7,9 @@ the CRUD endpoint or the import endpoint.
 """
 
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from computor_backend.model.course import (
     CourseMember,
@@ -250,3 +251,192 @@ async def course_member_post_create(
             exc_info=True,
         )
         return None
+
+
+def _members_needing_provisioning(
+    course_members: List[CourseMember],
+    db: Session,
+) -> List[CourseMember]:
+    """Set-based ``_should_skip_service_account`` over many members."""
+    from computor_backend.model.auth import User
+    from computor_backend.model.service import Service
+
+    user_ids = {member.user_id for member in course_members}
+    service_user_ids = {
+        row[0] for row in
+        db.query(User.id).filter(User.id.in_(user_ids), User.is_service == True).all()
+    }
+    if not service_user_ids:
+        return list(course_members)
+
+    workspace_user_ids = {
+        service.user_id
+        for service in db.query(Service).filter(Service.user_id.in_(service_user_ids)).all()
+        if service.service_type and service.service_type.requires_workspace
+    }
+    skipped = service_user_ids - workspace_user_ids
+    if skipped:
+        logger.info(
+            f"Skipping post-create hooks for {len(skipped)} service accounts "
+            "(service type does not require workspace provisioning)"
+        )
+    return [m for m in course_members if m.user_id not in skipped]
+
+
+def _ensure_student_profiles(
+    course: Course,
+    course_members: List[CourseMember],
+    db: Session,
+) -> None:
+    """Set-based ``_ensure_student_profile`` for members of one course."""
+    from computor_backend.model.auth import StudentProfile, User
+
+    if not course.organization_id or not course_members:
+        return
+
+    user_ids = {member.user_id for member in course_members}
+    with_profile = {
+        row[0] for row in
+        db.query(StudentProfile.user_id).filter(
+            StudentProfile.user_id.in_(user_ids),
+            StudentProfile.organization_id == course.organization_id,
+        ).all()
+    }
+    missing = user_ids - with_profile
+    if not missing:
+        return
+
+    emails = dict(db.query(User.id, User.email).filter(User.id.in_(missing)).all())
+    db.add_all([
+        StudentProfile(
+            user_id=user_id,
+            student_email=emails.get(user_id),
+            organization_id=course.organization_id,
+            student_id=None,
+        )
+        for user_id in missing
+    ])
+    db.flush()
+    logger.info(
+        f"Created {len(missing)} StudentProfiles in organization {course.organization_id}"
+    )
+
+
+def _prepare_bulk_post_create(
+    course_id: str,
+    course_members: List[CourseMember],
+    db: Session,
+) -> Optional[Tuple[Course, List[CourseMember], Dict[str, List[str]]]]:
+    """Database part of ``course_members_post_create_bulk`` (blocking).
+
+    Returns:
+        ``(course, members_to_provision, submission_group_ids_by_member)``,
+        or None if there is nothing to provision
+    """
+    course = db.query(Course).filter(Course.id == course_id).first()
+    if not course:
+        return None
+
+    course_members = _members_needing_provisioning(course_members, db)
+    if not course_members:
+        return None
+
+    logger.info(
+        f"Running bulk post_create for {len(course_members)} members of course {course_id}"
+    )
+
+    try:
+        _ensure_student_profiles(course, course_members, db)
+    except Exception as e:
+        logger.error(f"Failed to create StudentProfiles for course {course_id}: {e}", exc_info=True)
+
+    from computor_backend.repositories.submission_group_provisioning import (
+        provision_submission_groups_for_members,
+    )
+
+    member_ids = [str(member.id) for member in course_members]
+    try:
+        groups_by_member = provision_submission_groups_for_members(course_id, member_ids, db)
+    except Exception as e:
+        logger.error(f"Failed to provision submission groups for course {course_id}: {e}")
+        groups_by_member = {}
+    return course, course_members, groups_by_member
+
+
+async def course_members_post_create_bulk(
+    course_id: str,
+    course_members: List[CourseMember],
+    db: Session,
+    permissions: Optional[Principal] = None,
+) -> Optional[str]:
+    """
+    Batched post-create hook for many members of one course.
+
+    Performs the same steps as ``course_member_post_create`` but with
+    set-based queries, and submits a single
+    ``StudentRepositoryBatchCreationWorkflow`` for the whole batch instead
+    of one workflow per member. The caller commits.
+
+    Args:
+        course_id: Course all members belong to
+        course_members: Newly created (or not yet provisioned) CourseMembers
+        db: Database session
+        permissions: Principal used for task tracking
+
+    Returns:
+        workflow_id if a task was submitted, None otherwise
+    """
+    prepared = await run_in_threadpool(_prepare_bulk_post_create, course_id, course_members, db)
+    if prepared is None:
+        return None
+    course, course_members, groups_by_member = prepared
+    member_ids = [str(member.id) for member in course_members]
+
+    try:
+        from computor_backend.task_tracker import get_task_tracker
+        from computor_types.tasks import TaskSubmission
+
+        task_tracker = await get_task_tracker()
+
+        task_submission = TaskSubmission(
+            task_name="StudentRepositoryBatchCreationWorkflow",
+            parameters={
+                "course_id": str(course_id),
+                "members": [
+                    {
+                        "course_member_id": member_id,
+                        "submission_group_ids": groups_by_member.get(member_id, []),
+                    }
+                    for member_id in member_ids
+                ],
+            },
+            queue="computor-tasks",
+        )
+
+        created_by = (
+            permissions.user_id
+            if permissions
+            else str(course_members[0].created_by or course_members[0].user_id)
+        )
+
+        workflow_id = await task_tracker.submit_and_track_task(
+            task_submission=task_submission,
+            created_by=created_by,
+            course_id=str(course_id),
+            organization_id=str(course.organization_id) if course.organization_id else None,
+            entity_type="course",
+            entity_id=str(course_id),
+            description=f"Creating repositories for {len(member_ids)} course members",
+        )
+        logger.info(
+            f"Triggered StudentRepositoryBatchCreationWorkflow: {workflow_id} "
+            f"for {len(member_ids)} members of course {course_id}"
+        )
+        return workflow_id
+    except Exception as e:
+        logger.error(
+            f"Failed to trigger StudentRepositoryBatchCreationWorkflow for "
+            f"course {course_id}: {e}",
+            exc_info=True,
+        )
+        return None
@@ -33,6 +33,11 @@ from computor_types.base import EntityInterface, ListQuery
 from computor_backend.custom_types import Ltree, LtreeType
 from computor_types.tasks import TaskStatus, map_task_status_to_int
 from computor_backend.database import set_db_user
+from computor_backend.business_logic.pagination import (
+    EntityPage,
+    count_rows,
+    fetch_cursor_page,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -193,40 +198,52 @@ async def get_entity_by_id(
         raise NotFoundException(detail=e.args) from e
 
 
-async def list_entities(
+async def list_entities_page(
     permissions: Principal,
     db: Session,
     params: ListQuery,
     interface: EntityInterface
-) -> tuple[list[BaseModel], int]:
+) -> EntityPage:
     """
-    List entities with pagination and permission filtering.
+    List one page of entities with permission filtering.
+
+    Offset pagination (``skip``/``limit``) is the default. Passing
+    ``params.after`` (empty string for the first page) switches to keyset
+    pagination ordered by ``(created_at, id)``, so deep pages cost the same
+    as the first one. ``params.count`` selects how the total is computed
+    (see ``business_logic.pagination.count_rows``).
 
     Args:
         permissions: Current user's permission context
         db: Database session
-        params: Query parameters (limit, skip, filters)
+        params: Query parameters (limit, skip, after, count, filters)
         interface: EntityInterface defining model and search logic
 
     Returns:
-        Tuple of (list of entities, total count)
+        EntityPage with the validated items, the total (None when not
+        counted) and the cursor for the next page (None outside cursor mode)
 
     Raises:
-        None - Returns empty list if no permission
+        BadRequestException: If ``params.after`` is not a valid cursor
     """
     db_type = interface.model
     query_func = interface.search
 
+    after = getattr(params, "after", None)
     query = check_permissions(permissions, db_type, "list", db)
 
     if query is None:
-        return [], 0
+        return EntityPage([], 0, "" if after is not None else None)
 
     query = query_func(db, query, params)
 
     # Wrap blocking pagination queries in threadpool
     def _get_paginated_results():
-        total = query.order_by(None).count()
+        total = count_rows(db, query, getattr(params, "count", None))
+
+        if after is not None:
+            results, next_cursor = fetch_cursor_page(query, db_type, after, params.limit)
+            return results, total, next_cursor
 
         paginated_query = query
         if params.limit is not None:
@@ -235,13 +252,32 @@ async def list_entities(
             paginated_query = paginated_query.offset(params.skip)
 
         results = paginated_query.all()
-        return results, total
+        return results, total, None
 
-    results, total = await run_in_threadpool(_get_paginated_results)
+    results, total, next_cursor = await run_in_threadpool(_get_paginated_results)
 
     query_result = [interface.list.model_validate(entity, from_attributes=True) for entity in results]
 
-    return query_result, total
+    return EntityPage(query_result, total, next_cursor)
+
+
+async def list_entities(
+    permissions: Principal,
+    db: Session,
+    params: ListQuery,
+    interface: EntityInterface
+) -> tuple[list[BaseModel], Optional[int]]:
+    """
+    List entities with pagination and permission filtering.
+
+    Thin wrapper over ``list_entities_page`` for callers that do not
+    need the next-page cursor.
+
+    Returns:
+        Tuple of (list of entities, total count or None)
+    """
+    page = await list_entities_page(permissions, db, params, interface)
+    return page.items, page.total
 
 
 async def update_entity(
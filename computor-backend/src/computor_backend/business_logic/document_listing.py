@@ -0,0 +1,182 @@
+"""Directory listings for the Documents API, cached per directory.
+
+Many clients list the same folders (a whole class opening the lecture
+notes), so the serialized listing of each directory is kept in memory
+together with an aggregate ETag over its entries. An entry is reused as
+long as the directory's ``(st_dev, st_ino, st_mtime_ns)`` is unchanged:
+creating, deleting or renaming an entry (all documents writes go through
+a rename) bumps the directory mtime, and the incremental documents sync
+swaps in a new directory inode. Writers that modify files in place call
+``invalidate_directory_listings``, which also touches the directory
+mtimes so caches in other processes revalidate.
+
+All filesystem work runs in the threadpool; the cache itself is only
+touched from the event loop, and concurrent rebuilds of one directory
+share a single scan.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import stat as stat_module
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from computor_types.documents import DocumentList
+
+logger = logging.getLogger(__name__)
+
+# Number of directories whose listings are kept
+LISTING_CACHE_SIZE = 1024
+
+# Listings are rebuilt at least this often (bounds staleness of in-place edits)
+LISTING_MAX_AGE = 60.0
+
+# A listing built this soon after the directory changed is not reused: a
+# further change within the same mtime tick would go unnoticed.
+RACY_WINDOW = 1.0
+
+
+def stat_etag(stat: os.stat_result) -> str:
+    """Quoted ETag derived from mtime+size.
+
+    Same format Starlette's ``FileResponse`` uses by default, so the
+    values returned by the listing endpoint match the ``ETag`` header
+    the file GET endpoint emits — clients can compare without
+    normalizing.
+    """
+    return f'"{stat.st_mtime}-{stat.st_size}"'
+
+
+Validator = Tuple[int, int, int]
+
+
+@dataclass
+class DirectoryListing:
+    """One directory's entries, serialized, with their aggregate ETag."""
+    validator: Validator
+    body: bytes
+    etag: str
+    built_at: float
+
+    def is_fresh(self, validator: Validator, now: float) -> bool:
+        if validator != self.validator or now - self.built_at > LISTING_MAX_AGE:
+            return False
+        return self.built_at - validator[2] / 1e9 >= RACY_WINDOW
+
+
+def stat_or_none(target: Path) -> Optional[os.stat_result]:
+    """Stat ``target``; None if it does not exist. Blocking."""
+    try:
+        return target.stat()
+    except FileNotFoundError:
+        return None
+
+
+def _scan_directory(target: Path) -> Tuple[Optional[Validator], bytes, str]:
+    """List ``target`` (sorted by name) and serialize the entries."""
+    dir_stat = target.stat()
+    validator = (dir_stat.st_dev, dir_stat.st_ino, dir_stat.st_mtime_ns)
+
+    entries: List[DocumentList] = []
+    with os.scandir(target) as it:
+        children = sorted(it, key=lambda e: e.name)
+    for child in children:
+        # Skip symlinks (and broken ones) — writes refuse to create
+        # them, and following them would defeat the scope-root
+        # containment guarantee from resolve_absolute_path.
+        if child.is_symlink():
+            continue
+        try:
+            stat = child.stat()
+        except OSError:
+            continue
+        last_modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+        if stat_module.S_ISDIR(stat.st_mode):
+            entries.append(DocumentList(
+                name=child.name, type="directory", etag=stat_etag(stat), last_modified=last_modified,
+            ))
+        elif stat_module.S_ISREG(stat.st_mode):
+            entries.append(DocumentList(
+                name=child.name, type="file", size=stat.st_size, etag=stat_etag(stat), last_modified=last_modified,
+            ))
+
+    body = ("[" + ",".join(entry.model_dump_json() for entry in entries) + "]").encode("utf-8")
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    # The directory changed while it was being listed: do not cache
+    if target.stat().st_mtime_ns != dir_stat.st_mtime_ns:
+        validator = None
+    return validator, body, etag
+
+
+class DirectoryListingCache:
+    """LRU of directory listings, validated against the directory stat."""
+
+    def __init__(self, max_size: int = LISTING_CACHE_SIZE):
+        self.max_size = max_size
+        self._listings: "OrderedDict[str, DirectoryListing]" = OrderedDict()
+        self._building: Dict[str, asyncio.Future] = {}
+
+    async def get(self, target: Path, dir_stat: os.stat_result) -> DirectoryListing:
+        """
+        Listing of the directory ``target`` whose current stat is ``dir_stat``.
+
+        Raises:
+            OSError: If the directory cannot be read (e.g. it was just removed)
+        """
+        key = str(target)
+        validator = (dir_stat.st_dev, dir_stat.st_ino, dir_stat.st_mtime_ns)
+        listing = self._listings.get(key)
+        if listing is not None and listing.is_fresh(validator, time.time()):
+            self._listings.move_to_end(key)
+            return listing
+
+        building = self._building.get(key)
+        if building is None:
+            building = asyncio.ensure_future(self._build(key, target))
+            self._building[key] = building
+            building.add_done_callback(lambda f: self._building.pop(key) if self._building.get(key) is f else None)
+        return await asyncio.shield(building)
+
+    async def _build(self, key: str, target: Path) -> DirectoryListing:
+        built_at = time.time()
+        validator, body, etag = await run_in_threadpool(_scan_directory, target)
+        listing = DirectoryListing(validator=validator, body=body, etag=etag, built_at=built_at)
+        if validator is not None:
+            self._listings[key] = listing
+            self._listings.move_to_end(key)
+            while len(self._listings) > self.max_size:
+                self._listings.popitem(last=False)
+        return listing
+
+    def invalidate(self, root: Path) -> None:
+        """Drop the listings of ``root`` and every directory below it."""
+        prefix = str(root).rstrip(os.sep) + os.sep
+        for key in [k for k in self._listings if k == str(root) or k.startswith(prefix)]:
+            del self._listings[key]
+
+
+listing_cache = DirectoryListingCache()
+
+
+def invalidate_directory_listings(root: str) -> None:
+    """
+    Invalidate cached listings of ``root`` and all directories below it.
+
+    Drops them from this process's cache and bumps the directories' mtimes,
+    so API processes elsewhere (the sync runs in a Temporal worker) see the
+    change on their next request. Blocking; run it off the event loop.
+    """
+    listing_cache.invalidate(Path(root))
+    for dirpath, _, _ in os.walk(root):
+        try:
+            os.utime(dirpath)
+        except OSError as e:
+            logger.debug(f"Could not touch {dirpath}: {e}")
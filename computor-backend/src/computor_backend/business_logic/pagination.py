@@ -0,0 +1,210 @@
+"""
+Keyset pagination and row-count strategies for generic list queries.
+
+``list_entities`` used to pay ``COUNT(*)`` plus ``OFFSET`` on every page,
+so page N cost O(N) rows scanned and discarded. The helpers here let a
+caller opt into:
+
+* cursor mode — ``WHERE (created_at, id) > (:c, :i) ORDER BY created_at, id``
+  driven by an opaque ``after`` token, so every page costs the same. Rows
+  without a ``created_at`` sort first (``NULLS FIRST``) and are paged by id;
+* count modes — ``exact`` (the old behaviour), ``estimated`` (the
+  planner's row estimate from ``EXPLAIN``) or ``none`` (skip counting).
+"""
+
+import base64
+import binascii
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from computor_backend.exceptions import BadRequestException
+
+logger = logging.getLogger(__name__)
+
+COUNT_EXACT = "exact"
+COUNT_ESTIMATED = "estimated"
+COUNT_NONE = "none"
+
+# Below this many estimated rows an exact count is cheap enough to just run,
+# and avoids showing wildly-off planner numbers on small tables.
+_ESTIMATE_EXACT_THRESHOLD = 10_000
+
+
+class EntityPage(NamedTuple):
+    """One page of a list query."""
+
+    items: List[Any]
+    total: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <stmt>`` that keeps the statement's bind processing."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+# ---------------------------------------------------------------------------
+# Cursor encoding
+# ---------------------------------------------------------------------------
+
+def encode_cursor(sort_value: Any, id_value: Any) -> str:
+    """Build the opaque ``after`` token for a row's (sort key, id) pair."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, str(id_value)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _invalid_cursor() -> BadRequestException:
+    return BadRequestException(detail="Invalid pagination cursor")
+
+
+def decode_cursor(token: str) -> Tuple[Optional[datetime], str]:
+    """Inverse of :func:`encode_cursor`.
+
+    Returns:
+        ``(sort_value, id_value)`` — the sort value parsed back into a
+        datetime (None for rows without one) and the id as a string.
+
+    Raises:
+        BadRequestException: If the token was not produced by this server.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise _invalid_cursor() from e
+
+    if not isinstance(value, list) or len(value) != 2:
+        raise _invalid_cursor()
+    sort_value, id_value = value
+    if not isinstance(id_value, str) or not (sort_value is None or isinstance(sort_value, str)):
+        raise _invalid_cursor()
+    if sort_value is not None:
+        try:
+            sort_value = datetime.fromisoformat(sort_value)
+        except ValueError as e:
+            raise _invalid_cursor() from e
+    return sort_value, id_value
+
+
+def _sort_column(db_type):
+    """Return the keyset sort column for ``db_type`` (``created_at`` when present)."""
+    return getattr(db_type, "created_at", None)
+
+
+def _cursor_id(id_col, id_value: str) -> str:
+    """Check a cursor id against the id column's type."""
+    if isinstance(id_col.type, UUID):
+        try:
+            return str(uuid.UUID(id_value))
+        except ValueError as e:
+            raise _invalid_cursor() from e
+    return id_value
+
+
+def apply_cursor(query: Query, db_type, after: str) -> Query:
+    """Order ``query`` by the keyset and skip past ``after`` (if non-empty).
+
+    Any ordering applied by the interface's ``search`` function is replaced:
+    keyset pagination only works over the (sort key, id) order. Rows whose
+    sort key is NULL come first, ordered by id, so they are paged like any
+    other row instead of dropping out of the comparison.
+    """
+    sort_col = _sort_column(db_type)
+    id_col = db_type.id
+
+    query = query.order_by(None)
+    if sort_col is None:
+        query = query.order_by(id_col.asc())
+    else:
+        query = query.order_by(sort_col.asc().nullsfirst(), id_col.asc())
+
+    if not after:
+        return query
+
+    sort_value, id_value = decode_cursor(after)
+    id_value = _cursor_id(id_col, id_value)
+    if sort_col is None:
+        return query.filter(id_col > id_value)
+
+    if sort_value is None:
+        return query.filter(or_(
+            and_(sort_col.is_(None), id_col > id_value),
+            sort_col.isnot(None),
+        ))
+    return query.filter(tuple_(sort_col, id_col) > tuple_(sort_value, id_value))
+
+
+def fetch_cursor_page(
+    query: Query,
+    db_type,
+    after: str,
+    limit: Optional[int],
+) -> Tuple[List[Any], str]:
+    """Fetch one keyset page.
+
+    Returns:
+        ``(rows, next_cursor)`` — ``next_cursor`` is ``""`` on the last page.
+    """
+    query = apply_cursor(query, db_type, after)
+    if limit is None:
+        return query.all(), ""
+
+    # One extra row tells us whether another page exists without a count.
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, ""
+
+    rows = rows[:limit]
+    last = rows[-1]
+    sort_col = _sort_column(db_type)
+    sort_value = getattr(last, sort_col.key) if sort_col is not None else None
+    return rows, encode_cursor(sort_value, last.id)
+
+
+# ---------------------------------------------------------------------------
+# Counting
+# ---------------------------------------------------------------------------
+
+def estimate_count(db: Session, query: Query) -> Optional[int]:
+    """Return the planner's row estimate for ``query``, or None if unavailable."""
+    try:
+        # Savepoint so a failed EXPLAIN doesn't abort the surrounding transaction.
+        with db.begin_nested():
+            plan = db.execute(_Explain(query.order_by(None).statement)).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception:
+        logger.debug("Row estimate failed, falling back to exact count", exc_info=True)
+        return None
+
+
+def count_rows(db: Session, query: Query, mode: Optional[str]) -> Optional[int]:
+    """Count rows according to ``mode``; returns None for ``none``."""
+    if mode == COUNT_NONE:
+        return None
+    if mode == COUNT_ESTIMATED:
+        estimate = estimate_count(db, query)
+        if estimate is not None and estimate >= _ESTIMATE_EXACT_THRESHOLD:
+            return estimate
+    return query.order_by(None).count()
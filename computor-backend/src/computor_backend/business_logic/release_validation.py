@@ -96,6 +96,126 @@ def resolve_course_contents_to_validate(
     return assignments
 
 
+# Deployment statuses an assignment can be released from:
+# 'pending' (will be deployed), 'deployed' (already deployed)
+RELEASABLE_DEPLOYMENT_STATUSES = ['pending', 'deployed']
+
+
+def load_release_state(
+    assignments: list[CourseContent],
+    db: Session
+) -> tuple[dict[str, CourseContentDeployment], set[str]]:
+    """
+    Load everything release validation needs for a set of course contents.
+
+    Two queries regardless of the number of assignments: their deployments,
+    then which of the referenced example versions exist.
+
+    Args:
+        assignments: Course contents to validate
+        db: Database session
+
+    Returns:
+        Tuple of (deployments by course content ID, existing example version IDs)
+    """
+
+    assignment_ids = [assignment.id for assignment in assignments]
+    deployments = {
+        str(deployment.course_content_id): deployment
+        for deployment in db.query(CourseContentDeployment).filter(
+            CourseContentDeployment.course_content_id.in_(assignment_ids)
+        ).all()
+    }
+
+    version_ids = {
+        deployment.example_version_id
+        for deployment in deployments.values()
+        if deployment.example_version_id
+    }
+    existing_version_ids = set()
+    if version_ids:
+        existing_version_ids = {
+            str(version_id)
+            for (version_id,) in db.query(ExampleVersion.id).filter(
+                ExampleVersion.id.in_(version_ids)
+            ).all()
+        }
+
+    return deployments, existing_version_ids
+
+
+def check_assignment_for_release(
+    assignment: CourseContent,
+    deployment: CourseContentDeployment | None,
+    existing_version_ids: set[str]
+) -> ValidationError | None:
+    """
+    Check a single assignment against its loaded deployment state.
+
+    Args:
+        assignment: Course content being validated
+        deployment: Its deployment, or None if it has none
+        existing_version_ids: Example version IDs that exist in the database
+
+    Returns:
+        A ValidationError describing the issue, or None if the assignment is valid
+    """
+
+    # Check 1: Deployment exists
+    if not deployment:
+        # Auto-create deployment with default version 1.0.0 assumption
+        # This allows assignments without explicit example assignments to be released
+        logger.warning(f"[Validation] ⚠️  '{assignment.path}': No deployment found, will use default version 1.0.0")
+        # Note: Assignment will be generated with version 1.0.0 as fallback
+        # The actual version resolution happens in the Temporal workflow
+        return None
+
+    # Check 2: Deployment is not unassigned
+    if deployment.deployment_status == 'unassigned':
+        logger.error(f"[Validation] ❌ '{assignment.path}': Example was unassigned")
+        return ValidationError(
+            course_content_id=str(assignment.id),
+            title=assignment.title or "Untitled",
+            path=str(assignment.path),
+            issue="Example was unassigned"
+        )
+
+    # Check 3: Deployment status is valid for release
+    # Invalid statuses: 'failed' (deployment failed), 'unassigned' (already handled above)
+    valid_statuses = RELEASABLE_DEPLOYMENT_STATUSES
+
+    if deployment.deployment_status not in valid_statuses:
+        logger.error(f"[Validation] ❌ '{assignment.path}': Invalid status '{deployment.deployment_status}' "
+                    f"(valid: {', '.join(valid_statuses)})")
+        return ValidationError(
+            course_content_id=str(assignment.id),
+            title=assignment.title or "Untitled",
+            path=str(assignment.path),
+            issue=f"Invalid deployment status: '{deployment.deployment_status}' (expected: {', '.join(valid_statuses)})"
+        )
+
+    # Check 4: Example version ID is present
+    if not deployment.example_version_id:
+        # No explicit version assigned - will use default version 1.0.0
+        logger.warning(f"[Validation] ⚠️  '{assignment.path}': No example version assigned, will use default version 1.0.0")
+        # Note: Assignment will be generated with version 1.0.0 as fallback
+        # The actual version resolution happens in the Temporal workflow
+        return None
+
+    # Check 5: Example version exists in database
+    if str(deployment.example_version_id) not in existing_version_ids:
+        logger.error(f"[Validation] ❌ '{assignment.path}': Example version {deployment.example_version_id} not found")
+        return ValidationError(
+            course_content_id=str(assignment.id),
+            title=assignment.title or "Untitled",
+            path=str(assignment.path),
+            issue=f"Example version {deployment.example_version_id} not found in database"
+        )
+
+    logger.debug(f"[Validation] ✅ '{assignment.path}': Valid (status: {deployment.deployment_status})")
+    return None
+
+
 def validate_course_for_release(
     course_id: str | UUID,
     db: Session,
@@ -108,6 +228,9 @@ def validate_course_for_release(
     """
     Validate that selected assignments have valid example deployments.
 
+    Deployments and example versions of all selected contents are loaded
+    up front (see load_release_state); the checks then run in memory.
+
     This function checks that:
     1. Selected submittable course contents (assignments) have CourseContentDeployment records
     2. Deployment status is valid for release (pending, failed, or deployed if force_redeploy)
@@ -152,83 +275,20 @@ def validate_course_for_release(
 
     logger.info(f"[Validation] Validating {len(assignments)} assignments")
 
+    deployments, existing_version_ids = load_release_state(assignments, db)
+
     validation_errors = []
 
     for i, assignment in enumerate(assignments, 1):
         logger.debug(f"[Validation] [{i}/{len(assignments)}] Checking '{assignment.path}' (ID: {assignment.id})")
 
-        # Get deployment for this assignment
-        deployment = db.query(CourseContentDeployment).options(
-            joinedload(CourseContentDeployment.example_version)
-        ).filter(
-            CourseContentDeployment.course_content_id == assignment.id
-        ).first()
-
-        # Check 1: Deployment exists
-        if not deployment:
-            # Auto-create deployment with default version 1.0.0 assumption
-            # This allows assignments without explicit example assignments to be released
-            logger.warning(f"[Validation] ⚠️  '{assignment.path}': No deployment found, will use default version 1.0.0")
-            # Note: Assignment will be generated with version 1.0.0 as fallback
-            # The actual version resolution happens in the Temporal workflow
-            continue
-
-        # Check 2: Deployment is not unassigned
-        if deployment.deployment_status == 'unassigned':
-            error = ValidationError(
-                course_content_id=str(assignment.id),
-                title=assignment.title or "Untitled",
-                path=str(assignment.path),
-                issue="Example was unassigned"
-            )
-            validation_errors.append(error)
-            logger.error(f"[Validation] ❌ '{assignment.path}': Example was unassigned")
-            continue
-
-        # Check 3: Deployment status is valid for release
-        # Valid statuses: 'pending' (will be deployed), 'deployed' (already deployed)
-        # Invalid statuses: 'failed' (deployment failed), 'unassigned' (already handled above)
-        valid_statuses = ['pending', 'deployed']
-
-        if deployment.deployment_status not in valid_statuses:
-            error = ValidationError(
-                course_content_id=str(assignment.id),
-                title=assignment.title or "Untitled",
-                path=str(assignment.path),
-                issue=f"Invalid deployment status: '{deployment.deployment_status}' (expected: {', '.join(valid_statuses)})"
-            )
+        error = check_assignment_for_release(
+            assignment,
+            deployments.get(str(assignment.id)),
+            existing_version_ids
+        )
+        if error is not None:
             validation_errors.append(error)
-            logger.error(f"[Validation] ❌ '{assignment.path}': Invalid status '{deployment.deployment_status}' "
-                        f"(valid: {', '.join(valid_statuses)})")
-            continue
-
-        # Check 4: Example version ID is present
-        if not deployment.example_version_id:
-            # No explicit version assigned - will use default version 1.0.0
-            logger.warning(f"[Validation] ⚠️  '{assignment.path}': No example version assigned, will use default version 1.0.0")
-            # Note: Assignment will be generated with version 1.0.0 as fallback
-            # The actual version resolution happens in the Temporal workflow
-            continue
-
-        # Check 5: Example version exists in database
-        if not deployment.example_version:
-            # Try to fetch it explicitly (in case relationship wasn't loaded)
-            example_version = db.query(ExampleVersion).filter(
-                ExampleVersion.id == deployment.example_version_id
-            ).first()
-
-            if not example_version:
-                error = ValidationError(
-                    course_content_id=str(assignment.id),
-                    title=assignment.title or "Untitled",
-                    path=str(assignment.path),
-                    issue=f"Example version {deployment.example_version_id} not found in database"
-                )
-                validation_errors.append(error)
-                logger.error(f"[Validation] ❌ '{assignment.path}': Example version {deployment.example_version_id} not found")
-                continue
-
-        logger.debug(f"[Validation] ✅ '{assignment.path}': Valid (status: {deployment.deployment_status})")
 
     is_valid = not validation_errors
 
@@ -80,6 +80,16 @@ def _stable_key(obj: Any) -> str:
     return hashlib.sha1(raw).hexdigest()
 
 
+def payload_etag(raw: bytes) -> str:
+    """
+    Strong, quoted ETag for a serialized cache payload.
+
+    Views are rendered deterministically from their cached payload, so the
+    payload digest doubles as a validator for the HTTP representation.
+    """
+    return '"' + hashlib.sha256(raw).hexdigest()[:32] + '"'
+
+
 class Cache:
     """
     Write-through cache with tag-based invalidation.
@@ -233,8 +243,9 @@ class Cache:
         key: str,
         payload: Any,
         tags: Iterable[str],
-        ttl: Optional[int] = None
-    ):
+        ttl: Optional[int] = None,
+        etag: bool = False,
+    ) -> Optional[str]:
         """
         Set value in cache with associated tags for invalidation.
 
@@ -247,6 +258,11 @@ class Cache:
             payload: Value to cache
             tags: Tags for grouping related cache entries
             ttl: Time-to-live in seconds
+            etag: Also store the payload's ETag under ``etag:<key>`` (same
+                TTL, removed together with the key on invalidation)
+
+        Returns:
+            The stored ETag when ``etag`` is set, otherwise None
 
         Example:
             >>> cache.set_with_tags(
@@ -258,29 +274,57 @@ class Cache:
         """
         tags = {t for t in tags if t}  # Remove None/empty tags
 
-        if not tags:
+        if not tags and not etag:
             # No tags, just set normally
             self.set_by_key(key, payload, ttl)
-            return
+            return None
 
         try:
             p = self.client.pipeline()
 
             # Set the actual cached value
-            p.setex(key, ttl or self.default_ttl, _dumps(payload))
+            raw = _dumps(payload)
+            p.setex(key, ttl or self.default_ttl, raw)
+
+            stored_etag = None
+            if etag:
+                stored_etag = payload_etag(raw)
+                p.setex(self.k("etag", key), ttl or self.default_ttl, stored_etag)
 
             # Create tag -> keys mapping
             for t in tags:
                 p.sadd(self.k("tag", t), key)
 
             # Create key -> tags mapping
-            p.sadd(self.k("keytags", key), *tags)
+            if tags:
+                p.sadd(self.k("keytags", key), *tags)
 
             p.execute()
             self._stats["sets"] += 1
             logger.debug(f"Cache SET with tags: {key} tags={tags} (ttl={ttl or self.default_ttl}s)")
+            return stored_etag
         except Exception as e:
             logger.error(f"Cache SET with tags error for key {key}: {e}")
+            return None
+
+    def get_etag_by_key(self, key: str) -> Optional[str]:
+        """
+        Get the ETag stored alongside a cached value (see ``set_with_tags``).
+
+        Args:
+            key: Cache key of the value
+
+        Returns:
+            Quoted ETag string, or None if absent/expired/invalidated
+        """
+        try:
+            value = self.client.get(self.k("etag", key))
+            if value is None:
+                return None
+            return value.decode() if isinstance(value, bytes) else value
+        except Exception as e:
+            logger.warning(f"Cache ETag GET error for key {key}: {e}")
+            return None
 
     def invalidate_tags(self, *tags: str):
         """
@@ -335,8 +379,9 @@ class Cache:
                     # Delete key-to-tags mapping
                     p.delete(keytags_key)
 
-                    # Delete the actual cached value
+                    # Delete the actual cached value and its ETag
                     p.delete(key)
+                    p.delete(self.k("etag", key))
 
                 # Delete tag set
                 p.delete(tagset_key)
@@ -498,6 +543,17 @@ class Cache:
     # User View Caching (for VSCode extension endpoints)
     # ========================================================================
 
+    def user_view_key(
+        self,
+        user_id: str,
+        view_type: str,
+        view_id: Optional[str] = None
+    ) -> str:
+        """Build the cache key for a user view (shared by get/set/etag)."""
+        if view_id:
+            return self.k("user_view", user_id, view_type, view_id)
+        return self.k("user_view", user_id, view_type)
+
     def get_user_view(
         self,
         user_id: str,
@@ -522,12 +578,21 @@ class Cache:
             >>> # Get specific course content for student
             >>> cache.get_user_view("user123", "course_content", "content456")
         """
-        if view_id:
-            key = self.k("user_view", user_id, view_type, view_id)
-        else:
-            key = self.k("user_view", user_id, view_type)
+        return self.get_by_key(self.user_view_key(user_id, view_type, view_id))
 
-        return self.get_by_key(key)
+    def get_user_view_etag(
+        self,
+        user_id: str,
+        view_type: str,
+        view_id: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get the ETag of a cached user view without loading the payload.
+
+        Lets conditional GETs answer ``304 Not Modified`` with a single
+        small Redis read. Returns None when the view is not cached.
+        """
+        return self.get_etag_by_key(self.user_view_key(user_id, view_type, view_id))
 
     def set_user_view(
         self,
@@ -537,10 +602,13 @@ class Cache:
         view_id: Optional[str] = None,
         ttl: Optional[int] = None,
         related_ids: Optional[Dict[str, str]] = None
-    ):
+    ) -> Optional[str]:
         """
         Cache user view data with proper tags for invalidation.
 
+        The view's ETag is stored next to it and returned, so endpoints can
+        answer conditional GETs (see ``get_user_view_etag``).
+
         Args:
             user_id: User ID requesting the view
             view_type: Type of view (e.g., "courses", "course_contents")
@@ -568,10 +636,7 @@ class Cache:
             ...     related_ids={"course_id": "789", "course_family_id": "012"}
             ... )
         """
-        if view_id:
-            key = self.k("user_view", user_id, view_type, view_id)
-        else:
-            key = self.k("user_view", user_id, view_type)
+        key = self.user_view_key(user_id, view_type, view_id)
 
         # Build tags for invalidation
         tags = {
@@ -588,11 +653,12 @@ class Cache:
             for entity_type, entity_id in related_ids.items():
                 tags.add(f"{entity_type}:{entity_id}")
 
-        self.set_with_tags(
+        return self.set_with_tags(
             key=key,
             payload=data,
             tags=tags,
-            ttl=ttl or 300  # Default 5 minutes for user views
+            ttl=ttl or 300,  # Default 5 minutes for user views
+            etag=True,
         )
 
     def invalidate_user_views(
@@ -13,6 +13,7 @@ __version__ = "0.1.0"
 # Client
 from .client import (
     CoderClient,
+    WorkspaceStatusPoller,
     get_coder_client,
     reset_coder_client,
 )
@@ -46,6 +47,10 @@ from .exceptions import (
 
 # Schemas
 from .schemas import (
+    BulkProvisionItem,
+    BulkProvisionOutcome,
+    BulkProvisionRequest,
+    BulkProvisionResponse,
     CoderHealthResponse,
     CoderTemplate,
     CoderUser,
@@ -65,6 +70,7 @@ __all__ = [
     "__version__",
     # Client
     "CoderClient",
+    "WorkspaceStatusPoller",
     "get_coder_client",
     "reset_coder_client",
     # Configuration
@@ -89,6 +95,10 @@ __all__ = [
     "CoderWorkspaceExistsError",
     "CoderWorkspaceNotFoundError",
     # Schemas
+    "BulkProvisionItem",
+    "BulkProvisionOutcome",
+    "BulkProvisionRequest",
+    "BulkProvisionResponse",
     "CoderHealthResponse",
     "CoderTemplate",
     "CoderUser",
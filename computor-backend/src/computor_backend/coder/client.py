@@ -6,7 +6,8 @@ import asyncio
 import logging
 import secrets
 import string
-from typing import Any, Optional
+import time
+from typing import Any, Iterable, Optional
 
 import httpx
 
@@ -19,10 +20,13 @@ from .exceptions import (
     CoderTimeoutError,
     CoderUserExistsError,
     CoderUserNotFoundError,
+    CoderWorkspaceActionError,
     CoderWorkspaceExistsError,
     CoderWorkspaceNotFoundError,
 )
 from .schemas import (
+    BulkProvisionItem,
+    BulkProvisionOutcome,
     CoderTemplate,
     CoderUser,
     CoderUserCreate,
@@ -36,6 +40,21 @@ from .schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Workspace IDs per ``id:`` filtered status query (bounds the URL length)
+WORKSPACE_ID_BATCH_SIZE = 50
+
+# A template name missing from the cache triggers a refresh at most this often
+TEMPLATE_MISS_REFRESH_SECONDS = 5.0
+
+# Settled states; waiting for any other state fails once one of these is reached
+SETTLED_WORKSPACE_STATES = frozenset({
+    WorkspaceStatus.RUNNING,
+    WorkspaceStatus.STOPPED,
+    WorkspaceStatus.FAILED,
+    WorkspaceStatus.CANCELED,
+    WorkspaceStatus.DELETED,
+})
+
 
 def _generate_coder_password(length: int = 24) -> str:
     """Generate a random password that satisfies Coder's requirements.
@@ -76,7 +95,14 @@ class CoderClient:
         self.settings = settings or get_coder_settings()
         self._session_token: Optional[str] = None
         self._org_id: Optional[str] = None
+        self._org_fetched_at = 0.0
+        self._templates: Optional[dict[str, CoderTemplate]] = None
+        self._templates_fetched_at = 0.0
         self._client: Optional[httpx.AsyncClient] = None
+        # Concurrent provisioning shares one login and one template/org lookup
+        self._auth_lock = asyncio.Lock()
+        self._cache_lock = asyncio.Lock()
+        self._poller: Optional[WorkspaceStatusPoller] = None
 
     async def __aenter__(self) -> "CoderClient":
         """Async context manager entry."""
@@ -103,6 +129,7 @@ class CoderClient:
             self._client = None
         self._session_token = None
         self._org_id = None
+        self._templates = None
 
     async def _get_session_token(self) -> str:
         """
@@ -118,6 +145,13 @@ class CoderClient:
         if self._session_token:
             return self._session_token
 
+        async with self._auth_lock:
+            if self._session_token:
+                return self._session_token
+            return await self._login()
+
+    async def _login(self) -> str:
+        """Log in as admin; callers hold ``_auth_lock``."""
         client = await self._ensure_client()
 
         try:
@@ -147,7 +181,7 @@ class CoderClient:
 
     async def _get_org_id(self) -> str:
         """
-        Get the default organization ID.
+        Get the default organization ID (cached for ``template_cache_ttl``).
 
         Returns:
             Organization ID string
@@ -155,7 +189,7 @@ class CoderClient:
         Raises:
             CoderAPIError: If no organizations found
         """
-        if self._org_id:
+        if self._org_id and time.monotonic() - self._org_fetched_at < self.settings.template_cache_ttl:
             return self._org_id
 
         token = await self._get_session_token()
@@ -177,6 +211,7 @@ class CoderClient:
             raise CoderAPIError("No organizations found in Coder")
 
         self._org_id = orgs[0]["id"]
+        self._org_fetched_at = time.monotonic()
         return self._org_id
 
     def _get_headers(self, token: str) -> dict[str, str]:
@@ -556,6 +591,10 @@ class CoderClient:
         """
         Get template ID by name.
 
+        Templates are cached for ``template_cache_ttl`` seconds; an unknown
+        name refreshes the cache (at most every few seconds) before failing,
+        so newly pushed templates are found without waiting for the TTL.
+
         Args:
             template_name: Template name (e.g., "python3.13-workspace")
 
@@ -565,14 +604,38 @@ class CoderClient:
         Raises:
             CoderTemplateNotFoundError: If template not found
         """
-        templates = await self.list_templates()
+        templates = await self._get_templates_by_name()
+        if template_name not in templates:
+            templates = await self._get_templates_by_name(max_age=TEMPLATE_MISS_REFRESH_SECONDS)
 
-        for tpl in templates:
-            if tpl.name == template_name:
-                return tpl.id
+        if template_name in templates:
+            return templates[template_name].id
 
         raise CoderTemplateNotFoundError(template_name)
 
+    async def _get_templates_by_name(self, max_age: Optional[float] = None) -> dict[str, CoderTemplate]:
+        """
+        Templates by name, listed at most once per ``max_age`` seconds.
+
+        Args:
+            max_age: Maximum age of the cached listing (defaults to template_cache_ttl)
+        """
+        max_age = self.settings.template_cache_ttl if max_age is None else max_age
+
+        def fresh() -> bool:
+            return self._templates is not None and time.monotonic() - self._templates_fetched_at < max_age
+
+        if fresh():
+            return self._templates
+
+        async with self._cache_lock:
+            # Another task may have refreshed the listing while we waited
+            if not fresh():
+                templates = await self.list_templates()
+                self._templates = {tpl.name: tpl for tpl in templates}
+                self._templates_fetched_at = time.monotonic()
+            return self._templates
+
     # -------------------------------------------------------------------------
     # Workspace operations
     # -------------------------------------------------------------------------
@@ -653,6 +716,84 @@ class CoderClient:
             for ws in workspaces
         ]
 
+    async def get_workspace_statuses(self, workspace_ids: Iterable[str]) -> dict[str, WorkspaceStatus]:
+        """
+        Get the status of many workspaces with ``id:`` filtered listings.
+
+        Each request asks for up to ``WORKSPACE_ID_BATCH_SIZE`` workspaces by
+        ID, so polling a lab session costs a few requests regardless of how
+        many other workspaces the deployment has.
+
+        Args:
+            workspace_ids: IDs of the workspaces to look up
+
+        Returns:
+            Status by workspace ID (workspaces that no longer exist are omitted)
+        """
+        wanted = sorted(set(workspace_ids))
+        statuses: dict[str, WorkspaceStatus] = {}
+        if not wanted:
+            return statuses
+
+        token = await self._get_session_token()
+        client = await self._ensure_client()
+
+        for i in range(0, len(wanted), WORKSPACE_ID_BATCH_SIZE):
+            batch = wanted[i:i + WORKSPACE_ID_BATCH_SIZE]
+            resp = await client.get(
+                "/api/v2/workspaces",
+                headers={"Coder-Session-Token": token},
+                params={"q": f"id:{','.join(batch)}", "limit": len(batch)},
+            )
+
+            if resp.status_code != 200:
+                raise CoderAPIError(
+                    "Failed to list workspaces",
+                    status_code=resp.status_code,
+                )
+
+            for ws in resp.json().get("workspaces", []):
+                if ws["id"] in batch:
+                    latest_build = ws.get("latest_build", {})
+                    statuses[ws["id"]] = self._determine_workspace_status(
+                        latest_build, latest_build.get("job", {})
+                    )
+
+        return statuses
+
+    async def wait_for_workspace(
+        self,
+        workspace_id: str,
+        targets: Iterable[WorkspaceStatus] = (WorkspaceStatus.RUNNING,),
+        timeout: Optional[float] = None,
+    ) -> WorkspaceStatus:
+        """
+        Wait until a workspace build reaches one of ``targets``.
+
+        All waiting workspaces share one poller that queries their status in
+        batches every ``status_poll_interval`` seconds.
+
+        Args:
+            workspace_id: Workspace ID
+            targets: Statuses to wait for
+            timeout: Maximum seconds to wait (defaults to workspace_timeout)
+
+        Returns:
+            The status reached
+
+        Raises:
+            CoderWorkspaceActionError: If the build settles in another state
+            CoderWorkspaceNotFoundError: If the workspace is deleted while waiting
+            CoderTimeoutError: If no target status is reached in time
+        """
+        if self._poller is None:
+            self._poller = WorkspaceStatusPoller(self, self.settings.status_poll_interval)
+        return await self._poller.wait(
+            workspace_id,
+            targets,
+            timeout if timeout is not None else self.settings.workspace_timeout,
+        )
+
     async def workspace_exists(
         self,
         username: str,
@@ -1145,6 +1286,57 @@ class CoderClient:
             created_workspace=workspace_created,
         )
 
+    async def provision_workspaces(
+        self,
+        items: list[BulkProvisionItem],
+        max_concurrency: Optional[int] = None,
+        wait_until_running: bool = False,
+        timeout: Optional[float] = None,
+    ) -> list[BulkProvisionOutcome]:
+        """
+        Provision workspaces for many users with bounded concurrency.
+
+        Templates are resolved once for the whole batch. Failures are
+        reported per item instead of aborting the batch. When waiting for
+        the builds, the waits do not hold a provisioning slot and share one
+        batched status poller.
+
+        Args:
+            items: Users/workspaces to provision
+            max_concurrency: Concurrent provisions (defaults to bulk_provision_concurrency)
+            wait_until_running: Wait until each workspace is running
+            timeout: Per-workspace wait timeout (defaults to workspace_timeout)
+
+        Returns:
+            One outcome per item, in the order of ``items``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.settings.bulk_provision_concurrency)
+        await self._get_templates_by_name()
+
+        async def provision(item: BulkProvisionItem) -> BulkProvisionOutcome:
+            outcome = BulkProvisionOutcome(user_email=item.user_email)
+            try:
+                async with semaphore:
+                    outcome.result = await self.provision_workspace(
+                        user_email=item.user_email,
+                        username=item.username,
+                        full_name=item.full_name,
+                        template=item.template,
+                        workspace_name=item.workspace_name,
+                        computor_auth_token=item.computor_auth_token,
+                    )
+                if wait_until_running:
+                    outcome.status = await self.wait_for_workspace(
+                        outcome.result.workspace.id,
+                        timeout=timeout,
+                    )
+            except Exception as e:
+                logger.warning(f"Bulk provisioning failed for {item.user_email}: {e}")
+                outcome.error = str(e)
+            return outcome
+
+        return list(await asyncio.gather(*(provision(item) for item in items)))
+
     # -------------------------------------------------------------------------
     # Health check
     # -------------------------------------------------------------------------
@@ -1278,6 +1470,84 @@ class CoderClient:
             return False
 
 
+class WorkspaceStatusPoller:
+    """
+    Shared poller for workspace build status.
+
+    Waiters register a workspace and the statuses they wait for; while any
+    are registered, one background task fetches the status of all of them
+    with ``CoderClient.get_workspace_statuses`` every ``interval`` seconds
+    and resolves the waiters whose workspace has reached a target status.
+    Waiters for workspaces that no longer exist fail with
+    ``CoderWorkspaceNotFoundError``.
+    """
+
+    def __init__(self, client: CoderClient, interval: float):
+        self.client = client
+        self.interval = interval
+        self.polls = 0
+        self._waiters: dict[str, list[tuple[frozenset, asyncio.Future]]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def wait(
+        self,
+        workspace_id: str,
+        targets: Iterable[WorkspaceStatus],
+        timeout: float,
+    ) -> WorkspaceStatus:
+        """Wait until ``workspace_id`` reaches one of ``targets`` (see CoderClient.wait_for_workspace)."""
+        waiter = (frozenset(targets), asyncio.get_running_loop().create_future())
+        self._waiters.setdefault(workspace_id, []).append(waiter)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        try:
+            return await asyncio.wait_for(waiter[1], timeout)
+        except asyncio.TimeoutError:
+            raise CoderTimeoutError(f"wait for workspace {workspace_id}", timeout)
+        finally:
+            waiters = self._waiters.get(workspace_id, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self._waiters.pop(workspace_id, None)
+
+    async def _run(self) -> None:
+        while self._waiters:
+            pending = list(self._waiters)
+            try:
+                statuses = await self.client.get_workspace_statuses(pending)
+            except Exception as e:
+                logger.warning(f"Workspace status poll failed: {e}")
+                statuses = None
+            self.polls += 1
+
+            if statuses is None:
+                statuses = {}
+            else:
+                # Workspaces missing from a successful poll were deleted; stop polling them
+                for workspace_id in pending:
+                    if workspace_id in statuses:
+                        continue
+                    for _, future in self._waiters.pop(workspace_id, []):
+                        if not future.done():
+                            future.set_exception(CoderWorkspaceNotFoundError(workspace_id))
+
+            for workspace_id, status in statuses.items():
+                for targets, future in self._waiters.get(workspace_id, []):
+                    if future.done():
+                        continue
+                    if status in targets:
+                        future.set_result(status)
+                    elif status in SETTLED_WORKSPACE_STATES:
+                        future.set_exception(
+                            CoderWorkspaceActionError("start", workspace_id, reason=f"workspace is {status.value}")
+                        )
+
+            if self._waiters:
+                await asyncio.sleep(self.interval)
+
+
 # Singleton instance
 _coder_client: Optional[CoderClient] = None
 
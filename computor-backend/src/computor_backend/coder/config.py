@@ -87,6 +87,20 @@ class CoderSettings(BaseSettings):
         description="Delay between retries in seconds"
     )
 
+    # Caching, status polling and bulk provisioning
+    template_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds the template list and organization ID are cached"
+    )
+    status_poll_interval: float = Field(
+        default=2.0,
+        description="Seconds between batched workspace status queries while builds are pending"
+    )
+    bulk_provision_concurrency: int = Field(
+        default=10,
+        description="Workspaces provisioned concurrently by bulk provisioning"
+    )
+
     # Template management
     templates_dir: str = Field(
         default="/templates",
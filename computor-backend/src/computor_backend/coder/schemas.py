@@ -134,6 +134,52 @@ class ProvisionResult(BaseModel):
     )
 
 
+class BulkProvisionItem(BaseModel):
+    """One user/workspace to provision in a bulk request."""
+
+    user_email: str = Field(..., description="User's email (must match backend user)")
+    username: str = Field(..., description="Backend user ID (sanitized to u{uuid})")
+    full_name: Optional[str] = Field(None, description="Display name")
+    template: WorkspaceTemplate = Field(WorkspaceTemplate.PYTHON, description="Workspace template to use")
+    workspace_name: Optional[str] = Field(None, description="Custom workspace name")
+    computor_auth_token: Optional[str] = Field(
+        None,
+        description="Pre-minted API token for automatic extension authentication"
+    )
+
+
+class BulkProvisionOutcome(BaseModel):
+    """Result of provisioning one item of a bulk request."""
+
+    user_email: str = Field(..., description="User's email")
+    result: Optional[ProvisionResult] = Field(None, description="Provisioning result (None on failure)")
+    status: Optional[WorkspaceStatus] = Field(
+        None,
+        description="Workspace status reached (only when waiting for the build)"
+    )
+    error: Optional[str] = Field(None, description="Error message if provisioning failed")
+
+
+class BulkProvisionRequest(BaseModel):
+    """Request to provision workspaces for several users (e.g. a lab session)."""
+
+    emails: list[str] = Field(..., min_length=1, description="Emails of the users to provision")
+    template: WorkspaceTemplate = Field(WorkspaceTemplate.PYTHON, description="Workspace template to use")
+    workspace_name: Optional[str] = Field(None, description="Custom workspace name")
+    wait_until_running: bool = Field(
+        False,
+        description="Wait until all workspace builds have finished starting"
+    )
+
+
+class BulkProvisionResponse(BaseModel):
+    """Response for bulk provisioning."""
+
+    results: list[BulkProvisionOutcome] = Field(default_factory=list)
+    succeeded: int = Field(0, description="Number of successfully provisioned users")
+    failed: int = Field(0, description="Number of failed users")
+
+
 class CoderTemplate(BaseModel):
     """Coder template information."""
 
@@ -37,6 +37,7 @@ from computor_types.courses import (
 from computor_backend.model.organization import Organization
 from computor_backend.model.course import CourseFamily, Course
 from computor_backend.repositories.organization import OrganizationRepository
+from .gitlab_resolver import GitLabResolver
 from ..custom_types import Ltree
 
 
@@ -84,6 +85,9 @@ class GitLabBuilder:
             logger.error(f"Failed to authenticate with GitLab: {e}")
             raise
         
+        # Groups and projects resolved during this run
+        self.resolver = GitLabResolver(self.gitlab)
+
         # Initialize repositories
         self.org_repo = OrganizationRepository(db_session)
 
@@ -142,7 +146,7 @@ class GitLabBuilder:
                                 gitlab_config
                             )
                         else:
-                            result["gitlab_group"] = self.gitlab.groups.get(gitlab_config["group_id"])
+                            result["gitlab_group"] = self.resolver.get_group(gitlab_config["group_id"])
                     else:
                         # No group_id stored, create GitLab group
                         gitlab_group, _ = self._create_gitlab_group(
@@ -277,7 +281,7 @@ class GitLabBuilder:
                     return result
                 
                 try:
-                    parent_group = self.gitlab.groups.get(parent_group_id)
+                    parent_group = self.resolver.get_group(parent_group_id)
                 except GitlabGetError as e:
                     result["error"] = f"Failed to retrieve parent group {parent_group_id}: {str(e)}"
                     return result
@@ -312,7 +316,7 @@ class GitLabBuilder:
                                 gitlab_config
                             )
                         else:
-                            result["gitlab_group"] = self.gitlab.groups.get(gitlab_config["group_id"])
+                            result["gitlab_group"] = self.resolver.get_group(gitlab_config["group_id"])
                     else:
                         # Create GitLab group
                         gitlab_group, _ = self._create_gitlab_group(
@@ -383,7 +387,7 @@ class GitLabBuilder:
                 return result
             
             try:
-                parent_group = self.gitlab.groups.get(parent_group_id)
+                parent_group = self.resolver.get_group(parent_group_id)
             except GitlabGetError as e:
                 result["error"] = f"Failed to retrieve parent group {parent_group_id}: {str(e)}"
                 return result
@@ -487,7 +491,7 @@ class GitLabBuilder:
                     return result
                 
                 try:
-                    parent_group = self.gitlab.groups.get(parent_group_id)
+                    parent_group = self.resolver.get_group(parent_group_id)
                 except GitlabGetError as e:
                     result["error"] = f"Failed to retrieve parent group {parent_group_id}: {str(e)}"
                     return result
@@ -522,7 +526,7 @@ class GitLabBuilder:
                                 gitlab_config
                             )
                         else:
-                            result["gitlab_group"] = self.gitlab.groups.get(gitlab_config["group_id"])
+                            result["gitlab_group"] = self.resolver.get_group(gitlab_config["group_id"])
                     else:
                         # Create GitLab group
                         gitlab_group, _ = self._create_gitlab_group(
@@ -613,7 +617,7 @@ class GitLabBuilder:
                 return result
             
             try:
-                parent_group = self.gitlab.groups.get(parent_group_id)
+                parent_group = self.resolver.get_group(parent_group_id)
             except GitlabGetError as e:
                 result["error"] = f"Failed to retrieve parent group {parent_group_id}: {str(e)}"
                 return result
@@ -729,18 +733,16 @@ class GitLabBuilder:
             full_path = f"{parent_group.full_path}/{path}"
         elif parent_id:
             logger.info(f"Looking up parent group with ID: {parent_id}")
-            parent = self.gitlab.groups.get(parent_id)
+            parent = self.resolver.get_group(parent_id)
             full_path = f"{parent.full_path}/{path}"
         else:
             full_path = path
         
-        # Search for existing group
+        # Look up existing group by path
         try:
-            groups = self.gitlab.groups.list(all=True)
-            existing_groups = [g for g in groups if g.full_path == full_path]
+            group = self.resolver.find_group(full_path)
             
-            if existing_groups:
-                group = self.gitlab.groups.get(existing_groups[0].id)
+            if group:
                 logger.info(f"Found existing GitLab group: {group.full_path}")
                 
                 # Update description if needed
@@ -752,7 +754,7 @@ class GitLabBuilder:
                 return group, {}
                 
         except Exception as e:
-            logger.warning(f"Error searching for group: {e}")
+            logger.warning(f"Error looking up group {full_path}: {e}")
         
         # Create new group
         payload = {
@@ -767,6 +769,7 @@ class GitLabBuilder:
         try:
             logger.info(f"Creating GitLab group with payload: {payload}")
             group = self.gitlab.groups.create(payload)
+            self.resolver.remember_group(group)
             logger.info(f"Created new GitLab group: {group.full_path}")
             
             # Return group with basic metadata (config will be created by caller)
@@ -776,10 +779,8 @@ class GitLabBuilder:
             # Check if it's a duplicate error
             if "has already been taken" in str(e):
                 # Try to find the existing group
-                groups = self.gitlab.groups.list(all=True)
-                existing_groups = [g for g in groups if g.full_path == full_path]
-                if existing_groups:
-                    group = self.gitlab.groups.get(existing_groups[0].id)
+                group = self.resolver.find_group(full_path)
+                if group:
                     logger.info(f"Found existing GitLab group after create error: {group.full_path}")
                     return group, {}
             raise
@@ -823,7 +824,7 @@ class GitLabBuilder:
     def _validate_gitlab_group(self, group_id: int, expected_path: str) -> bool:
         """Validate if GitLab group exists and matches expected path."""
         try:
-            group = self.gitlab.groups.get(group_id)
+            group = self.resolver.get_group(group_id)
             # Check if the group's path (not full_path) matches the expected path
             # This handles cases where the group is under a parent
             return group.path == expected_path
@@ -846,7 +847,7 @@ class GitLabBuilder:
         try:
             # Get the course family group
             try:
-                group = self.gitlab.groups.get(course_family_group_id)
+                group = self.resolver.get_group(course_family_group_id)
             except GitlabGetError as e:
                 logger.error(f"Failed to get GitLab group {course_family_group_id}: {e}")
                 return False
@@ -856,14 +857,10 @@ class GitLabBuilder:
             project = None
             repo_already_exists = False
 
-            try:
-                # Try to get the repository
-                project = self.gitlab.projects.get(repo_path.replace('/', '%2F'))
+            project = self.resolver.find_project(repo_path)
+            if project:
                 logger.info(f"Documents repository already exists: {repo_path}")
                 repo_already_exists = True
-            except GitlabGetError:
-                # Repository doesn't exist, create it
-                pass
 
             # If repository already exists, check if README exists before creating
             if repo_already_exists and project:
@@ -920,6 +917,7 @@ Documents are automatically synchronized and made available to students through
                 }
 
                 project = self.gitlab.projects.create(project_data)
+                self.resolver.remember_project(project)
                 logger.info(f"Created documents repository: {project.path_with_namespace}")
 
             # Create and commit README.md only if repository was just created or README is missing
@@ -1024,16 +1022,12 @@ Documents are automatically synchronized and made available to students through
             full_path = f"{parent_group.full_path}/{students_path}"
             
             # Try to find existing students group
-            existing_groups = parent_group.subgroups.list(search=students_path)
-            students_group = None
-            
-            for group in existing_groups:
-                if group.path == students_path:
-                    students_group = self.gitlab.groups.get(group.id)
-                    logger.info(f"Students group already exists: {students_group.full_path}")
-                    result["gitlab_group"] = students_group
-                    result["success"] = True
-                    return result
+            students_group = self.resolver.find_group(full_path)
+            if students_group:
+                logger.info(f"Students group already exists: {students_group.full_path}")
+                result["gitlab_group"] = students_group
+                result["success"] = True
+                return result
             
             # Create students group
             group_data = {
@@ -1045,6 +1039,7 @@ Documents are automatically synchronized and made available to students through
             }
             
             students_group = self.gitlab.groups.create(group_data)
+            self.resolver.remember_group(students_group)
             logger.info(f"Created students group: {students_group.full_path}")
             
             # Update course properties to include students group info
@@ -1095,16 +1090,12 @@ Documents are automatically synchronized and made available to students through
             full_path = f"{parent_group.full_path}/{tutors_path}"
             
             # Try to find existing tutors group
-            existing_groups = parent_group.subgroups.list(search=tutors_path)
-            tutors_group = None
-            
-            for group in existing_groups:
-                if group.path == tutors_path:
-                    tutors_group = self.gitlab.groups.get(group.id)
-                    logger.info(f"Tutors group already exists: {tutors_group.full_path}")
-                    result["gitlab_group"] = tutors_group
-                    result["success"] = True
-                    return result
+            tutors_group = self.resolver.find_group(full_path)
+            if tutors_group:
+                logger.info(f"Tutors group already exists: {tutors_group.full_path}")
+                result["gitlab_group"] = tutors_group
+                result["success"] = True
+                return result
             
             # Create tutors group
             group_data = {
@@ -1116,6 +1107,7 @@ Documents are automatically synchronized and made available to students through
             }
             
             tutors_group = self.gitlab.groups.create(group_data)
+            self.resolver.remember_group(tutors_group)
             logger.info(f"Created tutors group: {tutors_group.full_path}")
             
             # Update course properties to include tutors group info
@@ -1188,22 +1180,11 @@ Documents are automatically synchronized and made available to students through
                 full_path = f"{parent_group.full_path}/{project_path}"
                 
                 # Check if project already exists
-                existing_projects = self.gitlab.projects.list(
-                    search=project_path,
-                    namespace_id=parent_group.id
-                )
-                
-                project_exists = False
-                for existing in existing_projects:
-                    # Handle namespace as dict or object
-                    namespace_id = existing.namespace.get('id') if hasattr(existing.namespace, 'get') else existing.namespace.id
-                    if existing.path == project_path and namespace_id == parent_group.id:
-                        logger.info(f"Project already exists: {existing.path_with_namespace}")
-                        result["existing_projects"].append(project_path)
-                        project_exists = True
-                        break
-                
-                if not project_exists:
+                existing = self.resolver.find_project(full_path)
+                if existing:
+                    logger.info(f"Project already exists: {existing.path_with_namespace}")
+                    result["existing_projects"].append(project_path)
+                else:
                     # Create project
                     project_data = {
                         'name': project_config["name"],
@@ -1216,6 +1197,7 @@ Documents are automatically synchronized and made available to students through
                     }
                     
                     project = self.gitlab.projects.create(project_data)
+                    self.resolver.remember_project(project)
                     logger.info(f"Created project: {project.path_with_namespace}")
                     result["created_projects"].append(project_path)
             
@@ -0,0 +1,80 @@
+"""
+GitLab group and project lookups for the hierarchy builder.
+
+Groups and projects are looked up directly by ID or by full path
+(``GET /groups/:id`` with a URL-encoded path) instead of listing and
+filtering, and everything resolved is cached for the lifetime of the
+resolver, so one builder run asks GitLab about each group at most once.
+"""
+
+import logging
+from typing import Dict, Optional, Union
+
+from gitlab import Gitlab
+from gitlab.exceptions import GitlabGetError
+from gitlab.v4.objects import Group, Project
+
+logger = logging.getLogger(__name__)
+
+
+class GitLabResolver:
+    """Per-run cache of GitLab groups (by ID and full path) and projects (by full path)."""
+
+    def __init__(self, gitlab: Gitlab):
+        """
+        Args:
+            gitlab: Authenticated GitLab client
+        """
+        self.gitlab = gitlab
+        self._groups: Dict[Union[int, str], Group] = {}
+        self._projects: Dict[str, Project] = {}
+
+    def get_group(self, group_id: int) -> Group:
+        """
+        Group by ID.
+
+        Raises:
+            GitlabGetError: If the group does not exist
+        """
+        group = self._groups.get(int(group_id))
+        if group is None:
+            group = self.gitlab.groups.get(int(group_id))
+            self.remember_group(group)
+        return group
+
+    def find_group(self, full_path: str) -> Optional[Group]:
+        """Group by full path, or None if there is none."""
+        group = self._groups.get(full_path)
+        if group is None:
+            try:
+                # python-gitlab URL-encodes the path ("a/b" -> "a%2Fb")
+                group = self.gitlab.groups.get(full_path)
+            except GitlabGetError as e:
+                if e.response_code == 404:
+                    return None
+                raise
+            self.remember_group(group)
+        return group
+
+    def find_project(self, full_path: str) -> Optional[Project]:
+        """Project by full path (``path_with_namespace``), or None if there is none."""
+        project = self._projects.get(full_path)
+        if project is None:
+            try:
+                project = self.gitlab.projects.get(full_path)
+            except GitlabGetError as e:
+                if e.response_code == 404:
+                    return None
+                raise
+            self.remember_project(project)
+        return project
+
+    def remember_group(self, group: Group) -> None:
+        """Cache a group fetched or created elsewhere."""
+        self._groups[int(group.id)] = group
+        self._groups[group.full_path] = group
+
+    def remember_project(self, project: Project) -> None:
+        """Cache a project fetched or created elsewhere."""
+        self._projects[project.path_with_namespace] = project
+
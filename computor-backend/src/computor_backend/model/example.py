@@ -279,6 +279,15 @@ class ExampleVersion(Base):
         comment="Resolved Service.id for the executionBackend declared in meta.yaml",
     )
 
+    # SHA-256 over the stored files (computor_utils.compute_example_content_hash);
+    # lets uploaders skip unchanged examples. NULL for versions uploaded
+    # before the column existed.
+    content_hash = Column(
+        String(64),
+        nullable=True,
+        comment="SHA-256 of the version's files",
+    )
+
     # Tracking
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     created_by = Column(UUID, ForeignKey("user.id"), comment="User who created this version")
@@ -6,6 +6,7 @@ for students when they access submittable course content.
 """
 
 import logging
+from typing import Dict, Iterable, List
 from uuid import UUID
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_
@@ -25,7 +26,8 @@ logger = logging.getLogger(__name__)
 def _create_submission_group_for_member(
     course_member: CourseMember,
     course_content: CourseContent,
-    db: Session
+    db: Session,
+    check_existing: bool = True,
 ) -> SubmissionGroup | None:
     """
     Helper function to create or update a submission group for a course member and course content.
@@ -41,20 +43,24 @@ def _create_submission_group_for_member(
         course_member: CourseMember with user relationship loaded
         course_content: CourseContent to create submission group for
         db: Database session
+        check_existing: Look up an existing group first. Callers that already
+            know no group exists for this pair pass False to skip the query.
 
     Returns:
         Created or updated SubmissionGroup, or None if already exists and properly configured
     """
     # Check if submission group already exists
-    existing_group = (
-        db.query(SubmissionGroup)
-        .join(SubmissionGroupMember, SubmissionGroupMember.submission_group_id == SubmissionGroup.id)
-        .filter(
-            SubmissionGroup.course_content_id == course_content.id,
-            SubmissionGroupMember.course_member_id == course_member.id
+    existing_group = None
+    if check_existing:
+        existing_group = (
+            db.query(SubmissionGroup)
+            .join(SubmissionGroupMember, SubmissionGroupMember.submission_group_id == SubmissionGroup.id)
+            .filter(
+                SubmissionGroup.course_content_id == course_content.id,
+                SubmissionGroupMember.course_member_id == course_member.id
+            )
+            .first()
         )
-        .first()
-    )
 
     # Calculate max_group_size
     max_group_size = course_content.max_group_size if course_content.max_group_size is not None else 1
@@ -323,3 +329,87 @@ def provision_submission_groups_for_course_content(
     )
 
     return created_count
+
+
+def provision_submission_groups_for_members(
+    course_id: UUID | str,
+    course_member_ids: Iterable[UUID | str],
+    db: Session
+) -> Dict[str, List[str]]:
+    """
+    Provision submission groups for many members of one course at once.
+
+    Bulk counterpart of ``provision_submission_groups_for_user`` used by the
+    roster import: submittable contents are loaded once and existing
+    (member, content) pairs are resolved with a single query, instead of
+    repeating both lookups per member. Changes are flushed, not committed.
+
+    Args:
+        course_id: Course the members belong to
+        course_member_ids: CourseMember IDs to provision
+        db: Database session
+
+    Returns:
+        Mapping of course_member_id to all of its submission group IDs
+    """
+    member_ids = [str(m) for m in course_member_ids]
+    if not member_ids:
+        return {}
+
+    course_members = db.query(CourseMember).options(
+        joinedload(CourseMember.user)
+    ).filter(
+        CourseMember.course_id == course_id,
+        CourseMember.id.in_(member_ids),
+    ).all()
+
+    submittable_contents = [
+        course_content
+        for course_content, _ in (
+            db.query(CourseContent, CourseContentKind)
+            .join(CourseContentKind, CourseContentKind.id == CourseContent.course_content_kind_id)
+            .filter(
+                CourseContent.course_id == course_id,
+                CourseContentKind.submittable == True
+            )
+            .all()
+        )
+        if course_content.max_group_size is None or course_content.max_group_size <= 1
+    ]
+
+    def _existing_groups():
+        return (
+            db.query(SubmissionGroupMember.course_member_id, SubmissionGroup.course_content_id, SubmissionGroup.id)
+            .join(SubmissionGroup, SubmissionGroup.id == SubmissionGroupMember.submission_group_id)
+            .filter(SubmissionGroupMember.course_member_id.in_(member_ids))
+            .all()
+        )
+
+    existing_pairs = {
+        (str(member_id), str(content_id)) for member_id, content_id, _ in _existing_groups()
+    }
+
+    created_count = 0
+    for course_member in course_members:
+        for course_content in submittable_contents:
+            exists = (str(course_member.id), str(course_content.id)) in existing_pairs
+            # Only re-imported members with GitLab info can need an update
+            if exists and not (course_member.properties and 'gitlab' in course_member.properties):
+                continue
+            submission_group = _create_submission_group_for_member(
+                course_member, course_content, db, check_existing=exists
+            )
+            if submission_group:
+                created_count += 1
+
+    db.flush()
+
+    groups_by_member: Dict[str, List[str]] = {member_id: [] for member_id in member_ids}
+    for member_id, _, group_id in _existing_groups():
+        groups_by_member.setdefault(str(member_id), []).append(str(group_id))
+
+    logger.info(
+        f"Provisioned {created_count} submission groups for "
+        f"{len(course_members)} members of course {course_id}"
+    )
+    return groups_by_member
@@ -7,6 +7,8 @@ work with query results, DTOs, and complex data structures.
 """
 
 from abc import ABC
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any, Optional, Dict, List
 from sqlalchemy.orm import Session
 import logging
@@ -18,6 +20,58 @@ from ..cache import Cache
 logger = logging.getLogger(__name__)
 
 
+def if_none_match_hits(header: str, etag: str) -> bool:
+    """Compare a client's ``If-None-Match`` header against ``etag``.
+
+    Accepts a comma-separated list and the wildcard ``*``; ``W/``
+    weak prefixes on either side are stripped before comparison so a
+    client that re-quotes the etag as weak still matches.
+    """
+    def normalize(s: str) -> str:
+        s = s.strip()
+        if s.startswith("W/"):
+            s = s[2:]
+        return s
+
+    target = normalize(etag)
+    for raw in header.split(","):
+        candidate = raw.strip()
+        if candidate == "*":
+            return True
+        if normalize(candidate) == target:
+            return True
+    return False
+
+
+class ViewNotModified(Exception):
+    """Raised from a view cache lookup when the client's validator still matches.
+
+    Endpoints wrapped by ``api._conditional.conditional_view`` turn this into
+    ``304 Not Modified`` before the cached payload is even loaded.
+    """
+
+    def __init__(self, etag: str):
+        super().__init__(etag)
+        self.etag = etag
+
+
+@dataclass
+class ViewValidation:
+    """Per-request conditional-GET state shared with the view repositories.
+
+    Mutable on purpose: sync business logic runs in a worker thread with a
+    copy of the context, so the repository writes ``etag`` on this shared
+    object rather than setting a new context value.
+    """
+    if_none_match: Optional[str] = None
+    etag: Optional[str] = None
+
+
+view_validation: ContextVar[Optional[ViewValidation]] = ContextVar(
+    "view_validation", default=None
+)
+
+
 def _aggregate_grading_status(statuses: List[str]) -> Optional[str]:
     """
     Aggregate multiple grading statuses following priority rules.
@@ -117,6 +171,33 @@ class ViewRepository(ABC):
         """Check if caching is enabled."""
         return self.cache is not None
 
+    def _revalidate(self, user_id: str, view_type: str, view_id: Optional[str] = None) -> None:
+        """Answer a conditional GET from the stored view ETag, if one is in flight.
+
+        Records the cached view's ETag for the response and raises
+        ``ViewNotModified`` when it matches the client's ``If-None-Match``,
+        so neither the payload nor the mappers are touched.
+        """
+        state = view_validation.get()
+        if state is None:
+            return
+
+        etag = self.cache.get_user_view_etag(user_id=user_id, view_type=view_type, view_id=view_id)
+        if etag is None:
+            return
+
+        state.etag = etag
+        if state.if_none_match and if_none_match_hits(state.if_none_match, etag):
+            logger.debug(f"Cache NOT MODIFIED: user={user_id}, view={view_type}, id={view_id}")
+            raise ViewNotModified(etag)
+
+    @staticmethod
+    def _record_etag(etag: Optional[str]) -> None:
+        """Remember the ETag of a freshly cached view for the current request."""
+        state = view_validation.get()
+        if state is not None and etag is not None:
+            state.etag = etag
+
     def _build_cache_key(self, user_id: str, view_type: str, view_id: Optional[str] = None, **kwargs) -> str:
         """
         Build a cache key for user views.
@@ -158,6 +239,8 @@ class ViewRepository(ABC):
         if not self._use_cache():
             return None
 
+        self._revalidate(str(user_id), view_type, str(view_id) if view_id else None)
+
         cached = self.cache.get_user_view(
             user_id=str(user_id),
             view_type=view_type,
@@ -203,6 +286,8 @@ class ViewRepository(ABC):
         params_key = self._serialize_query_params(params)
         full_view_type = f"{view_type}:{params_key}"
 
+        self._revalidate(str(user_id), full_view_type)
+
         cached = self.cache.get_user_view(
             user_id=str(user_id),
             view_type=full_view_type
@@ -238,7 +323,7 @@ class ViewRepository(ABC):
         if not self._use_cache():
             return
 
-        self.cache.set_user_view(
+        etag = self.cache.set_user_view(
             user_id=str(user_id),
             view_type=view_type,
             view_id=str(view_id) if view_id else None,
@@ -247,6 +332,8 @@ class ViewRepository(ABC):
             related_ids=related_ids
         )
 
+        self._record_etag(etag)
+
         logger.debug(f"Cache SET: user={user_id}, view={view_type}, id={view_id}, ttl={ttl or self.get_default_ttl()}")
 
     def _set_cached_query_view(
@@ -292,7 +379,7 @@ class ViewRepository(ABC):
         # Merge auto-extracted IDs with manually provided ones
         all_related_ids = {**auto_related_ids, **(related_ids or {})}
 
-        self.cache.set_user_view(
+        etag = self.cache.set_user_view(
             user_id=str(user_id),
             view_type=full_view_type,
             data=data,
@@ -300,6 +387,8 @@ class ViewRepository(ABC):
             related_ids=all_related_ids if all_related_ids else None
         )
 
+        self._record_etag(etag)
+
         logger.debug(f"Cache SET: user={user_id}, view={full_view_type}, tags={list(all_related_ids.keys()) if all_related_ids else []}, ttl={ttl or self.get_default_ttl()}")
 
     def _invalidate_user_view(
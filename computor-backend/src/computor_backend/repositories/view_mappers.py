@@ -29,7 +29,7 @@ from computor_types.tasks import map_int_to_task_status
 from computor_backend.model.artifact import SubmissionGrade, SubmissionArtifact
 from computor_backend.model.course import CourseMember
 from computor_backend.repositories.course_content import CourseMemberCourseContentQueryResult
-from computor_backend.services.result_storage import retrieve_result_json, list_result_artifacts
+from computor_backend.services.result_storage import retrieve_result_details
 
 logger = logging.getLogger(__name__)
 
@@ -69,8 +69,9 @@ async def _build_result_payload(result, detailed: bool):
     """Convert a ``Result`` row to its student DTO.
 
     For ``detailed=True`` we additionally fetch ``result_json`` and the
-    artifact listing from MinIO — the only I/O outside the database
-    that this module performs.
+    artifact listing from MinIO (concurrently, ``result_json`` usually
+    from the Redis cache) — the only I/O outside the database that this
+    module performs.
     """
     if result is None or result.test_system_id is None:
         return None
@@ -89,8 +90,7 @@ async def _build_result_payload(result, detailed: bool):
     if not detailed:
         return ResultStudentList(**common)
 
-    result_json_data = await retrieve_result_json(result.id)
-    artifacts = await list_result_artifacts(result.id)
+    result_json_data, artifacts = (await retrieve_result_details([result.id]))[str(result.id)]
     result_artifacts = [
         ResultArtifactInfo(
             id=f"{result.id}_{artifact['filename']}",
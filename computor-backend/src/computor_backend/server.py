@@ -286,7 +286,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["X-Total-Count"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor"],
 )
 
 def _guard_no_archive_admin(entity, permissions, db):
@@ -11,13 +11,14 @@ Storage structure:
 """
 
 import logging
-from typing import List, Tuple
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
 from .storage_service import StorageService, get_storage_service
-from .result_storage import RESULTS_BUCKET, delete_result_json, delete_result_artifacts
+from .result_storage import RESULTS_BUCKET, delete_result_json, delete_result_artifacts, get_result_json_key
 from ..exceptions import NotFoundException
 
 logger = logging.getLogger(__name__)
@@ -57,6 +58,74 @@ async def cleanup_submission_artifact(
         return False
 
 
+async def remove_objects_by_bucket(
+    objects: Iterable[Tuple[str, str]],
+    storage: StorageService | None = None
+) -> int:
+    """
+    Delete (bucket_name, object_key) pairs with one multi-object delete per bucket batch.
+
+    Args:
+        objects: (bucket_name, object_key) tuples
+        storage: Optional storage service instance
+
+    Returns:
+        Number of objects deleted
+    """
+    if storage is None:
+        storage = get_storage_service()
+
+    by_bucket: Dict[str, List[str]] = defaultdict(list)
+    for bucket_name, object_key in objects:
+        if bucket_name and object_key:
+            by_bucket[bucket_name].append(object_key)
+
+    deleted_count = 0
+    for bucket_name, keys in by_bucket.items():
+        try:
+            deleted_count += await storage.remove_objects(keys, bucket_name=bucket_name)
+        except Exception as e:
+            logger.warning(f"Error deleting {len(keys)} objects from {bucket_name}: {e}")
+    return deleted_count
+
+
+async def remove_objects_by_prefix(
+    prefixes: Iterable[Tuple[str, str]],
+    storage: StorageService | None = None
+) -> int:
+    """
+    Delete everything under (bucket_name, prefix) pairs.
+
+    Each prefix still needs its own listing, but all listed keys of a
+    bucket are removed together in multi-object delete batches.
+
+    Args:
+        prefixes: (bucket_name, prefix) tuples
+        storage: Optional storage service instance
+
+    Returns:
+        Number of objects deleted
+    """
+    if storage is None:
+        storage = get_storage_service()
+
+    objects: List[Tuple[str, str]] = []
+    for bucket_name, prefix in prefixes:
+        if not bucket_name or not prefix:
+            continue
+        try:
+            listed = await storage.list_objects(bucket_name=bucket_name, prefix=prefix, recursive=True)
+        except NotFoundException:
+            logger.debug(f"Storage not found: {bucket_name}/{prefix}")
+            continue
+        except Exception as e:
+            logger.warning(f"Error listing storage {bucket_name}/{prefix}: {e}")
+            continue
+        objects.extend((bucket_name, obj.object_name) for obj in listed)
+
+    return await remove_objects_by_bucket(objects, storage)
+
+
 async def cleanup_submission_artifacts_batch(
     artifacts: List[Tuple[str, str]],
     storage: StorageService | None = None
@@ -71,13 +140,7 @@ async def cleanup_submission_artifacts_batch(
     Returns:
         Number of artifacts successfully deleted
     """
-    if storage is None:
-        storage = get_storage_service()
-
-    deleted_count = 0
-    for bucket_name, object_key in artifacts:
-        if await cleanup_submission_artifact(bucket_name, object_key, storage):
-            deleted_count += 1
+    deleted_count = await remove_objects_by_bucket(artifacts, storage)
 
     logger.info(f"Deleted {deleted_count}/{len(artifacts)} submission artifacts")
     return deleted_count
@@ -112,18 +175,27 @@ async def cleanup_results_batch(
     """
     Delete all MinIO objects for multiple results.
 
+    The result.json keys are known and removed in multi-object batches;
+    artifact folders are listed per result and removed the same way.
+
     Args:
         result_ids: List of result IDs
-        storage: Optional storage service instance (not used, but kept for consistency)
+        storage: Optional storage service instance
 
     Returns:
         Total number of objects deleted
     """
-    total_deleted = 0
+    if not result_ids:
+        return 0
 
-    for result_id in result_ids:
-        deleted = await cleanup_result_storage(result_id)
-        total_deleted += deleted
+    total_deleted = await remove_objects_by_bucket(
+        ((RESULTS_BUCKET, get_result_json_key(result_id)) for result_id in result_ids),
+        storage,
+    )
+    total_deleted += await remove_objects_by_prefix(
+        ((RESULTS_BUCKET, f"{str(result_id)}/artifacts/") for result_id in result_ids),
+        storage,
+    )
 
     logger.info(f"Deleted storage for {len(result_ids)} results ({total_deleted} objects)")
     return total_deleted
@@ -145,33 +217,8 @@ async def cleanup_example_version_storage(
     Returns:
         Number of objects deleted
     """
-    if storage is None:
-        storage = get_storage_service()
-
-    deleted_count = 0
-
-    try:
-        # List all objects under the storage path
-        objects = await storage.list_objects(
-            bucket_name=bucket_name,
-            prefix=storage_path,
-            recursive=True
-        )
-
-        for obj in objects:
-            try:
-                await storage.delete_file(obj.object_name, bucket_name=bucket_name)
-                deleted_count += 1
-                logger.debug(f"Deleted example file: {bucket_name}/{obj.object_name}")
-            except Exception as e:
-                logger.warning(f"Failed to delete example file {obj.object_name}: {e}")
-
-        logger.info(f"Deleted {deleted_count} files for example version at {bucket_name}/{storage_path}")
-    except NotFoundException:
-        logger.debug(f"Example storage not found: {bucket_name}/{storage_path}")
-    except Exception as e:
-        logger.warning(f"Error listing example version storage {bucket_name}/{storage_path}: {e}")
-
+    deleted_count = await remove_objects_by_prefix([(bucket_name, storage_path)], storage)
+    logger.info(f"Deleted {deleted_count} files for example version at {bucket_name}/{storage_path}")
     return deleted_count
 
 
@@ -189,15 +236,10 @@ async def cleanup_example_versions_batch(
     Returns:
         Total number of objects deleted
     """
-    if storage is None:
-        storage = get_storage_service()
-
-    total_deleted = 0
-
-    for storage_path, bucket_name in versions:
-        if storage_path and bucket_name:
-            deleted = await cleanup_example_version_storage(storage_path, bucket_name, storage)
-            total_deleted += deleted
+    total_deleted = await remove_objects_by_prefix(
+        ((bucket_name, storage_path) for storage_path, bucket_name in versions),
+        storage,
+    )
 
     logger.info(f"Deleted storage for {len(versions)} example versions ({total_deleted} objects)")
     return total_deleted
@@ -222,34 +264,11 @@ async def cleanup_submission_group_by_prefix(
     Returns:
         Number of objects deleted
     """
-    if storage is None:
-        storage = get_storage_service()
-
-    deleted_count = 0
-    prefix = f"{str(submission_group_id)}/"
-
-    try:
-        objects = await storage.list_objects(
-            bucket_name=bucket_name,
-            prefix=prefix,
-            recursive=True
-        )
-
-        for obj in objects:
-            try:
-                await storage.delete_file(obj.object_name, bucket_name=bucket_name)
-                deleted_count += 1
-                logger.debug(f"Deleted submission file: {bucket_name}/{obj.object_name}")
-            except Exception as e:
-                logger.warning(f"Failed to delete submission file {obj.object_name}: {e}")
-
-        if deleted_count > 0:
-            logger.info(f"Deleted {deleted_count} files for submission group {submission_group_id}")
-    except NotFoundException:
-        logger.debug(f"Submission group storage not found: {bucket_name}/{prefix}")
-    except Exception as e:
-        logger.warning(f"Error listing submission group storage {bucket_name}/{prefix}: {e}")
-
+    deleted_count = await remove_objects_by_prefix(
+        [(bucket_name, f"{str(submission_group_id)}/")], storage
+    )
+    if deleted_count > 0:
+        logger.info(f"Deleted {deleted_count} files for submission group {submission_group_id}")
     return deleted_count
 
 
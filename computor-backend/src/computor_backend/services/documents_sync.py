@@ -0,0 +1,440 @@
+"""
+Incremental sync of a course family's documents repository to the served
+documents directory.
+
+The repository is kept up to date in the worker's git mirror
+(``services.git_mirror``), so a sync only fetches new commits. The files
+changed since the last synced commit come from ``git diff-tree``; they are
+applied to a hard-linked copy of the served tree, which then replaces the
+served tree in one atomic directory swap. Unchanged files are never
+rewritten, and readers never see a half-synced tree.
+
+Files in the target that did not come from the repository (e.g. uploaded
+through the documents API) are kept, including ones written while a sync
+is running: they are carried over to the new tree just before and again
+just after the swap. Which files did come from the repository is
+recorded, together with the synced commit, in a small state file outside
+the served tree::
+
+    <state_dir>/<sha256(target)>.json   # {"url", "commit", "files"}
+    <state_dir>/<sha256(target)>.lock   # flock serializing syncs of one target
+
+The state lives next to the shared documents volume rather than in the
+worker-local mirror, so any worker can continue where another left off. A
+full sync is done when there is no usable state, on ``force``, or when the
+previous commit is unknown to this worker's mirror (e.g. after a force push).
+"""
+
+import ctypes
+import errno
+import fcntl
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from git import GitCommandError, Repo
+
+from .git_mirror import GitMirrorCache, MirrorBranchNotFound, strip_url_credentials
+
+logger = logging.getLogger(__name__)
+
+# Files/directories excluded from sync anywhere in the tree. These are
+# sensitive or unnecessary files that should not be exposed.
+SYNC_BLACKLIST = {
+    '.git',           # Git metadata
+    '.gitignore',     # Git configuration (not needed for static serving)
+    '.gitlab-ci.yml', # CI/CD configuration
+    '.DS_Store',      # macOS metadata
+    'Thumbs.db',      # Windows metadata
+    '.env',           # Environment variables (security)
+    '.env.local',     # Environment variables
+    'node_modules',   # Dependencies
+    '__pycache__',    # Python cache
+    '*.pyc',          # Python compiled files
+    '.vscode',        # Editor settings
+    '.idea',          # Editor settings
+}
+
+# Excluded from the repository root only
+ROOT_BLACKLIST = {
+    'README.md',      # Root README (repository description, not course document)
+}
+
+# Branches tried, in order, when picking the branch to sync
+DEFAULT_BRANCHES = ("main", "master")
+
+# git tree entry modes of regular files; symlinks and submodules are not synced
+_FILE_MODES = {"100644", "100755"}
+_EXECUTABLE_MODE = "100755"
+
+_RENAME_EXCHANGE = 2
+_AT_FDCWD = -100
+
+
+def should_exclude(name: str, blacklist: set) -> bool:
+    """Check if a file/directory name matches a blacklist entry or pattern."""
+    if name in blacklist:
+        return True
+    return any(fnmatch.fnmatch(name, pattern) for pattern in blacklist)
+
+
+def is_synced_path(path: str) -> bool:
+    """Whether a repository path (``/``-separated) is synced to the target."""
+    parts = path.split("/")
+    if len(parts) == 1 and should_exclude(parts[0], ROOT_BLACKLIST):
+        return False
+    return not any(should_exclude(part, SYNC_BLACKLIST) for part in parts)
+
+
+def copy_tree_filtered(src: str, dst: str, blacklist: set = SYNC_BLACKLIST, root_src: Optional[str] = None):
+    """
+    Copy directory tree while filtering out blacklisted items.
+
+    Args:
+        src: Source directory
+        dst: Destination directory
+        blacklist: Set of items to exclude everywhere
+        root_src: Original root source directory (to detect root-level files)
+    """
+    if root_src is None:
+        root_src = src
+    is_root = (src == root_src)
+
+    os.makedirs(dst, exist_ok=True)
+
+    for item in os.listdir(src):
+        if should_exclude(item, blacklist):
+            logger.debug(f"Skipping blacklisted item: {item}")
+            continue
+        if is_root and should_exclude(item, ROOT_BLACKLIST):
+            logger.debug(f"Skipping root-level file: {item}")
+            continue
+
+        src_path = os.path.join(src, item)
+        dst_path = os.path.join(dst, item)
+
+        if os.path.isdir(src_path):
+            copy_tree_filtered(src_path, dst_path, blacklist, root_src)
+        else:
+            shutil.copy2(src_path, dst_path)
+
+
+@dataclass
+class DocumentsSyncResult:
+    """Outcome of one documents sync."""
+    commit: str
+    mode: str  # "full", "incremental" or "unchanged"
+    files: int  # repository files present in the target
+    written: int = 0
+    deleted: int = 0
+
+
+def _exchange_directories(a: str, b: str) -> None:
+    """Atomically swap two directories (``renameat2(RENAME_EXCHANGE)``)."""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        renameat2 = None
+    if renameat2 is not None:
+        if renameat2(_AT_FDCWD, os.fsencode(a), _AT_FDCWD, os.fsencode(b), _RENAME_EXCHANGE) == 0:
+            return
+        err = ctypes.get_errno()
+        if err not in (errno.ENOSYS, errno.EINVAL):
+            raise OSError(err, os.strerror(err), a)
+    # Not supported by the kernel/filesystem: two renames, briefly without ``b``
+    parked = b + ".swap"
+    os.rename(b, parked)
+    os.rename(a, b)
+    os.rename(parked, a)
+
+
+def _resolve_branch(repo: Repo, branch: Optional[str]) -> str:
+    """Commit SHA of the branch to sync in a mirror."""
+    names = [branch] if branch else list(DEFAULT_BRANCHES)
+    for name in names:
+        try:
+            return repo.git.rev_parse("--verify", "--quiet", f"refs/remotes/origin/{name}^{{commit}}")
+        except GitCommandError:
+            continue
+    if not branch:
+        refs = repo.git.for_each_ref("--format=%(refname)", "refs/remotes/origin/").split()
+        if refs:
+            return repo.git.rev_parse(f"{refs[0]}^{{commit}}")
+    raise MirrorBranchNotFound(f"Branch '{branch or DEFAULT_BRANCHES[0]}' not found")
+
+
+def _tree_files(repo: Repo, commit: str) -> Dict[str, Tuple[str, str]]:
+    """Synced regular files of a commit: path -> (mode, blob SHA)."""
+    files = {}
+    for record in repo.git.ls_tree("-r", "-z", commit).split("\0"):
+        if not record:
+            continue
+        meta, path = record.split("\t", 1)
+        mode, _, sha = meta.split(" ")
+        if mode in _FILE_MODES and is_synced_path(path):
+            files[path] = (mode, sha)
+    return files
+
+
+def _tree_changes(repo: Repo, old: str, new: str) -> Tuple[Dict[str, Tuple[str, str]], Set[str]]:
+    """
+    Synced paths changed between two commits.
+
+    Returns:
+        (files to write: path -> (mode, blob SHA), paths to delete)
+
+    Raises:
+        GitCommandError: If ``old`` is not in the mirror
+    """
+    output = repo.git.diff_tree("-r", "-z", "--no-renames", old, new)
+    fields = output.split("\0")
+    written, deleted = {}, set()
+    for meta, path in zip(fields[0::2], fields[1::2]):
+        if not meta.startswith(":") or not is_synced_path(path):
+            continue
+        _, new_mode, _, new_sha, status = meta[1:].split(" ")
+        if status != "D" and new_mode in _FILE_MODES:
+            written[path] = (new_mode, new_sha)
+        else:
+            deleted.add(path)
+    return written, deleted
+
+
+def _write_blob(repo: Repo, sha: str, mode: str, dst: str) -> None:
+    if os.path.isdir(dst) and not os.path.islink(dst):
+        shutil.rmtree(dst)
+    elif os.path.lexists(dst):
+        # Never write through a hard link shared with the served tree
+        os.unlink(dst)
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    stream = repo.odb.stream(bytes.fromhex(sha))
+    with open(dst, "wb") as fh:
+        shutil.copyfileobj(stream, fh)
+    if mode == _EXECUTABLE_MODE:
+        os.chmod(dst, 0o755)
+
+
+def _delete_path(root: str, path: str) -> bool:
+    dst = os.path.join(root, path)
+    if not os.path.lexists(dst) or (os.path.isdir(dst) and not os.path.islink(dst)):
+        return False
+    os.unlink(dst)
+    # Remove directories left empty by the deletion
+    parent = os.path.dirname(dst)
+    while parent != root:
+        try:
+            os.rmdir(parent)
+        except OSError:
+            break
+        parent = os.path.dirname(parent)
+    return True
+
+
+def _other_entries(root: str, repo_paths: Set[str]) -> Dict[str, Optional[Tuple[int, int]]]:
+    """Entries not owned by the repository: path -> (device, inode) of files, None for directories."""
+    repo_dirs = {path.rsplit("/", i)[0] for path in repo_paths for i in range(1, path.count("/") + 1)}
+    entries = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = os.path.relpath(dirpath, root)
+        prefix = "" if rel == "." else rel.replace(os.sep, "/") + "/"
+        for name in dirnames + filenames:
+            path = prefix + name
+            st = os.lstat(os.path.join(dirpath, name))
+            if stat.S_ISDIR(st.st_mode):
+                if path not in repo_dirs:
+                    entries[path] = None
+            elif path not in repo_paths:
+                entries[path] = (st.st_dev, st.st_ino)
+    return entries
+
+
+def _carry_over_entries(source: str, dest: str, repo_paths: Set[str]) -> int:
+    """
+    Make the entries of ``dest`` the repository does not own match ``source``.
+
+    Files are hard-linked, so this only costs a walk of both trees when
+    nothing changed. Returns the number of files linked or removed.
+    """
+    theirs = _other_entries(source, repo_paths)
+    ours = _other_entries(dest, repo_paths)
+    changed = 0
+    # Children before their directories
+    for path in sorted(set(ours) - set(theirs), reverse=True):
+        dst = os.path.join(dest, path)
+        if ours[path] is not None:
+            os.unlink(dst)
+            changed += 1
+        else:
+            try:
+                os.rmdir(dst)
+            except OSError:
+                pass  # Still holds repository files
+    for path, ident in sorted(theirs.items()):
+        dst = os.path.join(dest, path)
+        if ident is None:
+            os.makedirs(dst, exist_ok=True)
+        elif ours.get(path) != ident:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            tmp = dst + ".sync-link"
+            os.link(os.path.join(source, path), tmp, follow_symlinks=False)
+            os.replace(tmp, dst)
+            changed += 1
+    return changed
+
+
+class DocumentsSync:
+    """Syncs documents repositories from a mirror cache into served directories."""
+
+    def __init__(self, mirror_cache: GitMirrorCache, state_dir: str):
+        """
+        Args:
+            mirror_cache: Worker-local git mirrors
+            state_dir: Directory for per-target sync state (shared between workers)
+        """
+        self.mirror_cache = mirror_cache
+        self.state_dir = state_dir
+        os.makedirs(self.state_dir, exist_ok=True)
+
+    def _state_path(self, target_path: str) -> str:
+        key = hashlib.sha256(os.path.abspath(target_path).encode("utf-8")).hexdigest()
+        return os.path.join(self.state_dir, f"{key}.json")
+
+    @contextmanager
+    def _lock(self, target_path: str) -> Iterator[None]:
+        with open(self._state_path(target_path)[:-len(".json")] + ".lock", "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _read_state(self, target_path: str, url: str) -> Optional[dict]:
+        try:
+            with open(self._state_path(target_path)) as fh:
+                state = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if state.get("url") != strip_url_credentials(url) or not state.get("commit"):
+            return None
+        return state
+
+    def _write_state(self, target_path: str, url: str, commit: str, files: Iterable[str]) -> None:
+        state_path = self._state_path(target_path)
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as fh:
+            json.dump({"url": strip_url_credentials(url), "commit": commit, "files": sorted(files)}, fh)
+        os.replace(tmp_path, state_path)
+
+    def sync(
+        self,
+        url: str,
+        target_path: str,
+        auth_url: Optional[str] = None,
+        force: bool = False,
+        branch: Optional[str] = None,
+    ) -> DocumentsSyncResult:
+        """
+        Bring ``target_path`` up to date with the remote repository.
+
+        Args:
+            url: Remote URL (credential-free; used as mirror and state key)
+            target_path: Served documents directory
+            auth_url: URL with credentials used for the fetch only
+            force: Rebuild the target from the repository, dropping other files
+            branch: Branch to sync (default: ``main``, ``master``, or the only branch)
+
+        Raises:
+            GitCommandError: If the remote cannot be fetched
+            MirrorBranchNotFound: If the remote has no branch to sync (e.g. it is empty)
+        """
+        repo = self.mirror_cache.update(url, auth_url)
+        try:
+            commit = _resolve_branch(repo, branch)
+            with self._lock(target_path):
+                return self._sync_locked(repo, url, commit, target_path, force)
+        finally:
+            repo.close()
+
+    def _sync_locked(self, repo: Repo, url: str, commit: str, target_path: str, force: bool) -> DocumentsSyncResult:
+        state = None if force else self._read_state(target_path, url)
+        exists = os.path.isdir(target_path)
+        if state is not None and not exists:
+            state = None
+
+        if state is not None and state["commit"] == commit:
+            return DocumentsSyncResult(commit=commit, mode="unchanged", files=len(state["files"]))
+
+        written: Dict[str, Tuple[str, str]] = {}
+        deleted: Set[str] = set()
+        mode = "full"
+        files: Set[str]
+        if state is not None:
+            try:
+                written, deleted = _tree_changes(repo, state["commit"], commit)
+                mode = "incremental"
+                files = (set(state["files"]) - deleted) | set(written)
+            except GitCommandError as e:
+                logger.info(f"Previous commit {state['commit']} not in mirror, doing a full sync: {e}")
+        if mode == "full":
+            written = _tree_files(repo, commit)
+            files = set(written)
+            # Previously synced files no longer in the repository
+            deleted = set(state["files"]) - files if state is not None else set()
+            if state is None and not force and exists:
+                # No record of which files came from the repository; keep them all
+                deleted = set()
+
+        if mode == "incremental" and not written and not deleted:
+            # Only excluded paths changed
+            self._write_state(target_path, url, commit, files)
+            return DocumentsSyncResult(commit=commit, mode=mode, files=len(files))
+
+        parent = os.path.dirname(os.path.abspath(target_path))
+        os.makedirs(parent, exist_ok=True)
+        repo_paths = files | deleted
+        work_dir = tempfile.mkdtemp(dir=parent, prefix=f".{os.path.basename(target_path)}.sync-")
+        try:
+            staging = os.path.join(work_dir, "tree")
+            if exists and not force:
+                # Hard-linked copy: unchanged files cost one link each, no data
+                shutil.copytree(target_path, staging, symlinks=True, copy_function=os.link)
+            else:
+                os.makedirs(staging)
+
+            deleted_count = sum(_delete_path(staging, path) for path in sorted(deleted, reverse=True))
+            for path, (file_mode, sha) in written.items():
+                _write_blob(repo, sha, file_mode, os.path.join(staging, path))
+
+            if exists:
+                carried = 0
+                if not force:
+                    # Files written through the documents API since the copy ...
+                    carried = _carry_over_entries(target_path, staging, repo_paths)
+                _exchange_directories(staging, target_path)
+                if not force:
+                    # ... and those written between that check and the swap
+                    carried += _carry_over_entries(staging, target_path, repo_paths)
+                if carried:
+                    logger.info(f"Carried {carried} documents written during the sync of {target_path}")
+            else:
+                os.rename(staging, target_path)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        self._write_state(target_path, url, commit, files)
+        logger.info(
+            f"Documents sync ({mode}) of {target_path} at {commit[:12]}: "
+            f"{len(written)} written, {deleted_count} deleted"
+        )
+        return DocumentsSyncResult(
+            commit=commit, mode=mode, files=len(files), written=len(written), deleted=deleted_count,
+        )
@@ -0,0 +1,156 @@
+"""
+Worker-local bare mirrors of remote git repositories.
+
+Template generation used to clone the whole student-template repository
+into a temporary directory on every run. With a mirror cache each worker
+keeps one bare repository per remote URL, brings it up to date with an
+incremental fetch and checks out a throw-away ``git worktree`` from it, so
+only the delta since the previous run crosses the network.
+
+Credentials are never stored in the mirror: the mirror is keyed by (and
+configured with) the credential-free URL, and the authenticated URL is
+passed on the command line for the fetch and for the caller's push.
+
+Layout (``GIT_MIRROR_CACHE_DIR``)::
+
+    <sha256(url)>.git/     # bare mirror, remote branches in refs/remotes/origin/*
+    <sha256(url)>.lock     # flock serializing fetch / worktree add / remove
+"""
+
+import fcntl
+import hashlib
+import logging
+import os
+import shutil
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from urllib.parse import urlparse, urlunparse
+
+from git import GitCommandError, Repo
+
+logger = logging.getLogger(__name__)
+
+REMOTE_REFSPEC = "+refs/heads/*:refs/remotes/origin/*"
+
+
+def strip_url_credentials(url: str) -> str:
+    """Remove the user-info part (e.g. ``oauth2:token@``) from a git URL."""
+    parsed = urlparse(url)
+    if not parsed.scheme or "@" not in parsed.netloc:
+        return url
+    return urlunparse(parsed._replace(netloc=parsed.netloc.rsplit("@", 1)[1]))
+
+
+class MirrorBranchNotFound(LookupError):
+    """Raised when the requested branch does not exist on the remote."""
+
+
+class GitMirrorCache:
+    """Bare mirrors of remote repositories, updated incrementally."""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(self.root, exist_ok=True)
+
+    def mirror_path(self, url: str) -> str:
+        """Path of the bare mirror for a (credential-free) URL."""
+        key = hashlib.sha256(strip_url_credentials(url).encode("utf-8")).hexdigest()
+        return os.path.join(self.root, f"{key}.git")
+
+    @contextmanager
+    def _lock(self, mirror: str) -> Iterator[None]:
+        with open(mirror[:-len(".git")] + ".lock", "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _open_mirror(self, url: str, mirror: str) -> Repo:
+        if os.path.isdir(mirror):
+            try:
+                return Repo(mirror)
+            except Exception as e:
+                logger.warning(f"Discarding unreadable git mirror {mirror}: {e}")
+                shutil.rmtree(mirror, ignore_errors=True)
+        repo = Repo.init(mirror, bare=True)
+        with repo.config_writer() as config:
+            config.set_value('remote "origin"', "url", strip_url_credentials(url))
+            config.set_value('remote "origin"', "fetch", REMOTE_REFSPEC)
+        return repo
+
+    def update(self, url: str, auth_url: Optional[str] = None) -> Repo:
+        """
+        Create or incrementally update the mirror of ``url``.
+
+        Args:
+            url: Remote URL (used as cache key and stored in the mirror)
+            auth_url: URL with credentials used for this fetch only
+
+        Returns:
+            The bare mirror repository
+
+        Raises:
+            GitCommandError: If the remote cannot be fetched
+        """
+        mirror = self.mirror_path(url)
+        with self._lock(mirror):
+            repo = self._open_mirror(url, mirror)
+            repo.git.fetch("--prune", "--no-tags", auth_url or url, REMOTE_REFSPEC)
+            return repo
+
+    @contextmanager
+    def checkout(
+        self,
+        url: str,
+        path: str,
+        auth_url: Optional[str] = None,
+        branch: str = "main",
+    ) -> Iterator[Repo]:
+        """
+        Fetch ``url`` into its mirror and check ``branch`` out at ``path``.
+
+        The worktree has a detached HEAD at the remote branch and no remote
+        of its own; push with ``repo.git.push(auth_url, "HEAD:<branch>")``.
+        The worktree is removed from the mirror on exit.
+
+        Raises:
+            GitCommandError: If the remote cannot be fetched
+            MirrorBranchNotFound: If the remote has no ``branch`` (e.g. it is empty)
+        """
+        mirror_path = self.mirror_path(url)
+        mirror = self.update(url, auth_url)
+        with self._lock(mirror_path):
+            # Drop registrations of worktrees whose directories are gone
+            mirror.git.worktree("prune")
+            try:
+                head = mirror.git.rev_parse("--verify", "--quiet", f"refs/remotes/origin/{branch}^{{commit}}")
+            except GitCommandError:
+                raise MirrorBranchNotFound(f"Branch '{branch}' not found in {strip_url_credentials(url)}")
+            mirror.git.worktree("add", "--detach", path, head)
+
+        repo = Repo(path)
+        try:
+            yield repo
+        finally:
+            repo.close()
+            with self._lock(mirror_path):
+                try:
+                    mirror.git.worktree("remove", "--force", path)
+                except GitCommandError:
+                    shutil.rmtree(path, ignore_errors=True)
+                    mirror.git.worktree("prune")
+
+
+_default_cache: Optional[GitMirrorCache] = None
+
+
+def get_git_mirror_cache() -> Optional[GitMirrorCache]:
+    """Process-wide mirror cache, or None if disabled by settings."""
+    global _default_cache
+    if _default_cache is None:
+        from ..settings import settings
+        if not settings.GIT_MIRROR_CACHE_DIR:
+            return None
+        _default_cache = GitMirrorCache(settings.GIT_MIRROR_CACHE_DIR)
+    return _default_cache
@@ -0,0 +1,336 @@
+"""
+Async GitLab REST gateway for repository provisioning.
+
+python-gitlab is synchronous, so provisioning activities that used it
+blocked the worker's event loop on every GitLab round trip and built a new
+client per activity. This gateway instead:
+
+- reuses one pooled ``httpx.AsyncClient`` per (GitLab URL, token) and event loop
+- rate-limits requests per GitLab host with a shared token bucket, pausing
+  all callers when GitLab answers 429 (``Retry-After``)
+- waits for forks on the ``/projects/:id/import`` status endpoint with
+  exponential backoff that starts from the recently observed fork duration,
+  instead of polling group project searches at a fixed interval
+
+Only the endpoints needed for student/team repository provisioning are
+wrapped; results are the plain JSON dicts returned by the GitLab API.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote, urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Retries for 429 / 5xx responses and transport errors
+MAX_RETRIES = 4
+
+
+class GitLabGatewayError(Exception):
+    """A GitLab API request failed."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` requests per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (server asked us to back off)."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+        # Refill only from the end of the pause, not for the time spent paused
+        self.updated = self.paused_until
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class GitLabGateway:
+    """Rate-limited async client for the GitLab REST API (v4)."""
+
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        bucket: Optional[TokenBucket] = None,
+        max_connections: int = 20,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeout: float = 30.0,
+    ):
+        """
+        Initialize the gateway.
+
+        Args:
+            url: GitLab base URL (e.g. "https://gitlab.example.com")
+            token: Private/personal access token
+            bucket: Rate limiter shared by all gateways for this host
+            max_connections: Connection pool size
+            transport: Optional httpx transport (tests use an ASGI fake)
+            timeout: Per-request timeout in seconds
+        """
+        self.url = url.rstrip("/")
+        self.bucket = bucket or TokenBucket(rate=10, capacity=20)
+        self.client = httpx.AsyncClient(
+            base_url=f"{self.url}/api/v4",
+            headers={"PRIVATE-TOKEN": token},
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+            transport=transport,
+        )
+        self.request_count = 0
+        # Exponentially weighted average of observed fork durations (seconds)
+        self._fork_seconds: Optional[float] = None
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        ok_statuses: Tuple[int, ...] = (),
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send one rate-limited request, retrying 429/5xx responses.
+
+        Args:
+            method: HTTP method
+            path: API path relative to /api/v4
+            ok_statuses: Error statuses returned to the caller instead of raised
+            **kwargs: Passed to ``httpx.AsyncClient.request``
+
+        Raises:
+            GitLabGatewayError: For other error responses or when retries run out
+        """
+        delay = 0.5
+        for attempt in range(MAX_RETRIES + 1):
+            await self.bucket.acquire()
+            self.request_count += 1
+            try:
+                response = await self.client.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                if attempt == MAX_RETRIES:
+                    raise GitLabGatewayError(f"{method} {path} failed: {e}") from e
+                await asyncio.sleep(delay)
+                delay *= 2
+                continue
+
+            if response.status_code == 429 or response.status_code >= 500:
+                if attempt == MAX_RETRIES:
+                    break
+                retry_after = _retry_after(response) or delay
+                if response.status_code == 429:
+                    logger.warning(f"GitLab rate limit hit, pausing requests for {retry_after:.1f}s")
+                    self.bucket.pause(retry_after)
+                else:
+                    await asyncio.sleep(retry_after)
+                delay *= 2
+                continue
+
+            if response.is_success or response.status_code in ok_statuses:
+                return response
+            break
+
+        raise GitLabGatewayError(
+            f"{method} {path} failed with {response.status_code}: {_error_message(response)}",
+            status_code=response.status_code,
+        )
+
+    async def get_project(self, project: int | str) -> Optional[Dict[str, Any]]:
+        """Get a project by ID or full path, or None if it does not exist."""
+        response = await self.request("GET", f"/projects/{_project_ref(project)}", ok_statuses=(404,))
+        return response.json() if response.status_code != 404 else None
+
+    async def get_group(self, group_id: int | str) -> Dict[str, Any]:
+        return (await self.request("GET", f"/groups/{_project_ref(group_id)}")).json()
+
+    async def find_project_in_group(self, group_id: int | str, path: str) -> Optional[Dict[str, Any]]:
+        """Get the project ``path`` directly inside group ``group_id``, if it exists."""
+        group = await self.get_group(group_id)
+        return await self.get_project(f"{group['full_path']}/{path}")
+
+    async def fork_project(
+        self,
+        source_project_id: int | str,
+        dest_path: str,
+        dest_name: str,
+        namespace_id: int | str,
+    ) -> Dict[str, Any]:
+        """Start forking a project; the fork may still be importing when this returns."""
+        response = await self.request(
+            "POST",
+            f"/projects/{_project_ref(source_project_id)}/fork",
+            json={"path": dest_path, "name": dest_name, "namespace_id": namespace_id},
+        )
+        return response.json()
+
+    async def wait_for_import(
+        self,
+        project_id: int,
+        initial_interval: float = 0.5,
+        max_interval: float = 10.0,
+        backoff: float = 2.0,
+        timeout: float = 300.0,
+    ) -> Dict[str, Any]:
+        """
+        Poll a project's import status until it is finished.
+
+        The first wait is based on how long recent forks took; after that
+        the interval grows by ``backoff`` up to ``max_interval``.
+
+        Returns:
+            The project, once its import has finished
+
+        Raises:
+            GitLabGatewayError: If the import fails or does not finish in time
+        """
+        start = time.monotonic()
+        interval = initial_interval
+        if self._fork_seconds:
+            interval = min(max_interval, max(initial_interval, self._fork_seconds * 0.8))
+
+        while True:
+            response = await self.request("GET", f"/projects/{project_id}/import")
+            status = response.json().get("import_status")
+            if status in ("finished", "none", None):
+                elapsed = time.monotonic() - start
+                self._fork_seconds = elapsed if self._fork_seconds is None else (
+                    0.7 * self._fork_seconds + 0.3 * elapsed
+                )
+                return await self.get_project(project_id)
+            if status == "failed":
+                raise GitLabGatewayError(
+                    f"Import of project {project_id} failed: {response.json().get('import_error')}"
+                )
+            if time.monotonic() - start + interval > timeout:
+                raise GitLabGatewayError(f"Import of project {project_id} not finished after {timeout:.0f}s")
+            await asyncio.sleep(interval)
+            interval = min(max_interval, interval * backoff)
+
+    async def fork_and_wait(
+        self,
+        source_project_id: int | str,
+        dest_path: str,
+        dest_name: str,
+        namespace_id: int | str,
+        timeout: float = 300.0,
+    ) -> Dict[str, Any]:
+        """Fork a project and wait until the fork is ready to use."""
+        fork = await self.fork_project(source_project_id, dest_path, dest_name, namespace_id)
+        return await self.wait_for_import(fork["id"], timeout=timeout)
+
+    async def unprotect_branch(self, project_id: int | str, branch: str) -> None:
+        """Remove branch protection (no-op if the branch is not protected)."""
+        await self.request(
+            "DELETE",
+            f"/projects/{_project_ref(project_id)}/protected_branches/{quote(branch, safe='')}",
+            ok_statuses=(404,),
+        )
+
+    async def find_user_id(self, username: str) -> Optional[int]:
+        users = (await self.request("GET", "/users", params={"username": username})).json()
+        return users[0]["id"] if users else None
+
+    async def add_project_member(self, project_id: int | str, user_id: int, access_level: int) -> None:
+        """Add a project member, or update the access level of an existing one."""
+        project = _project_ref(project_id)
+        response = await self.request(
+            "POST",
+            f"/projects/{project}/members",
+            json={"user_id": user_id, "access_level": access_level},
+            ok_statuses=(409,),
+        )
+        if response.status_code == 409:
+            member = (await self.request("GET", f"/projects/{project}/members/{user_id}")).json()
+            if member.get("access_level") != access_level:
+                await self.request(
+                    "PUT",
+                    f"/projects/{project}/members/{user_id}",
+                    json={"access_level": access_level},
+                )
+
+
+def _project_ref(project: int | str) -> str:
+    """Project/group ID or URL-encoded full path for use in an API path."""
+    return str(project) if isinstance(project, int) or str(project).isdigit() else quote(str(project), safe="")
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _error_message(response: httpx.Response) -> str:
+    try:
+        body = response.json()
+    except ValueError:
+        return response.text[:500]
+    if isinstance(body, dict):
+        return str(body.get("message") or body.get("error") or body)
+    return str(body)
+
+
+# Pools are bound to the event loop they were created on
+_gateways: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], GitLabGateway]]" = (
+    weakref.WeakKeyDictionary()
+)
+_buckets: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, TokenBucket]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_gitlab_gateway(url: str, token: str) -> GitLabGateway:
+    """
+    Shared gateway for a GitLab instance and token on the running event loop.
+
+    Gateways for the same host share one rate limiter, configured by
+    GITLAB_API_RATE / GITLAB_API_BURST; the connection pool size comes from
+    GITLAB_API_MAX_CONNECTIONS.
+    """
+    from ..settings import settings
+
+    loop = asyncio.get_running_loop()
+    gateways = _gateways.setdefault(loop, {})
+    key = (url.rstrip("/"), token)
+    gateway = gateways.get(key)
+    if gateway is None:
+        host = urlparse(url).netloc
+        buckets = _buckets.setdefault(loop, {})
+        bucket = buckets.get(host)
+        if bucket is None:
+            bucket = buckets[host] = TokenBucket(settings.GITLAB_API_RATE, settings.GITLAB_API_BURST)
+        gateway = gateways[key] = GitLabGateway(
+            url, token, bucket=bucket, max_connections=settings.GITLAB_API_MAX_CONNECTIONS
+        )
+    return gateway
+
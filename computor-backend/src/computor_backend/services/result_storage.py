@@ -7,14 +7,24 @@ that was previously stored in the PostgreSQL database.
 Storage structure:
 - Bucket: "results"
 - Path: {result_id}/result.json
+
+result.json is written as compact JSON; documents of at least
+``RESULT_JSON_COMPRESS_MIN_BYTES`` are gzip-compressed (readers detect
+the gzip magic, so older pretty-printed objects still load). The stored
+bytes are also written through to Redis, keyed by result id, so repeated
+reads of finished results skip MinIO.
 """
 
+import asyncio
+import gzip
 import json
 import logging
 from io import BytesIO
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
+from starlette.concurrency import run_in_threadpool
+
 from .storage_service import get_storage_service
 from ..exceptions import NotFoundException
 
@@ -23,6 +33,14 @@ logger = logging.getLogger(__name__)
 # Dedicated bucket for test results
 RESULTS_BUCKET = "results"
 
+# Documents at least this large are stored gzip-compressed
+RESULT_JSON_COMPRESS_MIN_BYTES = 16 * 1024
+
+# Result JSON only changes through store_result_json, which rewrites the cache
+RESULT_JSON_CACHE_TTL = 24 * 60 * 60
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
 
 def get_result_json_key(result_id: str | UUID) -> str:
     """
@@ -54,21 +72,22 @@ async def store_result_json(result_id: str | UUID, result_json: dict) -> str:
     storage = get_storage_service()
     object_key = get_result_json_key(result_id)
 
-    # Serialize JSON to bytes
-    json_bytes = json.dumps(result_json, indent=2).encode('utf-8')
-    json_stream = BytesIO(json_bytes)
+    data = encode_result_json(result_json)
+    compressed = data[:2] == _GZIP_MAGIC
 
     # Upload to MinIO in dedicated "results" bucket
     await storage.upload_file(
-        file_data=json_stream,
+        file_data=BytesIO(data),
         object_key=object_key,
         bucket_name=RESULTS_BUCKET,
-        content_type="application/json",
+        content_type="application/gzip" if compressed else "application/json",
         metadata={
             "result_id": str(result_id),
-            "type": "result_json"
+            "type": "result_json",
+            "encoding": "gzip" if compressed else "identity",
         }
     )
+    await _cache_result_json({str(result_id): data})
 
     logger.info(f"Stored result JSON for result {result_id} in {RESULTS_BUCKET}/{object_key}")
     return object_key
@@ -88,29 +107,171 @@ async def retrieve_result_json(result_id: str | UUID) -> Optional[dict]:
         Returns None instead of raising NotFoundException to allow
         graceful handling of missing JSON data.
     """
+    cached = await _cached_result_json([str(result_id)])
+    if str(result_id) in cached:
+        return _decode_or_none(result_id, cached[str(result_id)])
+
     storage = get_storage_service()
     object_key = get_result_json_key(result_id)
 
     try:
         # Download from MinIO "results" bucket
         json_bytes = await storage.download_file(object_key, bucket_name=RESULTS_BUCKET)
-
-        # Deserialize JSON
-        result_json = json.loads(json_bytes.decode('utf-8'))
-
-        logger.debug(f"Retrieved result JSON for result {result_id}")
-        return result_json
-
     except NotFoundException:
         logger.debug(f"No result JSON found for result {result_id}")
         return None
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to decode result JSON for result {result_id}: {e}")
-        return None
     except Exception as e:
         logger.error(f"Error retrieving result JSON for result {result_id}: {e}")
         return None
 
+    result_json = _decode_or_none(result_id, json_bytes)
+    if result_json is not None:
+        await _cache_result_json({str(result_id): json_bytes})
+        logger.debug(f"Retrieved result JSON for result {result_id}")
+    return result_json
+
+
+async def retrieve_result_jsons(result_ids: Iterable[str | UUID]) -> Dict[str, Optional[dict]]:
+    """
+    Retrieve the result JSON of many results at once.
+
+    Cached documents come from one Redis MGET; the rest are downloaded from
+    MinIO concurrently (bounded by the storage service) and cached.
+
+    Args:
+        result_ids: Result IDs
+
+    Returns:
+        Mapping of result ID (str) to its JSON data, or None if not found
+    """
+    ids = list(dict.fromkeys(str(result_id) for result_id in result_ids))
+    if not ids:
+        return {}
+
+    raw = await _cached_result_json(ids)
+    missing = [result_id for result_id in ids if result_id not in raw]
+
+    if missing:
+        storage = get_storage_service()
+        downloaded = await storage.download_files(
+            (get_result_json_key(result_id) for result_id in missing),
+            bucket_name=RESULTS_BUCKET,
+        )
+        fetched = {
+            result_id: downloaded[get_result_json_key(result_id)]
+            for result_id in missing
+            if downloaded.get(get_result_json_key(result_id)) is not None
+        }
+        await _cache_result_json(fetched)
+        raw.update(fetched)
+
+    return {
+        result_id: _decode_or_none(result_id, raw[result_id]) if result_id in raw else None
+        for result_id in ids
+    }
+
+
+async def retrieve_result_details(
+    result_ids: Iterable[str | UUID],
+) -> Dict[str, Tuple[Optional[dict], List[dict]]]:
+    """
+    Fetch result JSON and artifact listings for many results concurrently.
+
+    Used by detailed result views; costs one cache lookup plus a few
+    parallel MinIO requests instead of two sequential requests per result.
+
+    Returns:
+        Mapping of result ID (str) to (result_json, artifacts); artifacts
+        have the same shape as ``list_result_artifacts``
+    """
+    ids = list(dict.fromkeys(str(result_id) for result_id in result_ids))
+    if not ids:
+        return {}
+
+    storage = get_storage_service()
+    result_jsons, listings = await asyncio.gather(
+        retrieve_result_jsons(ids),
+        storage.list_objects_many(
+            (f"{result_id}/artifacts/" for result_id in ids),
+            bucket_name=RESULTS_BUCKET,
+        ),
+    )
+
+    return {
+        result_id: (
+            result_jsons.get(result_id),
+            _artifact_infos(listings.get(f"{result_id}/artifacts/", [])),
+        )
+        for result_id in ids
+    }
+
+
+def encode_result_json(result_json: dict) -> bytes:
+    """Serialize result JSON compactly, gzip-compressing large documents."""
+    data = json.dumps(result_json, separators=(",", ":")).encode('utf-8')
+    if len(data) >= RESULT_JSON_COMPRESS_MIN_BYTES:
+        data = gzip.compress(data, compresslevel=6)
+    return data
+
+
+def decode_result_json(data: bytes) -> dict:
+    """Inverse of ``encode_result_json``; also reads legacy pretty-printed objects."""
+    if data[:2] == _GZIP_MAGIC:
+        data = gzip.decompress(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _decode_or_none(result_id: str | UUID, data: bytes) -> Optional[dict]:
+    try:
+        return decode_result_json(data)
+    except (OSError, ValueError) as e:
+        logger.error(f"Failed to decode result JSON for result {result_id}: {e}")
+        return None
+
+
+def _result_json_cache_key(cache, result_id: str) -> str:
+    return cache.k("result_json", result_id)
+
+
+async def _cached_result_json(result_ids: List[str]) -> Dict[str, bytes]:
+    """Stored result.json bytes found in Redis (best effort)."""
+    try:
+        from ..redis_cache import get_cache
+        cache = get_cache()
+        keys = [_result_json_cache_key(cache, result_id) for result_id in result_ids]
+        values = await run_in_threadpool(cache.client.mget, keys)
+    except Exception as e:
+        logger.warning(f"Result JSON cache lookup failed: {e}")
+        return {}
+    return {result_id: value for result_id, value in zip(result_ids, values) if value is not None}
+
+
+async def _cache_result_json(documents: Dict[str, bytes]) -> None:
+    """Write stored result.json bytes through to Redis (best effort)."""
+    if not documents:
+        return
+
+    def write(cache) -> None:
+        pipe = cache.client.pipeline(transaction=False)
+        for result_id, data in documents.items():
+            pipe.setex(_result_json_cache_key(cache, result_id), RESULT_JSON_CACHE_TTL, data)
+        pipe.execute()
+
+    try:
+        from ..redis_cache import get_cache
+        await run_in_threadpool(write, get_cache())
+    except Exception as e:
+        logger.warning(f"Result JSON cache write failed: {e}")
+
+
+async def _forget_result_json(result_id: str | UUID) -> None:
+    try:
+        from ..redis_cache import get_cache
+        cache = get_cache()
+        await run_in_threadpool(cache.client.delete, _result_json_cache_key(cache, str(result_id)))
+    except Exception as e:
+        logger.warning(f"Result JSON cache delete failed: {e}")
+
 
 async def delete_result_json(result_id: str | UUID) -> bool:
     """
@@ -127,6 +288,7 @@ async def delete_result_json(result_id: str | UUID) -> bool:
     """
     storage = get_storage_service()
     object_key = get_result_json_key(result_id)
+    await _forget_result_json(result_id)
 
     try:
         await storage.delete_file(object_key, bucket_name=RESULTS_BUCKET)
@@ -246,20 +408,24 @@ async def list_result_artifacts(result_id: str | UUID) -> list[dict]:
             recursive=True,
         )
 
-        return [
-            {
-                "object_key": obj.object_name,
-                "filename": obj.object_name.split("/")[-1],
-                "size": obj.size,
-                "last_modified": obj.last_modified,
-            }
-            for obj in objects
-        ]
+        return _artifact_infos(objects)
     except Exception as e:
         logger.error(f"Error listing result artifacts for result {result_id}: {e}")
         return []
 
 
+def _artifact_infos(objects) -> list[dict]:
+    return [
+        {
+            "object_key": obj.object_name,
+            "filename": obj.object_name.split("/")[-1],
+            "size": obj.size,
+            "last_modified": obj.last_modified,
+        }
+        for obj in objects
+    ]
+
+
 async def retrieve_result_artifact(result_id: str | UUID, filename: str) -> Optional[bytes]:
     """
     Retrieve a result artifact from MinIO.
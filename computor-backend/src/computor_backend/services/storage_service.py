@@ -1,9 +1,12 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import BinaryIO, Optional, Dict, List, Tuple
+from typing import BinaryIO, Iterable, Optional, Dict, List, Tuple, Union
 from minio.error import S3Error
 from minio.datatypes import Object
 from minio.commonconfig import CopySource
+from minio.deleteobjects import DeleteObject
+from starlette.concurrency import run_in_threadpool
 
 from ..minio_client import get_minio_client, MINIO_DEFAULT_BUCKET
 from ..exceptions import (
@@ -20,6 +23,15 @@ from computor_types.storage import (
 
 logger = logging.getLogger(__name__)
 
+# S3 DeleteObjects accepts at most 1000 keys per request
+REMOVE_OBJECTS_BATCH_SIZE = 1000
+
+# Parallel MinIO requests issued by the batch read helpers
+BATCH_READ_CONCURRENCY = 16
+
+# Parallel MinIO requests issued by the batch write helpers
+BATCH_WRITE_CONCURRENCY = 8
+
 
 class StorageService:
     """Service for handling MinIO storage operations"""
@@ -170,6 +182,50 @@ class StorageService:
                 raise NotFoundException(f"Bucket not found: {bucket}")
             raise ServiceUnavailableException(f"Storage delete error: {e}")
     
+    async def remove_objects(
+        self,
+        object_keys: Iterable[str],
+        bucket_name: Optional[str] = None
+    ) -> int:
+        """Delete many objects with multi-object delete requests.
+
+        Keys are sent in batches of ``REMOVE_OBJECTS_BATCH_SIZE``, one
+        request each, instead of one request per object, from the
+        threadpool. Missing keys count as deleted (S3 semantics), which
+        makes the call safe to repeat.
+
+        Returns:
+            Number of keys removed (requested minus per-key errors)
+        """
+        bucket = bucket_name or self.default_bucket
+        removed = 0
+        batch: List[str] = []
+
+        def flush(batch: List[str]) -> int:
+            errors = list(self.client.remove_objects(bucket, [DeleteObject(k) for k in batch]))
+            for error in errors:
+                logger.warning(f"Error deleting object {bucket}/{error.name}: {error.code} {error.message}")
+            return len(batch) - len(errors)
+
+        try:
+            for key in object_keys:
+                batch.append(key)
+                if len(batch) >= REMOVE_OBJECTS_BATCH_SIZE:
+                    removed += await run_in_threadpool(flush, batch)
+                    batch = []
+            if batch:
+                removed += await run_in_threadpool(flush, batch)
+        except S3Error as e:
+            if e.code == 'NoSuchBucket':
+                logger.debug(f"Bucket not found while removing objects: {bucket}")
+                return removed
+            logger.error(f"Error removing objects: {e}")
+            raise ServiceUnavailableException(f"Storage delete error: {e}") from e
+
+        if removed:
+            logger.info(f"Deleted {removed} objects from {bucket}")
+        return removed
+
     async def list_objects(
         self,
         bucket_name: Optional[str] = None,
@@ -181,14 +237,15 @@ class StorageService:
         bucket = bucket_name or self.default_bucket
         
         try:
-            objects = self.client.list_objects(
-                bucket_name=bucket,
-                prefix=prefix,
-                recursive=recursive,
-                include_user_meta=include_user_metadata
-            )
-            
-            return list(objects)
+            def fetch() -> List[Object]:
+                return list(self.client.list_objects(
+                    bucket_name=bucket,
+                    prefix=prefix,
+                    recursive=recursive,
+                    include_user_meta=include_user_metadata
+                ))
+
+            return await run_in_threadpool(fetch)
             
         except S3Error as e:
             logger.error(f"Error listing objects: {e}")
@@ -196,6 +253,164 @@ class StorageService:
                 raise NotFoundException(f"Bucket not found: {bucket}") from e
             raise ServiceUnavailableException(f"Storage list error: {e}")
     
+    async def download_files(
+        self,
+        object_keys: Iterable[str],
+        bucket_name: Optional[str] = None,
+        max_concurrency: int = BATCH_READ_CONCURRENCY
+    ) -> Dict[str, Optional[bytes]]:
+        """Download many objects concurrently.
+
+        The blocking MinIO calls run in the threadpool, at most
+        ``max_concurrency`` at a time. Missing (or unreadable) objects map
+        to None instead of failing the whole batch.
+        """
+        bucket = bucket_name or self.default_bucket
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        def fetch(object_key: str) -> bytes:
+            response = self.client.get_object(bucket, object_key)
+            try:
+                return response.read()
+            finally:
+                response.close()
+                response.release_conn()
+
+        async def download(object_key: str) -> Tuple[str, Optional[bytes]]:
+            async with semaphore:
+                try:
+                    return object_key, await run_in_threadpool(fetch, object_key)
+                except S3Error as e:
+                    if e.code not in ('NoSuchKey', 'NoSuchBucket'):
+                        logger.error(f"Error downloading {bucket}/{object_key}: {e}")
+                except Exception as e:
+                    logger.error(f"Error downloading {bucket}/{object_key}: {e}")
+                return object_key, None
+
+        keys = list(dict.fromkeys(object_keys))
+        return dict(await asyncio.gather(*(download(key) for key in keys)))
+
+    async def list_objects_many(
+        self,
+        prefixes: Iterable[str],
+        bucket_name: Optional[str] = None,
+        max_concurrency: int = BATCH_READ_CONCURRENCY
+    ) -> Dict[str, List[Object]]:
+        """List several prefixes concurrently (recursive).
+
+        Prefixes that cannot be listed map to an empty list.
+        """
+        bucket = bucket_name or self.default_bucket
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        def fetch(prefix: str) -> List[Object]:
+            return list(self.client.list_objects(bucket_name=bucket, prefix=prefix, recursive=True))
+
+        async def list_prefix(prefix: str) -> Tuple[str, List[Object]]:
+            async with semaphore:
+                try:
+                    return prefix, await run_in_threadpool(fetch, prefix)
+                except Exception as e:
+                    logger.error(f"Error listing {bucket}/{prefix}: {e}")
+                    return prefix, []
+
+        unique = list(dict.fromkeys(prefixes))
+        return dict(await asyncio.gather(*(list_prefix(prefix) for prefix in unique)))
+
+    async def upload_files(
+        self,
+        uploads: Iterable[Tuple[str, Union[BinaryIO, str], Optional[str], Optional[Dict[str, str]]]],
+        bucket_name: Optional[str] = None,
+        max_concurrency: int = BATCH_WRITE_CONCURRENCY
+    ) -> int:
+        """Upload many objects concurrently.
+
+        Each upload is ``(object_key, source, content_type, metadata)``
+        where ``source`` is a file object or the path of a local file;
+        paths are opened only while their upload runs. The blocking MinIO
+        calls run in the threadpool, at most ``max_concurrency`` at a time.
+        Unlike :meth:`upload_file`, no ``stat_object`` follows each upload.
+
+        Returns:
+            Number of objects uploaded
+        """
+        bucket = await self.ensure_bucket_exists(bucket_name)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        def put(
+            object_key: str,
+            file_data: BinaryIO,
+            content_type: Optional[str],
+            metadata: Optional[Dict[str, str]]
+        ) -> None:
+            file_data.seek(0, 2)
+            file_size = file_data.tell()
+            file_data.seek(0)
+            self.client.put_object(
+                bucket_name=bucket,
+                object_name=object_key,
+                data=file_data,
+                length=file_size,
+                content_type=content_type or 'application/octet-stream',
+                metadata={f"x-amz-meta-{k}": v for k, v in (metadata or {}).items()}
+            )
+
+        def store(object_key: str, source: Union[BinaryIO, str], *args) -> None:
+            if isinstance(source, str):
+                with open(source, 'rb') as file_data:
+                    put(object_key, file_data, *args)
+            else:
+                put(object_key, source, *args)
+
+        async def upload(object_key: str, *args) -> None:
+            async with semaphore:
+                try:
+                    await run_in_threadpool(store, object_key, *args)
+                except S3Error as e:
+                    logger.error(f"Error uploading {bucket}/{object_key}: {e}")
+                    raise ServiceUnavailableException(f"Storage upload error: {e}") from e
+
+        items = list(uploads)
+        await asyncio.gather(*(upload(*item) for item in items))
+        if items:
+            logger.info(f"Uploaded {len(items)} objects to {bucket}")
+        return len(items)
+
+    async def copy_objects(
+        self,
+        copies: Iterable[Tuple[str, str]],
+        bucket_name: Optional[str] = None,
+        max_concurrency: int = BATCH_WRITE_CONCURRENCY
+    ) -> int:
+        """Copy many objects within a bucket concurrently (server-side).
+
+        Each copy is ``(source_object, dest_object)``; content type and
+        user metadata are copied along with the data.
+
+        Returns:
+            Number of objects copied
+        """
+        bucket = bucket_name or self.default_bucket
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def copy(source_object: str, dest_object: str) -> None:
+            async with semaphore:
+                try:
+                    await run_in_threadpool(
+                        self.client.copy_object, bucket, dest_object, CopySource(bucket, source_object)
+                    )
+                except S3Error as e:
+                    logger.error(f"Error copying {bucket}/{source_object} -> {dest_object}: {e}")
+                    if e.code == 'NoSuchKey':
+                        raise NotFoundException(f"Source object not found: {source_object}") from e
+                    raise ServiceUnavailableException(f"Storage copy error: {e}") from e
+
+        items = list(copies)
+        await asyncio.gather(*(copy(*item) for item in items))
+        if items:
+            logger.info(f"Copied {len(items)} objects in {bucket}")
+        return len(items)
+
     async def get_object_info(
         self,
         object_key: str,
@@ -27,6 +27,16 @@ class BackendSettings:
         # Extension public download URL
         self.EXTENSION_PUBLIC_DOWNLOAD_URL = os.environ.get("EXTENSION_PUBLIC_DOWNLOAD_URL", None)
 
+        # Worker-local bare mirrors used by student-template generation
+        # (services/git_mirror.py). Set to an empty string to always clone.
+        self.GIT_MIRROR_CACHE_DIR = os.environ.get("GIT_MIRROR_CACHE_DIR", "/tmp/computor-git-mirrors")
+
+        # GitLab REST gateway used for repository provisioning
+        # (services/gitlab_gateway.py): per-host request rate, burst and pool size
+        self.GITLAB_API_RATE = float(os.environ.get("GITLAB_API_RATE", "10"))  # requests per second
+        self.GITLAB_API_BURST = float(os.environ.get("GITLAB_API_BURST", "20"))
+        self.GITLAB_API_MAX_CONNECTIONS = int(os.environ.get("GITLAB_API_MAX_CONNECTIONS", "20"))
+
         # WebSocket settings
         self.WS_MAX_CONNECTIONS_PER_USER = int(os.environ.get("WS_MAX_CONNECTIONS_PER_USER", "10"))
         self.WS_MAX_TOTAL_CONNECTIONS = int(os.environ.get("WS_MAX_TOTAL_CONNECTIONS", "10000"))
@@ -35,6 +45,10 @@ class BackendSettings:
         self.WS_HANDLER_TIMEOUT = int(os.environ.get("WS_HANDLER_TIMEOUT", "5"))  # seconds per handler
         self.WS_PING_INTERVAL = int(os.environ.get("WS_PING_INTERVAL", "25"))  # client-side ping interval
         self.WS_SEND_TIMEOUT = int(os.environ.get("WS_SEND_TIMEOUT", "10"))  # seconds for send operations
+        # Per-connection send queues (websocket/send_queue.py): events queued per
+        # client, and how long its oldest event may wait before it is disconnected
+        self.WS_SEND_QUEUE_SIZE = int(os.environ.get("WS_SEND_QUEUE_SIZE", "256"))
+        self.WS_MAX_SEND_LAG = float(os.environ.get("WS_MAX_SEND_LAG", "30"))  # seconds
 
         self.ANALYTICS_ROOT = os.environ.get(
             "ANALYTICS_ROOT",
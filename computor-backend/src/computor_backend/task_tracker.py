@@ -6,10 +6,12 @@ users to query tasks they have access to based on user_id, course_id, or
 organization_id context.
 """
 
+import heapq
 import json
 import logging
+import uuid
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 import redis.asyncio as aioredis
 
@@ -21,6 +23,10 @@ logger = logging.getLogger(__name__)
 # Default TTL for task entries (24 hours)
 DEFAULT_TASK_TTL = 86400
 
+# Prefix of the task index sorted sets. (The previous set-based indexes
+# lived under "task_idx"; they are no longer read and expire on their own.)
+INDEX_PREFIX = "task_zidx"
+
 
 class TaskTracker:
     """
@@ -34,10 +40,15 @@ class TaskTracker:
 
     Redis key structure:
     - task:{workflow_id} -> TaskTrackerEntry JSON
-    - task_idx:user:{user_id} -> Set of workflow_ids
-    - task_idx:course:{course_id} -> Set of workflow_ids
-    - task_idx:org:{organization_id} -> Set of workflow_ids
-    - task_idx:all -> Set of all workflow_ids (for admin listing)
+    - task_zidx:user:{user_id} -> Sorted set of workflow_ids
+    - task_zidx:course:{course_id} -> Sorted set of workflow_ids
+    - task_zidx:org:{organization_id} -> Sorted set of workflow_ids
+    - task_zidx:all -> Sorted set of all workflow_ids (for admin listing)
+
+    Index members are scored by creation time (epoch seconds), so a page of
+    the newest accessible tasks is read with one pipelined ZREVRANGE per
+    index plus one MGET, whatever the length of the task history. Index
+    members whose entry has expired are removed when a listing hits them.
     """
 
     def __init__(self, redis_client: aioredis.Redis):
@@ -104,28 +115,14 @@ class TaskTracker:
             task_key = self._key("task", workflow_id)
             pipe.setex(task_key, ttl, entry.model_dump_json())
 
-            # Add to indexes for efficient querying
-            # User index - always add (user can see their own tasks)
-            user_index_key = self._key("task_idx", "user", entry.user_id)
-            pipe.sadd(user_index_key, workflow_id)
-            pipe.expire(user_index_key, ttl)
-
-            # Course index - if course_id provided
-            if course_id:
-                course_index_key = self._key("task_idx", "course", course_id)
-                pipe.sadd(course_index_key, workflow_id)
-                pipe.expire(course_index_key, ttl)
-
-            # Organization index - if organization_id provided
-            if organization_id:
-                org_index_key = self._key("task_idx", "org", organization_id)
-                pipe.sadd(org_index_key, workflow_id)
-                pipe.expire(org_index_key, ttl)
-
-            # Global index for admin listing
-            all_index_key = self._key("task_idx", "all")
-            pipe.sadd(all_index_key, workflow_id)
-            pipe.expire(all_index_key, ttl)
+            # Add to indexes for efficient querying, newest last.
+            # User index - always add (user can see their own tasks);
+            # course/organization indexes if a context was provided;
+            # global index for admin listing
+            score = entry.created_at.timestamp()
+            for index_key in self._entry_index_keys(entry):
+                pipe.zadd(index_key, {workflow_id: score})
+                pipe.expire(index_key, ttl)
 
             await pipe.execute()
             logger.info(f"Tracked task {workflow_id} for user {created_by}")
@@ -204,6 +201,63 @@ class TaskTracker:
 
         return False
 
+    def _entry_index_keys(self, entry: TaskTrackerEntry) -> List[str]:
+        """Index keys a task entry is listed in."""
+        keys = [self._key(INDEX_PREFIX, "user", entry.user_id)]
+        if entry.course_id:
+            keys.append(self._key(INDEX_PREFIX, "course", entry.course_id))
+        if entry.organization_id:
+            keys.append(self._key(INDEX_PREFIX, "org", entry.organization_id))
+        keys.append(self._key(INDEX_PREFIX, "all"))
+        return keys
+
+    def _accessible_index_keys(self, permissions: Principal) -> List[str]:
+        """Index keys whose union is the set of tasks the user can access."""
+        if permissions.is_admin:
+            # Admin sees all tasks
+            return [self._key(INDEX_PREFIX, "all")]
+
+        # User's own tasks
+        keys = [self._key(INDEX_PREFIX, "user", permissions.user_id)]
+
+        # Tasks from courses where user is lecturer+
+        for course_id in sorted(permissions.get_courses_with_role("_lecturer")):
+            keys.append(self._key(INDEX_PREFIX, "course", course_id))
+        return keys
+
+    async def _newest_ids(self, index_keys: List[str], count: int) -> List[str]:
+        """
+        The ``count`` newest workflow IDs in the union of ``index_keys``.
+
+        Reads the top ``count`` of every index in one pipeline and merges
+        them; a task listed in several indexes is returned once. The top
+        ``count`` of the union is always contained in the per-index tops.
+        """
+        if count <= 0:
+            return []
+        pipe = self.redis.pipeline(transaction=False)
+        for index_key in index_keys:
+            pipe.zrevrange(index_key, 0, count - 1, withscores=True)
+        ranked: List[List[Tuple[str, float]]] = await pipe.execute()
+
+        ids: List[str] = []
+        seen = set()
+        for workflow_id, _ in heapq.merge(*ranked, key=lambda item: -item[1]):
+            if workflow_id not in seen:
+                seen.add(workflow_id)
+                ids.append(workflow_id)
+                if len(ids) == count:
+                    break
+        return ids
+
+    async def _prune(self, index_keys: List[str], workflow_ids: List[str]) -> None:
+        """Remove workflow IDs whose entries have expired from the given indexes."""
+        pipe = self.redis.pipeline(transaction=False)
+        for index_key in index_keys:
+            pipe.zrem(index_key, *workflow_ids)
+        await pipe.execute()
+        logger.debug(f"Pruned {len(workflow_ids)} expired tasks from {len(index_keys)} indexes")
+
     async def list_accessible_tasks(
         self,
         permissions: Principal,
@@ -211,7 +265,7 @@ class TaskTracker:
         offset: int = 0
     ) -> List[TaskTrackerEntry]:
         """
-        List tasks the user has access to.
+        List tasks the user has access to, newest first.
 
         Args:
             permissions: User's principal with roles
@@ -222,45 +276,54 @@ class TaskTracker:
             List of TaskTrackerEntry objects
         """
         try:
-            workflow_ids = set()
+            index_keys = self._accessible_index_keys(permissions)
 
-            if permissions.is_admin:
-                # Admin sees all tasks
-                all_index_key = self._key("task_idx", "all")
-                all_ids = await self.redis.smembers(all_index_key)
-                workflow_ids.update(all_ids)
-            else:
-                # User's own tasks
-                user_index_key = self._key("task_idx", "user", permissions.user_id)
-                user_ids = await self.redis.smembers(user_index_key)
-                workflow_ids.update(user_ids)
-
-                # Tasks from courses where user is lecturer+
-                for course_id, role in permissions.course_roles.items():
-                    role_level = course_role_hierarchy.get_role_level(role)
-                    lecturer_level = course_role_hierarchy.get_role_level("_lecturer")
-                    if role_level >= lecturer_level:
-                        course_index_key = self._key("task_idx", "course", course_id)
-                        course_ids = await self.redis.smembers(course_index_key)
-                        workflow_ids.update(course_ids)
-
-            # Fetch task entries
-            entries = []
-            for wf_id in workflow_ids:
-                entry = await self.get_task_entry(wf_id)
-                if entry:
-                    entries.append(entry)
-
-            # Sort by created_at descending (newest first)
-            entries.sort(key=lambda e: e.created_at, reverse=True)
-
-            # Apply pagination
-            return entries[offset:offset + limit]
+            while True:
+                page_ids = (await self._newest_ids(index_keys, offset + limit))[offset:]
+                if not page_ids:
+                    return []
+
+                raw_entries = await self.redis.mget([self._key("task", wf_id) for wf_id in page_ids])
+                expired = [wf_id for wf_id, data in zip(page_ids, raw_entries) if data is None]
+                if not expired:
+                    return [TaskTrackerEntry.model_validate_json(data) for data in raw_entries]
+
+                # Drop expired entries from the indexes and read the page again
+                await self._prune(index_keys, expired)
 
         except Exception as e:
             logger.error(f"Failed to list accessible tasks: {e}")
             return []
 
+    async def count_accessible_tasks(self, permissions: Principal) -> int:
+        """
+        Number of tasks the user has access to.
+
+        Counted in Redis (ZUNIONSTORE into a temporary key), so no IDs are
+        transferred. Entries that expired but were not pruned yet are counted.
+
+        Args:
+            permissions: User's principal with roles
+
+        Returns:
+            Number of accessible tasks
+        """
+        try:
+            index_keys = self._accessible_index_keys(permissions)
+            if len(index_keys) == 1:
+                return await self.redis.zcard(index_keys[0])
+
+            union_key = self._key(INDEX_PREFIX, "count", uuid.uuid4().hex)
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.zunionstore(union_key, index_keys)
+            pipe.delete(union_key)
+            count, _ = await pipe.execute()
+            return count
+
+        except Exception as e:
+            logger.error(f"Failed to count accessible tasks: {e}")
+            return 0
+
     async def get_accessible_task_ids(
         self,
         permissions: Principal
@@ -275,27 +338,13 @@ class TaskTracker:
             Set of workflow IDs
         """
         try:
-            workflow_ids = set()
-
-            if permissions.is_admin:
-                all_index_key = self._key("task_idx", "all")
-                all_ids = await self.redis.smembers(all_index_key)
-                workflow_ids.update(all_ids)
-            else:
-                # User's own tasks
-                user_index_key = self._key("task_idx", "user", permissions.user_id)
-                user_ids = await self.redis.smembers(user_index_key)
-                workflow_ids.update(user_ids)
-
-                # Tasks from courses where user is lecturer+
-                for course_id, role in permissions.course_roles.items():
-                    role_level = course_role_hierarchy.get_role_level(role)
-                    lecturer_level = course_role_hierarchy.get_role_level("_lecturer")
-                    if role_level >= lecturer_level:
-                        course_index_key = self._key("task_idx", "course", course_id)
-                        course_ids = await self.redis.smembers(course_index_key)
-                        workflow_ids.update(course_ids)
+            pipe = self.redis.pipeline(transaction=False)
+            for index_key in self._accessible_index_keys(permissions):
+                pipe.zrange(index_key, 0, -1)
 
+            workflow_ids = set()
+            for ids in await pipe.execute():
+                workflow_ids.update(ids)
             return workflow_ids
 
         except Exception as e:
@@ -372,12 +421,8 @@ class TaskTracker:
             pipe = self.redis.pipeline()
 
             # Remove from indexes
-            pipe.srem(self._key("task_idx", "user", entry.user_id), workflow_id)
-            if entry.course_id:
-                pipe.srem(self._key("task_idx", "course", entry.course_id), workflow_id)
-            if entry.organization_id:
-                pipe.srem(self._key("task_idx", "org", entry.organization_id), workflow_id)
-            pipe.srem(self._key("task_idx", "all"), workflow_id)
+            for index_key in self._entry_index_keys(entry):
+                pipe.zrem(index_key, workflow_id)
 
             # Remove the task entry itself
             pipe.delete(self._key("task", workflow_id))
@@ -15,6 +15,7 @@ from .temporal_client import (
     DEFAULT_TASK_QUEUE
 )
 from .temporal_base import BaseWorkflow, WorkflowResult
+from .listing import list_accessible_task_page
 
 # Import Temporal examples to auto-register tasks
 from . import temporal_examples
@@ -43,6 +44,9 @@ from . import temporal_tutor_testing
 # Import Coder setup tasks to auto-register (image building, template push)
 from . import temporal_coder_setup
 
+# Import cascade deletion tasks to auto-register
+from . import temporal_cascade_deletion
+
 __all__ = [
     'TaskExecutor',
     'get_task_executor', 
@@ -58,4 +62,5 @@ __all__ = [
     'DEFAULT_TASK_QUEUE',
     'BaseWorkflow',
     'WorkflowResult',
+    'list_accessible_task_page',
 ]
@@ -0,0 +1,143 @@
+"""
+Permission-scoped task listing.
+
+Pages are cut from the task tracker's time-ordered index of the tasks a
+user can access, and Temporal is only asked about the tasks on that page
+(``TemporalTaskExecutor.describe_tasks``). Listing cost therefore depends
+on the page, not on the size of the workflow history.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from computor_types.tasks import TaskStatus, TaskTrackerEntry
+from computor_backend.permissions.principal import Principal
+from computor_backend.task_tracker import TaskTracker
+from .temporal_executor import TemporalTaskExecutor
+
+logger = logging.getLogger(__name__)
+
+# Number of tracked tasks examined in the first step when filtering by
+# status; each further step examines twice as many
+STATUS_SCAN_BATCH = 200
+
+# Most tracked tasks (newest first) examined for one status-filtered page
+STATUS_SCAN_LIMIT = 2000
+
+# Status filter names accepted by the API -> matching task statuses
+STATUS_FILTERS = {
+    "PENDING": {TaskStatus.QUEUED.value, TaskStatus.STARTED.value},
+    "STARTED": {TaskStatus.STARTED.value},
+    "FINISHED": {TaskStatus.FINISHED.value},
+    "SUCCESS": {TaskStatus.FINISHED.value},
+    "FAILED": {TaskStatus.FAILED.value},
+    "CANCELLED": {TaskStatus.CANCELLED.value},
+    "REVOKED": {TaskStatus.CANCELLED.value},
+}
+
+
+def _tracked_task_dict(entry: TaskTrackerEntry) -> Dict[str, Any]:
+    """Listing info of a tracked task Temporal does not know (yet)."""
+    status_value = TaskStatus.QUEUED.value
+    short_task_id = entry.workflow_id.split('-')[-1] if '-' in entry.workflow_id else entry.workflow_id
+    return {
+        "task_id": entry.workflow_id,
+        "short_task_id": short_task_id,
+        "task_name": entry.task_name,
+        "status": status_value,
+        "status_display": status_value.upper(),
+        "created_at": entry.created_at,
+        "started_at": None,
+        "finished_at": None,
+        "completed_at": None,
+        "error": None,
+        "worker": "unknown",
+        "queue": "unknown",
+        "workflow_id": entry.workflow_id,
+        "run_id": None,
+        "execution_time": None,
+        "history_length": None,
+        "has_result": False,
+        "result_available": "No",
+        "duration": None,
+    }
+
+
+async def _describe_entries(
+    executor: TemporalTaskExecutor,
+    entries: List[TaskTrackerEntry]
+) -> List[Dict[str, Any]]:
+    infos = await executor.describe_tasks([entry.workflow_id for entry in entries])
+    return [infos.get(entry.workflow_id) or _tracked_task_dict(entry) for entry in entries]
+
+
+async def list_accessible_task_page(
+    tracker: TaskTracker,
+    executor: TemporalTaskExecutor,
+    permissions: Principal,
+    limit: int = 100,
+    offset: int = 0,
+    status: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    One page of the tasks a user can access, newest first.
+
+    Without a status filter the page is read from the tracker index and only
+    its tasks are described. With a filter, the newest tracked tasks are
+    described in growing batches (starting at ``STATUS_SCAN_BATCH``) until
+    the page is filled or ``STATUS_SCAN_LIMIT`` tasks have been examined;
+    finished tasks come from the executor's cache on later requests.
+
+    Args:
+        tracker: Task tracker holding the permission index
+        executor: Temporal task executor
+        permissions: User's principal with roles
+        limit: Maximum number of tasks to return
+        offset: Number of tasks to skip
+        status: Optional status filter (see ``STATUS_FILTERS``)
+
+    Returns:
+        Dictionary with task list and pagination info (same shape as
+        ``TemporalTaskExecutor.list_tasks``). With a status filter, ``total``
+        counts the matches among the examined tasks and ``total_is_estimate``
+        is set when older tasks were not examined.
+    """
+    wanted = STATUS_FILTERS.get(status.upper()) if status else None
+
+    if wanted is None:
+        # One extra entry tells whether there is a next page
+        entries = await tracker.list_accessible_tasks(permissions, limit=limit + 1, offset=offset)
+        has_more = len(entries) > limit
+        tasks = await _describe_entries(executor, entries[:limit])
+        total = await tracker.count_accessible_tasks(permissions)
+        return {
+            "tasks": tasks,
+            "total": max(total, offset + len(tasks)),
+            "limit": limit,
+            "offset": offset,
+            "has_more": has_more,
+        }
+
+    matched: List[Dict[str, Any]] = []
+    scanned = 0
+    batch = STATUS_SCAN_BATCH
+    exhausted = False
+    while len(matched) <= offset + limit and scanned < STATUS_SCAN_LIMIT:
+        # Doubling the batch keeps the index reads linear in the tasks examined
+        batch = min(batch, STATUS_SCAN_LIMIT - scanned)
+        entries = await tracker.list_accessible_tasks(permissions, limit=batch, offset=scanned)
+        scanned += len(entries)
+        matched.extend(task for task in await _describe_entries(executor, entries) if task["status"] in wanted)
+        if len(entries) < batch:
+            exhausted = True
+            break
+        batch *= 2
+
+    return {
+        "tasks": matched[offset:offset + limit],
+        "total": len(matched),
+        "total_is_estimate": not exhausted,
+        "limit": limit,
+        "offset": offset,
+        "has_more": len(matched) > offset + limit,
+    }
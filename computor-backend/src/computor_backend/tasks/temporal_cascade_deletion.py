@@ -0,0 +1,202 @@
+"""
+Temporal workflow for background cascade deletion of courses, course families
+and organizations.
+
+The workflow walks the plan from ``business_logic.cascade_deletion`` step by
+step. Each activity call deletes a bounded number of chunks (one short
+transaction each) and reports back, so the workflow can expose progress and
+a crashed or cancelled run simply resumes with the rows that are left.
+"""
+
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Any, Dict, List
+
+from temporalio import workflow, activity
+from temporalio.common import RetryPolicy
+
+from .temporal_base import BaseWorkflow, WorkflowResult
+from .registry import register_task
+
+logger = logging.getLogger(__name__)
+
+# Chunks deleted per activity call; keeps each call well below its timeout.
+CHUNKS_PER_ACTIVITY = 20
+
+
+@activity.defn(name="plan_cascade_deletion")
+async def plan_cascade_deletion_activity(entity_type: str, entity_id: str) -> List[List[str]]:
+    """
+    Resolve the ordered steps of a cascade deletion.
+
+    Args:
+        entity_type: "course", "course_family" or "organization"
+        entity_id: ID of the root entity
+
+    Returns:
+        List of [scope, scope_id, step_name] triples
+    """
+    from ..database import get_db_session
+    from ..business_logic.cascade_deletion import CASCADE_STEPS, plan_cascade_deletion
+
+    def plan_in_session():
+        with get_db_session() as db:
+            return plan_cascade_deletion(db, entity_type, entity_id)
+
+    plan = await asyncio.to_thread(plan_in_session)
+
+    return [
+        [scope, scope_id, step.name]
+        for scope, scope_id in plan
+        for step in CASCADE_STEPS[scope]
+    ]
+
+
+@activity.defn(name="delete_cascade_chunks")
+async def delete_cascade_chunks_activity(
+    scope: str,
+    scope_id: str,
+    step_name: str,
+    max_chunks: int = CHUNKS_PER_ACTIVITY,
+) -> Dict[str, Any]:
+    """
+    Delete up to ``max_chunks`` chunks of one cascade step.
+
+    The queries and object removals of each chunk run in worker threads,
+    so the worker's event loop keeps sending heartbeats while a chunk runs.
+
+    Returns:
+        Dict with deleted rows, deleted MinIO objects and whether the step is done
+    """
+    from ..database import get_db_session
+    from ..business_logic.cascade_deletion import get_cascade_step, delete_cascade_chunk, CASCADE_CHUNK_SIZE
+    from ..services.storage_service import get_storage_service
+
+    step = get_cascade_step(scope, step_name)
+    storage = get_storage_service()
+
+    deleted = 0
+    objects_deleted = 0
+    done = False
+
+    with get_db_session() as db:
+        for _ in range(max_chunks):
+            rows, objects = await delete_cascade_chunk(db, step, scope_id, storage, CASCADE_CHUNK_SIZE)
+            deleted += rows
+            objects_deleted += objects
+            activity.heartbeat({"step": step_name, "deleted": deleted})
+            if rows < CASCADE_CHUNK_SIZE:
+                done = True
+                break
+
+    return {"deleted": deleted, "objects_deleted": objects_deleted, "done": done}
+
+
+@register_task
+@workflow.defn(name="CascadeDeletionWorkflow", sandboxed=False)
+class CascadeDeletionWorkflow(BaseWorkflow):
+    """
+    Delete a course, course family or organization with all descendant data
+    in the background, chunk by chunk.
+    """
+
+    def __init__(self) -> None:
+        self._progress: Dict[str, Any] = {
+            "steps_total": 0,
+            "steps_done": 0,
+            "current_step": None,
+            "deleted_counts": {},
+            "minio_objects_deleted": 0,
+        }
+
+    @classmethod
+    def get_name(cls) -> str:
+        """Get the workflow name."""
+        return "CascadeDeletionWorkflow"
+
+    @classmethod
+    def get_execution_timeout(cls) -> timedelta:
+        """Whole organizations can take a long time to delete."""
+        return timedelta(hours=12)
+
+    @workflow.query
+    def progress(self) -> Dict[str, Any]:
+        """Current step and per-entity deleted counts."""
+        return self._progress
+
+    @workflow.run
+    async def run(self, params: Dict[str, Any]) -> WorkflowResult:
+        """
+        Execute the cascade deletion.
+
+        Expected params:
+        - entity_type: "course", "course_family" or "organization"
+        - entity_id: ID of the root entity
+        """
+        entity_type = params.get('entity_type')
+        entity_id = params.get('entity_id')
+
+        retry_policy = RetryPolicy(
+            maximum_attempts=5,
+            initial_interval=timedelta(seconds=2),
+            maximum_interval=timedelta(seconds=60),
+            backoff_coefficient=2
+        )
+
+        try:
+            steps = await workflow.execute_activity(
+                plan_cascade_deletion_activity,
+                args=[entity_type, entity_id],
+                retry_policy=retry_policy,
+                start_to_close_timeout=timedelta(minutes=2)
+            )
+        except Exception as e:
+            logger.error(f"Planning cascade deletion of {entity_type} {entity_id} failed: {e}")
+            return WorkflowResult(status="failed", result=None, error=str(e))
+
+        progress = self._progress
+        progress["steps_total"] = len(steps)
+        counts = progress["deleted_counts"]
+
+        for scope, scope_id, step_name in steps:
+            progress["current_step"] = {"scope": scope, "scope_id": scope_id, "step": step_name}
+            done = False
+            while not done:
+                try:
+                    chunk = await workflow.execute_activity(
+                        delete_cascade_chunks_activity,
+                        args=[scope, scope_id, step_name, CHUNKS_PER_ACTIVITY],
+                        retry_policy=retry_policy,
+                        start_to_close_timeout=timedelta(minutes=15),
+                        heartbeat_timeout=timedelta(minutes=5)
+                    )
+                except Exception as e:
+                    logger.error(f"Cascade deletion of {entity_type} {entity_id} failed at {step_name}: {e}")
+                    return WorkflowResult(
+                        status="failed",
+                        result=dict(progress),
+                        error=f"Failed deleting {step_name} of {scope} {scope_id}: {e}",
+                        metadata={"entity_type": entity_type, "entity_id": entity_id}
+                    )
+                counts[step_name] = counts.get(step_name, 0) + chunk["deleted"]
+                progress["minio_objects_deleted"] += chunk["objects_deleted"]
+                done = chunk["done"]
+            progress["steps_done"] += 1
+
+        progress["current_step"] = None
+        return WorkflowResult(
+            status="completed",
+            result=dict(progress),
+            metadata={"entity_type": entity_type, "entity_id": entity_id}
+        )
+
+
+WORKFLOWS = [
+    CascadeDeletionWorkflow,
+]
+
+ACTIVITIES = [
+    plan_cascade_deletion_activity,
+    delete_cascade_chunks_activity,
+]
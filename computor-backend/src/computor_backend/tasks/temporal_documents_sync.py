@@ -1,11 +1,13 @@
 """
 Temporal activity and workflow to sync documents repository from GitLab to filesystem.
 
-This activity clones the documents repository from the course family's GitLab group
-and syncs it to the shared documents directory for serving via static-server.
+This activity syncs the documents repository of the course family's GitLab group
+to the shared documents directory for serving via static-server, incrementally
+from the worker's git mirror when it is enabled.
 """
 from datetime import timedelta, datetime, timezone
 from typing import Any, Dict, Optional
+import asyncio
 import os
 import tempfile
 import shutil
@@ -24,22 +26,31 @@ logger = logging.getLogger(__name__)
 @activity.defn(name="sync_documents_repository")
 async def sync_documents_repository_activity(
     course_family_id: str,
-    force_update: bool = False
+    force_update: bool = False,
+    incremental: bool = True
 ) -> Dict[str, Any]:
     """
     Sync documents repository from GitLab to shared filesystem.
 
+    With ``incremental`` (and the git mirror cache enabled) only the files
+    changed since the last sync are applied (see ``services.documents_sync``);
+    otherwise the repository is cloned and copied as a whole.
+
     Args:
         course_family_id: CourseFamily ID
-        force_update: If True, delete and re-clone; if False, just git pull
+        force_update: If True, rebuild the target from the repository; if False, update it
+        incremental: Sync from the worker's git mirror instead of a fresh clone
 
     Returns:
         Dict with success status, synced file count, and any errors
     """
     import git
+    from ..business_logic.document_listing import invalidate_directory_listings
     from ..database import get_db_session
     from ..model.course import CourseFamily
     from ..model.organization import Organization
+    from ..services.documents_sync import DocumentsSync, SYNC_BLACKLIST, copy_tree_filtered
+    from ..services.git_mirror import MirrorBranchNotFound, get_git_mirror_cache
     from ..settings import settings
     from ..utils.docker_utils import transform_localhost_url
 
@@ -115,78 +126,35 @@ async def sync_documents_repository_activity(
             # Prepare authenticated URL if token available
             auth_url = make_git_auth_url(documents_url, gitlab_token) if gitlab_token else documents_url
 
-            # Define blacklist of files/directories to exclude from sync
-            # These are sensitive or unnecessary files that should not be exposed
-            SYNC_BLACKLIST = {
-                '.git',           # Git metadata
-                '.gitignore',     # Git configuration (not needed for static serving)
-                '.gitlab-ci.yml', # CI/CD configuration
-                '.DS_Store',      # macOS metadata
-                'Thumbs.db',      # Windows metadata
-                '.env',           # Environment variables (security)
-                '.env.local',     # Environment variables
-                'node_modules',   # Dependencies
-                '__pycache__',    # Python cache
-                '*.pyc',          # Python compiled files
-                '.vscode',        # Editor settings
-                '.idea',          # Editor settings
-            }
-
-            # Special case: exclude README.md only from root directory
-            ROOT_BLACKLIST = {
-                'README.md',      # Root README (repository description, not course document)
-            }
-
-            def should_exclude(name: str, blacklist: set) -> bool:
-                """Check if a file/directory should be excluded based on blacklist."""
-                # Direct match
-                if name in blacklist:
-                    return True
-                # Pattern match (e.g., *.pyc)
-                import fnmatch
-                for pattern in blacklist:
-                    if fnmatch.fnmatch(name, pattern):
-                        return True
-                return False
-
-            def copy_tree_filtered(src: str, dst: str, blacklist: set, root_src: str = None):
-                """
-                Copy directory tree while filtering out blacklisted items.
-
-                Args:
-                    src: Source directory
-                    dst: Destination directory
-                    blacklist: Set of items to exclude everywhere
-                    root_src: Original root source directory (to detect root-level files)
-                """
-                # Track root directory for special exclusions
-                if root_src is None:
-                    root_src = src
-
-                is_root = (src == root_src)
-
-                os.makedirs(dst, exist_ok=True)
-
-                for item in os.listdir(src):
-                    # Skip blacklisted items
-                    if should_exclude(item, blacklist):
-                        logger.debug(f"Skipping blacklisted item: {item}")
-                        continue
-
-                    # Skip root-level README.md
-                    if is_root and should_exclude(item, ROOT_BLACKLIST):
-                        logger.debug(f"Skipping root-level file: {item}")
-                        continue
-
-                    src_path = os.path.join(src, item)
-                    dst_path = os.path.join(dst, item)
-
-                    if os.path.isdir(src_path):
-                        # Recursively copy directory
-                        copy_tree_filtered(src_path, dst_path, blacklist, root_src)
-                    else:
-                        # Copy file
-                        shutil.copy2(src_path, dst_path)
+            mirror_cache = get_git_mirror_cache() if incremental else None
+            if mirror_cache is not None:
+                # Fetch new commits into the worker's mirror and apply only the changed files
+                state_dir = os.path.join(settings.API_LOCAL_STORAGE_DIR, "documents-sync")
+                try:
+                    sync = await asyncio.to_thread(
+                        DocumentsSync(mirror_cache, state_dir).sync,
+                        documents_url, target_path, auth_url, force_update,
+                    )
+                except (git.exc.GitCommandError, MirrorBranchNotFound) as e:
+                    # Repository might not exist yet (or is still empty)
+                    result["error"] = f"Failed to fetch documents repository: {str(e)}"
+                    result["success"] = True
+                    logger.warning(result["error"])
+                    return result
+
+                if sync.mode != "unchanged":
+                    await asyncio.to_thread(invalidate_directory_listings, target_path)
+
+                result.update({
+                    "success": True,
+                    "synced_files": sync.files,
+                    "mode": sync.mode,
+                    "commit": sync.commit,
+                    "changed_files": sync.written,
+                    "deleted_files": sync.deleted,
+                })
+                logger.info(f"Synced documents repository to {target_path} ({sync.mode}, {sync.files} files)")
+                return result
 
             # Create temporary directory for cloning
             with tempfile.TemporaryDirectory() as temp_dir:
@@ -212,7 +180,10 @@ async def sync_documents_repository_activity(
 
                 # Copy files from temp to target, excluding blacklisted items
                 logger.info(f"Syncing files to {target_path} (excluding: {', '.join(SYNC_BLACKLIST)})")
-                copy_tree_filtered(temp_repo_path, target_path, SYNC_BLACKLIST)
+                copy_tree_filtered(temp_repo_path, target_path)
+
+                # Files were copied over in place: make API listings revalidate
+                invalidate_directory_listings(target_path)
 
                 # Count synced files
                 file_count = sum(len(files) for _, _, files in os.walk(target_path))
@@ -248,12 +219,14 @@ class SyncDocumentsRepositoryWorkflow(BaseWorkflow):
             params: Dictionary with:
                 - course_family_id: CourseFamily ID
                 - force_update: If True, delete and re-clone; if False, just update
+                - incremental: If False, clone and copy the whole repository (default True)
 
         Returns:
             WorkflowResult with sync status
         """
         course_family_id = params.get('course_family_id')
         force_update = params.get('force_update', False)
+        incremental = params.get('incremental', True)
 
         workflow_id = workflow.info().workflow_id
 
@@ -263,7 +236,7 @@ class SyncDocumentsRepositoryWorkflow(BaseWorkflow):
             # Execute the sync activity
             result = await workflow.execute_activity(
                 sync_documents_repository_activity,
-                args=[course_family_id, force_update],
+                args=[course_family_id, force_update, incremental],
                 start_to_close_timeout=timedelta(minutes=10),
                 retry_policy=RetryPolicy(
                     maximum_attempts=3,
@@ -281,6 +254,8 @@ class SyncDocumentsRepositoryWorkflow(BaseWorkflow):
                         "synced_files": result["synced_files"],
                         "documents_url": result["documents_url"],
                         "target_path": result["target_path"],
+                        "mode": result.get("mode", "full"),
+                        "commit": result.get("commit"),
                         "message": f"Synced {result['synced_files']} files from documents repository"
                     },
                     error=None
@@ -2,10 +2,12 @@
 Task executor implementation using Temporal.
 """
 
+import asyncio
 import logging
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterable, Optional, List
 from temporalio.client import WorkflowHandle, WorkflowExecutionStatus
 from temporalio.common import WorkflowIDReusePolicy
 from .temporal_client import get_temporal_client, get_task_queue_name, DEFAULT_TASK_QUEUE
@@ -15,6 +17,21 @@ from computor_types.tasks import TaskStatus, TaskResult, TaskInfo, TaskSubmissio
 
 logger = logging.getLogger(__name__)
 
+# Concurrent describe calls when loading a page of tasks
+DESCRIBE_CONCURRENCY = 16
+
+# Number of finished tasks whose listing info is kept in memory
+TERMINAL_CACHE_SIZE = 10000
+
+# Workflow states that never change again
+TERMINAL_STATUSES = frozenset({
+    WorkflowExecutionStatus.COMPLETED,
+    WorkflowExecutionStatus.FAILED,
+    WorkflowExecutionStatus.CANCELED,
+    WorkflowExecutionStatus.TERMINATED,
+    WorkflowExecutionStatus.TIMED_OUT,
+})
+
 
 class TemporalTaskExecutor:
     """
@@ -33,6 +50,8 @@ class TemporalTaskExecutor:
             WorkflowExecutionStatus.CONTINUED_AS_NEW: TaskStatus.STARTED,
             WorkflowExecutionStatus.TIMED_OUT: TaskStatus.FAILED,
         }
+        # Listing info of finished workflows (workflow ID -> task dict), LRU
+        self._terminal_tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
     
     def _calculate_duration(self, start_time: Optional[datetime], end_time: Optional[datetime]) -> Optional[str]:
         """Calculate human-readable duration between start and end times."""
@@ -160,6 +179,14 @@ class TemporalTaskExecutor:
                     logger.warning(f"Failed to extract error message from workflow: {e}")
                     error_message = "Task failed"
 
+            # Long-running workflows may expose a "progress" query
+            progress = None
+            if status == TaskStatus.STARTED:
+                try:
+                    progress = await handle.query("progress")
+                except Exception:
+                    progress = None
+
             # Build task info
             task_info = TaskInfo(
                 task_id=task_id,
@@ -180,7 +207,8 @@ class TemporalTaskExecutor:
                 workflow_id=task_id,
                 run_id=description.most_recent_execution_run_id if hasattr(description, 'most_recent_execution_run_id') else None,
                 execution_time=description.start_time,
-                history_length=getattr(description, 'history_length', None)
+                history_length=getattr(description, 'history_length', None),
+                progress=progress
             )
             
             return task_info
@@ -297,6 +325,95 @@ class TemporalTaskExecutor:
     #         }
     #     }
     
+    def _task_dict(self, workflow) -> Dict[str, Any]:
+        """Listing info of a workflow execution (from visibility or describe)."""
+        status_value = self._status_mapping.get(workflow.status, TaskStatus.QUEUED).value
+
+        # Create shortened task ID for better display
+        short_task_id = workflow.id.split('-')[-1] if '-' in workflow.id else workflow.id
+
+        # Determine if task has result
+        has_result = workflow.status in [WorkflowExecutionStatus.COMPLETED, WorkflowExecutionStatus.FAILED]
+
+        return {
+            "task_id": workflow.id,
+            "short_task_id": short_task_id,
+            "task_name": workflow.workflow_type,
+            "status": status_value,
+            "status_display": status_value.upper(),
+            "created_at": workflow.start_time,
+            "started_at": workflow.start_time,
+            "finished_at": workflow.close_time,
+            "completed_at": workflow.close_time,  # Alternative field name for UI
+            "error": None,
+            "worker": workflow.task_queue or "unknown",
+            "queue": workflow.task_queue or "unknown",
+            "workflow_id": workflow.id,
+            "run_id": workflow.run_id,
+            "execution_time": workflow.execution_time,
+            "history_length": workflow.history_length,
+            "has_result": has_result,
+            "result_available": "Yes" if has_result else "No",
+            "duration": self._calculate_duration(workflow.start_time, workflow.close_time)
+        }
+
+    async def describe_tasks(
+        self,
+        task_ids: Iterable[str],
+        max_concurrency: int = DESCRIBE_CONCURRENCY
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Listing info for a batch of tasks.
+
+        Describes the workflows concurrently (at most ``max_concurrency`` at a
+        time). Finished workflows are served from an in-memory cache, since
+        their state never changes again.
+
+        Args:
+            task_ids: Task/Workflow IDs
+            max_concurrency: Maximum number of concurrent describe calls
+
+        Returns:
+            Task ID -> task dict (same shape as ``list_tasks`` entries);
+            tasks that cannot be described are left out
+        """
+        tasks: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for task_id in task_ids:
+            cached = self._terminal_tasks.get(task_id)
+            if cached is not None:
+                self._terminal_tasks.move_to_end(task_id)
+                tasks[task_id] = cached
+            else:
+                missing.append(task_id)
+
+        if not missing:
+            return tasks
+
+        client = await get_temporal_client()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def describe(task_id: str):
+            async with semaphore:
+                try:
+                    return await client.get_workflow_handle(task_id).describe()
+                except Exception as e:
+                    logger.debug(f"Could not describe task {task_id}: {e}")
+                    return None
+
+        descriptions = await asyncio.gather(*(describe(task_id) for task_id in missing))
+        for task_id, description in zip(missing, descriptions):
+            if description is None:
+                continue
+            task_info = self._task_dict(description)
+            tasks[task_id] = task_info
+            if description.status in TERMINAL_STATUSES:
+                self._terminal_tasks[task_id] = task_info
+                if len(self._terminal_tasks) > TERMINAL_CACHE_SIZE:
+                    self._terminal_tasks.popitem(last=False)
+
+        return tasks
+
     async def list_tasks(self, limit: int = 100, offset: int = 0, status: Optional[str] = None) -> Dict[str, Any]:
         """
         List tasks with pagination and filtering.
@@ -344,36 +461,7 @@ class TemporalTaskExecutor:
                 page_size=min(limit + offset, 1000)
             ):
                 
-                # Convert to our TaskInfo format
-                status_value = self._status_mapping.get(workflow.status, TaskStatus.QUEUED).value
-                
-                # Create shortened task ID for better display
-                short_task_id = workflow.id.split('-')[-1] if '-' in workflow.id else workflow.id
-                
-                # Determine if task has result
-                has_result = workflow.status in [WorkflowExecutionStatus.COMPLETED, WorkflowExecutionStatus.FAILED]
-                
-                task_info = {
-                    "task_id": workflow.id,
-                    "short_task_id": short_task_id,
-                    "task_name": workflow.workflow_type,
-                    "status": status_value,
-                    "status_display": status_value.upper(),
-                    "created_at": workflow.start_time,
-                    "started_at": workflow.start_time,
-                    "finished_at": workflow.close_time,
-                    "completed_at": workflow.close_time,  # Alternative field name for UI
-                    "error": None,
-                    "worker": workflow.task_queue or "unknown",
-                    "queue": workflow.task_queue or "unknown",
-                    "workflow_id": workflow.id,
-                    "run_id": workflow.run_id,
-                    "execution_time": workflow.execution_time,
-                    "history_length": workflow.history_length,
-                    "has_result": has_result,
-                    "result_available": "Yes" if has_result else "No",
-                    "duration": self._calculate_duration(workflow.start_time, workflow.close_time)
-                }
+                task_info = self._task_dict(workflow)
                 workflows.append(task_info)
                 
                 # Apply manual offset/limit since Temporal doesn't support offset directly
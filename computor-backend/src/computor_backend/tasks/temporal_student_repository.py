@@ -2,17 +2,17 @@
 Temporal workflows for creating and managing student repositories.
 This workflow handles forking the student-template repository when students join a course.
 """
+import asyncio
 import logging
 import json
 from datetime import timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from uuid import UUID
 
 from temporalio import workflow, activity
 from temporalio.common import RetryPolicy
 from sqlalchemy.orm import Session
 from gitlab import Gitlab
-from gitlab.exceptions import GitlabGetError
 
 from .temporal_base import BaseWorkflow, WorkflowResult
 from .registry import register_task
@@ -21,78 +21,49 @@ from ..model.course import Course, CourseMember, SubmissionGroup, SubmissionGrou
 from ..gitlab_utils import construct_gitlab_http_url, construct_gitlab_ssh_url, construct_gitlab_web_url
 from ..model.organization import Organization
 from computor_types.tokens import decrypt_api_key
-from ..gitlab_utils import gitlab_fork_project, gitlab_unprotect_branches
+from ..services.gitlab_gateway import GitLabGateway, get_gitlab_gateway
 
 logger = logging.getLogger(__name__)
 
 
 async def fork_project_with_polling(
-    gitlab: Gitlab,
+    gateway: GitLabGateway,
     source_project_id: int,
     dest_path: str,
     dest_name: str,
     namespace_id: int,
-    max_attempts: int = 10,
-    poll_interval: int = 5,
-    initial_wait: int = 2
-) -> Any:
+    timeout: float = 300.0
+) -> Dict[str, Any]:
     """
-    Fork a GitLab project and poll for completion.
+    Fork a GitLab project and wait for the fork to finish importing.
+    
+    Polls the fork's import status with exponential backoff (see
+    ``GitLabGateway.wait_for_import``).
     
     Args:
-        gitlab: GitLab client instance
+        gateway: GitLab gateway
         source_project_id: ID of the project to fork
         dest_path: Path for the forked project
         dest_name: Name for the forked project
         namespace_id: GitLab namespace ID where to create the fork
-        max_attempts: Maximum number of polling attempts
-        poll_interval: Seconds between polling attempts
-        initial_wait: Initial wait before starting to poll
+        timeout: Seconds to wait for the import to finish
         
     Returns:
-        The forked GitLab project object
+        The forked project (GitLab API JSON)
         
     Raises:
-        ValueError: If the fork is not found after max_attempts
+        GitLabGatewayError: If the fork fails or is not ready within the timeout
     """
-    import asyncio
-    
-    # Initiate the fork
-    gitlab_fork_project(
-        gitlab=gitlab,
-        fork_id=source_project_id,
-        dest_path=dest_path,
-        dest_name=dest_name,
-        namespace_id=namespace_id
+    forked_project = await gateway.fork_and_wait(
+        source_project_id, dest_path, dest_name, namespace_id, timeout=timeout
     )
-    
-    # Initial wait before polling
-    await asyncio.sleep(initial_wait)
-    
-    # Poll for fork completion
-    forked_project = None
-    for attempt in range(max_attempts):
-        # Find the forked project
-        projects = gitlab.groups.get(namespace_id).projects.list(search=dest_path)
-        for project in projects:
-            if project.path == dest_path:
-                forked_project = gitlab.projects.get(project.id)
-                break
-        
-        if forked_project:
-            logger.info(f"Fork completed after {attempt + 1} attempt(s)")
-            return forked_project
-            
-        if attempt < max_attempts - 1:
-            logger.info(f"Fork not ready yet, waiting {poll_interval} seconds (attempt {attempt + 1}/{max_attempts})")
-            await asyncio.sleep(poll_interval)
-            
-    raise ValueError(f"Forked project {dest_path} not found after {max_attempts} attempts")
+    logger.info(f"Fork {forked_project['path_with_namespace']} is ready")
+    return forked_project
 
 
 async def add_members_to_project(
-    gitlab: Gitlab,
-    project,
+    gateway: GitLabGateway,
+    project: Dict[str, Any],
     member_ids: list[str],
     db: Session,
     access_level: int = 40,
@@ -105,15 +76,14 @@ async def add_members_to_project(
     Gracefully skips members who haven't registered their GitLab account yet.
 
     Args:
-        gitlab: GitLab client instance
-        project: GitLab project object
+        gateway: GitLab gateway
+        project: GitLab project (API JSON)
         member_ids: List of course member IDs to add
         db: Database session
         access_level: GitLab access level (40 = Maintainer, 30 = Developer)
         provider_url: GitLab provider URL (e.g., "https://gitlab.com")
     """
     from ..model.auth import Account
-    from gitlab.exceptions import GitlabCreateError, GitlabGetError
 
     for member_id in member_ids:
         member = db.query(CourseMember).filter(CourseMember.id == member_id).first()
@@ -132,7 +102,7 @@ async def add_members_to_project(
             # User hasn't registered their GitLab account yet - skip gracefully
             logger.info(
                 f"User {member.user.email} (course_member {member_id}) has not registered "
-                f"GitLab account yet - skipping permission grant for project {project.id}"
+                f"GitLab account yet - skipping permission grant for project {project['id']}"
             )
             continue
 
@@ -141,71 +111,43 @@ async def add_members_to_project(
 
         # Fetch numeric GitLab user ID by username
         try:
-            users = gitlab.users.list(username=gitlab_username)
-            if not users:
+            gitlab_user_id = await gateway.find_user_id(gitlab_username)
+            if gitlab_user_id is None:
                 logger.warning(
                     f"GitLab user '{gitlab_username}' not found on GitLab instance "
                     f"for user {member.user.email} (course_member {member_id})"
                 )
                 continue
 
-            gitlab_user_id = users[0].id
-
         except Exception as e:
             logger.warning(
                 f"Failed to fetch GitLab user ID for username '{gitlab_username}': {e}"
             )
             continue
 
-        # Add user to project
+        # Add user to project (or update the access level of an existing member)
         try:
-            project.members.create({
-                'user_id': gitlab_user_id,
-                'access_level': access_level
-            })
+            await gateway.add_project_member(project['id'], gitlab_user_id, access_level)
             logger.info(
                 f"Added GitLab user '{gitlab_username}' (ID {gitlab_user_id}) "
-                f"to project {project.path_with_namespace} with access level {access_level}"
+                f"to project {project['path_with_namespace']} with access level {access_level}"
             )
-        except GitlabCreateError as e:
-            # Check if already a member
-            if e.response_code == 409:
-                logger.info(
-                    f"User '{gitlab_username}' already member of project "
-                    f"{project.path_with_namespace} - ensuring access level"
-                )
-                try:
-                    existing_member = project.members.get(gitlab_user_id)
-                    if existing_member.access_level != access_level:
-                        existing_member.access_level = access_level
-                        existing_member.save()
-                        logger.info(
-                            f"Updated access level for '{gitlab_username}' to {access_level}"
-                        )
-                except Exception as update_error:
-                    logger.warning(
-                        f"Could not update member access level for '{gitlab_username}': {update_error}"
-                    )
-            else:
-                logger.warning(
-                    f"Could not add member '{gitlab_username}' (ID {gitlab_user_id}) "
-                    f"to project {project.path_with_namespace}: {e}"
-                )
         except Exception as e:
             logger.warning(
-                f"Unexpected error adding member '{gitlab_username}' to project: {e}"
+                f"Could not add member '{gitlab_username}' (ID {gitlab_user_id}) "
+                f"to project {project['path_with_namespace']}: {e}"
             )
 
 
-def get_gitlab_client(organization: Organization) -> Gitlab:
+def get_gitlab_credentials(organization: Organization) -> Tuple[str, str]:
     """
-    Get a configured GitLab client from organization settings.
+    Get the GitLab API URL and decrypted token from organization settings.
     
     Args:
         organization: The organization with GitLab configuration
         
     Returns:
-        Configured GitLab client
+        Tuple of (api_url, token)
         
     Raises:
         ValueError: If GitLab configuration is missing or invalid
@@ -224,9 +166,31 @@ def get_gitlab_client(organization: Organization) -> Gitlab:
     from ..utils.docker_utils import transform_localhost_url
     api_url = transform_localhost_url(gitlab_url)
     
+    return api_url, gitlab_token
+
+
+def get_gitlab_client(organization: Organization) -> Gitlab:
+    """
+    Get a configured (synchronous) GitLab client from organization settings.
+    
+    Raises:
+        ValueError: If GitLab configuration is missing or invalid
+    """
+    api_url, gitlab_token = get_gitlab_credentials(organization)
     return Gitlab(api_url, private_token=gitlab_token)
 
 
+def get_organization_gitlab_gateway(organization: Organization) -> GitLabGateway:
+    """
+    Get the shared, rate-limited GitLab gateway for an organization.
+    
+    Raises:
+        ValueError: If GitLab configuration is missing or invalid
+    """
+    api_url, gitlab_token = get_gitlab_credentials(organization)
+    return get_gitlab_gateway(api_url, gitlab_token)
+
+
 def get_course_gitlab_config(course: Course, gitlab: Optional[Gitlab] = None) -> Dict[str, Any]:
     """
     Extract GitLab configuration from course properties.
@@ -311,15 +275,15 @@ def get_course_gitlab_config(course: Course, gitlab: Optional[Gitlab] = None) ->
 
 
 async def find_existing_repository(
-    gitlab: Gitlab,
+    gateway: GitLabGateway,
     namespace_id: int,
     repo_path: str
-) -> Optional[Any]:
+) -> Optional[Dict[str, Any]]:
     """
     Check if a repository already exists in the namespace.
     
     Args:
-        gitlab: GitLab client
+        gateway: GitLab gateway
         namespace_id: The namespace/group ID to search in
         repo_path: The repository path to look for
         
@@ -327,24 +291,10 @@ async def find_existing_repository(
         The existing project if found, None otherwise
     """
     try:
-        # Try to get the namespace group
-        namespace_group = gitlab.groups.get(namespace_id)
-        
-        # Method 1: Direct path access
-        full_path = f"{namespace_group.full_path}/{repo_path}"
-        try:
-            project = gitlab.projects.get(full_path.replace('/', '%2F'))
-            logger.info(f"Found existing repository: {project.path_with_namespace}")
-            return project
-        except GitlabGetError:
-            # Project does not exist on this path — fall through to search.
-            pass
-        
-        # Method 2: Search projects in namespace by name
-        for project in namespace_group.projects.list(search=repo_path, per_page=10):
-            if project.path == repo_path:
-                return gitlab.projects.get(project.id)
-                
+        project = await gateway.find_project_in_group(namespace_id, repo_path)
+        if project:
+            logger.info(f"Found existing repository: {project['path_with_namespace']}")
+        return project
     except Exception as e:
         logger.warning(f"Error checking for existing repository: {e}")
     
@@ -453,9 +403,13 @@ async def create_student_repository(
         if not organization:
             raise ValueError(f"Organization for course {course_id} not found")
         
-        # Get GitLab client and course configuration
-        gitlab = get_gitlab_client(organization)
-        gitlab_config = get_course_gitlab_config(course, gitlab)
+        # Get GitLab gateway and course configuration
+        gateway = get_organization_gitlab_gateway(organization)
+        try:
+            gitlab_config = get_course_gitlab_config(course)
+        except ValueError:
+            # Students group not stored yet - look it up with the (sync) client
+            gitlab_config = get_course_gitlab_config(course, get_gitlab_client(organization))
         gitlab_url = organization.properties.get('gitlab', {}).get('url')
         provider_url = gitlab_url  # Provider URL for Account lookup
         
@@ -468,34 +422,13 @@ async def create_student_repository(
             if not template_path:
                 raise ValueError(f"Course {course_id} missing student-template project configuration")
             
-            # Look up project by searching in the course namespace
+            # Look up project by its full path
             try:
-                # Extract the project name from the full path
-                project_name = template_path.split('/')[-1]  # 'student-template'
-                course_group_id = gitlab_config.get('group_id')
-                
-                if not course_group_id:
-                    raise ValueError(f"Course {course_id} missing gitlab.group_id")
-                
-                # Search for the project in the course namespace
-                projects = gitlab.projects.list(
-                    search=project_name,
-                    search_namespaces=True,
-                    owned=True,
-                    all=True
-                )
-                
-                # Find the exact match by full path
-                student_template_project = None
-                for project in projects:
-                    if project.path_with_namespace == template_path:
-                        student_template_project = project
-                        break
-                
+                student_template_project = await gateway.get_project(template_path)
                 if not student_template_project:
                     raise ValueError(f"Student template project not found at path: {template_path}")
                 
-                student_template_id = student_template_project.id
+                student_template_id = student_template_project['id']
                 logger.info(f"Found student-template project with ID {student_template_id} at {template_path}")
             except Exception as e:
                 raise ValueError(f"Could not find student-template project at {template_path}: {e}")
@@ -514,7 +447,7 @@ async def create_student_repository(
         logger.info(f"Checking for existing repository {repo_path} in namespace {gitlab_namespace_id}")
         
         # Check if repository already exists
-        existing_project = await find_existing_repository(gitlab, gitlab_namespace_id, repo_path)
+        existing_project = await find_existing_repository(gateway, gitlab_namespace_id, repo_path)
         
         # If repository exists, use it; otherwise fork
         if existing_project:
@@ -524,7 +457,7 @@ async def create_student_repository(
             # Ensure student is maintainer even for existing repo
             try:
                 await add_members_to_project(
-                    gitlab=gitlab,
+                    gateway=gateway,
                     project=forked_project,
                     member_ids=[course_member_id],
                     db=db,
@@ -537,7 +470,7 @@ async def create_student_repository(
             logger.info(f"Forking template {student_template_id} to {repo_path}")
             try:
                 forked_project = await fork_project_with_polling(
-                    gitlab=gitlab,
+                    gateway=gateway,
                     source_project_id=student_template_id,
                     dest_path=repo_path,
                     dest_name=repo_name,
@@ -547,7 +480,7 @@ async def create_student_repository(
                 # If fork fails with "already taken", try to find the existing repo
                 if "has already been taken" in str(fork_error):
                     logger.warning(f"Repository already exists, searching for it...")
-                    forked_project = await find_existing_repository(gitlab, gitlab_namespace_id, repo_path)
+                    forked_project = await find_existing_repository(gateway, gitlab_namespace_id, repo_path)
                     if not forked_project:
                         raise ValueError(f"Repository {repo_path} exists but cannot be accessed")
                 else:
@@ -556,13 +489,13 @@ async def create_student_repository(
             # Unprotect branches to allow student pushes
             for branch in ["main", "master"]:
                 try:
-                    gitlab_unprotect_branches(gitlab, forked_project.id, branch)
+                    await gateway.unprotect_branch(forked_project['id'], branch)
                 except Exception as e:
                     logger.debug(f"Could not unprotect {branch} branch: {e}")
                 
             # Add student as maintainer of the repository
             await add_members_to_project(
-                gitlab=gitlab,
+                gateway=gateway,
                 project=forked_project,
                 member_ids=[course_member_id],
                 db=db,
@@ -572,18 +505,18 @@ async def create_student_repository(
         # Prepare repository information
         repository_info = {
             "url": gitlab_url,
-            "full_path": forked_project.path_with_namespace,
+            "full_path": forked_project['path_with_namespace'],
             "directory": None,  # Will be set per assignment
-            "web_url": forked_project.web_url,
-            "group_id": forked_project.id,
+            "web_url": forked_project['web_url'],
+            "group_id": forked_project['id'],
             "namespace_id": gitlab_namespace_id,
-            "namespace_path": forked_project.namespace['full_path'] if hasattr(forked_project.namespace, '__getitem__') else forked_project.namespace.full_path,
+            "namespace_path": forked_project['namespace']['full_path'],
             # Keep for backward compatibility
-            "gitlab_project_id": forked_project.id,
-            "gitlab_project_path": forked_project.path_with_namespace,
+            "gitlab_project_id": forked_project['id'],
+            "gitlab_project_path": forked_project['path_with_namespace'],
             # Use properly constructed URLs instead of broken GitLab API fields
-            "http_url_to_repo": construct_gitlab_http_url(gitlab_url, forked_project.path_with_namespace),
-            "ssh_url_to_repo": construct_gitlab_ssh_url(forked_project.path_with_namespace, gitlab_url.split('://')[1].split('/')[0] if '://' in gitlab_url else 'localhost')
+            "http_url_to_repo": construct_gitlab_http_url(gitlab_url, forked_project['path_with_namespace']),
+            "ssh_url_to_repo": construct_gitlab_ssh_url(forked_project['path_with_namespace'], gitlab_url.split('://')[1].split('/')[0] if '://' in gitlab_url else 'localhost')
         }
         
         # Store repository info in course member properties
@@ -648,24 +581,9 @@ async def create_team_repository(
         if not organization:
             raise ValueError(f"Organization for course {course_id} not found")
         
-        # Get GitLab credentials from organization
-        org_properties = organization.properties or {}
-        gitlab_config = org_properties.get('gitlab', {})
-        gitlab_url = gitlab_config.get('url')
-        gitlab_token_encrypted = gitlab_config.get('token')
-        
-        if not gitlab_url or not gitlab_token_encrypted:
-            raise ValueError(f"Organization {organization.id} missing GitLab configuration")
-        
-        # Decrypt the GitLab token
-        gitlab_token = decrypt_api_key(gitlab_token_encrypted)
-        
-        # Transform URL for Docker environment if needed
-        from ..utils.docker_utils import transform_localhost_url
-        api_url = transform_localhost_url(gitlab_url)
-        
-        # Initialize GitLab client with organization's credentials
-        gitlab = Gitlab(api_url, private_token=gitlab_token)
+        # Get the GitLab gateway for the organization's credentials
+        gitlab_url = (organization.properties or {}).get('gitlab', {}).get('url')
+        gateway = get_organization_gitlab_gateway(organization)
             
         # Get GitLab properties
         course_properties = course.properties or {}
@@ -692,34 +610,11 @@ async def create_team_repository(
         
         # Find the student-template project
         try:
-            # Extract project name and namespace from path
-            path_parts = student_template_path.split('/')
-            if len(path_parts) < 2:
-                raise ValueError(f"Invalid student template path: {student_template_path}")
-            
-            project_name = path_parts[-1]  # Last part is the project name
-            
-            # Get the course group ID to search in the correct namespace
-            course_group_id = gitlab_props.get('group_id')
-            if not course_group_id:
-                raise ValueError(f"Course {course_id} missing gitlab.group_id")
-            
-            # Search for the project in the course namespace
-            projects = gitlab.projects.list(
-                search=project_name,
-                namespace_id=course_group_id
-            )
-            
-            student_template_project = None
-            for project in projects:
-                if project.path == project_name:
-                    student_template_project = gitlab.projects.get(project.id)
-                    break
-            
+            student_template_project = await gateway.get_project(student_template_path)
             if not student_template_project:
-                raise ValueError(f"Student template project '{project_name}' not found in namespace {course_group_id}")
+                raise ValueError(f"Student template project '{student_template_path}' not found")
             
-            student_template_id = student_template_project.id
+            student_template_id = student_template_project['id']
         except Exception as e:
             raise ValueError(f"Could not find student-template project at {student_template_path}: {e}")
             
@@ -741,7 +636,7 @@ async def create_team_repository(
         
         # Fork the student-template repository with polling
         team_project = await fork_project_with_polling(
-            gitlab=gitlab,
+            gateway=gateway,
             source_project_id=student_template_id,
             dest_path=repo_path,
             dest_name=repo_name,
@@ -749,12 +644,12 @@ async def create_team_repository(
         )
             
         # Unprotect branches
-        gitlab_unprotect_branches(gitlab, team_project.id, "main")
-        gitlab_unprotect_branches(gitlab, team_project.id, "master")
+        await gateway.unprotect_branch(team_project['id'], "main")
+        await gateway.unprotect_branch(team_project['id'], "master")
 
         # Add team members as maintainers
         await add_members_to_project(
-            gitlab=gitlab,
+            gateway=gateway,
             project=team_project,
             member_ids=team_members,
             db=db,
@@ -777,24 +672,24 @@ async def create_team_repository(
         
         # Update submission group with repository information
         repository_info = {
-            "gitlab_project_id": team_project.id,
-            "gitlab_project_path": team_project.path_with_namespace,
+            "gitlab_project_id": team_project['id'],
+            "gitlab_project_path": team_project['path_with_namespace'],
             # Use properly constructed URLs instead of broken GitLab API fields
-            "http_url_to_repo": construct_gitlab_http_url(gitlab_url, team_project.path_with_namespace),
-            "ssh_url_to_repo": construct_gitlab_ssh_url(team_project.path_with_namespace, gitlab_url.split('://')[1].split('/')[0] if '://' in gitlab_url else 'localhost'),
-            "web_url": construct_gitlab_web_url(gitlab_url, team_project.path_with_namespace),
+            "http_url_to_repo": construct_gitlab_http_url(gitlab_url, team_project['path_with_namespace']),
+            "ssh_url_to_repo": construct_gitlab_ssh_url(team_project['path_with_namespace'], gitlab_url.split('://')[1].split('/')[0] if '://' in gitlab_url else 'localhost'),
+            "web_url": construct_gitlab_web_url(gitlab_url, team_project['path_with_namespace']),
             "team_members": team_members,
             "gitlab": {
                 "url": gitlab_url,
-                "full_path": team_project.path_with_namespace,
+                "full_path": team_project['path_with_namespace'],
                 "directory": assignment_directory,
-                "web_url": construct_gitlab_web_url(gitlab_url, team_project.path_with_namespace),
+                "web_url": construct_gitlab_web_url(gitlab_url, team_project['path_with_namespace']),
                 "group_id": gitlab_namespace_id,
                 "namespace_id": gitlab_namespace_id,
-                "namespace_path": team_project.namespace['full_path'],
+                "namespace_path": team_project['namespace']['full_path'],
                 # Use properly constructed URLs instead of broken GitLab API fields
-                "http_url_to_repo": construct_gitlab_http_url(gitlab_url, team_project.path_with_namespace),
-                "ssh_url_to_repo": construct_gitlab_ssh_url(team_project.path_with_namespace, gitlab_url.split('://')[1].split('/')[0] if '://' in gitlab_url else 'localhost')
+                "http_url_to_repo": construct_gitlab_http_url(gitlab_url, team_project['path_with_namespace']),
+                "ssh_url_to_repo": construct_gitlab_ssh_url(team_project['path_with_namespace'], gitlab_url.split('://')[1].split('/')[0] if '://' in gitlab_url else 'localhost')
             }
         }
         
@@ -892,8 +787,80 @@ class StudentRepositoryCreationWorkflow(BaseWorkflow):
                 metadata={"error_details": str(e)}
             )
 
+@register_task
+@workflow.defn(name="StudentRepositoryBatchCreationWorkflow", sandboxed=False)
+class StudentRepositoryBatchCreationWorkflow(BaseWorkflow):
+    """
+    Workflow to create repositories for many students of one course.
+    Started once per roster import instead of one workflow per member.
+    """
+
+    # Forks running at the same time; keeps the GitLab API from being flooded.
+    MAX_PARALLEL = 8
+
+    @classmethod
+    def get_name(cls) -> str:
+        """Get the workflow name."""
+        return "StudentRepositoryBatchCreationWorkflow"
+
+    @workflow.run
+    async def run(self, params: Dict[str, Any]) -> WorkflowResult:
+        """
+        Execute the batched student repository creation workflow.
+
+        Expected params:
+        - course_id: ID of the course
+        - members: List of {course_member_id, submission_group_ids}
+        - max_parallel: Optional override of MAX_PARALLEL
+        """
+        retry_policy = RetryPolicy(
+            maximum_attempts=3,
+            initial_interval=timedelta(seconds=1),
+            maximum_interval=timedelta(seconds=10),
+            backoff_coefficient=2
+        )
+
+        course_id = params.get('course_id')
+        members = params.get('members', [])
+        max_parallel = max(1, int(params.get('max_parallel') or self.MAX_PARALLEL))
+
+        # Sliding window: a new fork starts as soon as any running one
+        # finishes, instead of waiting for the slowest fork of a wave
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def create(member: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await workflow.execute_activity(
+                    create_student_repository,
+                    args=[member['course_member_id'], course_id, member.get('submission_group_ids', [])],
+                    retry_policy=retry_policy,
+                    start_to_close_timeout=timedelta(minutes=5)
+                )
+
+        outcomes = await asyncio.gather(*(create(m) for m in members), return_exceptions=True)
+
+        results = []
+        failures = []
+        for member, outcome in zip(members, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    f"Repository creation failed for course member "
+                    f"{member['course_member_id']}: {outcome}"
+                )
+                failures.append({"course_member_id": member['course_member_id'], "error": str(outcome)})
+            else:
+                results.append(outcome)
+
+        return WorkflowResult(
+            status="success" if not failures else ("completed_with_errors" if results else "failed"),
+            result={"message": f"Created {len(results)} repositories", "repositories": results},
+            error=f"{len(failures)} repositories failed" if failures else None,
+            metadata={"repository_count": len(results), "failures": failures}
+        )
+
 WORKFLOWS = [
     StudentRepositoryCreationWorkflow,
+    StudentRepositoryBatchCreationWorkflow,
 ]
 
 ACTIVITIES = [
@@ -2,6 +2,7 @@
 Temporal workflows for generating student templates from Example Library.
 Version 2: Fixed deployment status handling and sandbox restrictions.
 """
+import asyncio
 import logging
 from datetime import timedelta
 from typing import Dict, Any, List
@@ -14,6 +15,10 @@ from .registry import register_task
 
 logger = logging.getLogger(__name__)
 
+# Example versions downloaded from object storage at the same time during
+# template generation (each one fetches its files with bounded concurrency too)
+EXAMPLE_PREFETCH_CONCURRENCY = 4
+
 
 async def process_example_for_student_template_v2(
     example_files: Dict[str, bytes],
@@ -232,31 +237,56 @@ async def download_example_from_object_storage(
     
     logger.info(f"Downloading from {repository.source_type} bucket: {bucket_name}, path: {storage_path}")
     
-    # Download all files for this example
+    # List and download all files for this example (bounded concurrency)
+    listing = await storage_service.list_objects_many([prefix], bucket_name=bucket_name)
+    object_names = [obj.object_name for obj in listing.get(prefix, [])]
+    contents = await storage_service.download_files(object_names, bucket_name=bucket_name)
+    
     example_files = {}
-    objects = await storage_service.list_objects(
-        prefix=prefix,
-        bucket_name=bucket_name
-    )
+    for object_name in object_names:
+        file_data = contents.get(object_name)
+        if file_data is None:
+            logger.error(f"Failed to download {object_name}")
+            continue
+        
+        # Get relative path within example
+        relative_path = object_name
+        if prefix:
+            relative_path = object_name.replace(prefix, '').lstrip('/')
+        
+        example_files[relative_path] = file_data
+    
+    return example_files
+
+
+async def prefetch_example_files(
+    versions: List[Any],
+    max_concurrency: int = EXAMPLE_PREFETCH_CONCURRENCY
+) -> Dict[Any, Any]:
+    """
+    Download the files of several example versions concurrently.
     
-    for obj in objects:
+    Args:
+        versions: ExampleVersions (duplicates are downloaded once)
+        max_concurrency: Maximum number of examples downloaded at once
+        
+    Returns:
+        Dictionary mapping version id to its files, or to the exception
+        raised while downloading them
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    unique = {version.id: version for version in versions}
+
+    async def fetch(version: Any) -> Any:
         try:
-            # Download file content
-            file_data = await storage_service.download_file(
-                object_key=obj.object_name,
-                bucket_name=bucket_name
-            )
-            
-            # Get relative path within example
-            relative_path = obj.object_name
-            if prefix:
-                relative_path = obj.object_name.replace(prefix, '').lstrip('/')
-            
-            example_files[relative_path] = file_data
+            repository = version.example.repository
+            async with semaphore:
+                return await download_example_files(repository, version)
         except Exception as e:
-            logger.error(f"Failed to download {obj.object_name}: {e}")
-    
-    return example_files
+            return e
+
+    results = await asyncio.gather(*(fetch(version) for version in unique.values()))
+    return dict(zip(unique.keys(), results))
 
 
 # Activities
@@ -296,6 +326,7 @@ async def generate_student_template_activity_v2(
     import os
     import tempfile
     import shutil
+    from contextlib import ExitStack
     from pathlib import Path
     from datetime import datetime, timezone
     from sqlalchemy.orm import joinedload
@@ -307,6 +338,7 @@ async def generate_student_template_activity_v2(
     from ..model.deployment import CourseContentDeployment, DeploymentHistory
     from ..model.service import ServiceType
     from ..services.storage_service import StorageService
+    from ..services.git_mirror import get_git_mirror_cache
 
     with get_db_session() as db:
       try:
@@ -417,32 +449,50 @@ async def generate_student_template_activity_v2(
             logger.warning(f"No GitLab token found in organization {organization.title} properties")
         
         # Use temp directory for repository work
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory() as temp_dir, ExitStack() as git_stack:
             template_repo_path = os.path.join(temp_dir, "student-template")
             
             # Create authenticated URL if we have a token and it's HTTP
             auth_url = make_git_auth_url(student_template_url, gitlab_token) if gitlab_token else student_template_url
             
-            # Try to clone existing repo or create new one
-            try:
-                if gitlab_token and 'http' in student_template_url:
-                    template_repo = git.Repo.clone_from(auth_url, template_repo_path)
-                else:
-                    template_repo = git.Repo.clone_from(student_template_url, template_repo_path)
-            except Exception as e:
-                logger.info(f"Could not clone student template repo, creating new: {e}")
-                os.makedirs(template_repo_path, exist_ok=True)
-                template_repo = git.Repo.init(template_repo_path)
-                
-                # Set default branch to main
-                template_repo.git.checkout('-b', 'main')
-                
-                # Add remote with auth URL if we have a token
-                if 'http' in student_template_url:
-                    if gitlab_token:
-                        template_repo.create_remote('origin', auth_url)
+            # Check out from the worker's mirror of the repository (incremental
+            # fetch + worktree); fall back to a fresh clone or a new repo
+            template_repo = None
+            push_remote = None
+            mirror_cache = get_git_mirror_cache()
+            if mirror_cache:
+                try:
+                    template_repo = git_stack.enter_context(
+                        mirror_cache.checkout(student_template_url, template_repo_path, auth_url=auth_url)
+                    )
+                    # Worktrees have no remote of their own; push to the URL directly
+                    push_remote = auth_url
+                except Exception as e:
+                    logger.info(f"Could not check out student template from mirror, cloning: {e}")
+                    shutil.rmtree(template_repo_path, ignore_errors=True)
+
+            if template_repo is None:
+                try:
+                    if gitlab_token and 'http' in student_template_url:
+                        template_repo = git.Repo.clone_from(auth_url, template_repo_path)
                     else:
-                        template_repo.create_remote('origin', student_template_url)
+                        template_repo = git.Repo.clone_from(student_template_url, template_repo_path)
+                except Exception as e:
+                    logger.info(f"Could not clone student template repo, creating new: {e}")
+                    os.makedirs(template_repo_path, exist_ok=True)
+                    template_repo = git.Repo.init(template_repo_path)
+                    
+                    # Set default branch to main
+                    template_repo.git.checkout('-b', 'main')
+                    
+                    # Add remote with auth URL if we have a token
+                    if 'http' in student_template_url:
+                        if gitlab_token:
+                            template_repo.create_remote('origin', auth_url)
+                        else:
+                            template_repo.create_remote('origin', student_template_url)
+                if 'origin' in [remote.name for remote in template_repo.remotes]:
+                    push_remote = 'origin'
             
             # Configure git for commits (required in worker container)
             git_email = os.environ.get('SYSTEM_GIT_EMAIL', 'worker@computor.local')
@@ -555,6 +605,13 @@ async def generate_student_template_activity_v2(
             if not course_contents:
                 logger.warning(f"No course contents to deploy for course {course_id}. This will result in an empty student template.")
             
+            # Download the examples of all contents up front, several at a time
+            example_files_by_version = await prefetch_example_files([
+                content.deployment.example_version
+                for content in course_contents
+                if content.deployment and content.deployment.example_version
+            ])
+
             # Process each CourseContent with an example
             processed_count = 0
             errors = []
@@ -621,7 +678,11 @@ async def generate_student_template_activity_v2(
                             example_repo = content.deployment.example_version.example.repository
                             # download_example_files returns files already scoped to the example version
                             # No filtering needed - the storage_path in MinIO already isolates this example
-                            files = await download_example_files(example_repo, content.deployment.example_version)
+                            files = example_files_by_version.get(content.deployment.example_version.id)
+                            if files is None:
+                                files = await download_example_files(example_repo, content.deployment.example_version)
+                            elif isinstance(files, Exception):
+                                raise files
                     except Exception as e:
                         logger.warning(f"Failed to load files from example repository for {content.path}: {e}")
                         files = {}
@@ -866,11 +927,11 @@ async def generate_student_template_activity_v2(
                         logger.info(f"Committed changes: {commit_message}")
                         
                         # Push to remote with retry on concurrent push conflicts
-                        if 'origin' in [remote.name for remote in template_repo.remotes]:
+                        if push_remote:
                             max_push_attempts = 3
                             for push_attempt in range(max_push_attempts):
                                 try:
-                                    template_repo.git.push('origin', 'main')
+                                    template_repo.git.push(push_remote, 'HEAD:main')
                                     logger.info("Pushed changes to GitLab")
                                     git_push_successful = True
                                     break
@@ -882,7 +943,7 @@ async def generate_student_template_activity_v2(
                                                 f"Push failed (attempt {push_attempt + 1}/{max_push_attempts}), "
                                                 f"pulling with rebase and retrying: {push_err}"
                                             )
-                                            template_repo.git.pull('--rebase', 'origin', 'main')
+                                            template_repo.git.pull('--rebase', push_remote, 'main')
                                         else:
                                             logger.error(f"Push failed after {max_push_attempts} attempts: {push_err}")
                                             raise
@@ -39,6 +39,7 @@ from . import (
     temporal_student_repository,
     temporal_tutor_testing,
     temporal_coder_setup,
+    temporal_cascade_deletion,
 )
 
 _TEMPORAL_MODULES = [
@@ -51,6 +52,7 @@ _TEMPORAL_MODULES = [
     temporal_student_repository,
     temporal_tutor_testing,
     temporal_coder_setup,
+    temporal_cascade_deletion,
 ]
 
 
@@ -244,6 +244,9 @@ class ComputorTestingBackend(TestingBackend):
         "itpcp.exec.doc": "document",
     }
 
+    # Exit code `computor-test serve` reports for jobs killed by their timeout
+    SERVER_TIMEOUT_EXIT_CODE = 124
+
     def get_backend_type(self) -> str:
         return "computor-testing"
 
@@ -288,6 +291,48 @@ class ComputorTestingBackend(TestingBackend):
             os.environ.get("TESTING_EXECUTABLE", "computor-test")
         )
 
+        timeout_seconds = backend_properties.get("timeout_seconds", 300)
+        verbosity = backend_properties.get("verbosity", 0)
+
+        # Prefer a running `computor-test serve` harness: it skips the
+        # interpreter and import start-up of every test run
+        server_socket = backend_properties.get(
+            "testing_server_socket",
+            os.environ.get("TESTING_SERVER_SOCKET")
+        )
+        if server_socket and os.path.exists(server_socket):
+            try:
+                response = self._request_server_job(
+                    server_socket,
+                    {
+                        "language": language,
+                        "testsuite": test_file_path,
+                        "specification": spec_file_path,
+                        "verbosity": verbosity,
+                        "timeout": timeout_seconds,
+                    },
+                    timeout=timeout_seconds + 10,
+                )
+            except TimeoutError:
+                response = {"exit_code": self.SERVER_TIMEOUT_EXIT_CODE}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Test server at {server_socket} unavailable, falling back to CLI: {e}")
+                response = None
+            if response is not None:
+                logger.info(f"Test server job finished with exit code {response.get('exit_code')}")
+                if response.get("stderr"):
+                    logger.warning(f"Test stderr: {response['stderr'][:500]}...")
+                if response.get("exit_code") == self.SERVER_TIMEOUT_EXIT_CODE:
+                    return {
+                        "passed": 0,
+                        "failed": 1,
+                        "total": 1,
+                        "error": f"Test execution timed out after {timeout_seconds} seconds",
+                        "details": {"timeout": True}
+                    }
+                # Results are written to testSummary.json like with the CLI
+                return None
+
         # Build command: computor-test <language> run -T <test.yaml> -s <spec.yaml>
         # Note: -t (target) parameter is optional, specification has executionDirectory
         cmd_parts = [
@@ -299,7 +344,6 @@ class ComputorTestingBackend(TestingBackend):
         ]
 
         # Add verbosity if specified
-        verbosity = backend_properties.get("verbosity", 0)
         if verbosity > 0:
             cmd_parts.extend(["-v", str(verbosity)])
 
@@ -313,7 +357,7 @@ class ComputorTestingBackend(TestingBackend):
                 shell=True,
                 capture_output=True,
                 text=True,
-                timeout=backend_properties.get("timeout_seconds", 300)
+                timeout=timeout_seconds
             )
 
             # Log output for debugging
@@ -333,7 +377,7 @@ class ComputorTestingBackend(TestingBackend):
                 "passed": 0,
                 "failed": 1,
                 "total": 1,
-                "error": f"Test execution timed out after {backend_properties.get('timeout_seconds', 300)} seconds",
+                "error": f"Test execution timed out after {timeout_seconds} seconds",
                 "details": {"timeout": True}
             }
         except Exception as e:
@@ -346,6 +390,23 @@ class ComputorTestingBackend(TestingBackend):
                 "details": {"exception": str(e)}
             }
 
+    @staticmethod
+    def _request_server_job(socket_path: str, job: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one job to a `computor-test serve` socket and wait for its JSON reply."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(timeout)
+            conn.connect(socket_path)
+            conn.sendall(json.dumps(job).encode("utf-8") + b"\n")
+            chunks = []
+            while True:
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        if not chunks:
+            raise ConnectionError("Test server closed the connection without a result")
+        return json.loads(b"".join(chunks))
+
     def _get_language_from_slug(self, service_slug: str) -> Optional[str]:
         """Map service slug to computor-test language name."""
         if not service_slug:
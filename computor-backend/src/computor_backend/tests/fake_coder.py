@@ -0,0 +1,175 @@
+"""
+Minimal fake Coder API for workspace provisioning tests and benchmarks.
+
+Implements just the endpoints used by ``coder.client.CoderClient`` for
+provisioning and status polling, with a fixed per-request latency and a
+fixed workspace build duration. Use it in-process through
+``httpx.ASGITransport(app=fake.app)`` or run it standalone:
+
+    python -m computor_backend.tests.fake_coder --port 8098 --latency 0.05 --build-seconds 5
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs
+
+
+class FakeCoder:
+    """In-memory Coder with one organization, templates, users and workspaces."""
+
+    def __init__(self, latency: float = 0.0, build_seconds: float = 0.0):
+        """
+        Args:
+            latency: Seconds added to every request
+            build_seconds: Time until a start build has succeeded
+        """
+        self.latency = latency
+        self.build_seconds = build_seconds
+        self.templates: Dict[str, Dict[str, Any]] = {}
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.workspaces: Dict[str, Dict[str, Any]] = {}
+        self.failing_users: set = set()
+        self.requests: List[str] = []
+
+    def add_template(self, name: str) -> str:
+        template_id = str(uuid.uuid4())
+        self.templates[template_id] = {"id": template_id, "name": name, "active_version_id": str(uuid.uuid4())}
+        return template_id
+
+    def count(self, method: str, path: str) -> int:
+        return self.requests.count(f"{method} {path}")
+
+    # -- ASGI --------------------------------------------------------------
+
+    async def app(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        method = scope["method"]
+        path = scope["path"]
+        self.requests.append(f"{method} {path}")
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        query = {k: v[0] for k, v in parse_qs(scope.get("query_string", b"").decode()).items()}
+        data = json.loads(body) if body else {}
+        status, payload = self._handle(method, path, query, data)
+
+        content = json.dumps(payload).encode() if payload is not None else b""
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json")],
+        })
+        await send({"type": "http.response.body", "body": content})
+
+    def _workspace(self, workspace: Dict[str, Any]) -> Dict[str, Any]:
+        build = workspace["latest_build"]
+        if build["job"]["status"] == "running" and time.monotonic() >= workspace["_ready_at"]:
+            build["job"]["status"] = "succeeded"
+            build["status"] = "running"
+        return {k: v for k, v in workspace.items() if not k.startswith("_")}
+
+    def _handle(self, method: str, path: str, query: Dict[str, str], data: Dict[str, Any]):
+        parts = path.strip("/").split("/")
+        if parts[:2] != ["api", "v2"]:
+            return 404, {"message": "Not found"}
+        parts = parts[2:]
+
+        if parts == ["users", "login"] and method == "POST":
+            return 201, {"session_token": "session"}
+
+        if parts == ["organizations"] and method == "GET":
+            return 200, [{"id": "org", "name": "coder"}]
+
+        if parts == ["templates"] and method == "GET":
+            return 200, list(self.templates.values())
+
+        if parts == ["users"] and method == "GET":
+            email = query.get("q", "").lower()
+            return 200, {"users": [u for u in self.users.values() if u["email"].lower() == email]}
+
+        if parts == ["users"] and method == "POST":
+            if data["username"] in self.users:
+                return 409, {"message": "User already exists"}
+            user = {"id": str(uuid.uuid4()), "username": data["username"], "email": data["email"], "status": "active"}
+            self.users[data["username"]] = user
+            return 201, user
+
+        if len(parts) == 4 and parts[0] == "users" and parts[2] == "workspace" and method == "GET":
+            for workspace in self.workspaces.values():
+                if workspace["owner_name"] == parts[1] and workspace["name"] == parts[3]:
+                    return 200, self._workspace(workspace)
+            return 404, {"message": "Workspace not found"}
+
+        if parts == ["workspaces"] and method == "GET":
+            workspaces = sorted(self.workspaces.values(), key=lambda w: w["_created"])
+            search = query.get("q", "")
+            if search.startswith("id:"):
+                ids = set(search[3:].split(","))
+                workspaces = [w for w in workspaces if w["id"] in ids]
+            offset = int(query.get("offset", 0))
+            limit = int(query.get("limit", 0)) or len(workspaces)
+            page = workspaces[offset:offset + limit]
+            return 200, {"workspaces": [self._workspace(w) for w in page], "count": len(workspaces)}
+
+        if len(parts) == 5 and parts[:2] == ["organizations", "default"] and parts[4] == "workspaces":
+            return self._create_workspace(parts[3], data)
+
+        return 404, {"message": "Not found"}
+
+    def _create_workspace(self, username: str, data: Dict[str, Any]):
+        user = self.users.get(username)
+        if user is None:
+            return 404, {"message": "User not found"}
+        if username in self.failing_users:
+            return 500, {"message": "Provisioner unavailable"}
+        if any(w["owner_name"] == username and w["name"] == data["name"] for w in self.workspaces.values()):
+            return 409, {"message": "Workspace already exists"}
+        template = self.templates[data["template_id"]]
+        workspace_id = str(uuid.uuid4())
+        self.workspaces[workspace_id] = {
+            "id": workspace_id,
+            "name": data["name"],
+            "owner_id": user["id"],
+            "owner_name": username,
+            "template_id": template["id"],
+            "template_name": template["name"],
+            "latest_build": {
+                "status": "starting",
+                "transition": "start",
+                "template_version_id": template["active_version_id"],
+                "job": {"status": "running"},
+                "resources": [],
+            },
+            "_created": len(self.workspaces),
+            "_ready_at": time.monotonic() + self.build_seconds,
+        }
+        return 201, self._workspace(self.workspaces[workspace_id])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run a fake Coder API for provisioning benchmarks")
+    parser.add_argument("--port", type=int, default=8098)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--build-seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    fake = FakeCoder(latency=args.latency, build_seconds=args.build_seconds)
+    fake.add_template("python-workspace")
+    fake.add_template("matlab-workspace")
+    uvicorn.run(fake.app, host="127.0.0.1", port=args.port)
@@ -0,0 +1,333 @@
+"""
+Minimal fake GitLab REST API for repository provisioning tests and benchmarks.
+
+Implements just the endpoints used by ``services.gitlab_gateway`` and
+``generator.gitlab_builder`` with a fixed per-request latency and a fixed
+fork import duration, so throughput measurements are deterministic. Use it
+in-process through ``httpx.ASGITransport(app=fake.app)``, through
+``fake.requests_session()`` for python-gitlab, or run it standalone:
+
+    python -m computor_backend.tests.fake_gitlab --port 8099 --latency 0.05 --fork-seconds 1
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, unquote
+
+
+class FakeGitLab:
+    """In-memory GitLab with groups, projects, forks, users and members."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        fork_seconds: float = 0.0,
+        rate_limit: Optional[int] = None,
+    ):
+        """
+        Args:
+            latency: Seconds added to every request
+            fork_seconds: Time until a fork's import_status becomes "finished"
+            rate_limit: Requests per second before answering 429 (None: unlimited)
+        """
+        self.latency = latency
+        self.fork_seconds = fork_seconds
+        self.rate_limit = rate_limit
+        self.groups: Dict[int, Dict[str, Any]] = {}
+        self.group_paths: Dict[str, int] = {}
+        self.projects: Dict[int, Dict[str, Any]] = {}
+        self.users: Dict[str, int] = {}
+        self.members: Dict[int, Dict[int, int]] = {}
+        self.protected: Dict[int, set] = {}
+        self.files: Dict[int, Dict[str, str]] = {}
+        self.requests: List[str] = []
+        self.rejected = 0
+        self._recent: deque = deque()
+        self._next_id = 100
+
+    # -- setup -------------------------------------------------------------
+
+    def _id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    def add_group(self, full_path: str, name: Optional[str] = None, description: str = "") -> int:
+        group_id = self._id()
+        parent_path, _, path = full_path.rpartition("/")
+        self.groups[group_id] = {
+            "id": group_id,
+            "full_path": full_path,
+            "path": path,
+            "name": name or path,
+            "description": description,
+            "parent_id": self.group_paths.get(parent_path),
+            "visibility": "private",
+            "web_url": f"http://gitlab.test/groups/{full_path}",
+        }
+        self.group_paths[full_path] = group_id
+        return group_id
+
+    def add_project(self, group_id: int, path: str) -> int:
+        project_id = self._id()
+        group = self.groups[group_id]
+        self.projects[project_id] = {
+            "id": project_id,
+            "path": path,
+            "name": path,
+            "path_with_namespace": f"{group['full_path']}/{path}",
+            "web_url": f"http://gitlab.test/{group['full_path']}/{path}",
+            "namespace": {"id": group_id, "full_path": group["full_path"]},
+            "import_status": "none",
+            "_ready_at": 0.0,
+        }
+        self.protected[project_id] = {"main"}
+        return project_id
+
+    def count(self, method: str, prefix: str) -> int:
+        """Number of requests with the given method whose path starts with ``prefix``."""
+        return sum(1 for r in self.requests if r.startswith(f"{method} {prefix}"))
+
+    def requests_session(self):
+        """``requests.Session`` routed to this app, e.g. for ``Gitlab(session=...)``."""
+        import requests
+
+        session = requests.Session()
+        session.mount("http://", _ASGIAdapter(self.app))
+        return session
+
+    def add_user(self, username: str) -> int:
+        user_id = self._id()
+        self.users[username] = user_id
+        return user_id
+
+    # -- ASGI --------------------------------------------------------------
+
+    async def app(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                await send({"type": message["type"] + ".complete"})
+                if message["type"] == "lifespan.shutdown":
+                    return
+        if scope["type"] != "http":
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        method = scope["method"]
+        raw_path = scope.get("raw_path") or scope["path"].encode()
+        path = raw_path.decode().split("?")[0]
+        self.requests.append(f"{method} {path}")
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self.rate_limit and self._over_limit():
+            self.rejected += 1
+            status, payload, headers = 429, {"message": "Retry later"}, [(b"retry-after", b"0.2")]
+        else:
+            query = {k: v[0] for k, v in parse_qs(scope.get("query_string", b"").decode()).items()}
+            data = json.loads(body) if body else {}
+            status, payload, *extra = self._handle(method, path, query, data)
+            headers = [(k.encode(), v.encode()) for k, v in (extra[0] if extra else {}).items()]
+
+        content = json.dumps(payload).encode() if payload is not None else b""
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json")] + headers,
+        })
+        await send({"type": "http.response.body", "body": content})
+
+    def _over_limit(self) -> bool:
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] > 1.0:
+            self._recent.popleft()
+        if len(self._recent) >= self.rate_limit:
+            return True
+        self._recent.append(now)
+        return False
+
+    def _group(self, ref: str) -> Optional[Dict[str, Any]]:
+        ref = unquote(ref)
+        if ref.isdigit():
+            return self.groups.get(int(ref))
+        group_id = self.group_paths.get(ref)
+        return self.groups.get(group_id) if group_id else None
+
+    def _list_groups(self, path: str, query: Dict[str, str]):
+        per_page = min(int(query.get("per_page", 20)), 100)
+        page = int(query.get("page", 1))
+        groups = list(self.groups.values())
+        headers = {}
+        if page * per_page < len(groups):
+            headers["link"] = f'<http://gitlab.test{path}?page={page + 1}&per_page={per_page}>; rel="next"'
+        return 200, groups[(page - 1) * per_page:page * per_page], headers
+
+    def _project(self, ref: str) -> Optional[Dict[str, Any]]:
+        ref = unquote(ref)
+        if ref.isdigit():
+            return self.projects.get(int(ref))
+        return next((p for p in self.projects.values() if p["path_with_namespace"] == ref), None)
+
+    @staticmethod
+    def _public(project: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in project.items() if not k.startswith("_")}
+
+    def _handle(self, method: str, path: str, query: Dict[str, str], data: Dict[str, Any]):
+        parts = path.strip("/").split("/")
+        if parts[:2] != ["api", "v4"]:
+            return 404, {"message": "404 Not Found"}
+        parts = parts[2:]
+
+        if parts == ["version"]:
+            return 200, {"version": "17.0.0", "revision": "fake"}
+
+        if parts == ["groups"] and method == "GET":
+            return self._list_groups(path, query)
+
+        if parts == ["groups"] and method == "POST":
+            parent = self.groups.get(int(data["parent_id"])) if data.get("parent_id") else None
+            full_path = f"{parent['full_path']}/{data['path']}" if parent else data["path"]
+            if full_path in self.group_paths:
+                return 400, {"message": {"path": ["has already been taken"]}}
+            group_id = self.add_group(full_path, data.get("name"), data.get("description", ""))
+            return 201, self.groups[group_id]
+
+        if parts[0] == "groups" and len(parts) == 2:
+            group = self._group(parts[1])
+            if group is None:
+                return 404, {"message": "404 Group Not Found"}
+            if method == "PUT":
+                group.update({k: v for k, v in data.items() if k in ("name", "description", "visibility")})
+            return 200, group
+
+        if parts == ["projects"] and method == "POST":
+            group = self.groups[int(data["namespace_id"])]
+            if any(p["path_with_namespace"] == f"{group['full_path']}/{data['path']}" for p in self.projects.values()):
+                return 400, {"message": {"path": ["has already been taken"]}}
+            project_id = self.add_project(group["id"], data["path"])
+            self.projects[project_id]["name"] = data.get("name", data["path"])
+            return 201, self._public(self.projects[project_id])
+
+        if parts[0] == "users" and method == "GET":
+            user_id = self.users.get(query.get("username", ""))
+            return 200, ([{"id": user_id, "username": query["username"]}] if user_id else [])
+
+        if parts[0] != "projects" or len(parts) < 2:
+            return 404, {"message": "404 Not Found"}
+
+        project = self._project(parts[1])
+        if project is None:
+            return 404, {"message": "404 Project Not Found"}
+        rest = parts[2:]
+
+        if not rest and method == "GET":
+            return 200, self._public(project)
+
+        if rest == ["fork"] and method == "POST":
+            group = self.groups[int(data["namespace_id"])]
+            if any(p["path_with_namespace"] == f"{group['full_path']}/{data['path']}" for p in self.projects.values()):
+                return 409, {"message": {"name": ["has already been taken"], "path": ["has already been taken"]}}
+            fork_id = self.add_project(group["id"], data["path"])
+            fork = self.projects[fork_id]
+            fork["name"] = data.get("name", data["path"])
+            fork["import_status"] = "scheduled"
+            fork["_ready_at"] = time.monotonic() + self.fork_seconds
+            return 201, self._public(fork)
+
+        if rest == ["import"] and method == "GET":
+            if project["import_status"] in ("scheduled", "started") and time.monotonic() >= project["_ready_at"]:
+                project["import_status"] = "finished"
+            elif project["import_status"] == "scheduled":
+                project["import_status"] = "started"
+            return 200, {"id": project["id"], "import_status": project["import_status"], "import_error": None}
+
+        if rest[:2] == ["repository", "files"] and len(rest) == 3:
+            files = self.files.setdefault(project["id"], {})
+            file_path = unquote(rest[2])
+            if method == "POST":
+                if file_path in files:
+                    return 400, {"message": "A file with this name already exists"}
+                files[file_path] = data.get("content", "")
+                return 201, {"file_path": file_path, "branch": data.get("branch")}
+            if file_path not in files:
+                return 404, {"message": "404 File Not Found"}
+            return 200, {"file_path": file_path, "content": files[file_path], "ref": query.get("ref")}
+
+        if rest[:1] == ["protected_branches"] and len(rest) == 2 and method == "DELETE":
+            branch = unquote(rest[1])
+            if branch not in self.protected[project["id"]]:
+                return 404, {"message": "404 Not found"}
+            self.protected[project["id"]].discard(branch)
+            return 204, None
+
+        members = self.members.setdefault(project["id"], {})
+        if rest == ["members"] and method == "POST":
+            if data["user_id"] in members:
+                return 409, {"message": "Member already exists"}
+            members[data["user_id"]] = data["access_level"]
+            return 201, {"id": data["user_id"], "access_level": data["access_level"]}
+
+        if rest[:1] == ["members"] and len(rest) == 2:
+            user_id = int(rest[1])
+            if user_id not in members:
+                return 404, {"message": "404 Member Not Found"}
+            if method == "PUT":
+                members[user_id] = data["access_level"]
+            return 200, {"id": user_id, "access_level": members[user_id]}
+
+        return 404, {"message": "404 Not Found"}
+
+
+class _ASGIAdapter:
+    """``requests`` transport adapter that answers from an ASGI app."""
+
+    def __init__(self, app):
+        from starlette.testclient import TestClient
+
+        # Entered once so all requests share one event loop thread
+        self.client = TestClient(app, base_url="http://gitlab.test").__enter__()
+
+    def send(self, request, **kwargs):
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        reply = self.client.request(request.method, request.url, content=request.body, headers=dict(request.headers))
+        response = requests.Response()
+        response.status_code = reply.status_code
+        response._content = reply.content
+        response.headers = CaseInsensitiveDict(reply.headers)
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8"
+        return response
+
+    def close(self):
+        self.client.__exit__(None, None, None)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run a fake GitLab API for provisioning benchmarks")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--fork-seconds", type=float, default=1.0)
+    parser.add_argument("--rate-limit", type=int, default=None)
+    args = parser.parse_args()
+
+    fake = FakeGitLab(latency=args.latency, fork_seconds=args.fork_seconds, rate_limit=args.rate_limit)
+    students = fake.add_group("course/students")
+    fake.add_project(fake.add_group("course"), "student-template")
+    print(f"students group id: {students}")
+    uvicorn.run(fake.app, host="127.0.0.1", port=args.port)
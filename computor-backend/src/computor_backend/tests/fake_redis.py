@@ -0,0 +1,118 @@
+"""
+In-memory stand-in for the async Redis client (``redis.asyncio.Redis``).
+
+Implements the string and sorted-set commands the task tracker uses, both
+directly and through pipelines. ``round_trips`` counts commands sent to the
+"server" (a pipeline counts once), and each round trip sleeps for
+``latency`` seconds to model network cost in benchmarks.
+"""
+
+import asyncio
+
+
+class FakeRedis:
+    """In-memory async Redis (strings and sorted sets) counting round trips."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.strings = {}
+        self.zsets = {}
+        self.round_trips = 0
+
+    async def _round_trip(self):
+        self.round_trips += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    # Commands (applied immediately, no round trip)
+
+    def _setex(self, key, ttl, value):
+        self.strings[key] = value
+
+    def _get(self, key):
+        return self.strings.get(key)
+
+    def _zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def _zrem(self, key, *members):
+        zset = self.zsets.get(key, {})
+        return sum(zset.pop(m, None) is not None for m in members)
+
+    def _zrange(self, key, start, end, desc=False, withscores=False):
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda kv: (kv[1], kv[0]), reverse=desc)
+        items = items[start:] if end == -1 else items[start:end + 1]
+        return [(m, s) for m, s in items] if withscores else [m for m, _ in items]
+
+    def _expire(self, key, ttl):
+        return True
+
+    def _zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def _zunionstore(self, dest, keys):
+        union = {}
+        for key in keys:
+            for member, score in self.zsets.get(key, {}).items():
+                union[member] = union.get(member, 0) + score
+        self.zsets[dest] = union
+        return len(union)
+
+    def _delete(self, *keys):
+        for key in keys:
+            self.strings.pop(key, None)
+            self.zsets.pop(key, None)
+
+    # Async client API
+
+    async def get(self, key):
+        await self._round_trip()
+        return self._get(key)
+
+    async def mget(self, keys):
+        await self._round_trip()
+        return [self._get(k) for k in keys]
+
+    async def zcard(self, key):
+        await self._round_trip()
+        return self._zcard(key)
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands = []
+
+    def setex(self, key, ttl, value):
+        self.commands.append(lambda: self.redis._setex(key, ttl, value))
+
+    def get(self, key):
+        self.commands.append(lambda: self.redis._get(key))
+
+    def zadd(self, key, mapping):
+        self.commands.append(lambda: self.redis._zadd(key, mapping))
+
+    def zrem(self, key, *members):
+        self.commands.append(lambda: self.redis._zrem(key, *members))
+
+    def zrange(self, key, start, end):
+        self.commands.append(lambda: self.redis._zrange(key, start, end))
+
+    def zrevrange(self, key, start, end, withscores=False):
+        self.commands.append(lambda: self.redis._zrange(key, start, end, desc=True, withscores=withscores))
+
+    def zunionstore(self, dest, keys):
+        self.commands.append(lambda: self.redis._zunionstore(dest, keys))
+
+    def expire(self, key, ttl):
+        self.commands.append(lambda: self.redis._expire(key, ttl))
+
+    def delete(self, *keys):
+        self.commands.append(lambda: self.redis._delete(*keys))
+
+    async def execute(self):
+        await self.redis._round_trip()
+        return [command() for command in self.commands]
@@ -0,0 +1,204 @@
+"""
+Tests for chunked cascade deletion and batched MinIO object removal.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from computor_backend.business_logic import cascade_deletion as cd
+from computor_backend.model import Result
+from computor_backend.services import storage_service as ss
+from computor_backend.services.storage_service import StorageService
+
+
+def _storage_with_client(client) -> StorageService:
+    storage = StorageService.__new__(StorageService)
+    storage.client = client
+    storage.default_bucket = "default"
+    return storage
+
+
+@pytest.mark.unit
+class TestRemoveObjects:
+    """StorageService.remove_objects batches multi-object deletes."""
+
+    @pytest.mark.asyncio
+    async def test_batches_and_counts_errors(self):
+        client = MagicMock()
+        failed = MagicMock(name="err", code="AccessDenied", message="denied")
+        client.remove_objects.side_effect = [iter([failed]), iter([])]
+        storage = _storage_with_client(client)
+
+        with patch.object(ss, "REMOVE_OBJECTS_BATCH_SIZE", 3):
+            removed = await storage.remove_objects([f"k{i}" for i in range(5)], bucket_name="b")
+
+        assert removed == 4
+        assert client.remove_objects.call_count == 2
+        sizes = [len(call.args[1]) for call in client.remove_objects.call_args_list]
+        assert sizes == [3, 2]
+
+    @pytest.mark.asyncio
+    async def test_client_calls_leave_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        threads = []
+        client = MagicMock()
+        client.remove_objects.side_effect = lambda *a: threads.append(threading.get_ident()) or iter([])
+        client.list_objects.side_effect = lambda **kw: threads.append(threading.get_ident()) or iter([])
+        storage = _storage_with_client(client)
+
+        await storage.remove_objects(["k"], bucket_name="b")
+        await storage.list_objects(bucket_name="b", prefix="p/")
+
+        assert len(threads) == 2 and loop_thread not in threads
+
+    @pytest.mark.asyncio
+    async def test_no_keys_no_request(self):
+        client = MagicMock()
+        storage = _storage_with_client(client)
+
+        assert await storage.remove_objects([], bucket_name="b") == 0
+        client.remove_objects.assert_not_called()
+
+
+def _db_returning_ids(*batches):
+    """Session whose id SELECTs return the given batches in turn."""
+    db = MagicMock()
+    db.execute.return_value.all.side_effect = [[(i,) for i in batch] for batch in batches]
+    db.query.return_value.filter.return_value.delete.side_effect = [len(b) for b in batches if b]
+    return db
+
+
+@pytest.mark.unit
+class TestCascadeChunks:
+    """Chunks remove objects first, then rows, in short transactions."""
+
+    def _step(self, objects=None):
+        return cd.CascadeStep("results", Result, lambda cid: Result.course_content_id == cid, objects)
+
+    @pytest.mark.asyncio
+    async def test_objects_removed_before_rows(self):
+        calls = []
+        db = _db_returning_ids(["r1", "r2"])
+        db.query.return_value.filter.return_value.delete.side_effect = lambda **kw: calls.append("rows") or 2
+        db.commit.side_effect = lambda: calls.append("commit")
+
+        async def remove_keys(keys, storage):
+            calls.append(("keys", list(keys)))
+            return len(keys)
+
+        async def remove_prefixes(prefixes, storage):
+            calls.append("prefixes")
+            return 0
+
+        step = self._step(objects=lambda db, ids: ([("results", f"{i}/result.json") for i in ids], []))
+        with patch.object(cd, "remove_objects_by_bucket", side_effect=remove_keys), \
+                patch.object(cd, "remove_objects_by_prefix", side_effect=remove_prefixes):
+            deleted, objects = await cd.delete_cascade_chunk(db, step, "c1", MagicMock(), chunk_size=10)
+
+        assert (deleted, objects) == (2, 2)
+        assert calls == [
+            ("keys", [("results", "r1/result.json"), ("results", "r2/result.json")]),
+            "prefixes",
+            "rows",
+            "commit",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_queries_leave_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        threads = []
+        db = _db_returning_ids(["a"])
+        db.commit.side_effect = lambda: threads.append(threading.get_ident())
+        db.execute.side_effect = lambda stmt: threads.append(threading.get_ident()) or MagicMock(
+            all=MagicMock(return_value=[("a",)])
+        )
+
+        await cd.delete_cascade_chunk(db, self._step(), "c1", MagicMock(), chunk_size=10)
+
+        assert len(threads) == 2 and loop_thread not in threads
+
+    @pytest.mark.asyncio
+    async def test_step_runs_until_short_chunk(self):
+        db = _db_returning_ids(["a", "b"], ["c", "d"], ["e"])
+
+        rows, objects, done = await cd.run_cascade_step(db, self._step(), "c1", MagicMock(), chunk_size=2)
+
+        assert (rows, objects, done) == (5, 0, True)
+        assert db.commit.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_max_chunks_stops_early(self):
+        db = _db_returning_ids(["a", "b"], ["c", "d"])
+
+        rows, _, done = await cd.run_cascade_step(
+            db, self._step(), "c1", MagicMock(), chunk_size=2, max_chunks=2
+        )
+
+        assert rows == 4 and done is False
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_rolls_back_and_reports(self):
+        db = _db_returning_ids(["a"])
+        db.query.return_value.filter.return_value.delete.side_effect = RuntimeError("lock timeout")
+
+        with patch.dict(cd.CASCADE_STEPS, {"course": [self._step()]}):
+            counts, minio, errors = await cd.execute_cascade_plan(db, [("course", "c1")], MagicMock())
+
+        db.rollback.assert_called()
+        assert counts.results == 0 and minio == 0
+        assert errors and "lock timeout" in errors[0]
+
+    def test_plan_orders_courses_before_parents(self):
+        db = MagicMock()
+        course_rows = [MagicMock(id="c1"), MagicMock(id="c2")]
+        family_rows = [MagicMock(id="f1")]
+        db.query.return_value.filter.return_value.order_by.return_value.all.side_effect = [
+            course_rows, family_rows,
+        ]
+
+        plan = cd.plan_cascade_deletion(db, "organization", "o1")
+
+        assert plan == [
+            ("course", "c1"), ("course", "c2"), ("course_family", "f1"), ("organization", "o1"),
+        ]
+
+    def test_counts_issue_one_count_per_step(self):
+        db = MagicMock()
+        db.execute.return_value.scalar.return_value = 3
+        steps = [self._step(), cd.CascadeStep("messages", Result, lambda cid: Result.id == cid)]
+
+        with patch.dict(cd.CASCADE_STEPS, {"course": steps}):
+            counts = cd.count_cascade_plan(db, [("course", "c1"), ("course", "c2")])
+
+        assert db.execute.call_count == 4
+        assert "count" in str(db.execute.call_args.args[0]).lower()
+        assert (counts.results, counts.messages, counts.courses) == (6, 6, 0)
+
+    @pytest.mark.asyncio
+    async def test_submit_does_not_count(self):
+        tracker = MagicMock()
+
+        async def submit_and_track_task(**kwargs):
+            return "wf-1"
+
+        async def get_task_tracker():
+            return tracker
+
+        tracker.submit_and_track_task.side_effect = submit_and_track_task
+        with patch("computor_backend.task_tracker.get_task_tracker", get_task_tracker), \
+                patch.object(cd, "count_cascade_plan") as count:
+            result = await cd.submit_cascade_deletion("course", "c1", created_by="u1")
+
+        count.assert_not_called()
+        assert result.workflow_id == "wf-1" and result.dry_run is False
+        assert result.deleted_counts == cd.EntityDeleteCount()
+        assert tracker.submit_and_track_task.call_args.kwargs["task_submission"].parameters == {
+            "entity_type": "course", "entity_id": "c1",
+        }
+
+    def test_step_names_are_count_fields(self):
+        fields = set(cd.EntityDeleteCount.model_fields)
+        for steps in cd.CASCADE_STEPS.values():
+            assert {step.name for step in steps} <= fields
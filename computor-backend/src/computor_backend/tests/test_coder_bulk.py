@@ -0,0 +1,199 @@
+"""
+Tests for Coder template caching, batched workspace status polling and
+bulk workspace provisioning.
+
+Requests go to an in-process fake Coder (``fake_coder.FakeCoder``) through
+``httpx.ASGITransport``. The serial-vs-bulk throughput comparison lives in
+``tests/seed/bench_coder_provisioning.py``.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from computor_backend.coder.client import CoderClient
+from computor_backend.coder.config import CoderSettings
+from computor_backend.coder.exceptions import (
+    CoderTemplateNotFoundError,
+    CoderTimeoutError,
+    CoderWorkspaceNotFoundError,
+)
+from computor_backend.coder.schemas import BulkProvisionItem, WorkspaceStatus, WorkspaceTemplate
+from computor_backend.tests.fake_coder import FakeCoder
+
+
+def _client(fake: FakeCoder, **settings) -> CoderClient:
+    client = CoderClient(CoderSettings(
+        url="http://coder.test",
+        admin_email="admin@example.com",
+        admin_password="secret",
+        status_poll_interval=0.05,
+        **settings,
+    ))
+    client._client = httpx.AsyncClient(
+        base_url="http://coder.test",
+        transport=httpx.ASGITransport(app=fake.app),
+    )
+    return client
+
+
+def _items(count: int, prefix: str = "student") -> list[BulkProvisionItem]:
+    return [
+        BulkProvisionItem(user_email=f"{prefix}{i}@example.com", username=f"{prefix}{i}", computor_auth_token="t")
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def fake():
+    fake = FakeCoder()
+    fake.add_template("python-workspace")
+    return fake
+
+
+def test_template_lookups_are_cached(fake):
+    async def run():
+        client = _client(fake)
+        try:
+            ids = await asyncio.gather(*(client.get_template_id("python-workspace") for _ in range(20)))
+            with pytest.raises(CoderTemplateNotFoundError):
+                await client.get_template_id("matlab-workspace")
+            # A template pushed later is found once the miss refresh interval has passed
+            client._templates_fetched_at -= 10
+            fake.add_template("matlab-workspace")
+            await client.get_template_id("matlab-workspace")
+        finally:
+            await client.close()
+        return ids
+
+    ids = asyncio.run(run())
+
+    assert len(set(ids)) == 1
+    assert fake.count("GET", "/api/v2/templates") == 2
+    assert fake.count("POST", "/api/v2/users/login") == 1
+
+
+def test_template_cache_expires(fake):
+    async def run():
+        client = _client(fake, template_cache_ttl=0.05)
+        try:
+            await client.get_template_id("python-workspace")
+            await client.get_template_id("python-workspace")
+            await asyncio.sleep(0.06)
+            await client.get_template_id("python-workspace")
+        finally:
+            await client.close()
+
+    asyncio.run(run())
+
+    assert fake.count("GET", "/api/v2/templates") == 2
+
+
+def test_status_poller_multiplexes_waiters(fake):
+    fake.build_seconds = 0.2
+
+    async def run():
+        client = _client(fake)
+        try:
+            outcomes = await client.provision_workspaces(_items(30), wait_until_running=True, timeout=5)
+        finally:
+            await client.close()
+        return outcomes, client._poller.polls
+
+    outcomes, polls = asyncio.run(run())
+
+    assert all(o.error is None and o.status == WorkspaceStatus.RUNNING for o in outcomes)
+    # One listing per poll interval for all 30 workspaces, not one request per workspace
+    assert fake.count("GET", "/api/v2/workspaces") == polls < 15
+    assert not any("/api/v2/workspaces/" in r for r in fake.requests)
+
+
+def test_status_query_is_filtered_to_pending_workspaces(fake):
+    async def run():
+        client = _client(fake)
+        try:
+            others = await client.provision_workspaces(_items(120, "other"))
+            mine = await client.provision_workspaces(_items(3))
+            fake.requests.clear()
+            statuses = await client.get_workspace_statuses(o.result.workspace.id for o in mine)
+        finally:
+            await client.close()
+        return others, mine, statuses
+
+    others, mine, statuses = asyncio.run(run())
+
+    assert set(statuses) == {o.result.workspace.id for o in mine}
+    assert not {o.result.workspace.id for o in others} & set(statuses)
+    assert fake.requests == ["GET /api/v2/workspaces"]
+
+
+def test_deleted_workspace_stops_being_polled(fake):
+    fake.build_seconds = 10
+
+    async def run():
+        client = _client(fake)
+        try:
+            [outcome] = await client.provision_workspaces(_items(1))
+            workspace_id = outcome.result.workspace.id
+            del fake.workspaces[workspace_id]
+            with pytest.raises(CoderWorkspaceNotFoundError):
+                await client.wait_for_workspace(workspace_id, timeout=5)
+        finally:
+            await client.close()
+        return client._poller.polls
+
+    assert asyncio.run(run()) == 1
+
+
+def test_wait_times_out(fake):
+    fake.build_seconds = 10
+
+    async def run():
+        client = _client(fake)
+        try:
+            [outcome] = await client.provision_workspaces(_items(1))
+            await client.wait_for_workspace(outcome.result.workspace.id, timeout=0.1)
+        finally:
+            await client.close()
+
+    with pytest.raises(CoderTimeoutError):
+        asyncio.run(run())
+
+
+def test_bulk_provisioning_reports_failures_per_user(fake):
+    fake.failing_users.add("ustudent1")
+
+    async def run():
+        client = _client(fake)
+        try:
+            first = await client.provision_workspaces(_items(3), max_concurrency=2)
+            again = await client.provision_workspaces(_items(3), max_concurrency=2)
+        finally:
+            await client.close()
+        return first, again
+
+    first, again = asyncio.run(run())
+
+    assert [o.user_email for o in first] == [f"student{i}@example.com" for i in range(3)]
+    assert "Provisioner unavailable" in first[1].error
+    assert first[0].result.created_workspace and first[2].result.created_workspace
+    # Existing workspaces are reused on the second run
+    assert not again[0].result.created_workspace and not again[0].result.created_user
+    assert len(fake.workspaces) == 2
+
+
+def test_bulk_provisioning_with_unknown_template(fake):
+    async def run():
+        client = _client(fake)
+        try:
+            items = _items(2)
+            items[1].template = WorkspaceTemplate.MATLAB
+            return await client.provision_workspaces(items)
+        finally:
+            await client.close()
+
+    outcomes = asyncio.run(run())
+
+    assert outcomes[0].error is None
+    assert "matlab-workspace" in outcomes[1].error
@@ -0,0 +1,80 @@
+"""
+Tests for conditional GET (ETag / If-None-Match) on cached user views.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Response
+
+from computor_backend.api._conditional import conditional_view
+from computor_backend.cache import payload_etag
+from computor_backend.repositories.view_base import ViewRepository
+
+
+class _Repo(ViewRepository):
+    pass
+
+
+def _cache_with_etag(etag):
+    cache = MagicMock()
+    cache.get_user_view_etag.return_value = etag
+    cache.get_user_view.return_value = [{"id": "1"}]
+    return cache
+
+
+@pytest.mark.unit
+class TestConditionalView:
+    """conditional_view answers 304 from the stored view ETag."""
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_skips_payload(self):
+        cache = _cache_with_etag('"v1"')
+        repo = _Repo(cache=cache)
+
+        result = await conditional_view(
+            Response(), '"v1"', lambda: repo._get_cached_view("u1", "courses")
+        )
+
+        assert result.status_code == 304
+        assert result.headers["ETag"] == '"v1"'
+        cache.get_user_view.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_etag_serves_payload_with_current_etag(self):
+        cache = _cache_with_etag('"v2"')
+        repo = _Repo(cache=cache)
+        response = Response()
+
+        result = await conditional_view(
+            response, '"v1"', lambda: repo._get_cached_view("u1", "courses")
+        )
+
+        assert result == [{"id": "1"}]
+        assert response.headers["ETag"] == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_uncached_view_falls_back_to_payload_hash(self):
+        response = Response()
+
+        async def produce():
+            return {"id": "1"}
+
+        result = await conditional_view(response, None, produce)
+        etag = response.headers["ETag"]
+
+        assert result == {"id": "1"}
+        again = await conditional_view(Response(), etag, produce)
+        assert again.status_code == 304
+
+    def test_revalidate_is_noop_outside_conditional_request(self):
+        cache = _cache_with_etag('"v1"')
+        repo = _Repo(cache=cache)
+
+        assert repo._get_cached_view("u1", "courses") == [{"id": "1"}]
+        cache.get_user_view_etag.assert_not_called()
+
+    def test_payload_etag_is_strong_and_stable(self):
+        assert payload_etag(b"abc") == payload_etag(b"abc")
+        assert payload_etag(b"abc").startswith('"')
+        assert payload_etag(b"abc") != payload_etag(b"abd")
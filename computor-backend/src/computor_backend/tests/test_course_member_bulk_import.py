@@ -0,0 +1,212 @@
+"""
+Tests for bulk course member import: roster CSV parsing, batched username
+generation and chunked import.
+"""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from computor_backend.business_logic import course_member_import as cmi
+from computor_backend.permissions.principal import Principal
+from computor_backend.utils.roster_csv import RosterCSVParser, iter_roster_csv
+from computor_backend.utils.username_generation import generate_usernames_from_names
+from computor_types.course_member_import import (
+    CourseMemberBulkImportSummary,
+    CourseMemberImportRowResult,
+    ImportStatus,
+)
+
+
+def _parse(data: bytes, chunk_size: int):
+    parser = RosterCSVParser()
+    rows = []
+    for start in range(0, len(data), chunk_size):
+        rows.extend(parser.feed(data[start:start + chunk_size]))
+    rows.extend(parser.close())
+    return rows
+
+
+@pytest.mark.unit
+class TestRosterCSV:
+    """RosterCSVParser emits rows across arbitrary chunk boundaries."""
+
+    CSV = (
+        "email,given_name,family_name,course_group_title\n"
+        "a@example.com,Ann,Lee,\"Group, A\"\n"
+        "\n"
+        "b@example.com,\"Bo\nB\",Ng,Group B"
+    ).encode("utf-8")
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+    def test_rows_independent_of_chunking(self, chunk_size):
+        rows = _parse(self.CSV, chunk_size)
+
+        assert [r["email"] for r in rows] == ["a@example.com", "b@example.com"]
+        assert rows[0]["course_group_title"] == "Group, A"
+        assert rows[1]["given_name"] == "Bo\nB"
+
+    def test_export_headers_and_semicolons(self):
+        data = "\ufeffE-Mail;Vorname;Familienname;Gruppe\nx@example.com;Xi;Yu;G1\n".encode("utf-8")
+
+        rows = _parse(data, 5)
+
+        assert rows == [{
+            "email": "x@example.com",
+            "given_name": "Xi",
+            "family_name": "Yu",
+            "course_group_title": "G1",
+        }]
+
+    @pytest.mark.asyncio
+    async def test_iter_roster_csv_from_stream(self):
+        async def chunks():
+            yield b"email\nc@exa"
+            yield b"mple.com\n"
+
+        rows = [row async for row in iter_roster_csv(chunks())]
+        assert rows == [{"email": "c@example.com"}]
+
+
+@pytest.mark.unit
+class TestBatchUsernames:
+    """generate_usernames_from_names resolves collisions in one query."""
+
+    def test_collisions_within_batch_and_db(self):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = [("mmusterm",)]
+
+        usernames = generate_usernames_from_names(
+            [("Max", "Mustermann"), ("Max", "Mustermann"), ("Eva", "Li")], db
+        )
+
+        assert usernames == ["mamuster", "maxmuste", "eli"]
+        assert db.query.call_count == 1
+
+
+def _principal() -> Principal:
+    return Principal(user_id=str(uuid4()), is_admin=False, roles=[])
+
+
+@pytest.mark.unit
+class TestBulkImport:
+    """import_course_members_bulk chunks rows and summarizes results."""
+
+    def _state(self):
+        return cmi._BulkImportState(
+            course_id=str(uuid4()),
+            user_role="_lecturer",
+            permissions=_principal(),
+            username_strategy="name",
+        )
+
+    def test_invalid_rows_fail_without_touching_members(self):
+        state = self._state()
+        db = MagicMock()
+        chunk = [
+            (0, {"email": ""}),
+            (1, {"email": "y@example.com", "create_missing_group": "maybe"}),
+            (2, {"email": "x@example.com", "course_role_id": "_owner"}),
+        ]
+
+        results, provision, user_ids = cmi._import_chunk(state, chunk, db)
+
+        assert [r.status for r in results] == [ImportStatus.FAILED] * 3
+        assert "Email is required" in results[0].message
+        assert "create_missing_group" in results[1].message
+        assert "_owner" in results[2].message
+        assert provision == [] and user_ids == set()
+        db.query.assert_not_called()
+
+    def test_failed_chunk_is_retried_row_by_row(self):
+        state = self._state()
+        db = MagicMock()
+
+        def fake_import(state, chunk, db):
+            results = []
+            for i, raw in chunk:
+                if raw["email"] in state.seen_emails:
+                    raise AssertionError("row seen twice")
+                state.seen_emails.add(raw["email"])
+                if raw["email"].startswith("bad"):
+                    raise RuntimeError("constraint violated")
+                results.append(CourseMemberImportRowResult(
+                    row=i, email=raw["email"], status=ImportStatus.CREATED
+                ))
+            return results, [], set()
+
+        chunk = [(0, {"email": "a@example.com"}), (1, {"email": "bad@example.com"}),
+                 (2, {"email": "c@example.com"})]
+        with patch.object(cmi, "_import_chunk", side_effect=fake_import), \
+                patch.object(cmi, "_invalidate_import_views"):
+            results = cmi._import_and_commit_chunk(state, chunk, db)
+
+        assert [r.status for r in results] == [
+            ImportStatus.CREATED, ImportStatus.FAILED, ImportStatus.CREATED
+        ]
+        assert results[1].email == "bad@example.com"
+        assert "constraint violated" in results[1].message
+        assert (db.commit.call_count, db.rollback.call_count) == (2, 2)
+        assert state.seen_emails == {"a@example.com", "c@example.com"}
+
+    @pytest.mark.asyncio
+    async def test_chunks_and_summary(self):
+        seen_chunks = []
+
+        def fake_chunk(state, chunk, db):
+            seen_chunks.append([i for i, _ in chunk])
+            return [
+                CourseMemberImportRowResult(
+                    row=i,
+                    email=raw["email"],
+                    status=ImportStatus.CREATED if i % 2 == 0 else ImportStatus.FAILED,
+                )
+                for i, raw in chunk
+            ]
+
+        course = MagicMock(id=uuid4())
+        rows = [{"email": f"s{i}@example.com"} for i in range(5)]
+
+        with patch.object(cmi, "_import_and_commit_chunk", side_effect=fake_chunk):
+            out = [
+                item async for item in cmi.import_course_members_bulk(
+                    course, "_lecturer", rows, _principal(), MagicMock(), chunk_size=2
+                )
+            ]
+
+        assert seen_chunks == [[0, 1], [2, 3], [4]]
+        assert [r.row for r in out[:-1]] == [0, 1, 2, 3, 4]
+        summary = out[-1]
+        assert isinstance(summary, CourseMemberBulkImportSummary)
+        assert (summary.total, summary.created, summary.failed) == (5, 3, 2)
+        assert summary.workflow_id is None
+
+    @pytest.mark.asyncio
+    async def test_single_batched_post_create(self):
+        def fake_chunk(state, chunk, db):
+            state.to_provision.extend(str(uuid4()) for _ in chunk)
+            return [
+                CourseMemberImportRowResult(row=i, email=raw["email"], status=ImportStatus.CREATED)
+                for i, raw in chunk
+            ]
+
+        post_create = MagicMock()
+
+        async def fake_post_create(course_id, members, db, permissions):
+            post_create(course_id, members)
+            return "wf-1"
+
+        rows = [{"email": f"s{i}@example.com"} for i in range(3)]
+        with patch.object(cmi, "_import_and_commit_chunk", side_effect=fake_chunk), patch(
+            "computor_backend.business_logic.course_member_post_create.course_members_post_create_bulk",
+            side_effect=fake_post_create,
+        ):
+            out = [
+                item async for item in cmi.import_course_members_bulk(
+                    MagicMock(id=uuid4()), "_lecturer", rows, _principal(), MagicMock(), chunk_size=1
+                )
+            ]
+
+        assert post_create.call_count == 1
+        assert out[-1].workflow_id == "wf-1"
@@ -0,0 +1,186 @@
+"""Tests for cached, non-blocking documents directory listings.
+
+The endpoint functions are called directly at the system scope with
+``DOCUMENTS_ROOT`` pointed at a tmp dir (no auth chain, no database).
+Directory mtimes are moved into the past where a test relies on a cached
+listing being reused, since listings of just-changed directories are not.
+``tests/seed/bench_documents_listing.py`` times a class listing one folder.
+"""
+import asyncio
+import json
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from computor_backend.api import documents as api
+from computor_backend.business_logic import document_listing
+from computor_backend.business_logic import documents as bl
+from computor_backend.business_logic.document_listing import (
+    DirectoryListingCache,
+    invalidate_directory_listings,
+    stat_etag,
+)
+from computor_backend.exceptions import ConflictException, NotFoundException
+from computor_backend.permissions.principal import Principal
+
+
+@pytest.fixture
+def docs_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(bl.settings, "DOCUMENTS_ROOT", str(tmp_path))
+    monkeypatch.setattr(api, "listing_cache", DirectoryListingCache())
+    return tmp_path
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    calls = []
+    scan = document_listing._scan_directory
+
+    def counting_scan(target):
+        calls.append(str(target))
+        return scan(target)
+
+    monkeypatch.setattr(document_listing, "_scan_directory", counting_scan)
+    return calls
+
+
+def _age(path, seconds: float = 10.0):
+    """Move a directory's mtime into the past."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _list(path=None, if_none_match=None):
+    return asyncio.run(api.list_documents_directory(
+        permissions=Principal(user_id="student"),
+        scope="system",
+        path=path,
+        if_none_match=if_none_match,
+        db=MagicMock(),
+    ))
+
+
+def test_listing_body_and_etag(docs_root):
+    (docs_root / "week1").mkdir()
+    (docs_root / "week1" / "notes.md").write_text("notes")
+    (docs_root / "week1" / "sub").mkdir()
+    os.symlink("/etc", docs_root / "week1" / "link")
+
+    response = _list("week1")
+
+    entries = json.loads(response.body)
+    assert [(e["name"], e["type"], e["size"]) for e in entries] == [("notes.md", "file", 5), ("sub", "directory", None)]
+    assert entries[0]["etag"] == stat_etag((docs_root / "week1" / "notes.md").stat())
+    assert _list("week1", if_none_match=response.headers["ETag"]).status_code == 304
+    assert _list("week1", if_none_match='"other"').status_code == 200
+
+
+def test_unchanged_directory_is_served_from_cache(docs_root, scans):
+    (docs_root / "week1").mkdir()
+    (docs_root / "week1" / "notes.md").write_text("notes")
+    _age(docs_root / "week1")
+
+    first = _list("week1")
+    second = _list("week1")
+
+    assert len(scans) == 1
+    assert first.body == second.body and first.headers["ETag"] == second.headers["ETag"]
+
+
+def test_directory_change_is_seen(docs_root, scans):
+    (docs_root / "week1").mkdir()
+    _age(docs_root / "week1")
+    before = _list("week1")
+
+    (docs_root / "week1" / "slides.md").write_text("slides")
+
+    after = _list("week1")
+    assert [e["name"] for e in json.loads(after.body)] == ["slides.md"]
+    assert after.headers["ETag"] != before.headers["ETag"]
+    assert len(scans) == 2
+
+
+def test_in_place_change_needs_invalidation(docs_root):
+    (docs_root / "week1").mkdir()
+    (docs_root / "week1" / "notes.md").write_text("notes")
+    _age(docs_root / "week1")
+    etag = _list("week1").headers["ETag"]
+
+    # Copied over in place (the clone-and-copy sync): the directory mtime does not change
+    with open(docs_root / "week1" / "notes.md", "w") as fh:
+        fh.write("longer notes")
+    assert _list("week1").headers["ETag"] == etag
+
+    invalidate_directory_listings(str(docs_root))
+
+    assert json.loads(_list("week1").body)[0]["size"] == len("longer notes")
+
+
+def test_concurrent_requests_share_one_scan(docs_root, scans):
+    (docs_root / "week1").mkdir()
+    for i in range(20):
+        (docs_root / "week1" / f"{i}.md").write_text("x")
+    # Requests whose directory stat returns after the scan finished reuse its listing
+    _age(docs_root / "week1")
+
+    async def run():
+        return await asyncio.gather(*(
+            api.list_documents_directory(
+                permissions=Principal(user_id="student"), scope="system", path="week1",
+                if_none_match=None, db=MagicMock(),
+            )
+            for _ in range(50)
+        ))
+
+    responses = asyncio.run(run())
+
+    assert len(scans) == 1
+    assert len({r.body for r in responses}) == 1
+
+
+def test_missing_and_non_directory_targets(docs_root, monkeypatch):
+    assert json.loads(_list().body) == []
+    (docs_root / "file.md").write_text("x")
+    with pytest.raises(NotFoundException):
+        _list("missing")
+    with pytest.raises(ConflictException):
+        _list("file.md")
+    # An unwritten scope root lists as empty
+    monkeypatch.setattr(bl.settings, "DOCUMENTS_ROOT", str(docs_root / "unwritten"))
+    assert _list() == []
+
+
+def test_cache_is_bounded(docs_root):
+    cache = DirectoryListingCache(max_size=3)
+
+    async def run():
+        for i in range(5):
+            (docs_root / str(i)).mkdir()
+            _age(docs_root / str(i))
+            path = docs_root / str(i)
+            await cache.get(path, path.stat())
+
+    asyncio.run(run())
+    assert list(cache._listings) == [str(docs_root / str(i)) for i in (2, 3, 4)]
+
+
+def test_file_get_revalidates(docs_root):
+    (docs_root / "notes.md").write_text("notes")
+
+    async def get(if_none_match=None):
+        return await api.get_document_file(
+            permissions=Principal(user_id="student"), scope="system", path="notes.md",
+            if_none_match=if_none_match, db=MagicMock(),
+        )
+
+    response = asyncio.run(get())
+    assert response.status_code == 200
+    assert asyncio.run(get(response.headers["etag"])).status_code == 304
+    with pytest.raises(NotFoundException):
+        asyncio.run(api.get_document_file(
+            permissions=Principal(user_id="student"), scope="system", path="missing.md",
+            if_none_match=None, db=MagicMock(),
+        ))
+
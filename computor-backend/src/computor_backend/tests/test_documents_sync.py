@@ -0,0 +1,197 @@
+"""
+Tests for the incremental documents sync (``services.documents_sync``).
+
+The remote is a local bare repository, so these tests run without network
+access. ``tests/seed/bench_documents_sync.py`` times a one-file push to a
+lecture-notes sized repository against a fresh clone and filtered copy.
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+from git import Repo
+
+from computor_backend.services import documents_sync
+from computor_backend.services.documents_sync import DocumentsSync, is_synced_path
+from computor_backend.services.git_mirror import GitMirrorCache, MirrorBranchNotFound
+
+
+def _commit(repo: Repo, files: dict, message: str, delete: tuple = ()) -> str:
+    for name, content in files.items():
+        path = os.path.join(repo.working_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fh:
+            fh.write(content)
+    for name in delete:
+        repo.git.rm("-q", name)
+    repo.git.add(A=True)
+    repo.git.config("user.name", "Test")
+    repo.git.config("user.email", "test@example.com")
+    repo.git.commit("-m", message)
+    repo.git.push("-q", "--force", "origin", "main")
+    return repo.head.commit.hexsha
+
+
+def _read(root, path: str) -> str:
+    with open(os.path.join(root, path)) as fh:
+        return fh.read()
+
+
+@pytest.fixture
+def remote(tmp_path):
+    """A bare "remote" documents repository plus a working clone to push from."""
+    bare = tmp_path / "documents.git"
+    Repo.init(bare, bare=True, initial_branch="main")
+    work = Repo.clone_from(str(bare), tmp_path / "upstream")
+    work.git.checkout("-b", "main")
+    _commit(work, {
+        "README.md": "# Documents repository\n",
+        ".gitlab-ci.yml": "stages: []\n",
+        "week1/notes.md": "Week 1\n",
+        "week1/slides.md": "Slides 1\n",
+        "week1/__pycache__/x.pyc": "bytecode",
+        "tools/README.md": "Tools\n",
+    }, "initial")
+    return SimpleNamespace(url=str(bare), work=work)
+
+
+@pytest.fixture
+def syncer(tmp_path):
+    return DocumentsSync(GitMirrorCache(str(tmp_path / "mirrors")), str(tmp_path / "state"))
+
+
+def test_is_synced_path():
+    assert is_synced_path("week1/notes.md")
+    assert is_synced_path("tools/README.md")
+    assert not is_synced_path("README.md")
+    assert not is_synced_path(".gitlab-ci.yml")
+    assert not is_synced_path("week1/__pycache__/x.pyc")
+    assert not is_synced_path("src/module.pyc")
+    assert not is_synced_path("app/node_modules/lib/index.js")
+
+
+def test_full_sync_filters_blacklist(syncer, remote, tmp_path):
+    target = tmp_path / "served" / "org" / "family"
+
+    result = syncer.sync(remote.url, str(target))
+
+    assert result.mode == "full"
+    assert result.commit == remote.work.head.commit.hexsha
+    synced = {os.path.relpath(os.path.join(d, f), target) for d, _, fs in os.walk(target) for f in fs}
+    assert synced == {"week1/notes.md", "week1/slides.md", "tools/README.md"}
+    assert result.files == 3
+    # Nothing of the sync machinery is left next to the target
+    assert os.listdir(target.parent) == ["family"]
+
+
+def test_incremental_sync_applies_changes_and_deletions(syncer, remote, tmp_path):
+    target = tmp_path / "served"
+    syncer.sync(remote.url, str(target))
+    untouched = os.stat(target / "week1" / "notes.md").st_ino
+    # Uploaded through the documents API, not part of the repository
+    (target / "week1" / "upload.pdf").write_text("pdf")
+
+    sha = _commit(remote.work, {"week1/slides.md": "Slides 1, fixed\n", "week2/notes.md": "Week 2\n"},
+                  "update", delete=("tools/README.md",))
+    result = syncer.sync(remote.url, str(target))
+
+    assert (result.mode, result.commit) == ("incremental", sha)
+    assert (result.written, result.deleted, result.files) == (2, 1, 3)
+    assert _read(target, "week1/slides.md") == "Slides 1, fixed\n"
+    assert _read(target, "week2/notes.md") == "Week 2\n"
+    assert not (target / "tools").exists()
+    assert _read(target, "week1/upload.pdf") == "pdf"
+    # Unchanged files are not rewritten
+    assert os.stat(target / "week1" / "notes.md").st_ino == untouched
+
+    assert syncer.sync(remote.url, str(target)).mode == "unchanged"
+
+
+def test_changed_file_does_not_write_through_hard_links(syncer, remote, tmp_path):
+    target = tmp_path / "served"
+    syncer.sync(remote.url, str(target))
+    # A reader holding the old file keeps the old content
+    with open(target / "week1" / "slides.md") as old:
+        _commit(remote.work, {"week1/slides.md": "Slides 1, v2\n"}, "update")
+        syncer.sync(remote.url, str(target))
+        assert old.read() == "Slides 1\n"
+    assert _read(target, "week1/slides.md") == "Slides 1, v2\n"
+
+
+def test_rewritten_history_falls_back_to_full_sync(syncer, remote, tmp_path):
+    target = tmp_path / "served"
+    syncer.sync(remote.url, str(target))
+
+    # Force push a history without week1/slides.md, synced by a worker with a fresh mirror
+    remote.work.git.checkout("--orphan", "rewritten")
+    remote.work.git.rm("-rq", "--cached", ".")
+    for name in ("week1/slides.md", "tools/README.md"):
+        os.remove(os.path.join(remote.work.working_dir, name))
+    remote.work.git.add(A=True)
+    remote.work.git.commit("-m", "rewritten")
+    remote.work.git.push("-q", "--force", "origin", "rewritten:main")
+    other_worker = DocumentsSync(GitMirrorCache(str(tmp_path / "other-mirrors")), syncer.state_dir)
+
+    result = other_worker.sync(remote.url, str(target))
+
+    assert result.mode == "full"
+    assert not (target / "week1" / "slides.md").exists()
+    assert _read(target, "week1/notes.md") == "Week 1\n"
+
+
+def test_force_rebuilds_target(syncer, remote, tmp_path):
+    target = tmp_path / "served"
+    syncer.sync(remote.url, str(target))
+    (target / "stale.txt").write_text("x")
+
+    result = syncer.sync(remote.url, str(target), force=True)
+
+    assert result.mode == "full"
+    assert not (target / "stale.txt").exists()
+    assert (target / "week1" / "notes.md").exists()
+
+
+def test_empty_remote_raises(syncer, tmp_path):
+    empty = tmp_path / "empty.git"
+    Repo.init(empty, bare=True)
+    with pytest.raises(MirrorBranchNotFound):
+        syncer.sync(str(empty), str(tmp_path / "served"))
+
+
+def test_documents_written_during_sync_are_kept(syncer, remote, tmp_path, monkeypatch):
+    target = tmp_path / "served"
+    syncer.sync(remote.url, str(target))
+    (target / "week1" / "old.pdf").write_text("old")
+    (target / "week1" / "replaced.pdf").write_text("v1")
+    syncer.sync(remote.url, str(target))
+    write_blob, exchange = documents_sync._write_blob, documents_sync._exchange_directories
+
+    def write_blob_during_api_writes(*args):
+        # Between the hard-linked copy and the swap
+        (target / "week1" / "upload.pdf").write_text("pdf")
+        (target / "week1" / "old.pdf").unlink()
+        tmp = target / "week1" / "replaced.pdf.tmp"
+        tmp.write_text("v2")
+        tmp.replace(target / "week1" / "replaced.pdf")
+        write_blob(*args)
+
+    def exchange_after_api_write(a, b):
+        # After the check before the swap
+        (target / "late" / "upload.pdf").parent.mkdir()
+        (target / "late" / "upload.pdf").write_text("late")
+        exchange(a, b)
+
+    monkeypatch.setattr(documents_sync, "_write_blob", write_blob_during_api_writes)
+    monkeypatch.setattr(documents_sync, "_exchange_directories", exchange_after_api_write)
+    _commit(remote.work, {"week1/slides.md": "Slides 1, v2\n"}, "update")
+
+    result = syncer.sync(remote.url, str(target))
+
+    assert result.written == 1
+    assert _read(target, "week1/slides.md") == "Slides 1, v2\n"
+    assert _read(target, "week1/upload.pdf") == "pdf"
+    assert _read(target, "week1/replaced.pdf") == "v2"
+    assert _read(target, "late/upload.pdf") == "late"
+    assert not (target / "week1" / "old.pdf").exists()
+    assert [name for name in os.listdir(tmp_path) if name.startswith(".served")] == []
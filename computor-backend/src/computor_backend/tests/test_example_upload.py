@@ -0,0 +1,229 @@
+"""
+Tests for streaming example archive uploads.
+
+Storage goes to an in-memory fake (``FakeStorage`` below) that implements
+the batch methods used by ``api.examples``. The upload endpoint tests run
+against a minimal app with the database part of the upload
+(``_store_example_version``) replaced by a stub that only stores the files;
+``tests/seed/bench_example_upload.py`` times a 50 MB example through it.
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import os
+import zipfile
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from computor_backend.api import examples
+from computor_backend.database import get_db
+from computor_backend.permissions.auth import get_current_principal
+from computor_backend.services.storage_service import get_storage_service
+from computor_utils import compute_example_content_hash, compute_example_content_hash_from_digests
+
+
+class FakeStorage:
+    """In-memory bucket with the StorageService batch API."""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploaded = []
+        self.copied = []
+
+    async def list_objects(self, bucket_name=None, prefix=None, recursive=True, include_user_metadata=False):
+        return [
+            SimpleNamespace(object_name=key, metadata={f"X-Amz-Meta-{k.title()}": v for k, v in meta.items()})
+            for key, (_, meta) in self.objects.items()
+            if key.startswith(prefix or "")
+        ]
+
+    async def upload_files(self, uploads, bucket_name=None, max_concurrency=8):
+        for object_key, source, _content_type, metadata in uploads:
+            if isinstance(source, str):
+                with open(source, "rb") as fp:
+                    data = fp.read()
+            else:
+                data = source.read()
+            self.objects[object_key] = (hashlib.sha256(data).hexdigest(), dict(metadata or {}))
+            self.uploaded.append(object_key)
+
+    async def copy_objects(self, copies, bucket_name=None, max_concurrency=8):
+        for source_object, dest_object in copies:
+            self.objects[dest_object] = self.objects[source_object]
+            self.copied.append(dest_object)
+
+
+def _zip(files: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+def test_safe_archive_name():
+    assert examples._safe_archive_name("src/main.py") == "src/main.py"
+    assert examples._safe_archive_name("/src//main.py") == "src/main.py"
+    assert examples._safe_archive_name("a\\b.txt") == "a/b.txt"
+    assert examples._safe_archive_name("../etc/passwd") is None
+    assert examples._safe_archive_name("src/../../x") is None
+    assert examples._safe_archive_name("__MACOSX/._main.py") is None
+    assert examples._safe_archive_name("src/.hidden") is None
+    assert examples._safe_archive_name("main.py.meta.yaml") is None
+
+
+def test_extract_archive_hashes_files_on_disk(tmp_path):
+    files = {"meta.yaml": b"title: Demo\n", "src/data.bin": os.urandom(3 * examples.ARCHIVE_CHUNK_SIZE + 7)}
+    archive = _zip({**files, "../evil.txt": b"x", "inner.zip": b"PK", "dir/": b""})
+
+    extracted = examples._extract_archive(io.BytesIO(archive), str(tmp_path))
+
+    assert set(extracted) == set(files)
+    for name, content in files.items():
+        assert extracted[name].read() == content
+        assert extracted[name].sha256 == hashlib.sha256(content).digest()
+        assert extracted[name].data is None
+    digests = {name: f.sha256 for name, f in extracted.items()}
+    assert compute_example_content_hash_from_digests(digests) == compute_example_content_hash(files)
+
+
+def test_sync_version_files_uploads_only_changed_files():
+    storage = FakeStorage()
+
+    def example_files(**contents):
+        return {
+            name: examples._ExampleFile(sha256=hashlib.sha256(data).digest(), is_binary=True, data=data)
+            for name, data in contents.items()
+        }
+
+    v1 = example_files(**{"meta.yaml": b"v1", "a.py": b"a", "b.py": b"b"})
+    asyncio.run(examples._sync_version_files(storage, "bucket", "ex/v1", v1, None))
+    assert sorted(storage.uploaded) == ["ex/v1/a.py", "ex/v1/b.py", "ex/v1/meta.yaml"]
+
+    # Updating a version in place re-uploads only the changed file
+    storage.uploaded.clear()
+    v1_update = example_files(**{"meta.yaml": b"v1", "a.py": b"a2", "b.py": b"b"})
+    asyncio.run(examples._sync_version_files(storage, "bucket", "ex/v1", v1_update, "ex/v1"))
+    assert storage.uploaded == ["ex/v1/a.py"]
+    assert storage.copied == []
+
+    # A new version copies unchanged files from the previous one server-side
+    storage.uploaded.clear()
+    v2 = example_files(**{"meta.yaml": b"v2", "a.py": b"a2", "b.py": b"b", "c.py": b"c"})
+    asyncio.run(examples._sync_version_files(storage, "bucket", "ex/v2", v2, "ex/v1"))
+    assert sorted(storage.uploaded) == ["ex/v2/c.py", "ex/v2/meta.yaml"]
+    assert sorted(storage.copied) == ["ex/v2/a.py", "ex/v2/b.py"]
+    assert storage.objects["ex/v2/b.py"][1] == {"sha256": hashlib.sha256(b"b").hexdigest()}
+
+
+def test_unchanged_upload_returns_existing_version(monkeypatch):
+    files = {
+        name: examples._ExampleFile(sha256=hashlib.sha256(data).digest(), is_binary=True, data=data)
+        for name, data in {"meta.yaml": b"title: Demo\nversion: '1.0'\n", "main.py": b"print(1)\n"}.items()
+    }
+    content_hash = compute_example_content_hash_from_digests({n: f.sha256 for n, f in files.items()})
+    existing = SimpleNamespace(id="version", content_hash=content_hash)
+    version_repo = MagicMock()
+    version_repo.find_by_version_tag.return_value = existing
+    monkeypatch.setattr(examples, "ExampleVersionRepository", lambda db, cache: version_repo)
+    monkeypatch.setattr(examples, "get_cache", lambda: None)
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = SimpleNamespace(id="example", directory="demo")
+    storage = FakeStorage()
+    repository = SimpleNamespace(id="repo", source_url="bucket")
+    principal = SimpleNamespace(user_id="user")
+
+    version = asyncio.run(examples._store_example_version(db, principal, storage, repository, "demo", files))
+
+    assert version is existing
+    assert storage.uploaded == [] and storage.copied == []
+    version_repo.create.assert_not_called()
+    version_repo.update.assert_not_called()
+
+    # Different content under the same version tag is not skipped
+    existing.content_hash = "other"
+    with pytest.raises(examples.BadRequestException):
+        asyncio.run(examples._store_example_version(db, principal, storage, repository, "demo", files))
+
+
+@pytest.fixture
+def upload_app(monkeypatch):
+    storage = FakeStorage()
+
+    async def store(db, permissions, storage_service, repository, directory, files):
+        content_hash = compute_example_content_hash_from_digests({n: f.sha256 for n, f in files.items()})
+        await examples._sync_version_files(storage_service, "bucket", f"examples/{directory}/v1", files, None)
+        return {
+            "id": "version",
+            "example_id": "example",
+            "version_tag": "1.0.0",
+            "version_number": 1,
+            "storage_path": f"examples/{directory}/v1",
+            "content_hash": content_hash,
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc),
+        }
+
+    monkeypatch.setattr(examples, "_get_upload_repository", lambda db, permissions, repository_id: None)
+    monkeypatch.setattr(examples, "_store_example_version", store)
+
+    app = FastAPI()
+    app.include_router(examples.examples_router)
+    app.dependency_overrides[get_db] = lambda: None
+    app.dependency_overrides[get_current_principal] = lambda: None
+    app.dependency_overrides[get_storage_service] = lambda: storage
+    return app, storage
+
+
+def test_archive_upload_endpoint(upload_app):
+    app, storage = upload_app
+    files = {"meta.yaml": b"title: Demo\n", "main.py": b"print(1)\n"}
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.post(
+                "/examples/upload/archive",
+                data={"repository_id": "repo", "directory": "demo"},
+                files={"file": ("demo.zip", io.BytesIO(_zip(files)), "application/zip")},
+            )
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 200, response.text
+    assert response.json()["content_hash"] == compute_example_content_hash(files)
+    assert sorted(storage.uploaded) == ["examples/demo/v1/main.py", "examples/demo/v1/meta.yaml"]
+
+
+def test_json_and_archive_uploads_store_the_same_files(upload_app):
+    app, storage = upload_app
+    files = {"meta.yaml": b"title: Demo\n", "data/blob.bin": os.urandom(3 * examples.ARCHIVE_CHUNK_SIZE + 7)}
+    archive = _zip(files)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            json_response = await client.post("/examples/upload", json={
+                "repository_id": "repo",
+                "directory": "demo",
+                "files": {"demo.zip": base64.b64encode(archive).decode("ascii")},
+            })
+            json_objects = dict(storage.objects)
+            storage.objects.clear()
+            archive_response = await client.post(
+                "/examples/upload/archive",
+                data={"repository_id": "repo", "directory": "demo"},
+                files={"file": ("demo.zip", io.BytesIO(archive), "application/zip")},
+            )
+            return json_response, json_objects, archive_response
+
+    json_response, json_objects, archive_response = asyncio.run(run())
+
+    assert json_response.status_code == archive_response.status_code == 200
+    assert json_response.json()["content_hash"] == archive_response.json()["content_hash"]
+    assert json_objects == storage.objects
@@ -0,0 +1,167 @@
+"""
+Tests for path-indexed GitLab group resolution in the hierarchy builder.
+
+python-gitlab talks to the in-process fake GitLab (``fake_gitlab.FakeGitLab``)
+through ``fake.requests_session()``; the database session is a mock.
+``_ListingResolver`` keeps the previous list-and-filter lookups to compare
+request counts against.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from cryptography.fernet import Fernet
+from gitlab import Gitlab
+from gitlab.exceptions import GitlabGetError
+
+from computor_backend.generator import gitlab_builder
+from computor_backend.generator.gitlab_builder import GitLabBuilder
+from computor_backend.generator.gitlab_resolver import GitLabResolver
+from computor_types.deployments_refactored import CourseConfig, CourseFamilyConfig, OrganizationConfig
+from computor_types import tokens
+from computor_types.gitlab import GitLabConfig
+from computor_backend.tests.fake_gitlab import FakeGitLab
+
+
+class _ListingResolver(GitLabResolver):
+    """Previous lookups: no cache, groups found by listing all and filtering."""
+
+    def get_group(self, group_id):
+        return self.gitlab.groups.get(int(group_id))
+
+    def find_group(self, full_path):
+        if full_path.endswith(("/students", "/tutors")):
+            # These were looked up with one subgroup search
+            try:
+                return self.gitlab.groups.get(full_path)
+            except GitlabGetError:
+                return None
+        matches = [g for g in self.gitlab.groups.list(all=True) if g.full_path == full_path]
+        return self.gitlab.groups.get(matches[0].id) if matches else None
+
+    def find_project(self, full_path):
+        try:
+            return self.gitlab.projects.get(full_path)
+        except GitlabGetError:
+            return None
+
+    def remember_group(self, group):
+        pass
+
+    def remember_project(self, project):
+        pass
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    fake = FakeGitLab()
+    session = fake.requests_session()
+    monkeypatch.setattr(
+        gitlab_builder,
+        "Gitlab",
+        lambda url, private_token, keep_base_url: Gitlab("http://gitlab.test", private_token=private_token, session=session),
+    )
+    monkeypatch.setattr(gitlab_builder, "flag_modified", lambda obj, key: None)
+    monkeypatch.setattr(tokens, "secret_key", Fernet.generate_key().decode())
+    return fake
+
+
+def _builder(resolver_class=GitLabResolver) -> GitLabBuilder:
+    db = MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = None
+    builder = GitLabBuilder(db, "http://gitlab.test", "token")
+    builder.resolver = resolver_class(builder.gitlab)
+    builder.org_repo = MagicMock(find_by_path=lambda path: None, create=lambda org: org)
+    return builder
+
+
+def _create_hierarchy(resolver_class=GitLabResolver) -> dict:
+    org = _builder(resolver_class)._create_organization(OrganizationConfig(
+        name="Uni", path="uni", gitlab=GitLabConfig(url="http://gitlab.test", token="token", parent=None),
+    ))
+    assert org["success"], org["error"]
+    organization = org["organization"]
+    organization.id = "org"
+
+    family = _builder(resolver_class)._create_course_family(CourseFamilyConfig(name="Prog", path="prog"), organization)
+    assert family["success"], family["error"]
+    course_family = family["course_family"]
+    course_family.id = "family"
+
+    course = _builder(resolver_class)._create_course(
+        CourseConfig(name="Prog 2026", path="prog2026"), organization, course_family,
+    )
+    assert course["success"], course["error"]
+    return course
+
+
+def test_resolver_caches_groups_and_projects(fake):
+    group_id = fake.add_group("uni")
+    fake.add_project(group_id, "documents")
+    resolver = GitLabResolver(_builder().gitlab)
+
+    assert resolver.find_group("uni").id == group_id
+    assert resolver.get_group(group_id).full_path == "uni"
+    assert resolver.find_group("uni/missing") is None
+    assert resolver.find_project("uni/documents").path == "documents"
+    assert resolver.find_project("uni/documents").path == "documents"
+
+    assert fake.count("GET", "/api/v4/groups/") == 2
+    assert fake.count("GET", "/api/v4/groups/uni%2Fmissing") == 1
+    assert fake.count("GET", "/api/v4/projects/") == 1
+    with pytest.raises(GitlabGetError):
+        resolver.get_group(999999)
+
+
+def test_hierarchy_creation(fake):
+    course = _create_hierarchy()
+
+    paths = set(fake.group_paths)
+    assert {"uni", "uni/prog", "uni/prog/prog2026", "uni/prog/prog2026/students", "uni/prog/prog2026/tutors"} <= paths
+    projects = {p["path_with_namespace"] for p in fake.projects.values()}
+    assert projects == {"uni/prog/documents", "uni/prog/prog2026/student-template", "uni/prog/prog2026/assignments"}
+    assert course["course"].properties["gitlab"]["students_group"]["full_path"] == "uni/prog/prog2026/students"
+    assert fake.count("GET", "/api/v4/groups?") == 0
+
+
+def test_existing_groups_are_reused(fake):
+    _create_hierarchy()
+    groups, projects = len(fake.groups), len(fake.projects)
+
+    # Running again (e.g. after the database was reset) finds everything by path
+    _create_hierarchy()
+
+    assert (len(fake.groups), len(fake.projects)) == (groups, projects)
+    assert fake.count("POST", "/api/v4/groups") == 5
+
+
+def test_create_conflict_resolves_by_path(fake):
+    builder = _builder()
+    fake.add_group("uni")
+    # The lookup misses (e.g. created concurrently), the create conflicts
+    builder.resolver.find_group = MagicMock(side_effect=[None, GitLabResolver.find_group(builder.resolver, "uni")])
+
+    group, _ = builder._create_gitlab_group("Uni", "uni", None)
+
+    assert group.full_path == "uni"
+    assert builder.resolver.find_group.call_count == 2
+
+
+def test_hierarchy_requests_do_not_grow_with_the_instance(fake):
+    """Create organization, course family and course before and among 200 existing groups."""
+    def count_requests(resolver_class) -> int:
+        fake.requests.clear()
+        _create_hierarchy(resolver_class)
+        for path in [p for p in fake.group_paths if p.startswith("uni")]:
+            del fake.groups[fake.group_paths.pop(path)]
+        fake.projects.clear()
+        return len(fake.requests)
+
+    empty_requests = count_requests(GitLabResolver)
+    for i in range(200):
+        fake.add_group(f"other{i // 50}/group{i}" if i % 50 else f"other{i // 50}")
+    legacy_requests = count_requests(_ListingResolver)
+    requests = count_requests(GitLabResolver)
+
+    assert requests == empty_requests
+    assert requests * 2 < legacy_requests
@@ -0,0 +1,245 @@
+"""
+Tests for the async GitLab gateway used by repository provisioning.
+
+Requests go to an in-process fake GitLab (``fake_gitlab.FakeGitLab``)
+through ``httpx.ASGITransport``. Tests that depend on timing run on a
+``FakeClock`` instead of real sleeps.
+"""
+
+import asyncio
+import heapq
+import itertools
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from computor_backend.services import gitlab_gateway as gg
+from computor_backend.services.gitlab_gateway import GitLabGateway, GitLabGatewayError, TokenBucket
+from computor_backend.tests import fake_gitlab
+from computor_backend.tests.fake_gitlab import FakeGitLab
+
+
+class FakeClock:
+    """Virtual time for the gateway and the fake GitLab.
+
+    ``sleep`` parks the caller until ``run`` advances the clock to its wake
+    time, which happens whenever every other task is blocked.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self._sleepers = []
+        self._seq = itertools.count()
+        self._real_sleep = asyncio.sleep
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        if seconds <= 0:
+            await self._real_sleep(0)
+            return
+        future = asyncio.get_running_loop().create_future()
+        # Like a real clock, always move forward (float rounding can ask for ~0s)
+        wake = self.now + max(seconds, 1e-6)
+        heapq.heappush(self._sleepers, (wake, next(self._seq), future))
+        await future
+
+    async def run(self, coro):
+        task = asyncio.ensure_future(coro)
+        while not task.done():
+            for _ in range(50):
+                await self._real_sleep(0)
+            if self._sleepers and not task.done():
+                wake = self._sleepers[0][0]
+                self.now = max(self.now, wake)
+                while self._sleepers and self._sleepers[0][0] <= wake:
+                    heapq.heappop(self._sleepers)[2].set_result(None)
+        return task.result()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    fake_asyncio = SimpleNamespace(**vars(asyncio))
+    fake_asyncio.sleep = clock.sleep
+    for module in (gg, fake_gitlab):
+        monkeypatch.setattr(module, "time", SimpleNamespace(monotonic=clock.monotonic))
+        monkeypatch.setattr(module, "asyncio", fake_asyncio)
+    return clock
+
+
+def _gateway(fake: FakeGitLab, rate: float = 1000, burst: float = 1000) -> GitLabGateway:
+    return GitLabGateway(
+        "http://gitlab.test",
+        "token",
+        bucket=TokenBucket(rate, burst),
+        transport=httpx.ASGITransport(app=fake.app),
+    )
+
+
+@pytest.fixture
+def fake():
+    fake = FakeGitLab()
+    fake.students = fake.add_group("course/students")
+    fake.template = fake.add_project(fake.add_group("course"), "student-template")
+    return fake
+
+
+def test_token_bucket_limits_rate(clock):
+    async def run():
+        bucket = TokenBucket(rate=100, capacity=5)
+        times = []
+        for _ in range(25):
+            await bucket.acquire()
+            times.append(clock.now)
+        return times
+
+    times = asyncio.run(clock.run(run()))
+
+    # 5 from the burst, the other 20 at 100/s
+    assert times[:5] == [0.0] * 5
+    assert times[5:] == pytest.approx([0.01 * i for i in range(1, 21)], abs=1e-4)
+
+
+def test_token_bucket_does_not_refill_while_paused(clock):
+    async def run():
+        bucket = TokenBucket(rate=100, capacity=5)
+        for _ in range(5):
+            await bucket.acquire()
+        bucket.pause(1.0)
+        times = []
+        for _ in range(3):
+            await bucket.acquire()
+            times.append(clock.now)
+        return times
+
+    assert asyncio.run(clock.run(run())) == pytest.approx([1.01, 1.02, 1.03], abs=1e-4)
+
+
+def test_fork_and_wait_polls_import_status(fake):
+    fake.fork_seconds = 0.3
+
+    async def run():
+        gateway = _gateway(fake)
+        try:
+            project = await gateway.fork_and_wait(fake.template, "alice", "alice", fake.students)
+            second = await gateway.fork_and_wait(fake.template, "bob", "bob", fake.students)
+        finally:
+            await gateway.aclose()
+        return project, second
+
+    project, second = asyncio.run(run())
+
+    assert project["path_with_namespace"] == "course/students/alice"
+    assert project["import_status"] == "finished"
+    assert second["import_status"] == "finished"
+    polls = [r for r in fake.requests if r.endswith("/import")]
+    # Exponential backoff: a handful of polls, fewer for the second fork
+    # whose first wait starts from the observed fork duration
+    assert len(polls) <= 6
+    assert not any("search" in r for r in fake.requests)
+
+
+def test_fork_conflict_is_reported(fake):
+    fake.add_project(fake.students, "alice")
+
+    async def run():
+        gateway = _gateway(fake)
+        try:
+            await gateway.fork_and_wait(fake.template, "alice", "alice", fake.students)
+        finally:
+            await gateway.aclose()
+
+    with pytest.raises(GitLabGatewayError, match="has already been taken") as exc:
+        asyncio.run(run())
+    assert exc.value.status_code == 409
+
+
+def test_rate_limited_requests_are_retried(fake):
+    fake.rate_limit = 5
+
+    async def run():
+        gateway = _gateway(fake)
+        try:
+            return await asyncio.gather(*(gateway.get_project(fake.template) for _ in range(12)))
+        finally:
+            await gateway.aclose()
+
+    projects = asyncio.run(run())
+
+    assert all(p["id"] == fake.template for p in projects)
+    assert fake.rejected > 0
+
+
+def test_lookup_helpers(fake):
+    user_id = fake.add_user("alice")
+
+    async def run():
+        gateway = _gateway(fake)
+        try:
+            assert await gateway.get_project("course/student-template") is not None
+            assert await gateway.find_project_in_group(fake.students, "nobody") is None
+            assert await gateway.find_user_id("alice") == user_id
+            assert await gateway.find_user_id("nobody") is None
+            await gateway.unprotect_branch(fake.template, "main")
+            await gateway.unprotect_branch(fake.template, "main")  # already unprotected
+            await gateway.add_project_member(fake.template, user_id, 30)
+            await gateway.add_project_member(fake.template, user_id, 40)  # 409 -> update
+        finally:
+            await gateway.aclose()
+
+    asyncio.run(run())
+
+    assert fake.protected[fake.template] == set()
+    assert fake.members[fake.template][user_id] == 40
+
+
+def test_gateways_are_shared_per_loop_and_host():
+    async def run():
+        a = gg.get_gitlab_gateway("http://gitlab.test/", "t1")
+        b = gg.get_gitlab_gateway("http://gitlab.test", "t1")
+        c = gg.get_gitlab_gateway("http://gitlab.test", "t2")
+        try:
+            return a is b, a is c, a.bucket is c.bucket
+        finally:
+            await a.aclose()
+            await c.aclose()
+
+    assert asyncio.run(run()) == (True, False, True)
+
+
+def test_course_provisioning_fans_out(fake, clock):
+    """Bounded fan-out starts the next forks while earlier ones import."""
+    fake.latency = 0.01
+    fake.fork_seconds = 0.2
+    user_ids = [fake.add_user(f"s{i}") for i in range(12)]
+
+    async def provision():
+        gateway = _gateway(fake, rate=500, burst=50)
+        semaphore = asyncio.Semaphore(6)
+
+        async def one(i: int, user_id: int) -> None:
+            async with semaphore:
+                project = await gateway.fork_and_wait(fake.template, f"s{i}", f"s{i}", fake.students)
+                await gateway.unprotect_branch(project["id"], "main")
+                await gateway.add_project_member(project["id"], user_id, 40)
+
+        try:
+            await asyncio.gather(*(one(i, u) for i, u in enumerate(user_ids)))
+        finally:
+            await gateway.aclose()
+        return gateway.request_count
+
+    request_count = asyncio.run(clock.run(provision()))
+
+    forks = [i for i, r in enumerate(fake.requests) if r.endswith("/fork")]
+    polls = [r for r in fake.requests if r.endswith("/import")]
+    assert len(forks) == 12
+    # The first six forks go out before any import is polled
+    assert forks[:6] == list(range(6))
+    # One fork, its polls, one project GET, one unprotect and one member add per repository
+    assert request_count == len(fake.requests) == 12 * 4 + len(polls)
+    assert len(polls) <= 12 * 3
+    assert fake.count("POST", f"/api/v4/projects/{fake.template}/fork") == 12
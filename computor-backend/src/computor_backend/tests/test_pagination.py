@@ -0,0 +1,193 @@
+"""
+Tests for keyset cursors and count modes in list pagination.
+
+The keyset queries run against an in-memory SQLite table with the same
+``(created_at, id)`` shape as the entity tables.
+"""
+
+import base64
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Response
+from sqlalchemy import Column, DateTime, String, create_engine
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import Query, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from computor_backend.api._pagination import paginated_list
+from computor_backend.business_logic.pagination import (
+    COUNT_NONE,
+    apply_cursor,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    fetch_cursor_page,
+)
+from computor_backend.exceptions import BadRequestException
+from computor_backend.model.organization import Organization
+
+Base = declarative_base()
+
+
+class Entity(Base):
+    __tablename__ = "entity"
+
+    id = Column(String(36), primary_key=True)
+    created_at = Column(DateTime, nullable=True)
+
+
+def _token(value) -> str:
+    raw = json.dumps(value).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+@pytest.fixture
+def entity_db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.mark.unit
+class TestCursorEncoding:
+    """Cursor tokens round-trip and reject garbage."""
+
+    def test_round_trip_datetime(self):
+        created = datetime(2024, 3, 1, 12, 30, tzinfo=timezone.utc)
+        token = encode_cursor(created, "3f1c0e9a-0000-4000-8000-000000000001")
+
+        sort_value, id_value = decode_cursor(token)
+
+        assert sort_value == created
+        assert id_value == "3f1c0e9a-0000-4000-8000-000000000001"
+
+    def test_token_is_url_safe(self):
+        token = encode_cursor("x" * 50, "id")
+        assert "=" not in token
+        assert "+" not in token and "/" not in token
+
+    @pytest.mark.parametrize("token", ["not-a-cursor", "e30", "!!!"])
+    def test_invalid_token_rejected(self, token):
+        with pytest.raises(BadRequestException):
+            decode_cursor(token)
+
+    @pytest.mark.parametrize("value", [
+        "ab",
+        [1, 2, 3],
+        {"created_at": None, "id": "x"},
+        [12, "3f1c0e9a-0000-4000-8000-000000000001"],
+        ["yesterday", "3f1c0e9a-0000-4000-8000-000000000001"],
+        [None, 7],
+    ])
+    def test_malformed_cursor_rejected(self, value):
+        with pytest.raises(BadRequestException):
+            decode_cursor(_token(value))
+
+    def test_non_uuid_id_rejected(self):
+        token = encode_cursor(datetime(2024, 3, 1), "1 OR 1=1")
+        with pytest.raises(BadRequestException):
+            apply_cursor(Query(Organization), Organization, token)
+
+
+@pytest.mark.unit
+class TestCountModes:
+    """Count mode selection and response headers."""
+
+    def test_count_none_skips_query(self):
+        query = MagicMock()
+        assert count_rows(MagicMock(), query, COUNT_NONE) is None
+        query.order_by.assert_not_called()
+
+    def test_paginated_list_headers(self):
+        response = Response()
+        paginated_list([1, 2], None, response=response, next_cursor="abc")
+
+        assert "X-Total-Count" not in response.headers
+        assert response.headers["X-Next-Cursor"] == "abc"
+
+    def test_paginated_list_offset_mode_has_no_cursor(self):
+        response = Response()
+        paginated_list([1, 2], 2, response=response)
+
+        assert response.headers["X-Total-Count"] == "2"
+        assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.unit
+class TestCursorPages:
+    """Keyset pages walked against the database."""
+
+    @staticmethod
+    def _add(db, rows):
+        db.add_all(Entity(id=str(id_), created_at=created) for created, id_ in rows)
+        db.commit()
+
+    @staticmethod
+    def _walk(db, limit):
+        pages, after = [], ""
+        while True:
+            rows, after = fetch_cursor_page(db.query(Entity), Entity, after, limit)
+            pages.append([row.id for row in rows])
+            if not after:
+                return pages
+
+    def test_pages_cover_rows_once(self, entity_db):
+        start = datetime(2024, 1, 1)
+        rows = sorted((start + timedelta(minutes=n), uuid.uuid4()) for n in range(7))
+        self._add(entity_db, rows)
+
+        pages = self._walk(entity_db, 3)
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert sum(pages, []) == [str(id_) for _, id_ in rows]
+
+    def test_exact_page_has_no_next_cursor(self, entity_db):
+        start = datetime(2024, 1, 1)
+        self._add(entity_db, [(start + timedelta(minutes=n), uuid.uuid4()) for n in range(4)])
+
+        rows, after = fetch_cursor_page(entity_db.query(Entity), Entity, "", 4)
+        assert len(rows) == 4 and after == ""
+
+        rows, after = fetch_cursor_page(entity_db.query(Entity), Entity, "", 3)
+        assert len(rows) == 3 and after
+
+    def test_ties_on_created_at_are_broken_by_id(self, entity_db):
+        created = datetime(2024, 1, 1)
+        ids = sorted(str(uuid.uuid4()) for _ in range(5))
+        self._add(entity_db, [(created, id_) for id_ in ids])
+
+        pages = self._walk(entity_db, 2)
+
+        assert pages == [ids[0:2], ids[2:4], ids[4:5]]
+
+    def test_rows_without_created_at_are_paged(self, entity_db):
+        start = datetime(2024, 1, 1)
+        undated = sorted(str(uuid.uuid4()) for _ in range(3))
+        dated = [(start + timedelta(minutes=n), str(uuid.uuid4())) for n in range(3)]
+        self._add(entity_db, [(None, id_) for id_ in undated] + dated)
+
+        pages = self._walk(entity_db, 2)
+
+        assert sum(pages, []) == undated + [id_ for _, id_ in dated]
+        assert [len(page) for page in pages] == [2, 2, 2]
+
+    def test_cursor_replaces_search_order(self, entity_db):
+        start = datetime(2024, 1, 1)
+        rows = [(start + timedelta(minutes=n), str(uuid.uuid4())) for n in range(3)]
+        self._add(entity_db, rows)
+
+        query = entity_db.query(Entity).order_by(Entity.id.desc())
+        assert [row.id for row in apply_cursor(query, Entity, "")] == [id_ for _, id_ in rows]
@@ -0,0 +1,175 @@
+"""
+Tests for set-based release validation (``business_logic.release_validation``).
+
+The session is a fake that evaluates the ``==``/``IN`` filters the
+validation issues against in-memory rows and counts queries, so the tests
+run without a database. Content selection is patched out.
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from computor_backend.business_logic import release_validation as rv
+from computor_backend.model.deployment import CourseContentDeployment
+from computor_backend.model.example import ExampleVersion
+
+
+class FakeQuery:
+    def __init__(self, session, entity):
+        self.session = session
+        if entity is CourseContentDeployment:
+            self.rows, self.columns = session.deployments, None
+        elif entity is ExampleVersion:
+            self.rows, self.columns = session.versions, None
+        else:
+            # A column: rows come back as tuples
+            self.rows, self.columns = session.versions, (entity.key,)
+
+    def options(self, *args):
+        return self
+
+    def filter(self, criterion):
+        values = criterion.right.value
+        values = set(values) if isinstance(values, (list, tuple, set)) else {values}
+        key = criterion.left.key
+        self.rows = [row for row in self.rows if getattr(row, key) in values]
+        return self
+
+    def _result(self, rows):
+        if self.columns is None:
+            return rows
+        return [tuple(getattr(row, c) for c in self.columns) for row in rows]
+
+    def all(self):
+        self.session.round_trip()
+        return self._result(self.rows)
+
+    def first(self):
+        self.session.round_trip()
+        rows = self._result(self.rows[:1])
+        return rows[0] if rows else None
+
+
+class FakeSession:
+    def __init__(self):
+        self.deployments = []
+        self.versions = []
+        self.queries = 0
+
+    def round_trip(self):
+        self.queries += 1
+
+    def query(self, entity):
+        return FakeQuery(self, entity)
+
+
+def _assignment(n: int):
+    return SimpleNamespace(id=uuid.uuid4(), title=f"Assignment {n}", path=f"unit.a{n}")
+
+
+def _deploy(db, assignment, status="pending", version=True):
+    version_id = None
+    if version:
+        version_id = uuid.uuid4()
+        if version != "missing":
+            db.versions.append(SimpleNamespace(id=version_id))
+    deployment = SimpleNamespace(
+        course_content_id=assignment.id, deployment_status=status,
+        example_version_id=version_id, example_version=None,
+    )
+    db.deployments.append(deployment)
+    return deployment
+
+
+def _validate(db, assignments):
+    with patch.object(rv, "resolve_course_contents_to_validate", return_value=assignments):
+        return rv.validate_course_for_release("course", db, all_flag=True)
+
+
+def test_checks_and_error_order():
+    db = FakeSession()
+    assignments = [_assignment(n) for n in range(7)]
+    _deploy(db, assignments[0])                            # valid, pending
+    _deploy(db, assignments[1], status="deployed")          # valid, deployed
+    _deploy(db, assignments[2], status="unassigned")
+    _deploy(db, assignments[3], status="failed")
+    _deploy(db, assignments[4], version=None)               # default version
+    missing = _deploy(db, assignments[5], version="missing")
+    # assignments[6] has no deployment: default version
+
+    is_valid, errors = _validate(db, assignments)
+
+    assert not is_valid
+    assert [(e.course_content_id, e.title, e.path) for e in errors] == [
+        (str(a.id), a.title, a.path) for a in (assignments[2], assignments[3], assignments[5])
+    ]
+    assert [e.issue for e in errors] == [
+        "Example was unassigned",
+        "Invalid deployment status: 'failed' (expected: pending, deployed)",
+        f"Example version {missing.example_version_id} not found in database",
+    ]
+
+
+def test_query_count_does_not_grow_with_assignments():
+    for count in (1, 50):
+        db = FakeSession()
+        assignments = [_assignment(n) for n in range(count)]
+        for assignment in assignments:
+            _deploy(db, assignment)
+
+        assert _validate(db, assignments) == (True, [])
+        assert db.queries == 2
+
+
+def test_no_version_lookup_without_versions():
+    db = FakeSession()
+    assignments = [_assignment(0), _assignment(1)]
+    _deploy(db, assignments[0], version=None)
+
+    assert _validate(db, assignments) == (True, [])
+    assert db.queries == 1
+
+
+def test_nothing_selected():
+    db = FakeSession()
+    assert _validate(db, []) == (True, [])
+    assert db.queries == 0
+
+
+def _legacy_validate(db, assignments):
+    """Previous loop: one deployment query (and one version query) per assignment."""
+    errors = []
+    for assignment in assignments:
+        deployment = db.query(CourseContentDeployment).filter(
+            CourseContentDeployment.course_content_id == assignment.id
+        ).first()
+        if not deployment or not deployment.example_version_id:
+            continue
+        if deployment.deployment_status not in ("pending", "deployed"):
+            errors.append(assignment.id)
+            continue
+        if not deployment.example_version:
+            if not db.query(ExampleVersion).filter(ExampleVersion.id == deployment.example_version_id).first():
+                errors.append(assignment.id)
+    return errors
+
+
+def test_course_release_matches_per_assignment_queries():
+    """Validate 150 assignments with two queries instead of one or two per assignment."""
+    db = FakeSession()
+    assignments = [_assignment(n) for n in range(150)]
+    for n, assignment in enumerate(assignments):
+        _deploy(db, assignment, status="failed" if n % 50 == 0 else "pending",
+                version="missing" if n % 30 == 1 else True)
+
+    legacy_errors = _legacy_validate(db, assignments)
+    legacy_queries, db.queries = db.queries, 0
+    is_valid, errors = _validate(db, assignments)
+
+    assert not is_valid
+    assert [e.course_content_id for e in errors] == [str(i) for i in legacy_errors]
+    assert legacy_queries >= len(assignments)
+    assert db.queries == 2
@@ -0,0 +1,146 @@
+"""
+Tests for compact result JSON encoding and batched, cached retrieval.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from computor_backend.services import result_storage as rs
+from computor_backend.services.storage_service import StorageService
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.mget_calls = 0
+
+    def mget(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(k) for k in keys]
+
+    def pipeline(self, transaction=False):
+        redis = self
+
+        class _Pipe:
+            def setex(self, key, ttl, value):
+                redis.data[key] = value
+
+            def execute(self):
+                pass
+
+        return _Pipe()
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def fake_cache():
+    cache = MagicMock()
+    cache.client = _FakeRedis()
+    cache.k.side_effect = lambda *parts: "test:" + ":".join(parts)
+    with patch("computor_backend.redis_cache.get_cache", return_value=cache):
+        yield cache
+
+
+@pytest.mark.unit
+class TestResultJsonEncoding:
+    """Stored result.json is compact and gzip-compressed when large."""
+
+    def test_small_documents_are_compact_json(self):
+        data = rs.encode_result_json({"a": [1, 2], "b": "x"})
+
+        assert data == b'{"a":[1,2],"b":"x"}'
+        assert rs.decode_result_json(data) == {"a": [1, 2], "b": "x"}
+
+    def test_large_documents_are_gzipped(self):
+        doc = {"tests": [{"name": f"t{i}", "output": "x" * 100} for i in range(500)]}
+
+        data = rs.encode_result_json(doc)
+
+        assert data[:2] == b"\x1f\x8b"
+        assert len(data) < len(json.dumps(doc)) / 10
+        assert rs.decode_result_json(data) == doc
+
+    def test_legacy_pretty_printed_objects_still_decode(self):
+        legacy = json.dumps({"a": 1}, indent=2).encode("utf-8")
+        assert rs.decode_result_json(legacy) == {"a": 1}
+
+
+@pytest.mark.unit
+class TestBatchRetrieval:
+    """retrieve_result_jsons reads the cache first, then MinIO for misses."""
+
+    @pytest.mark.asyncio
+    async def test_only_misses_hit_minio_and_get_cached(self, fake_cache):
+        fake_cache.client.data["test:result_json:r1"] = rs.encode_result_json({"id": "r1"})
+        storage = MagicMock()
+        storage.download_files = AsyncMock(return_value={
+            "r2/result.json": rs.encode_result_json({"id": "r2"}),
+            "r3/result.json": None,
+        })
+
+        with patch.object(rs, "get_storage_service", return_value=storage):
+            out = await rs.retrieve_result_jsons(["r1", "r2", "r3", "r1"])
+
+        assert out == {"r1": {"id": "r1"}, "r2": {"id": "r2"}, "r3": None}
+        keys = list(storage.download_files.call_args.args[0])
+        assert keys == ["r2/result.json", "r3/result.json"]
+        assert "test:result_json:r2" in fake_cache.client.data
+        assert "test:result_json:r3" not in fake_cache.client.data
+        assert fake_cache.client.mget_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_store_writes_through_and_delete_forgets(self, fake_cache):
+        storage = MagicMock()
+        storage.upload_file = AsyncMock()
+        storage.delete_file = AsyncMock()
+
+        with patch.object(rs, "get_storage_service", return_value=storage):
+            await rs.store_result_json("r9", {"ok": True})
+            assert await rs.retrieve_result_json("r9") == {"ok": True}
+            storage.download_file.assert_not_called()
+
+            await rs.delete_result_json("r9")
+
+        assert "test:result_json:r9" not in fake_cache.client.data
+        uploaded = storage.upload_file.call_args.kwargs
+        assert uploaded["file_data"].getvalue() == b'{"ok":true}'
+        assert uploaded["content_type"] == "application/json"
+
+
+@pytest.mark.unit
+class TestDownloadFiles:
+    """StorageService.download_files runs bounded parallel downloads."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_but_bounded(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def get_object(bucket, key):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            response = MagicMock()
+            response.read.return_value = key.encode()
+            return response
+
+        storage = StorageService.__new__(StorageService)
+        storage.client = MagicMock()
+        storage.client.get_object.side_effect = get_object
+        storage.default_bucket = "default"
+
+        out = await storage.download_files([f"k{i}" for i in range(12)], bucket_name="b", max_concurrency=4)
+
+        assert out == {f"k{i}": f"k{i}".encode() for i in range(12)}
+        assert 1 < peak <= 4
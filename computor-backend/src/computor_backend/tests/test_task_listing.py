@@ -0,0 +1,233 @@
+"""
+Tests for permission-scoped task listing (``tasks.listing``).
+
+Redis is ``fake_redis.FakeRedis``; Temporal is ``FakeTemporal`` below, which
+serves ``describe`` and visibility listing for in-memory workflows with a
+fixed per-call latency. ``tests/seed/bench_task_listing.py`` times a deep
+page of a student's tasks in a busy namespace against visibility listing.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from temporalio.client import WorkflowExecutionStatus
+
+from computor_backend.permissions.principal import Principal
+from computor_backend.task_tracker import TaskTracker
+from computor_backend.tasks import listing, temporal_executor
+from computor_backend.tasks.temporal_executor import TemporalTaskExecutor
+from computor_backend.tests.fake_redis import FakeRedis
+
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeTemporal:
+    """Workflows by ID; describe and list_workflows with fixed latency."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.workflows = {}
+        self.describes = 0
+        self.listed = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def add(self, workflow_id: str, status=WorkflowExecutionStatus.COMPLETED, start=START):
+        closed = status != WorkflowExecutionStatus.RUNNING
+        self.workflows[workflow_id] = SimpleNamespace(
+            id=workflow_id,
+            run_id=f"run-{workflow_id}",
+            workflow_type="students_sync",
+            status=status,
+            start_time=start,
+            close_time=start + timedelta(seconds=5) if closed else None,
+            execution_time=start,
+            history_length=10,
+            task_queue="computor-tasks",
+        )
+
+    def get_workflow_handle(self, workflow_id: str):
+        fake = self
+
+        class _Handle:
+            async def describe(self):
+                fake.describes += 1
+                fake.in_flight += 1
+                fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+                try:
+                    await asyncio.sleep(fake.latency)
+                finally:
+                    fake.in_flight -= 1
+                if workflow_id not in fake.workflows:
+                    raise RuntimeError("workflow not found")
+                return fake.workflows[workflow_id]
+
+        return _Handle()
+
+    async def list_workflows(self, query=None, page_size=1000):
+        ordered = sorted(self.workflows.values(), key=lambda w: w.start_time, reverse=True)
+        for i, workflow in enumerate(ordered):
+            if i % page_size == 0:
+                await asyncio.sleep(self.latency)
+            self.listed += 1
+            yield workflow
+
+
+@pytest.fixture
+def temporal(monkeypatch):
+    fake = FakeTemporal()
+
+    async def get_client():
+        return fake
+
+    monkeypatch.setattr(temporal_executor, "get_temporal_client", get_client)
+    return fake
+
+
+async def _track(tracker: TaskTracker, temporal: FakeTemporal, workflow_id: str, created_at: datetime,
+                 user_id: str = "student", status=WorkflowExecutionStatus.COMPLETED):
+    entry = await tracker.track_task(workflow_id, "students_sync", user_id)
+    entry.created_at = created_at
+    tracker.redis._setex(f"task:{workflow_id}", 0, entry.model_dump_json())
+    for key in tracker._entry_index_keys(entry):
+        tracker.redis._zadd(key, {workflow_id: created_at.timestamp()})
+    if status is not None:
+        temporal.add(workflow_id, status, start=created_at)
+
+
+def test_pages_come_from_the_tracker_index(temporal):
+    async def run():
+        tracker, executor = TaskTracker(FakeRedis()), TemporalTaskExecutor()
+        for i in range(25):
+            await _track(tracker, temporal, f"wf-{i}", START + timedelta(seconds=i))
+        principal = Principal(user_id="student")
+        first = await listing.list_accessible_task_page(tracker, executor, principal, limit=10)
+        last = await listing.list_accessible_task_page(tracker, executor, principal, limit=10, offset=20)
+        return first, last
+
+    first, last = asyncio.run(run())
+
+    assert [t["task_id"] for t in first["tasks"]] == [f"wf-{i}" for i in range(24, 14, -1)]
+    assert first["total"] == 25 and first["has_more"]
+    assert [t["task_id"] for t in last["tasks"]] == [f"wf-{i}" for i in range(4, -1, -1)]
+    assert not last["has_more"]
+    assert last["tasks"][0]["status"] == "finished"
+    # Only the tasks on each page were described
+    assert temporal.describes == 15
+
+
+def test_terminal_tasks_are_described_once(temporal):
+    async def run():
+        tracker, executor = TaskTracker(FakeRedis()), TemporalTaskExecutor()
+        await _track(tracker, temporal, "done", START)
+        await _track(tracker, temporal, "running", START + timedelta(seconds=1),
+                     status=WorkflowExecutionStatus.RUNNING)
+        await _track(tracker, temporal, "queued", START + timedelta(seconds=2), status=None)
+        principal = Principal(user_id="student")
+        for _ in range(3):
+            page = await listing.list_accessible_task_page(tracker, executor, principal)
+        return page
+
+    page = asyncio.run(run())
+
+    assert [(t["task_id"], t["status"]) for t in page["tasks"]] == [
+        ("queued", "queued"), ("running", "started"), ("done", "finished"),
+    ]
+    # "done" once, "running" and the unknown "queued" on every request
+    assert temporal.describes == 1 + 3 + 3
+
+
+def test_status_filter_fills_the_page(temporal, monkeypatch):
+    monkeypatch.setattr(listing, "STATUS_SCAN_BATCH", 7)
+
+    async def run():
+        tracker, executor = TaskTracker(FakeRedis()), TemporalTaskExecutor()
+        for i in range(40):
+            status = WorkflowExecutionStatus.FAILED if i % 4 == 0 else WorkflowExecutionStatus.COMPLETED
+            await _track(tracker, temporal, f"wf-{i}", START + timedelta(seconds=i), status=status)
+        principal = Principal(user_id="student")
+        return (
+            await listing.list_accessible_task_page(tracker, executor, principal, limit=3, offset=2, status="FAILED"),
+            await listing.list_accessible_task_page(tracker, executor, principal, limit=20, status="failed"),
+        )
+
+    page, all_failed = asyncio.run(run())
+
+    assert [t["task_id"] for t in page["tasks"]] == ["wf-28", "wf-24", "wf-20"]
+    assert page["has_more"]
+    assert len(all_failed["tasks"]) == all_failed["total"] == 10
+    assert not all_failed["has_more"] and not all_failed["total_is_estimate"]
+
+
+def test_status_filter_scan_is_capped(temporal, monkeypatch):
+    monkeypatch.setattr(listing, "STATUS_SCAN_BATCH", 4)
+    monkeypatch.setattr(listing, "STATUS_SCAN_LIMIT", 10)
+
+    async def run():
+        tracker, executor = TaskTracker(FakeRedis()), TemporalTaskExecutor()
+        for i in range(40):
+            status = WorkflowExecutionStatus.FAILED if i % 4 == 0 else WorkflowExecutionStatus.COMPLETED
+            await _track(tracker, temporal, f"wf-{i}", START + timedelta(seconds=i), status=status)
+        reads = []
+        list_tasks = tracker.list_accessible_tasks
+
+        async def counting_list(permissions, limit, offset):
+            reads.append((limit, offset))
+            return await list_tasks(permissions, limit=limit, offset=offset)
+
+        tracker.list_accessible_tasks = counting_list
+        page = await listing.list_accessible_task_page(
+            tracker, executor, Principal(user_id="student"), limit=20, status="FAILED"
+        )
+        return page, reads
+
+    page, reads = asyncio.run(run())
+
+    # Batches double (4, then the remaining 6) and stop at the scan limit
+    assert reads == [(4, 0), (6, 4)]
+    assert [t["task_id"] for t in page["tasks"]] == ["wf-36", "wf-32"]
+    assert page["total"] == 2 and page["total_is_estimate"]
+    assert not page["has_more"]
+
+
+def test_describe_concurrency_is_bounded(temporal):
+    temporal.latency = 0.001
+
+    async def run():
+        executor = TemporalTaskExecutor()
+        for i in range(50):
+            temporal.add(f"wf-{i}")
+        return await executor.describe_tasks([f"wf-{i}" for i in range(50)] + ["missing"], max_concurrency=4)
+
+    tasks = asyncio.run(run())
+
+    assert len(tasks) == 50 and "missing" not in tasks
+    assert temporal.max_in_flight == 4
+
+
+def test_deep_page_reads_only_its_tasks(temporal):
+    """A deep page of a student's tasks in a busy namespace describes only that page."""
+    workflows, own_every, limit, offset = 400, 10, 5, 20
+
+    async def run():
+        tracker, executor = TaskTracker(FakeRedis()), TemporalTaskExecutor()
+        for i in range(workflows):
+            created = START + timedelta(seconds=i)
+            if i % own_every == 0:
+                await _track(tracker, temporal, f"own-{i}", created)
+            else:
+                temporal.add(f"other-{i}", start=created)
+        temporal.describes = temporal.listed = 0
+        page = await listing.list_accessible_task_page(
+            tracker, executor, Principal(user_id="student"), limit=limit, offset=offset
+        )
+        return page["tasks"]
+
+    tasks = asyncio.run(run())
+
+    newest = workflows - own_every
+    assert [t["task_id"] for t in tasks] == [f"own-{newest - own_every * k}" for k in range(offset, offset + limit)]
+    assert temporal.describes == limit and temporal.listed == 0
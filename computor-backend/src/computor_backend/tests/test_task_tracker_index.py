@@ -0,0 +1,144 @@
+"""
+Tests for the time-ordered task tracker index.
+
+Redis is replaced by ``fake_redis.FakeRedis``, which counts round trips (a
+command or a pipeline execute). ``tests/seed/bench_task_tracker_index.py`` times
+the listing against the previous full-index read with a per-round-trip
+latency.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from computor_backend.permissions.principal import Principal
+from computor_backend.task_tracker import INDEX_PREFIX, TaskTracker
+from computor_backend.tests.fake_redis import FakeRedis
+
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+async def _track(tracker: TaskTracker, count: int, user_id: str = "u1", course_id=None, prefix: str = "wf",
+                 start: datetime = START):
+    for i in range(count):
+        entry = await tracker.track_task(f"{prefix}{i}", "students_sync", user_id, course_id=course_id)
+        # Spread creation times so the order is well defined
+        entry.created_at = start + timedelta(seconds=i)
+        tracker.redis._setex(f"task:{prefix}{i}", 0, entry.model_dump_json())
+        for key in tracker._entry_index_keys(entry):
+            tracker.redis._zadd(key, {f"{prefix}{i}": entry.created_at.timestamp()})
+
+
+def _lecturer(user_id: str, course_id: str) -> Principal:
+    return Principal(user_id=user_id, claims={"dependent": {"course": {course_id: ["_lecturer"]}}})
+
+
+def test_listing_is_newest_first_and_paged():
+    async def run():
+        tracker = TaskTracker(FakeRedis())
+        await _track(tracker, 25)
+        first = await tracker.list_accessible_tasks(Principal(user_id="u1"), limit=10)
+        third = await tracker.list_accessible_tasks(Principal(user_id="u1"), limit=10, offset=20)
+        return first, third
+
+    first, third = asyncio.run(run())
+
+    assert [e.workflow_id for e in first] == [f"wf{i}" for i in range(24, 14, -1)]
+    assert [e.workflow_id for e in third] == [f"wf{i}" for i in range(4, -1, -1)]
+
+
+def test_listing_merges_indexes_without_duplicates():
+    async def run():
+        tracker = TaskTracker(FakeRedis())
+        await _track(tracker, 5, user_id="lecturer", course_id="c1", prefix="own")
+        await _track(tracker, 5, user_id="student", course_id="c1", prefix="course")
+        await _track(tracker, 5, user_id="other", course_id="c2", prefix="hidden")
+        principal = _lecturer("lecturer", "c1")
+        return (
+            await tracker.list_accessible_tasks(principal, limit=100),
+            await tracker.get_accessible_task_ids(principal),
+        )
+
+    entries, ids = asyncio.run(run())
+
+    listed = [e.workflow_id for e in entries]
+    assert len(listed) == len(set(listed)) == 10
+    assert set(listed) == ids
+    assert not any(wf.startswith("hidden") for wf in listed)
+    created = [e.created_at for e in entries]
+    assert created == sorted(created, reverse=True)
+
+
+def test_admin_lists_all_tasks():
+    async def run():
+        tracker = TaskTracker(FakeRedis())
+        await _track(tracker, 3, user_id="a", prefix="a")
+        await _track(tracker, 3, user_id="b", prefix="b")
+        return await tracker.list_accessible_tasks(Principal(user_id="admin", is_admin=True))
+
+    assert len(asyncio.run(run())) == 6
+
+
+def test_expired_entries_are_pruned_and_page_refilled():
+    async def run():
+        redis = FakeRedis()
+        tracker = TaskTracker(redis)
+        await _track(tracker, 10)
+        for i in (9, 7, 6):
+            del redis.strings[f"task:wf{i}"]
+        page = await tracker.list_accessible_tasks(Principal(user_id="u1"), limit=4)
+        return page, redis
+
+    page, redis = asyncio.run(run())
+
+    assert [e.workflow_id for e in page] == ["wf8", "wf5", "wf4", "wf3"]
+    # Only the indexes the listing read are pruned
+    assert not {"wf9", "wf7", "wf6"} & set(redis.zsets[f"{INDEX_PREFIX}:user:u1"])
+    assert {"wf9", "wf7", "wf6"} <= set(redis.zsets[f"{INDEX_PREFIX}:all"])
+
+
+def test_delete_removes_entry_from_indexes():
+    async def run():
+        redis = FakeRedis()
+        tracker = TaskTracker(redis)
+        await _track(tracker, 2, course_id="c1")
+        await tracker.delete_task_entry("wf0")
+        return redis
+
+    redis = asyncio.run(run())
+
+    assert "task:wf0" not in redis.strings
+    for key in (f"{INDEX_PREFIX}:user:u1", f"{INDEX_PREFIX}:course:c1", f"{INDEX_PREFIX}:all"):
+        assert list(redis.zsets[key]) == ["wf1"]
+
+
+def test_listing_round_trips_do_not_grow_with_history():
+    """A lecturer's newest page takes the same Redis round trips for short and long histories."""
+    courses, page = 5, 20
+
+    def list_newest(history: int) -> tuple:
+        async def run():
+            redis = FakeRedis()
+            tracker = TaskTracker(redis)
+            for c in range(courses):
+                await _track(tracker, history // courses, user_id=f"s{c}", course_id=f"c{c}", prefix=f"c{c}-",
+                             start=START + timedelta(milliseconds=c))
+            principal = Principal(
+                user_id="lecturer",
+                claims={"dependent": {"course": {f"c{c}": ["_lecturer"] for c in range(courses)}}},
+            )
+            redis.round_trips = 0
+            entries = await tracker.list_accessible_tasks(principal, limit=page)
+            round_trips = redis.round_trips
+
+            everything = [await tracker.get_task_entry(i) for i in await tracker.get_accessible_task_ids(principal)]
+            everything.sort(key=lambda e: e.created_at, reverse=True)
+            return round_trips, [e.workflow_id for e in entries], [e.workflow_id for e in everything[:page]]
+
+        return asyncio.run(run())
+
+    small_trips, small_ids, small_expected = list_newest(200)
+    large_trips, large_ids, large_expected = list_newest(2000)
+
+    assert small_trips == large_trips == 2
+    assert small_ids == small_expected and large_ids == large_expected
@@ -0,0 +1,212 @@
+"""
+Tests for per-connection WebSocket send queues and slow-client handling.
+
+Connections use a fake WebSocket whose sends take a fixed time (or block
+until released), and are registered with the manager directly so no
+Redis is needed. ``tests/seed/bench_ws_broadcast.py`` reuses these fakes
+to time a broadcast burst with one stalled client among many.
+"""
+
+import asyncio
+import time
+
+from computor_backend.permissions.principal import Principal
+from computor_backend.websocket.connection_manager import Connection, ConnectionManager, WebSocketMetrics
+from computor_backend.websocket.send_queue import ConnectionSendQueue, OverflowPolicy
+
+
+manager_metrics = WebSocketMetrics()
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.stalled = asyncio.Event() if delay is None else None
+        self.sent = []
+        self.received_at = []
+        self.closed_with = None
+
+    async def send_json(self, data):
+        if self.stalled is not None:
+            await self.stalled.wait()
+        elif self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(data)
+        self.received_at.append(time.monotonic())
+
+    async def close(self, code=1000, reason=None):
+        self.closed_with = code
+
+
+def _connect(manager: ConnectionManager, user_id: str, websocket: FakeWebSocket, channel: str = "course:c1",
+             max_size: int = 16, send_timeout: float = 5.0, max_lag: float = 30.0) -> Connection:
+    conn = Connection(websocket=websocket, principal=Principal(user_id=user_id), subscriptions={channel})
+    conn.send_queue = ConnectionSendQueue(
+        websocket,
+        max_size=max_size,
+        send_timeout=send_timeout,
+        max_lag=max_lag,
+        on_laggard=lambda queue, reason: manager._disconnect_slow_client(conn, reason),
+        metrics=manager_metrics,
+        label=f"user={user_id}",
+    )
+    conn.send_queue.start()
+    manager._connections.setdefault(user_id, []).append(conn)
+    manager._channel_subscribers.setdefault(channel, set()).add(user_id)
+    return conn
+
+
+def _event(event_type: str, **data) -> dict:
+    return {"type": event_type, "channel": "course:c1", "data": data}
+
+
+def _typing(user_id: str) -> dict:
+    return {"type": "typing:update", "channel": "course:c1", "user_id": user_id, "is_typing": True}
+
+
+def test_events_are_delivered_in_order():
+    async def run():
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        _connect(manager, "u1", ws)
+        for i in range(10):
+            await manager._handle_pubsub_message("course:c1", _event("message:new", id=i))
+        await asyncio.sleep(0.01)
+        return ws
+
+    ws = asyncio.run(run())
+
+    assert [e["data"]["id"] for e in ws.sent] == list(range(10))
+
+
+def test_typing_events_drop_oldest_when_full():
+    async def run():
+        manager = ConnectionManager()
+        ws = FakeWebSocket(delay=None)
+        conn = _connect(manager, "u1", ws, max_size=4)
+        await asyncio.sleep(0)  # writer takes the first event and stalls
+        for i in range(6):
+            conn.send_queue.put(_typing(f"t{i}"))
+        # A reliable event evicts the oldest ephemeral one instead of failing
+        assert conn.send_queue.put(_event("message:new", id=1))
+        queued = [e.get("user_id") or e["type"] for e in (i.event for i in conn.send_queue._pending)]
+        dropped = conn.send_queue.dropped
+        await conn.send_queue.close()
+        return queued, dropped, ws.closed_with
+
+    queued, dropped, closed_with = asyncio.run(run())
+
+    assert queued == ["t3", "t4", "t5", "message:new"]
+    assert dropped == 3
+    assert closed_with is None
+
+
+def test_status_updates_are_coalesced():
+    async def run():
+        manager = ConnectionManager()
+        ws = FakeWebSocket(delay=None)
+        conn = _connect(manager, "u1", ws)
+        conn.send_queue.put(_event("message:new", id=0))
+        await asyncio.sleep(0)
+        for status in ("pending", "deploying", "deployed"):
+            conn.send_queue.put(_event("deployment:status_changed", deployment_id="d1", new_status=status))
+        conn.send_queue.put(_event("deployment:status_changed", deployment_id="d2", new_status="failed"))
+        ws.stalled.set()
+        await asyncio.sleep(0.01)
+        return ws.sent, conn.send_queue.coalesced
+
+    sent, coalesced = asyncio.run(run())
+
+    assert [(e["data"].get("deployment_id"), e["data"].get("new_status")) for e in sent] == [
+        (None, None), ("d1", "deployed"), ("d2", "failed"),
+    ]
+    assert coalesced == 2
+
+
+def test_laggard_is_disconnected_when_queue_is_full():
+    async def run():
+        manager = ConnectionManager()
+        slow = FakeWebSocket(delay=None)
+        conn = _connect(manager, "slow", slow, max_size=3)
+        before = manager_metrics.total_slow_client_disconnects
+        for i in range(5):
+            await manager._handle_pubsub_message("course:c1", _event("message:new", id=i))
+        await asyncio.sleep(0.01)
+        return slow.closed_with, conn.send_queue.closed, manager_metrics.total_slow_client_disconnects - before
+
+    closed_with, queue_closed, disconnects = asyncio.run(run())
+
+    assert closed_with == 4009
+    assert queue_closed
+    assert disconnects == 1
+
+
+def test_laggard_is_disconnected_when_events_wait_too_long():
+    async def run():
+        manager = ConnectionManager()
+        slow = FakeWebSocket(delay=None)
+        conn = _connect(manager, "slow", slow, max_lag=0.05)
+        conn.send_queue.put(_event("message:new", id=0))
+        await asyncio.sleep(0.06)
+        assert not conn.send_queue.put(_event("message:new", id=1))
+        await asyncio.sleep(0.01)
+        return slow.closed_with
+
+    assert asyncio.run(run()) == 4009
+
+
+def test_send_timeout_disconnects():
+    async def run():
+        manager = ConnectionManager()
+        slow = FakeWebSocket(delay=1.0)
+        _connect(manager, "slow", slow, send_timeout=0.05)
+        await manager.send_to_user("slow", _event("message:new", id=0))
+        await asyncio.sleep(0.1)
+        return slow.closed_with
+
+    assert asyncio.run(run()) == 4009
+
+
+def test_per_connection_lag_metrics():
+    async def run():
+        metrics = WebSocketMetrics()
+        fast_ws, slow_ws = FakeWebSocket(), FakeWebSocket(delay=None)
+        queues = []
+        for label, ws in (("fast", fast_ws), ("slow", slow_ws)):
+            queue = ConnectionSendQueue(ws, 16, 5.0, 30.0, lambda q, r: None, metrics=metrics, label=label)
+            queue.start()
+            queues.append(queue)
+        for queue in queues:
+            for i in range(3):
+                queue.put(_event("message:new", id=i))
+        await asyncio.sleep(0.02)
+        snapshot = metrics.get_metrics()
+        for queue in queues:
+            await queue.close()
+        return snapshot, metrics.get_queue_metrics()
+
+    snapshot, after_close = asyncio.run(run())
+
+    queues = snapshot["send_queues"]
+    assert queues["slowest_connections"][0]["connection"] == "slow"
+    assert queues["slowest_connections"][0]["lag_seconds"] >= 0.02
+    assert queues["queued_messages"] == 2  # one of the three is stuck in flight
+    assert snapshot["total_messages_sent"] == 3
+    assert after_close["slowest_connections"] == []
+
+
+def test_overflow_policies_are_configurable():
+    async def run():
+        ws = FakeWebSocket(delay=None)
+        queue = ConnectionSendQueue(
+            ws, 2, 5.0, 30.0, lambda q, r: None,
+            policies={"message:new": OverflowPolicy.DROP_OLDEST},
+        )
+        queue.start()
+        await asyncio.sleep(0)
+        results = [queue.put(_event("message:new", id=i)) for i in range(4)]
+        await queue.close()
+        return results
+
+    assert asyncio.run(run()) == [True, True, True, True]
+
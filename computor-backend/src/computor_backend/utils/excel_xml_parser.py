@@ -161,6 +161,36 @@ class ExcelXMLParser:
         raise ValueError("Could not decode XML file with any common encoding")
 
 
+# Common German column names of university roster exports, mapped to English keys
+COURSE_MEMBER_COLUMN_MAPPING = {
+    'E-Mail': 'email',
+    'Familienname': 'family_name',
+    'Vorname': 'given_name',
+    'Matrikelnummer': 'student_id',
+    'Gruppe': 'course_group_title',
+    'Incoming': 'incoming',
+    'Kennzahl': 'study_id',
+    'Studien-ID': 'study_id',
+    'Studium': 'study_name',
+    'Semester im Studium': 'semester',
+    'Anmeldedatum': 'registration_date',
+    'Anmerkung': 'notes',
+    'lfd.Nr.': 'sequence_number',
+    'Platz': 'place',
+    'Wartelistenposition': 'waitlist_position',
+}
+
+
+def standardize_course_member_column(name: str) -> str:
+    """Map a roster column header to its standardized key.
+
+    Known export headers use ``COURSE_MEMBER_COLUMN_MAPPING``; anything else
+    is lowercased with spaces replaced by underscores.
+    """
+    name = name.strip()
+    return COURSE_MEMBER_COLUMN_MAPPING.get(name, name.lower().replace(' ', '_'))
+
+
 def parse_course_member_xml(xml_content: str | bytes) -> List[Dict[str, str]]:
     """Convenience function to parse course member XML.
 
@@ -176,33 +206,12 @@ def parse_course_member_xml(xml_content: str | bytes) -> List[Dict[str, str]]:
         parser = ExcelXMLParser(xml_content)
         rows = parser.parse()
 
-    # Standardize common German column names to English keys
-    column_mapping = {
-        'E-Mail': 'email',
-        'Familienname': 'family_name',
-        'Vorname': 'given_name',
-        'Matrikelnummer': 'student_id',
-        'Gruppe': 'course_group_title',
-        'Incoming': 'incoming',
-        'Kennzahl': 'study_id',
-        'Studien-ID': 'study_id',
-        'Studium': 'study_name',
-        'Semester im Studium': 'semester',
-        'Anmeldedatum': 'registration_date',
-        'Anmerkung': 'notes',
-        'lfd.Nr.': 'sequence_number',
-        'Platz': 'place',
-        'Wartelistenposition': 'waitlist_position',
-    }
-
     # Transform rows to use standardized keys
     standardized_rows = []
     for row in rows:
         standardized = {}
         for original_key, value in row.items():
-            # Use mapped key if available, otherwise use original
-            key = column_mapping.get(original_key, original_key.lower().replace(' ', '_'))
-            standardized[key] = value
+            standardized[standardize_course_member_column(original_key)] = value
         standardized_rows.append(standardized)
 
     return standardized_rows
@@ -0,0 +1,114 @@
+"""Incremental CSV parser for course member rosters."""
+import codecs
+import csv
+import logging
+from typing import AsyncIterable, AsyncIterator, Dict, Iterator, List, Optional
+
+from computor_backend.utils.excel_xml_parser import standardize_course_member_column
+
+logger = logging.getLogger(__name__)
+
+
+class RosterCSVParser:
+    """Parse a CSV roster fed in arbitrary byte chunks.
+
+    Records are emitted as soon as they are complete, so a large upload can
+    be processed while it is still being received. A line break only ends a
+    record when the quotes seen so far are balanced, which keeps quoted
+    fields containing newlines intact.
+
+    The first record is the header; its columns are standardized with
+    ``standardize_course_member_column`` (so university exports using
+    ``E-Mail``/``Vorname``/``Gruppe`` work as-is). Blank rows are skipped.
+    """
+
+    def __init__(self, encoding: str = "utf-8-sig", delimiter: Optional[str] = None):
+        """Initialize parser.
+
+        Args:
+            encoding: Text encoding of the upload (BOM-tolerant by default)
+            delimiter: Field delimiter; sniffed from the header when None
+        """
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._delimiter = delimiter
+        self._buffer = ""
+        self._record = ""
+        self.headers: List[str] = []
+
+    def feed(self, chunk: bytes) -> Iterator[Dict[str, str]]:
+        """Consume a chunk and yield the rows it completed."""
+        self._buffer += self._decoder.decode(chunk)
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            row = self._push(line + "\n")
+            if row is not None:
+                yield row
+
+    def close(self) -> Iterator[Dict[str, str]]:
+        """Flush any trailing record without a final newline."""
+        self._buffer += self._decoder.decode(b"", final=True)
+        tail, self._buffer = self._buffer, ""
+        if tail:
+            row = self._push(tail)
+            if row is not None:
+                yield row
+        if self._record.strip():
+            logger.warning("Roster CSV ended inside a quoted field; parsing remainder as-is")
+            record, self._record = self._record, ""
+            row = self._parse(record)
+            if row is not None:
+                yield row
+
+    def _push(self, line: str) -> Optional[Dict[str, str]]:
+        self._record += line
+        if self._record.count('"') % 2:
+            return None
+        record, self._record = self._record, ""
+        return self._parse(record)
+
+    def _parse(self, record: str) -> Optional[Dict[str, str]]:
+        if not record.strip():
+            return None
+
+        if self._delimiter is None:
+            try:
+                self._delimiter = csv.Sniffer().sniff(record, delimiters=",;\t").delimiter
+            except csv.Error:
+                self._delimiter = ","
+
+        values = next(csv.reader([record.rstrip("\r\n")], delimiter=self._delimiter), [])
+
+        if not self.headers:
+            self.headers = [standardize_course_member_column(v) for v in values]
+            return None
+
+        if not any(v.strip() for v in values):
+            return None
+
+        return {
+            header: (values[i].strip() if i < len(values) else "")
+            for i, header in enumerate(self.headers)
+        }
+
+
+async def iter_roster_csv(
+    chunks: AsyncIterable[bytes],
+    encoding: str = "utf-8-sig",
+    delimiter: Optional[str] = None,
+) -> AsyncIterator[Dict[str, str]]:
+    """Yield standardized roster rows from a streamed CSV upload.
+
+    Args:
+        chunks: Raw body chunks (e.g. ``Request.stream()``)
+        encoding: Text encoding of the upload
+        delimiter: Field delimiter; sniffed from the header when None
+
+    Yields:
+        One dictionary per data row, keyed by standardized column name
+    """
+    parser = RosterCSVParser(encoding=encoding, delimiter=delimiter)
+    async for chunk in chunks:
+        for row in parser.feed(chunk):
+            yield row
+    for row in parser.close():
+        yield row
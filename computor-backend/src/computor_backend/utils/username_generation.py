@@ -10,7 +10,7 @@ Examples:
     - International: "Müller" → "muller", "José García" → "jgarcia"
 """
 
-from typing import Optional
+from typing import Iterable, List, Optional, Set, Tuple
 from sqlalchemy.orm import Session
 from text_unidecode import unidecode
 import logging
@@ -169,3 +169,90 @@ def _ensure_username_unique(base_username: str, db: Session) -> str:
             raise ValueError(f"Could not generate unique username for base '{base_username}'")
 
     return username
+
+
+def _username_candidates(
+    given_name: Optional[str],
+    family_name: Optional[str],
+    target_length: int = 8,
+) -> Tuple[List[str], str]:
+    """Return the expansion candidates tried by ``generate_username_from_names``.
+
+    Returns:
+        ``(candidates, suffix_base)`` - candidates in preference order and the
+        base used for numeric suffixes once all candidates are taken.
+    """
+    given = normalize_name_for_username(given_name or "").replace(" ", "")
+    family = normalize_name_for_username(family_name or "").replace(" ", "")
+
+    if not given and not family:
+        return ["user"], "user"
+    if not given:
+        return [family[:target_length]], family[:target_length]
+    if not family:
+        return [given[:target_length]], given[:target_length]
+
+    candidates = []
+    for given_chars in range(1, len(given) + 1):
+        family_chars = target_length - given_chars
+        if family_chars < 1:
+            family_chars = len(family)
+        candidates.append(given[:given_chars] + family[:family_chars])
+    return candidates, given + family
+
+
+def generate_usernames_from_names(
+    names: Iterable[Tuple[Optional[str], Optional[str]]],
+    db: Session,
+    target_length: int = 8,
+) -> List[str]:
+    """
+    Generate unique usernames for many (given_name, family_name) pairs at once.
+
+    Same algorithm as ``generate_username_from_names`` but resolves collisions
+    with one ``IN`` query over all candidates instead of one query per probe,
+    and keeps the generated names unique among themselves.
+
+    Args:
+        names: (given_name, family_name) pairs
+        db: Database session for uniqueness checking
+        target_length: Target username length (default: 8)
+
+    Returns:
+        Usernames in the same order as ``names``
+    """
+    expanded = [_username_candidates(g, f, target_length) for g, f in names]
+
+    all_candidates = {c for candidates, _ in expanded for c in candidates}
+    taken: Set[str] = set()
+    if all_candidates:
+        taken = {
+            row[0] for row in
+            db.query(User.username).filter(User.username.in_(all_candidates)).all()
+        }
+
+    usernames = []
+    for candidates, suffix_base in expanded:
+        username = next((c for c in candidates if c not in taken), None)
+        if username is None:
+            username = _ensure_username_unique_in(suffix_base, db, taken)
+        taken.add(username)
+        usernames.append(username)
+    return usernames
+
+
+def _ensure_username_unique_in(base_username: str, db: Session, taken: Set[str]) -> str:
+    """``_ensure_username_unique`` that also avoids names reserved in ``taken``."""
+    existing = taken | {
+        row[0] for row in
+        db.query(User.username).filter(User.username.like(f"{base_username}%")).all()
+    }
+    username = base_username
+    counter = 1
+    while username in existing:
+        username = f"{base_username}{counter}"
+        counter += 1
+        if counter > 9999:
+            logger.error(f"Username generation failed after 9999 attempts for base '{base_username}'")
+            raise ValueError(f"Could not generate unique username for base '{base_username}'")
+    return username
@@ -3,6 +3,7 @@ WebSocket package for real-time communication.
 
 This package provides a general-purpose WebSocket infrastructure with:
 - Connection management with Redis pub/sub for multi-instance support
+- Per-connection send queues, so slow clients never delay others
 - Bearer token authentication (reuses existing SSO auth)
 - Channel-based subscription model
 - Event routing system
@@ -14,6 +15,7 @@ Current features:
 """
 
 from computor_backend.websocket.connection_manager import ConnectionManager, manager, ws_metrics
+from computor_backend.websocket.send_queue import ConnectionSendQueue, OverflowPolicy
 from computor_backend.websocket.broadcast import WebSocketBroadcast, ws_broadcast
 from computor_backend.websocket.event_publisher import (
     publish_deployment_status_changed,
@@ -26,6 +28,8 @@ __all__ = [
     "ConnectionManager",
     "manager",
     "ws_metrics",
+    "ConnectionSendQueue",
+    "OverflowPolicy",
     "WebSocketBroadcast",
     "ws_broadcast",
     # Sync event publishers (for Temporal activities and background tasks)
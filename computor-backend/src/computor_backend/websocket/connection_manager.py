@@ -9,6 +9,7 @@ import asyncio
 import json
 import logging
 import time
+import weakref
 from typing import Dict, List, Set, Optional
 from dataclasses import dataclass, field
 
@@ -21,6 +22,7 @@ from computor_backend.permissions.principal import Principal
 from computor_backend.redis_cache import get_redis_client
 from computor_backend.settings import settings
 from computor_backend.websocket.pubsub import pubsub, typing_tracker, TYPING_PREFIX
+from computor_backend.websocket.send_queue import ConnectionSendQueue
 
 logger = logging.getLogger(__name__)
 
@@ -29,10 +31,15 @@ class WebSocketMetrics:
     """
     Simple metrics tracking for WebSocket connections.
 
-    Tracks connection counts, message counts, and error rates.
+    Tracks connection counts, message counts, error rates and send lag
+    (time from enqueueing an event to delivering it), both overall and
+    per connection via the registered send queues.
     Can be extended with Prometheus or other metrics backends.
     """
 
+    # Number of connections listed in the "slowest_connections" metric
+    SLOWEST_CONNECTIONS = 5
+
     def __init__(self):
         self.total_connections = 0
         self.total_disconnections = 0
@@ -41,6 +48,12 @@ class WebSocketMetrics:
         self.total_send_errors = 0
         self.total_send_timeouts = 0
         self.total_connection_limit_hits = 0
+        self.total_messages_dropped = 0
+        self.total_messages_coalesced = 0
+        self.total_slow_client_disconnects = 0
+        self.total_send_lag = 0.0
+        self.max_send_lag = 0.0
+        self._queues: "weakref.WeakSet[ConnectionSendQueue]" = weakref.WeakSet()
 
     def connection_opened(self):
         """Track a new connection."""
@@ -50,9 +63,11 @@ class WebSocketMetrics:
         """Track a closed connection."""
         self.total_disconnections += 1
 
-    def message_sent(self):
-        """Track a successfully sent message."""
+    def message_sent(self, lag: float = 0.0):
+        """Track a successfully sent message and how long it was queued."""
         self.total_messages_sent += 1
+        self.total_send_lag += lag
+        self.max_send_lag = max(self.max_send_lag, lag)
 
     def message_received(self):
         """Track a received message."""
@@ -70,6 +85,36 @@ class WebSocketMetrics:
         """Track when connection limit is reached."""
         self.total_connection_limit_hits += 1
 
+    def message_dropped(self):
+        """Track an ephemeral event dropped from a full send queue."""
+        self.total_messages_dropped += 1
+
+    def message_coalesced(self):
+        """Track a state update merged into a pending one."""
+        self.total_messages_coalesced += 1
+
+    def slow_client_disconnected(self):
+        """Track a client disconnected for falling too far behind."""
+        self.total_slow_client_disconnects += 1
+
+    def register_queue(self, queue: ConnectionSendQueue):
+        """Include a connection's send queue in the per-connection metrics."""
+        self._queues.add(queue)
+
+    def unregister_queue(self, queue: ConnectionSendQueue):
+        self._queues.discard(queue)
+
+    def get_queue_metrics(self) -> dict:
+        """Per-connection queue depth and lag, summarized."""
+        stats = [queue.stats() for queue in list(self._queues)]
+        stats.sort(key=lambda s: s["lag_seconds"], reverse=True)
+        return {
+            "queued_messages": sum(s["queued"] for s in stats),
+            "max_queue_depth": max((s["queued"] for s in stats), default=0),
+            "max_lag_seconds": stats[0]["lag_seconds"] if stats else 0.0,
+            "slowest_connections": stats[:self.SLOWEST_CONNECTIONS],
+        }
+
     def get_metrics(self) -> dict:
         """Get all metrics as a dictionary."""
         return {
@@ -81,9 +126,17 @@ class WebSocketMetrics:
             "total_send_errors": self.total_send_errors,
             "total_send_timeouts": self.total_send_timeouts,
             "total_connection_limit_hits": self.total_connection_limit_hits,
+            "total_messages_dropped": self.total_messages_dropped,
+            "total_messages_coalesced": self.total_messages_coalesced,
+            "total_slow_client_disconnects": self.total_slow_client_disconnects,
             "error_rate": (
                 self.total_send_errors / max(self.total_messages_sent, 1)
-            ) if self.total_messages_sent > 0 else 0.0
+            ) if self.total_messages_sent > 0 else 0.0,
+            "avg_send_lag_seconds": (
+                self.total_send_lag / self.total_messages_sent
+            ) if self.total_messages_sent > 0 else 0.0,
+            "max_send_lag_seconds": self.max_send_lag,
+            "send_queues": self.get_queue_metrics(),
         }
 
 
@@ -105,6 +158,7 @@ class Connection:
     websocket: WebSocket
     principal: Principal
     subscriptions: Set[str] = field(default_factory=set)
+    send_queue: Optional[ConnectionSendQueue] = None
 
 
 class ConnectionManager:
@@ -116,12 +170,17 @@ class ConnectionManager:
     - Manage channel subscriptions with permission validation
     - Route messages from Redis pub/sub to local connections
     - Handle presence tracking
+
+    Sends never block the caller: each connection has a bounded send
+    queue drained by its own writer task (see ``send_queue``), and clients
+    that fall too far behind are disconnected.
     """
 
     def __init__(self):
         self._connections: Dict[str, List[Connection]] = {}  # user_id -> connections
         self._channel_subscribers: Dict[str, Set[str]] = {}  # channel -> user_ids
         self._running = False
+        self._closing: Set[asyncio.Task] = set()  # slow-client disconnects in progress
 
     async def start(self):
         """Start the connection manager and pub/sub listener."""
@@ -154,10 +213,12 @@ class ConnectionManager:
         # Stop pub/sub listener
         await pubsub.stop()
 
-        # Close all connections with timeout
+        # Stop writers and close all connections with timeout
         close_tasks = []
         for user_id, connections in list(self._connections.items()):
             for conn in connections:
+                if conn.send_queue is not None:
+                    await conn.send_queue.close()
                 close_tasks.append(self._close_connection_safe(conn))
 
         if close_tasks:
@@ -227,6 +288,16 @@ class ConnectionManager:
         await websocket.accept()
 
         connection = Connection(websocket=websocket, principal=principal)
+        connection.send_queue = ConnectionSendQueue(
+            websocket,
+            max_size=settings.WS_SEND_QUEUE_SIZE,
+            send_timeout=settings.WS_SEND_TIMEOUT,
+            max_lag=settings.WS_MAX_SEND_LAG,
+            on_laggard=lambda queue, reason: self._disconnect_slow_client(connection, reason),
+            metrics=ws_metrics,
+            label=f"user={user_id}",
+        )
+        connection.send_queue.start()
 
         if user_id not in self._connections:
             self._connections[user_id] = []
@@ -267,6 +338,10 @@ class ConnectionManager:
         """
         user_id = connection.principal.user_id
 
+        # Stop the writer; undelivered events are discarded
+        if connection.send_queue is not None:
+            await connection.send_queue.close()
+
         # Remove from connections list
         if user_id in self._connections:
             self._connections[user_id] = [
@@ -625,40 +700,48 @@ class ConnectionManager:
 
         return False, "Not a member of this course"
 
-    async def _send_with_timeout(self, conn: Connection, data: dict, user_id: str) -> bool:
+    def _enqueue(self, conn: Connection, data: dict) -> bool:
         """
-        Send data to a connection with timeout.
+        Queue data for a connection's writer task without waiting for the send.
 
         Args:
             conn: Target connection
             data: Data to send
-            user_id: User ID for logging
 
         Returns:
-            True if successful, False otherwise
+            True if the event was queued
         """
-        try:
-            await asyncio.wait_for(
-                conn.websocket.send_json(data),
-                timeout=settings.WS_SEND_TIMEOUT
-            )
-            ws_metrics.message_sent()
-            return True
-        except asyncio.TimeoutError:
-            logger.warning(f"Send timeout to user {user_id}")
-            ws_metrics.send_timeout()
-            return False
-        except Exception as e:
-            logger.error(f"Failed to send to user {user_id}: {e}")
-            ws_metrics.send_error()
+        if conn.send_queue is None:
             return False
+        return conn.send_queue.put(data)
+
+    def _disconnect_slow_client(self, conn: Connection, reason: str):
+        """Close a connection whose send queue fell too far behind.
+
+        Runs in the background; the receive loop then sees the disconnect
+        and calls ``disconnect()``.
+        """
+        async def close():
+            if conn.send_queue is not None:
+                await conn.send_queue.close()
+            try:
+                await asyncio.wait_for(
+                    conn.websocket.close(code=4009, reason="Client too slow"),
+                    timeout=1.0
+                )
+            except Exception:
+                logger.debug("Closing slow WebSocket client failed", exc_info=True)
+
+        task = asyncio.get_running_loop().create_task(close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
 
     async def _handle_pubsub_message(self, channel: str, data: dict):
         """
         Handle incoming message from Redis pub/sub.
 
-        Routes the message to all local connections subscribed to this channel.
-        Uses concurrent sends for better performance.
+        Routes the message to the send queues of all local connections
+        subscribed to this channel.
 
         Args:
             channel: Channel name (without prefix)
@@ -674,37 +757,25 @@ class ConnectionManager:
         user_ids = set(self._channel_subscribers.get(channel, set()))
         logger.debug(f"Forwarding to {len(user_ids)} users on channel {channel}")
 
-        # Collect all send tasks for concurrent execution
-        send_tasks = []
+        queued = 0
+        total = 0
         for user_id in user_ids:
-            connections = list(self._connections.get(user_id, []))
-            for conn in connections:
+            for conn in list(self._connections.get(user_id, [])):
                 if channel in conn.subscriptions:
-                    send_tasks.append(self._send_with_timeout(conn, data, user_id))
-
-        # Execute all sends concurrently
-        if send_tasks:
-            results = await asyncio.gather(*send_tasks, return_exceptions=True)
-            success_count = sum(1 for r in results if r is True)
-            logger.debug(f"Broadcast to channel {channel}: {success_count}/{len(send_tasks)} successful")
+                    total += 1
+                    queued += self._enqueue(conn, data)
+        logger.debug(f"Broadcast to channel {channel}: {queued}/{total} queued")
 
     async def send_to_user(self, user_id: str, event: dict):
         """
         Send an event directly to a specific user (all their connections).
-        Uses concurrent sends for better performance.
 
         Args:
             user_id: Target user ID
             event: Event data to send
         """
-        # Make a copy to avoid modification during iteration
-        connections = list(self._connections.get(user_id, []))
-        if not connections:
-            return
-
-        # Send to all connections concurrently
-        send_tasks = [self._send_with_timeout(conn, event, user_id) for conn in connections]
-        await asyncio.gather(*send_tasks, return_exceptions=True)
+        for conn in list(self._connections.get(user_id, [])):
+            self._enqueue(conn, event)
 
     async def send_to_connection(self, connection: Connection, event: dict):
         """
@@ -714,15 +785,11 @@ class ConnectionManager:
             connection: Target connection
             event: Event data to send
         """
-        try:
-            await connection.websocket.send_json(event)
-        except Exception as e:
-            logger.error(f"Failed to send to connection: {e}")
+        self._enqueue(connection, event)
 
     async def broadcast_to_channel(self, channel: str, event: dict, exclude_user_id: Optional[str] = None):
         """
         Broadcast an event to all local subscribers of a channel.
-        Uses concurrent sends for better performance.
 
         Note: For multi-instance broadcasting, use pubsub.publish() instead.
 
@@ -734,40 +801,32 @@ class ConnectionManager:
         # Make copies to avoid modification during iteration
         user_ids = set(self._channel_subscribers.get(channel, set()))
 
-        # Collect all send tasks for concurrent execution
-        send_tasks = []
         for user_id in user_ids:
             if exclude_user_id and user_id == exclude_user_id:
                 continue
 
-            connections = list(self._connections.get(user_id, []))
-            for conn in connections:
+            for conn in list(self._connections.get(user_id, [])):
                 if channel in conn.subscriptions:
-                    send_tasks.append(self._send_with_timeout(conn, event, user_id))
-
-        # Execute all sends concurrently
-        if send_tasks:
-            await asyncio.gather(*send_tasks, return_exceptions=True)
+                    self._enqueue(conn, event)
 
     async def broadcast_to_all(self, event: dict):
         """
         Broadcast an event to ALL connected users on this instance.
-        Uses concurrent sends for better performance.
 
         Used for system-wide notifications like maintenance mode.
 
         Args:
             event: Event data to send
         """
-        send_tasks = []
+        queued = 0
+        total = 0
         for user_id, connections in list(self._connections.items()):
             for conn in list(connections):
-                send_tasks.append(self._send_with_timeout(conn, event, user_id))
+                total += 1
+                queued += self._enqueue(conn, event)
 
-        if send_tasks:
-            results = await asyncio.gather(*send_tasks, return_exceptions=True)
-            success_count = sum(1 for r in results if r is True)
-            logger.info(f"Broadcast to all: {success_count}/{len(send_tasks)} successful")
+        if total:
+            logger.info(f"Broadcast to all: {queued}/{total} queued")
 
     async def _handle_maintenance_broadcast(self, channel: str, data: dict):
         """Handle maintenance broadcasts from Redis pub/sub."""
@@ -0,0 +1,268 @@
+"""
+Per-connection outbound queues for WebSocket fanout.
+
+Every connection gets a bounded queue drained by its own writer task, so
+broadcasting only enqueues and a slow client can never hold up delivery
+to anyone else. When a queue is full, the event's overflow policy
+decides what happens:
+
+- ``DROP_OLDEST``: ephemeral events (typing/presence). The oldest queued
+  ephemeral event is evicted to make room; if there is none, the new
+  event is dropped.
+- ``COALESCE``: state updates. A pending update for the same entity is
+  replaced in place instead of queueing another one.
+- ``DISCONNECT``: everything else must be delivered in order. If no
+  ephemeral event can be evicted, the client is a chronic laggard and is
+  disconnected (it reconnects and refetches state).
+
+A client is also disconnected when a single send exceeds
+``WS_SEND_TIMEOUT`` or when its oldest undelivered event is older than
+``WS_MAX_SEND_LAG``.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Mapping, Optional, Tuple
+
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(str, Enum):
+    """What to do with an outbound event when a connection falls behind."""
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    DISCONNECT = "disconnect"
+
+
+# Event type -> overflow policy; unlisted types use DISCONNECT
+EVENT_OVERFLOW_POLICIES: Dict[str, OverflowPolicy] = {
+    "typing:update": OverflowPolicy.DROP_OLDEST,
+    "presence:update": OverflowPolicy.DROP_OLDEST,
+    "deployment:status_changed": OverflowPolicy.COALESCE,
+    "read:update": OverflowPolicy.COALESCE,
+}
+
+# Coalesced event type -> fields identifying the entity it updates. Fields
+# are looked up in the event's ``data`` payload first, then at top level
+# (typing and read events use a flat structure).
+COALESCE_KEYS: Dict[str, Tuple[str, ...]] = {
+    "deployment:status_changed": ("deployment_id",),
+    "read:update": ("channel", "message_id", "user_id"),
+}
+
+
+@dataclass
+class _Outbound:
+    event: dict
+    policy: OverflowPolicy
+    key: Optional[tuple]
+    enqueued_at: float
+
+
+def _coalesce_key(event_type: str, event: dict) -> Optional[tuple]:
+    fields = COALESCE_KEYS.get(event_type)
+    if not fields:
+        return None
+    data = event.get("data") if isinstance(event.get("data"), dict) else {}
+    return (event_type,) + tuple(data.get(f, event.get(f)) for f in fields)
+
+
+class ConnectionSendQueue:
+    """Bounded outbound queue of one WebSocket connection with its writer task."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_size: int,
+        send_timeout: float,
+        max_lag: float,
+        on_laggard: Callable[["ConnectionSendQueue", str], None],
+        policies: Optional[Mapping[str, OverflowPolicy]] = None,
+        metrics: Any = None,
+        label: str = "",
+    ):
+        """
+        Args:
+            websocket: Connection to write to
+            max_size: Maximum number of queued events
+            send_timeout: Seconds one send may take before the client is disconnected
+            max_lag: Seconds an event may wait before the client is disconnected
+            on_laggard: Called once (with a reason) when the client must be disconnected
+            policies: Event type -> overflow policy (default ``EVENT_OVERFLOW_POLICIES``)
+            metrics: ``WebSocketMetrics`` to report sends, drops and lag to
+            label: Connection description for logs and metrics (e.g. the user ID)
+        """
+        self.websocket = websocket
+        self.max_size = max_size
+        self.send_timeout = send_timeout
+        self.max_lag = max_lag
+        self.policies = EVENT_OVERFLOW_POLICIES if policies is None else policies
+        self.metrics = metrics
+        self.label = label
+        self._on_laggard = on_laggard
+        self._pending: Deque[_Outbound] = deque()
+        self._coalescable: Dict[tuple, _Outbound] = {}
+        self._inflight_since: Optional[float] = None
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.closed = False
+
+        # Per-connection stats
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.last_lag = 0.0
+        self.max_observed_lag = 0.0
+
+    def start(self) -> None:
+        """Start the writer task (on the running event loop)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"ws-writer:{self.label}")
+            if self.metrics is not None:
+                self.metrics.register_queue(self)
+
+    async def close(self) -> None:
+        """Stop the writer and discard undelivered events."""
+        self.closed = True
+        self._pending.clear()
+        self._coalescable.clear()
+        if self.metrics is not None:
+            self.metrics.unregister_queue(self)
+        task, self._task = self._task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def lag(self, now: Optional[float] = None) -> float:
+        """Seconds the oldest undelivered event has been waiting (0 when idle)."""
+        now = time.monotonic() if now is None else now
+        oldest = self._inflight_since
+        if self._pending and (oldest is None or self._pending[0].enqueued_at < oldest):
+            oldest = self._pending[0].enqueued_at
+        return now - oldest if oldest is not None else 0.0
+
+    def put(self, event: dict) -> bool:
+        """
+        Queue an event for sending; never blocks.
+
+        Returns:
+            True if the event was queued (or merged into a pending one)
+        """
+        if self.closed:
+            return False
+
+        now = time.monotonic()
+        event_type = event.get("type", "")
+        policy = self.policies.get(event_type, OverflowPolicy.DISCONNECT)
+
+        key = _coalesce_key(event_type, event) if policy is OverflowPolicy.COALESCE else None
+        if key is not None and key in self._coalescable:
+            self._coalescable[key].event = event
+            self.coalesced += 1
+            if self.metrics is not None:
+                self.metrics.message_coalesced()
+            return True
+
+        if self.lag(now) > self.max_lag:
+            self._disconnect(f"oldest event waiting {self.lag(now):.1f}s")
+            return False
+
+        if len(self._pending) >= self.max_size and not self._evict_ephemeral():
+            if policy is OverflowPolicy.DROP_OLDEST:
+                self._drop()
+                return False
+            self._disconnect(f"send queue full ({self.max_size} events)")
+            return False
+
+        item = _Outbound(event=event, policy=policy, key=key, enqueued_at=now)
+        self._pending.append(item)
+        if key is not None:
+            self._coalescable[key] = item
+        self._wakeup.set()
+        return True
+
+    def _evict_ephemeral(self) -> bool:
+        for item in self._pending:
+            if item.policy is OverflowPolicy.DROP_OLDEST:
+                self._pending.remove(item)
+                self._drop()
+                return True
+        return False
+
+    def _drop(self) -> None:
+        self.dropped += 1
+        if self.metrics is not None:
+            self.metrics.message_dropped()
+
+    def _disconnect(self, reason: str) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._pending.clear()
+        self._coalescable.clear()
+        logger.warning(f"Disconnecting slow WebSocket client {self.label}: {reason}")
+        if self.metrics is not None:
+            self.metrics.slow_client_disconnected()
+        self._on_laggard(self, reason)
+
+    async def _run(self) -> None:
+        while not self.closed:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            item = self._pending.popleft()
+            if item.key is not None:
+                self._coalescable.pop(item.key, None)
+            self._inflight_since = item.enqueued_at
+            try:
+                await asyncio.wait_for(self.websocket.send_json(item.event), timeout=self.send_timeout)
+            except asyncio.TimeoutError:
+                if self.metrics is not None:
+                    self.metrics.send_timeout()
+                self._disconnect(f"send took longer than {self.send_timeout}s")
+                return
+            except Exception as e:
+                # The socket is gone; the receive loop will clean up
+                logger.error(f"Failed to send to {self.label}: {e}")
+                if self.metrics is not None:
+                    self.metrics.send_error()
+                self.closed = True
+                self._pending.clear()
+                self._coalescable.clear()
+                return
+            finally:
+                self._inflight_since = None
+
+            lag = time.monotonic() - item.enqueued_at
+            self.sent += 1
+            self.last_lag = lag
+            self.max_observed_lag = max(self.max_observed_lag, lag)
+            if self.metrics is not None:
+                self.metrics.message_sent(lag)
+
+    def stats(self) -> dict:
+        """Per-connection lag and queue stats."""
+        return {
+            "connection": self.label,
+            "queued": len(self._pending),
+            "lag_seconds": round(self.lag(), 3),
+            "last_send_lag_seconds": round(self.last_lag, 3),
+            "max_send_lag_seconds": round(self.max_observed_lag, 3),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
@@ -42,6 +42,27 @@ def confirm_deletion(entity_type: str, entity_id: str, counts: dict, force: bool
     )
 
 
+def print_deletion_result(entity_label: str, entity_id: str, result: dict) -> None:
+    """Print the outcome of an inline or background deletion."""
+    workflow_id = result.get("workflow_id")
+    if workflow_id:
+        click.echo(f"\n{click.style('STARTED', fg='green', bold=True)} - Deleting {entity_label} {entity_id} in the background")
+        click.echo(f"\nEntities to delete:")
+        click.echo(format_counts(result.get("deleted_counts", {})))
+        click.echo(f"\nWorkflow ID: {workflow_id}")
+        click.echo(f"Progress: GET /tasks/{workflow_id}/status")
+    else:
+        click.echo(f"\n{click.style('SUCCESS', fg='green', bold=True)} - Deleted {entity_label} {entity_id}")
+        click.echo(f"\nDeleted entities:")
+        click.echo(format_counts(result.get("deleted_counts", {})))
+        click.echo(f"\nMinIO objects deleted: {result.get('minio_objects_deleted', 0)}")
+
+    if result.get("errors"):
+        click.echo(f"\n{click.style('Warnings:', fg='yellow')}")
+        for error in result["errors"]:
+            click.echo(f"  - {error}")
+
+
 @click.group()
 def delete():
     """Delete commands for organizations, courses, and examples."""
@@ -102,15 +123,7 @@ def delete_organization(organization_id: str, dry_run: bool, force: bool, auth:
     response.raise_for_status()
     result = response.json()
 
-    click.echo(f"\n{click.style('SUCCESS', fg='green', bold=True)} - Deleted organization {organization_id}")
-    click.echo(f"\nDeleted entities:")
-    click.echo(format_counts(result.get("deleted_counts", {})))
-    click.echo(f"\nMinIO objects deleted: {result.get('minio_objects_deleted', 0)}")
-
-    if result.get("errors"):
-        click.echo(f"\n{click.style('Warnings:', fg='yellow')}")
-        for error in result["errors"]:
-            click.echo(f"  - {error}")
+    print_deletion_result("organization", organization_id, result)
 
 
 @delete.command("course-family")
@@ -161,15 +174,7 @@ def delete_course_family(course_family_id: str, dry_run: bool, force: bool, auth
     response.raise_for_status()
     result = response.json()
 
-    click.echo(f"\n{click.style('SUCCESS', fg='green', bold=True)} - Deleted course family {course_family_id}")
-    click.echo(f"\nDeleted entities:")
-    click.echo(format_counts(result.get("deleted_counts", {})))
-    click.echo(f"\nMinIO objects deleted: {result.get('minio_objects_deleted', 0)}")
-
-    if result.get("errors"):
-        click.echo(f"\n{click.style('Warnings:', fg='yellow')}")
-        for error in result["errors"]:
-            click.echo(f"  - {error}")
+    print_deletion_result("course family", course_family_id, result)
 
 
 @delete.command("course")
@@ -221,15 +226,7 @@ def delete_course(course_id: str, dry_run: bool, force: bool, auth: CLIAuthConfi
     response.raise_for_status()
     result = response.json()
 
-    click.echo(f"\n{click.style('SUCCESS', fg='green', bold=True)} - Deleted course {course_id}")
-    click.echo(f"\nDeleted entities:")
-    click.echo(format_counts(result.get("deleted_counts", {})))
-    click.echo(f"\nMinIO objects deleted: {result.get('minio_objects_deleted', 0)}")
-
-    if result.get("errors"):
-        click.echo(f"\n{click.style('Warnings:', fg='yellow')}")
-        for error in result["errors"]:
-            click.echo(f"  - {error}")
+    print_deletion_result("course", course_id, result)
 
 
 @delete.command("examples")
@@ -8,12 +8,14 @@ including generating example configurations and deploying hierarchies.
 import sys
 import io
 import os
-import base64
+import asyncio
+import hashlib
+import tempfile
 import zipfile
 import yaml
 import click
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, BinaryIO, Callable
 
 from computor_types.deployments_refactored import (
     ComputorDeploymentConfig,
@@ -56,12 +58,20 @@ from computor_types.course_contents import CourseContentCreate, CourseContentQue
 from computor_types.course_content_types import CourseContentTypeQuery, CourseContentTypeCreate
 from computor_types.course_content_kind import CourseContentKindQuery
 from computor_utils.vsix_utils import parse_vsix_metadata
+from computor_utils.example_hash import compute_example_content_hash_from_digests
 from computor_types.exceptions import VsixManifestError
 # Deployment is handled through course-contents API, not a separate deployment endpoint
 
 from computor_cli.utils import run_async
 
 
+# Default number of concurrent API operations while applying a deployment
+APPLY_CONCURRENCY = 8
+
+# Read size when hashing example files
+EXAMPLE_READ_CHUNK_SIZE = 1024 * 1024
+
+
 class SyncHTTPWrapper:
     """Wrapper to make sync HTTP calls using ComputorClient's httpx client configuration."""
 
@@ -132,6 +142,87 @@ class SyncHTTPWrapper:
             self._client.close()
 
 
+class _AsyncMemo:
+    """Single-flight cache for lookups shared by concurrent apply tasks.
+
+    The first caller for a key runs the lookup; concurrent and later
+    callers await the same result (or exception). This also keeps
+    find-or-create lookups from creating duplicates when run in parallel.
+    """
+
+    def __init__(self):
+        self._futures: dict = {}
+
+    async def get(self, key, factory: Callable[[], Awaitable[Any]]) -> Any:
+        if key not in self._futures:
+            self._futures[key] = asyncio.ensure_future(factory())
+        return await self._futures[key]
+
+
+async def _run_dag(
+    nodes: dict[str, tuple[set[str], Callable[[], Awaitable[Any]]]],
+    max_concurrency: int,
+) -> dict[str, Any]:
+    """Run operations concurrently along their dependency graph.
+
+    Args:
+        nodes: ``key -> (dependencies, coroutine factory)`` in topological
+            order; dependencies must be keys that appear earlier
+        max_concurrency: Maximum number of operations running at once
+
+    Returns:
+        ``key -> result`` where failed operations map to their exception.
+        An operation whose dependency failed is not run and fails too.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    tasks: dict[str, asyncio.Future] = {}
+
+    async def run(deps: set[str], factory: Callable[[], Awaitable[Any]]) -> Any:
+        for dep in deps:
+            try:
+                await tasks[dep]
+            except Exception as e:
+                raise RuntimeError(f"dependency '{dep}' failed") from e
+        async with semaphore:
+            return await factory()
+
+    for key, (deps, factory) in nodes.items():
+        tasks[key] = asyncio.ensure_future(run(deps, factory))
+
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    return dict(zip(tasks, results))
+
+
+async def _list_all(client, path: str, params: dict, page_size: int = 100) -> list[dict]:
+    """Fetch every item of a list endpoint as raw dicts.
+
+    Follows ``X-Next-Cursor`` (keyset pagination) and falls back to
+    ``skip``/``limit`` for endpoints that do not send it.
+    """
+    items: list[dict] = []
+    after, skip = "", 0
+    while True:
+        query = {**params, "limit": page_size}
+        if after is not None:
+            query["after"] = after
+        else:
+            query["skip"] = skip
+        response = await client._http.get(path, params=query)
+        page = response.json()
+        items.extend(page)
+        skip += len(page)
+
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is not None:
+            if not cursor:
+                return items
+            after = cursor
+        elif len(page) < page_size:
+            return items
+        else:
+            after = None
+
+
 @click.group()
 def deployment():
     """Manage deployment configurations and operations."""
@@ -224,10 +315,28 @@ def init(output: str, format: str):
     click.echo(f"3. Run: ctutor deployment apply {output_path}")
 
 
-def _deploy_users(config: ComputorDeploymentConfig, auth: CLIAuthConfig):
-    """Deploy users and their course memberships from configuration."""
+def _deploy_users(config: ComputorDeploymentConfig, auth: CLIAuthConfig, max_concurrency: int = APPLY_CONCURRENCY):
+    """Deploy users and their course memberships from configuration.
+
+    Users are processed concurrently (at most ``max_concurrency`` at a
+    time). Organization/family/course, role and course group lookups are
+    shared between users, so each is resolved once per run.
+    """
 
     client = run_async(get_computor_client(auth))
+    processed_users, failed_users = run_async(_deploy_users_async(config, client, max_concurrency))
+
+    # Summary
+    click.echo(f"\n📊 User Deployment Summary:")
+    click.echo(f"  ✅ Successfully processed: {len(processed_users)} users")
+    if failed_users:
+        click.echo(f"  ❌ Failed: {len(failed_users)} users")
+        for user_dep in failed_users:
+            click.echo(f"    - {user_dep.display_name}")
+
+
+async def _deploy_users_async(config: ComputorDeploymentConfig, client, max_concurrency: int) -> tuple[list, list]:
+    """Create/update all configured users concurrently; returns (processed, failed)."""
 
     # Get API clients
     user_client = client.users  # Note: users (plural) for CRUD, user (singular) for current user
@@ -237,245 +346,243 @@ def _deploy_users(config: ComputorDeploymentConfig, auth: CLIAuthConfig):
     course_group_client = client.course_groups
     org_client = client.organizations
     family_client = client.course_families
+    role_client = client.roles
+    # user_roles methods are on client.user, not a separate client
+    user_client_current = client.user
+
+    lookups = _AsyncMemo()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def find_first(key, client_, query):
+        results = await lookups.get(key, lambda: client_.list(query))
+        return results[0] if results else None
+
+    async def resolve_course(cm_dep, log: list):
+        """Resolve a membership's course by path or ID (None if not found)."""
+        if cm_dep.is_path_based:
+            org = await find_first(("org", cm_dep.organization), org_client, OrganizationQuery(path=cm_dep.organization))
+            if not org:
+                log.append(f"  ⚠️  Organization not found: {cm_dep.organization}")
+                return None
+
+            family = await find_first(
+                ("family", str(org.id), cm_dep.course_family),
+                family_client,
+                CourseFamilyQuery(organization_id=str(org.id), path=cm_dep.course_family),
+            )
+            if not family:
+                log.append(f"  ⚠️  Course family not found: {cm_dep.course_family}")
+                return None
+
+            course = await find_first(
+                ("course", str(family.id), cm_dep.course),
+                course_client,
+                CourseQuery(course_family_id=str(family.id), path=cm_dep.course),
+            )
+            if not course:
+                log.append(f"  ⚠️  Course not found: {cm_dep.course}")
+            return course
+
+        if cm_dep.is_id_based:
+            # Direct course lookup by ID
+            course = await lookups.get(("course_id", cm_dep.id), lambda: course_client.get(cm_dep.id))
+            if not course:
+                log.append(f"  ⚠️  Course not found: {cm_dep.id}")
+            return course
+        return None
+
+    async def ensure_course_group(course, title: str) -> str:
+        """Find or create a course group and return its ID."""
+        groups = await course_group_client.list(CourseGroupQuery(course_id=str(course.id), title=title))
+        if groups:
+            return str(groups[0].id)
+        group_create = CourseGroupCreate(
+            title=title,
+            description=f"Course group {title}",
+            course_id=str(course.id)
+        )
+        new_group = await course_group_client.create(group_create)
+        click.echo(f"  ✅ Created course group: {title} ({course.path})")
+        return str(new_group.id)
+
+    async def set_password(user_dep) -> None:
+        # Use direct HTTP call since client doesn't have this method
+        await client._http.post(
+            "user/password",
+            json_data={"username": user_dep.username, "password": user_dep.password},
+        )
 
-    processed_users = []
-    failed_users = []
-
-    for user_deployment in config.users:
+    async def deploy_user(user_deployment, log: list) -> None:
         user_dep = user_deployment.user
-        click.echo(f"\n👤 Processing: {user_dep.display_name} ({user_dep.username})")
 
-        try:
-            # Check if user already exists by email or username
-            existing_users = []
-            if user_dep.email:
-                existing_users.extend(run_async(user_client.list(UserQuery(email=user_dep.email))))
-
-            # Also check by username if not found by email
-            if not existing_users and user_dep.username:
-                existing_users.extend(run_async(user_client.list(UserQuery(username=user_dep.username))))
-            
-            if existing_users:
-                user = existing_users[0]
-                click.echo(f"  ℹ️  User already exists: {user.display_name}")
+        # Check if user already exists by email or username
+        existing_users = []
+        if user_dep.email:
+            existing_users.extend(await user_client.list(UserQuery(email=user_dep.email)))
+
+        # Also check by username if not found by email
+        if not existing_users and user_dep.username:
+            existing_users.extend(await user_client.list(UserQuery(username=user_dep.username)))
+
+        if existing_users:
+            user = existing_users[0]
+            log.append(f"  ℹ️  User already exists: {user.display_name}")
+        else:
+            # Create new user
+            user_create = UserCreate(
+                given_name=user_dep.given_name,
+                family_name=user_dep.family_name,
+                email=user_dep.email,
+                number=user_dep.number,
+                username=user_dep.username,
+                user_type=user_dep.user_type,
+                properties=user_dep.properties
+            )
+
+            user = await user_client.create(user_create)
+            log.append(f"  ✅ Created user: {user.display_name}")
+
+        # Assign system roles if provided
+        for role_id in user_dep.roles or []:
+            try:
+                # Check if role exists
+                roles = await lookups.get(("role", role_id), lambda: role_client.list(RoleQuery(id=role_id)))
+                if not roles:
+                    log.append(f"  ⚠️  Role not found: {role_id}")
+                    continue
+
+                # Check if user already has this role
+                # Use kwargs to pass query params since user_roles() uses **kwargs
+                existing_user_roles = await user_client_current.user_roles(
+                    user_id=str(user.id),
+                    role_id=role_id
+                )
+
+                if existing_user_roles:
+                    log.append(f"  ℹ️  User already has role: {role_id}")
+                else:
+                    # Assign role to user
+                    user_role_create = UserRoleCreate(
+                        user_id=str(user.id),
+                        role_id=role_id
+                    )
+                    await user_client_current.post_user_roles(user_role_create)
+                    log.append(f"  ✅ Assigned role: {role_id}")
+            except Exception as e:
+                log.append(f"  ⚠️  Failed to assign role {role_id}: {e}")
+
+        # Set password if provided
+        if user_dep.password:
+            try:
+                await set_password(user_dep)
+                log.append(f"  ✅ Set password for user: {user.display_name}")
+            except Exception as e:
+                log.append(f"  ⚠️  Failed to set password: {e}")
+
+        # Create accounts
+        for account_dep in user_deployment.accounts:
+            # Check if account already exists for this user
+            existing_accounts = await account_client.list(AccountQuery(
+                provider_account_id=account_dep.provider_account_id,
+                user_id=str(user.id)
+            ))
+
+            if existing_accounts:
+                log.append(f"  Account already exists: {account_dep.type} @ {account_dep.provider}")
             else:
-                # Create new user
-                user_create = UserCreate(
-                    given_name=user_dep.given_name,
-                    family_name=user_dep.family_name,
-                    email=user_dep.email,
-                    number=user_dep.number,
-                    username=user_dep.username,
-                    user_type=user_dep.user_type,
-                    properties=user_dep.properties
+                # Create new account
+                account_create = AccountCreate(
+                    provider=account_dep.provider,
+                    type=account_dep.type,
+                    provider_account_id=account_dep.provider_account_id,
+                    user_id=str(user.id),
+                    properties=account_dep.properties or {}
                 )
-                
-                user = run_async(user_client.create(user_create))
-                click.echo(f"  ✅ Created user: {user.display_name}")
-                
-            # Assign system roles if provided
-            if user_dep.roles:
-                role_client = client.roles
-                # user_roles methods are on client.user, not a separate client
-                user_client_current = client.user
 
-                for role_id in user_dep.roles:
-                    try:
-                        # Check if role exists
-                        roles = run_async(role_client.list(RoleQuery(id=role_id)))
-                        if not roles:
-                            click.echo(f"  ⚠️  Role not found: {role_id}")
-                            continue
-
-                        # Check if user already has this role
-                        # Use kwargs to pass query params since user_roles() uses **kwargs
-                        existing_user_roles = run_async(user_client_current.user_roles(
-                            user_id=str(user.id),
-                            role_id=role_id
-                        ))
+                await account_client.create(account_create)
+                log.append(f"  ✅ Created account: {account_dep.type} @ {account_dep.provider}")
 
-                        if existing_user_roles:
-                            click.echo(f"  ℹ️  User already has role: {role_id}")
-                        else:
-                            # Assign role to user
-                            user_role_create = UserRoleCreate(
-                                user_id=str(user.id),
-                                role_id=role_id
-                            )
-                            run_async(user_client_current.post_user_roles(user_role_create))
-                            click.echo(f"  ✅ Assigned role: {role_id}")
+        # Create course memberships
+        for cm_dep in user_deployment.course_members:
+            try:
+                course = await resolve_course(cm_dep, log)
+                if not course:
+                    continue
+
+                # Handle course group for students
+                course_group_id = None
+                if cm_dep.role == "_student" and cm_dep.group:
+                    # Shared across users so concurrent tasks create each group only once
+                    try:
+                        course_group_id = await lookups.get(
+                            ("group", str(course.id), cm_dep.group),
+                            lambda: ensure_course_group(course, cm_dep.group),
+                        )
+                        log.append(f"  Using group: {cm_dep.group}")
                     except Exception as e:
-                        click.echo(f"  ⚠️  Failed to assign role {role_id}: {e}")
-                
-            # Set password if provided
-            if user_dep.password:
-                try:
-                    import httpx
-                    password_payload = {
-                        "username": user_dep.username,
-                        "password": user_dep.password
-                    }
-                    # Use direct HTTP call since client doesn't have this method
-                    # Build headers with auth token
-                    headers = dict(client._http._default_headers)
-                    headers["Content-Type"] = "application/json"
-                    if client._auth_provider.is_authenticated():
-                        token = client._auth_provider._access_token
-                        if token:
-                            headers["Authorization"] = f"Bearer {token}"
-                    with httpx.Client(base_url=client._http.base_url, headers=headers) as sync_client:
-                        response = sync_client.post("user/password", json=password_payload)
-                        response.raise_for_status()
-                    click.echo(f"  ✅ Set password for user: {user.display_name}")
-                except Exception as e:
-                    click.echo(f"  ⚠️  Failed to set password: {e}")
-            
-            # Create accounts
-            for account_dep in user_deployment.accounts:
-                # Check if account already exists for this user
-                existing_accounts = run_async(account_client.list(AccountQuery(
-                    provider_account_id=account_dep.provider_account_id,
-                    user_id=str(user.id)
-                )))
-                
-                if existing_accounts:
-                    click.echo(f"  Account already exists: {account_dep.type} @ {account_dep.provider}")
+                        log.append(f"  ⚠️  Failed to create course group {cm_dep.group}: {e}")
+                        continue
+
+                # Check if course member already exists
+                existing_members = await course_member_client.list(CourseMemberQuery(
+                    user_id=str(user.id),
+                    course_id=str(course.id)
+                ))
+
+                if existing_members:
+                    existing_member = existing_members[0]
+                    # Check if we need to update role or group
+                    needs_update = False
+                    if existing_member.course_role_id != cm_dep.role:
+                        log.append(f"  Updating role from {existing_member.course_role_id} to {cm_dep.role}")
+                        needs_update = True
+                    if course_group_id and existing_member.course_group_id != course_group_id:
+                        log.append(f"  Updating group assignment")
+                        needs_update = True
+
+                    if needs_update:
+                        # Update existing member
+                        member_update = {
+                            'course_role_id': cm_dep.role,
+                            'course_group_id': course_group_id
+                        }
+                        await course_member_client.update(str(existing_member.id), member_update)
+                        log.append(f"  ✅ Updated course membership: {course.path} as {cm_dep.role}")
+                    else:
+                        log.append(f"  Already member of course: {course.path} as {cm_dep.role}")
                 else:
-                    # Create new account
-                    account_create = AccountCreate(
-                        provider=account_dep.provider,
-                        type=account_dep.type,
-                        provider_account_id=account_dep.provider_account_id,
+                    # Create new course member
+                    member_create = CourseMemberCreate(
                         user_id=str(user.id),
-                        properties=account_dep.properties or {}
+                        course_id=str(course.id),
+                        course_role_id=cm_dep.role,
+                        course_group_id=course_group_id
                     )
-                    
-                    run_async(account_client.create(account_create))
-                    click.echo(f"  ✅ Created account: {account_dep.type} @ {account_dep.provider}")
-            
-            # Create course memberships
-            for cm_dep in user_deployment.course_members:
-                try:
-                    course = None
-                    
-                    # Resolve course by path or ID
-                    if cm_dep.is_path_based:
-                        # Find organization
-                        orgs = run_async(org_client.list(OrganizationQuery(path=cm_dep.organization)))
-                        if not orgs:
-                            click.echo(f"  ⚠️  Organization not found: {cm_dep.organization}")
-                            continue
-                        org = orgs[0]
-                        
-                        # Find course family
-                        families = run_async(family_client.list(CourseFamilyQuery(
-                            organization_id=str(org.id),
-                            path=cm_dep.course_family
-                        )))
-                        if not families:
-                            click.echo(f"  ⚠️  Course family not found: {cm_dep.course_family}")
-                            continue
-                        family = families[0]
-                        
-                        # Find course
-                        courses = run_async(course_client.list(CourseQuery(
-                            course_family_id=str(family.id),
-                            path=cm_dep.course
-                        )))
-                        if not courses:
-                            click.echo(f"  ⚠️  Course not found: {cm_dep.course}")
-                            continue
-                        course = courses[0]
-                    
-                    elif cm_dep.is_id_based:
-                        # Direct course lookup by ID
-                        course = run_async(course_client.get(cm_dep.id))
-                        if not course:
-                            click.echo(f"  ⚠️  Course not found: {cm_dep.id}")
-                            continue
-                    
-                    if course:
-                        # Handle course group for students
-                        course_group_id = None
-                        if cm_dep.role == "_student" and cm_dep.group:
-                            # Find or create course group
-                            groups = run_async(course_group_client.list(CourseGroupQuery(
-                                course_id=str(course.id),
-                                title=cm_dep.group
-                            )))
-                            if groups:
-                                course_group_id = str(groups[0].id)
-                                click.echo(f"  Using existing group: {cm_dep.group}")
-                            else:
-                                # Create the course group
-                                try:
-                                    group_create = CourseGroupCreate(
-                                        title=cm_dep.group,
-                                        description=f"Course group {cm_dep.group}",
-                                        course_id=str(course.id)
-                                    )
-                                    new_group = run_async(course_group_client.create(group_create))
-                                    course_group_id = str(new_group.id)
-                                    click.echo(f"  ✅ Created course group: {cm_dep.group}")
-                                except Exception as e:
-                                    click.echo(f"  ⚠️  Failed to create course group {cm_dep.group}: {e}")
-                                    continue
-                        
-                        # Check if course member already exists
-                        existing_members = run_async(course_member_client.list(CourseMemberQuery(
-                            user_id=str(user.id),
-                            course_id=str(course.id)
-                        )))
-                        
-                        if existing_members:
-                            existing_member = existing_members[0]
-                            # Check if we need to update role or group
-                            needs_update = False
-                            if existing_member.course_role_id != cm_dep.role:
-                                click.echo(f"  Updating role from {existing_member.course_role_id} to {cm_dep.role}")
-                                needs_update = True
-                            if course_group_id and existing_member.course_group_id != course_group_id:
-                                click.echo(f"  Updating group assignment")
-                                needs_update = True
-                            
-                            if needs_update:
-                                # Update existing member
-                                member_update = {
-                                    'course_role_id': cm_dep.role,
-                                    'course_group_id': course_group_id
-                                }
-                                run_async(course_member_client.update(str(existing_member.id), member_update))
-                                click.echo(f"  ✅ Updated course membership: {course.path} as {cm_dep.role}")
-                            else:
-                                click.echo(f"  Already member of course: {course.path} as {cm_dep.role}")
-                        else:
-                            # Create new course member
-                            member_create = CourseMemberCreate(
-                                user_id=str(user.id),
-                                course_id=str(course.id),
-                                course_role_id=cm_dep.role,
-                                course_group_id=course_group_id
-                            )
-                            
-                            run_async(course_member_client.create(member_create))
-                            click.echo(f"  ✅ Added to course: {course.path} as {cm_dep.role}")
-                        
-                except Exception as e:
-                    click.echo(f"  ⚠️  Failed to add course membership: {e}")
-            
-            processed_users.append(user_dep)
-            
-        except Exception as e:
-            click.echo(f"  ❌ Failed to process user: {e}")
-            failed_users.append(user_dep)
-    
-    # Summary
-    click.echo(f"\n📊 User Deployment Summary:")
-    click.echo(f"  ✅ Successfully processed: {len(processed_users)} users")
-    if failed_users:
-        click.echo(f"  ❌ Failed: {len(failed_users)} users")
-        for user_dep in failed_users:
-            click.echo(f"    - {user_dep.display_name}")
+
+                    await course_member_client.create(member_create)
+                    log.append(f"  ✅ Added to course: {course.path} as {cm_dep.role}")
+
+            except Exception as e:
+                log.append(f"  ⚠️  Failed to add course membership: {e}")
+
+    processed_users = []
+    failed_users = []
+
+    async def process(user_deployment) -> None:
+        user_dep = user_deployment.user
+        # Buffer output so concurrently processed users don't interleave
+        log = [f"\n👤 Processing: {user_dep.display_name} ({user_dep.username})"]
+        async with semaphore:
+            try:
+                await deploy_user(user_deployment, log)
+                processed_users.append(user_dep)
+            except Exception as e:
+                log.append(f"  ❌ Failed to process user: {e}")
+                failed_users.append(user_dep)
+        click.echo("\n".join(log))
+
+    await asyncio.gather(*(process(user_deployment) for user_deployment in config.users))
+    return processed_users, failed_users
 
 
 def _deploy_services(config: ComputorDeploymentConfig, auth: CLIAuthConfig) -> dict:
@@ -1556,41 +1663,57 @@ def _ensure_example_repository(repo_name: str, auth: CLIAuthConfig):
     return run_async(_find_or_create_repo())
 
 
-def _create_zip_bytes_from_directory(directory_path: Path) -> bytes:
-    """Create a zip archive from a directory; ensure meta.yaml exists.
+def _collect_example_files(directory_path: Path) -> dict[str, Path | bytes]:
+    """Map the files of an example directory, as they will be uploaded, to their paths.
 
-    - Skips hidden files/dirs (starting with '.')
-    - If meta.yaml is missing, generates a minimal one
+    - Skips hidden files/dirs (starting with '.') and '*.meta.yaml' files,
+      which the upload endpoint would drop anyway
+    - If meta.yaml is missing, generates a minimal one (held as bytes)
     """
-    # Determine if meta.yaml exists
-    meta_path = directory_path / "meta.yaml"
-    needs_meta = not meta_path.is_file()
-
-    # Prepare in-memory zip
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", compression=zipfile.ZIP_DEFLATED) as zipf:
-        # Add all non-hidden files recursively
-        for file_path in directory_path.rglob("*"):
-            rel = file_path.relative_to(directory_path)
-            # Skip hidden files/dirs
-            parts = rel.parts
-            if any(part.startswith(".") for part in parts):
-                continue
-            if file_path.is_file():
-                zipf.write(file_path, arcname=str(rel))
-
-        # Inject minimal meta.yaml if missing
-        if needs_meta:
-            minimal_meta = (
-                "title: "
-                + directory_path.name.replace('-', ' ').replace('_', ' ').title()
-                + "\n"
-                + f"description: Example from {directory_path.name}\n"
-                + "language: en\n"
-            )
-            zipf.writestr("meta.yaml", minimal_meta)
-
-    return zip_buffer.getvalue()
+    files: dict[str, Path | bytes] = {}
+    for file_path in sorted(directory_path.rglob("*")):
+        rel = file_path.relative_to(directory_path)
+        # Skip hidden files/dirs
+        if any(part.startswith(".") for part in rel.parts) or rel.name.endswith(".meta.yaml"):
+            continue
+        if file_path.is_file():
+            files[rel.as_posix()] = file_path
+
+    # Inject minimal meta.yaml if missing
+    if "meta.yaml" not in files:
+        files["meta.yaml"] = (
+            "title: "
+            + directory_path.name.replace('-', ' ').replace('_', ' ').title()
+            + "\n"
+            + f"description: Example from {directory_path.name}\n"
+            + "language: en\n"
+        ).encode("utf-8")
+    return files
+
+
+def _example_content_hash(files: dict[str, Path | bytes]) -> str:
+    """Content hash of collected example files, reading each file in chunks."""
+    digests: dict[str, bytes] = {}
+    for name, source in files.items():
+        if isinstance(source, bytes):
+            digests[name] = hashlib.sha256(source).digest()
+            continue
+        digest = hashlib.sha256()
+        with source.open("rb") as fp:
+            while chunk := fp.read(EXAMPLE_READ_CHUNK_SIZE):
+                digest.update(chunk)
+        digests[name] = digest.digest()
+    return compute_example_content_hash_from_digests(digests)
+
+
+def _write_example_archive(files: dict[str, Path | bytes], fileobj: BinaryIO) -> None:
+    """Write collected example files as a zip archive to ``fileobj``."""
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as zipf:
+        for name, source in files.items():
+            if isinstance(source, bytes):
+                zipf.writestr(name, source)
+            else:
+                zipf.write(source, name)
 
 
 def _read_meta_and_dependencies(example_dir: Path) -> tuple[str, list[str]]:
@@ -1771,14 +1894,22 @@ def _upload_extensions_from_config(entries: list, config_dir: Path, auth: CLIAut
         click.echo(f"  ✅ Uploaded version {uploaded_version} (sha256 {sha256})")
 
 
-def _upload_examples_from_directory(examples_dir: Path, repo_name: str, auth: CLIAuthConfig, client):
-    """Upload each subdirectory in examples_dir as a zipped example to the API.
+def _upload_examples_from_directory(
+    examples_dir: Path,
+    repo_name: str,
+    auth: CLIAuthConfig,
+    client,
+    max_concurrency: int = APPLY_CONCURRENCY,
+):
+    """Upload each changed subdirectory in examples_dir as a zipped example to the API.
 
-    The upload order is topologically sorted by dependencies found in meta.yaml.
+    The repository's examples and their latest version hashes are fetched
+    up front; examples whose content hash matches are skipped. Changed
+    examples are uploaded concurrently, each after its changed
+    dependencies (testDependencies in meta.yaml).
     """
 
     client = run_async(get_computor_client(auth))
-    custom_client = SyncHTTPWrapper(client)
 
     if not examples_dir.exists() or not examples_dir.is_dir():
         click.echo(f"⚠️  Examples directory not found or not a directory: {examples_dir}")
@@ -1797,31 +1928,75 @@ def _upload_examples_from_directory(examples_dir: Path, repo_name: str, auth: CL
     # Sort by dependencies so prerequisites upload first
     ordered_subdirs = _toposort_by_dependencies(subdirs)
 
-    click.echo(f"\n📦 Uploading {len(ordered_subdirs)} example(s) from '{examples_dir}' to repository '{repo_name}'...")
-
-    uploaded = 0
-    failed = 0
-    for subdir in ordered_subdirs:
-        try:
-            # Create zip bytes (ensure meta.yaml is included)
-            zip_bytes = _create_zip_bytes_from_directory(subdir)
-            b64_zip = base64.b64encode(zip_bytes).decode("ascii")
-
-            payload = {
-                "repository_id": repo_id,
-                "directory": subdir.name,
-                "files": {f"{subdir.name}.zip": b64_zip},
-            }
+    # Plan: compare local content hashes with the latest stored versions
+    local_files = {subdir.name: _collect_example_files(subdir) for subdir in ordered_subdirs}
+    stored_hashes = run_async(_fetch_example_hashes(client, repo_id, max_concurrency))
+    changed = [
+        subdir for subdir in ordered_subdirs
+        if stored_hashes.get(subdir.name) != _example_content_hash(local_files[subdir.name])
+    ]
+    unchanged = len(ordered_subdirs) - len(changed)
+
+    click.echo(
+        f"\n📦 Examples in '{examples_dir}' → repository '{repo_name}': "
+        f"{len(changed)} to upload, {unchanged} unchanged"
+    )
+    if not changed:
+        return
 
-            # Upload
-            custom_client.create("examples/upload", payload)
+    # Dependencies on examples that are uploaded in this run; only edges to
+    # earlier entries of the topological order are kept, so cycles cannot deadlock
+    slug_by_dir = {subdir.name: _read_meta_and_dependencies(subdir)[0] for subdir in changed}
+    position = {subdir.name: i for i, subdir in enumerate(changed)}
+    dir_by_slug = {slug: name for name, slug in slug_by_dir.items()}
+
+    def upload_node(subdir: Path):
+        async def upload():
+            # Spool the archive to disk and stream it as a multipart upload
+            with tempfile.TemporaryFile() as archive:
+                await asyncio.to_thread(_write_example_archive, local_files[subdir.name], archive)
+                archive.seek(0)
+                await client.examples.upload_archive(
+                    repo_id, subdir.name, archive, filename=f"{subdir.name}.zip"
+                )
             click.echo(f"  ✅ Uploaded example: {subdir.name}")
-            uploaded += 1
-        except Exception as e:
-            click.echo(f"  ❌ Failed to upload {subdir.name}: {e}")
+        return upload
+
+    nodes = {}
+    for subdir in changed:
+        _, deps = _read_meta_and_dependencies(subdir)
+        dep_dirs = {
+            dir_by_slug[dep] for dep in deps
+            if dep in dir_by_slug and position[dir_by_slug[dep]] < position[subdir.name]
+        }
+        nodes[subdir.name] = (dep_dirs, upload_node(subdir))
+
+    results = run_async(_run_dag(nodes, max_concurrency))
+
+    failed = 0
+    for name, result in results.items():
+        if isinstance(result, Exception):
+            click.echo(f"  ❌ Failed to upload {name}: {result}")
             failed += 1
 
-    click.echo(f"📊 Example upload summary — success: {uploaded}, failed: {failed}, total: {len(subdirs)}")
+    click.echo(
+        f"📊 Example upload summary — uploaded: {len(changed) - failed}, unchanged: {unchanged}, "
+        f"failed: {failed}, total: {len(subdirs)}"
+    )
+
+
+async def _fetch_example_hashes(client, repo_id: str, max_concurrency: int) -> dict[str, str | None]:
+    """Return ``directory -> content hash of the latest version`` for a repository."""
+    examples = await _list_all(client, "/examples", {"repository_id": repo_id})
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def latest_hash(example: dict) -> str | None:
+        async with semaphore:
+            versions = await client.examples.get_versions(example["id"], version_tag="latest")
+        return versions[0].content_hash if versions else None
+
+    hashes = await asyncio.gather(*(latest_hash(example) for example in examples))
+    return {example["directory"]: content_hash for example, content_hash in zip(examples, hashes)}
 
 
 @deployment.command()
@@ -1837,8 +2012,15 @@ def _upload_examples_from_directory(examples_dir: Path, repo_name: str, auth: CL
     default=True,
     help='Wait for deployment to complete'
 )
+@click.option(
+    '--concurrency',
+    type=click.IntRange(min=1),
+    default=APPLY_CONCURRENCY,
+    show_default=True,
+    help='Maximum number of concurrent API operations (users, example uploads)'
+)
 @authenticate
-def apply(config_file: str, dry_run: bool, wait: bool, auth: CLIAuthConfig):
+def apply(config_file: str, dry_run: bool, wait: bool, concurrency: int, auth: CLIAuthConfig):
     """
     Apply a deployment configuration to create the hierarchy.
     
@@ -1935,7 +2117,9 @@ def apply(config_file: str, dry_run: bool, wait: bool, auth: CLIAuthConfig):
         rel_path = Path(config.examples_upload.path)
         resolved_path = rel_path if rel_path.is_absolute() else (cfg_dir / rel_path).resolve()
         click.echo(f"\n🔼 Preparing example uploads from: {resolved_path}")
-        _upload_examples_from_directory(resolved_path, config.examples_upload.repository, auth, client)
+        _upload_examples_from_directory(
+            resolved_path, config.examples_upload.repository, auth, client, max_concurrency=concurrency
+        )
 
     # Check if there's anything to deploy
     if not config.organizations and not config.users and not config.services:
@@ -2024,7 +2208,7 @@ def apply(config_file: str, dry_run: bool, wait: bool, auth: CLIAuthConfig):
                                 # Phase 4: Deploy users if configured
                                 if config.users:
                                     click.echo(f"\n📥 Creating {len(config.users)} users...")
-                                    _deploy_users(config, auth)
+                                    _deploy_users(config, auth, max_concurrency=concurrency)
                                 break
                             elif status_data.get('status') == 'failed':
                                 error_msg = status_data.get('error', 'Unknown error')
@@ -2064,7 +2248,7 @@ def apply(config_file: str, dry_run: bool, wait: bool, auth: CLIAuthConfig):
 
         if config.users:
             click.echo(f"\n📥 Deploying {len(config.users)} users (no hierarchy deployment)...")
-            _deploy_users(config, auth)
+            _deploy_users(config, auth, max_concurrency=concurrency)
             click.echo("✅ User deployment completed!")
 
 
@@ -0,0 +1 @@
+"""Tests for the computor-cli package."""
@@ -0,0 +1,398 @@
+"""
+Tests for the concurrent parts of ``computor deployment apply``.
+
+The API is replaced by ``StubAPI``, an in-memory stand-in for the pieces of
+``ComputorClient`` the deployment code uses: generic CRUD endpoints for the
+user deployment, and an example store that pages ``/examples`` with
+``X-Next-Cursor`` and accepts archive uploads.
+"""
+
+import asyncio
+import io
+import itertools
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from computor_cli import deployment
+from computor_cli.deployment import (
+    _AsyncMemo,
+    _deploy_users_async,
+    _fetch_example_hashes,
+    _run_dag,
+    _upload_examples_from_directory,
+)
+from computor_types.deployments_refactored import ComputorDeploymentConfig
+from computor_utils import compute_example_content_hash
+
+
+class StubResponse:
+    def __init__(self, data, headers=None):
+        self._data = data
+        self.headers = headers or {}
+
+    def json(self):
+        return self._data
+
+
+class StubEndpoint:
+    """In-memory CRUD endpoint; ``list`` filters on the query's non-empty fields."""
+
+    def __init__(self, api: "StubAPI", name: str):
+        self.api = api
+        self.name = name
+        self.items = []
+        self.fail_create = set()
+
+    async def list(self, query):
+        self.api.calls.append(("list", self.name))
+        await asyncio.sleep(0)
+        criteria = {k: v for k, v in query.model_dump(exclude_none=True).items() if k not in ("skip", "limit")}
+        return [
+            item for item in self.items
+            if all(getattr(item, k, v) == v for k, v in criteria.items())
+        ]
+
+    async def get(self, item_id):
+        self.api.calls.append(("get", self.name))
+        return next((item for item in self.items if item.id == item_id), None)
+
+    async def create(self, data):
+        self.api.calls.append(("create", self.name))
+        await asyncio.sleep(0)
+        values = data.model_dump()
+        if values.get("username") in self.fail_create:
+            raise RuntimeError(f"cannot create {values['username']}")
+        item = SimpleNamespace(**{**values, "id": values.get("id") or self.api.next_id()})
+        item.display_name = f"{values.get('given_name')} {values.get('family_name')}"
+        self.items.append(item)
+        return item
+
+    async def update(self, item_id, data):
+        self.api.calls.append(("update", self.name))
+        item = next(item for item in self.items if item.id == item_id)
+        for key, value in data.items():
+            setattr(item, key, value)
+        return item
+
+
+class StubExamples:
+    """Example store: latest version hash per directory, plus archive uploads."""
+
+    def __init__(self, api: "StubAPI"):
+        self.api = api
+        self.examples = {}  # directory -> {"id", "directory", "content_hash"}
+        self.events = []
+        self.fail_upload = set()
+        self.upload_delay = 0.0
+
+    def add(self, directory: str, content_hash):
+        self.examples[directory] = {"id": f"ex-{directory}", "directory": directory, "content_hash": content_hash}
+
+    async def get_versions(self, example_id, version_tag=None):
+        self.api.calls.append(("versions", example_id))
+        example = next(e for e in self.examples.values() if e["id"] == example_id)
+        if example["content_hash"] is None:
+            return []
+        return [SimpleNamespace(content_hash=example["content_hash"])]
+
+    async def upload_archive(self, repository_id, directory, archive, filename="example.zip"):
+        self.events.append(("start", directory))
+        await asyncio.sleep(self.upload_delay)
+        if directory in self.fail_upload:
+            self.events.append(("fail", directory))
+            raise RuntimeError(f"upload of {directory} rejected")
+        with zipfile.ZipFile(archive) as zf:
+            files = {name: zf.read(name) for name in zf.namelist()}
+        self.add(directory, compute_example_content_hash(files))
+        self.events.append(("end", directory))
+
+    def uploads(self):
+        return [directory for event, directory in self.events if event == "end"]
+
+
+class StubAPI:
+    def __init__(self):
+        self.calls = []
+        self._ids = itertools.count(1)
+        for name in (
+            "users", "accounts", "courses", "course_members", "course_groups",
+            "organizations", "course_families", "roles",
+        ):
+            setattr(self, name, StubEndpoint(self, name))
+        self.user = SimpleNamespace(user_roles=self._user_roles, post_user_roles=self._post_user_roles)
+        self.examples = StubExamples(self)
+        self._http = SimpleNamespace(get=self._http_get, post=self._http_post)
+        self.user_roles = []
+
+    def next_id(self) -> str:
+        return f"id-{next(self._ids)}"
+
+    def count(self, kind: str, name: str) -> int:
+        return self.calls.count((kind, name))
+
+    async def _user_roles(self, user_id, role_id):
+        return [r for r in self.user_roles if r == (user_id, role_id)]
+
+    async def _post_user_roles(self, data):
+        self.user_roles.append((data.user_id, data.role_id))
+
+    async def _http_post(self, path, json_data=None):
+        self.calls.append(("post", path))
+
+    async def _http_get(self, path, params=None):
+        """``GET /examples`` with keyset pagination on the example ID."""
+        self.calls.append(("page", params.get("after")))
+        examples = sorted(
+            (e for e in self.examples.examples.values()),
+            key=lambda e: e["id"],
+        )
+        after = params.get("after") or ""
+        page = [e for e in examples if e["id"] > after][: params["limit"]]
+        cursor = page[-1]["id"] if len(page) == params["limit"] else ""
+        return StubResponse(
+            [{"id": e["id"], "directory": e["directory"]} for e in page],
+            headers={"X-Next-Cursor": cursor},
+        )
+
+
+# -- _AsyncMemo / _run_dag ----------------------------------------------------
+
+
+def test_async_memo_runs_each_lookup_once():
+    calls = []
+
+    async def lookup(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        if key == "bad":
+            raise LookupError(key)
+        return key.upper()
+
+    async def run():
+        memo = _AsyncMemo()
+        results = await asyncio.gather(*(memo.get(k, lambda k=k: lookup(k)) for k in ["a", "b", "a", "a"]))
+        errors = await asyncio.gather(
+            *(memo.get("bad", lambda: lookup("bad")) for _ in range(3)), return_exceptions=True
+        )
+        later = await memo.get("a", lambda: lookup("a"))
+        return results, errors, later
+
+    results, errors, later = asyncio.run(run())
+
+    assert results == ["A", "B", "A", "A"] and later == "A"
+    assert all(isinstance(e, LookupError) for e in errors)
+    assert sorted(calls) == ["a", "b", "bad"]
+
+
+def test_run_dag_respects_dependencies_and_concurrency():
+    events = []
+    running = peak = 0
+
+    def op(key):
+        async def run():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            events.append(("start", key))
+            await asyncio.sleep(0.01)
+            events.append(("end", key))
+            running -= 1
+            return key
+        return run
+
+    nodes = {
+        "a": (set(), op("a")),
+        "b": ({"a"}, op("b")),
+        "c": ({"b"}, op("c")),
+        "d": (set(), op("d")),
+        "e": (set(), op("e")),
+        "f": ({"a", "d"}, op("f")),
+    }
+
+    results = asyncio.run(_run_dag(nodes, max_concurrency=2))
+
+    assert results == {key: key for key in nodes}
+    assert peak == 2
+    for key, (deps, _) in nodes.items():
+        for dep in deps:
+            assert events.index(("end", dep)) < events.index(("start", key))
+
+
+def test_run_dag_failure_skips_dependents_without_deadlock():
+    ran = []
+
+    def op(key, fail=False):
+        async def run():
+            ran.append(key)
+            await asyncio.sleep(0)
+            if fail:
+                raise ValueError(key)
+            return key
+        return run
+
+    nodes = {
+        "a": (set(), op("a", fail=True)),
+        "b": ({"a"}, op("b")),
+        "c": ({"b"}, op("c")),
+        "d": (set(), op("d")),
+    }
+
+    results = asyncio.run(asyncio.wait_for(_run_dag(nodes, max_concurrency=1), timeout=5))
+
+    assert isinstance(results["a"], ValueError)
+    assert isinstance(results["b"], RuntimeError) and isinstance(results["b"].__cause__, ValueError)
+    assert isinstance(results["c"], RuntimeError) and isinstance(results["c"].__cause__, RuntimeError)
+    assert results["d"] == "d"
+    assert sorted(ran) == ["a", "d"]
+
+
+# -- _deploy_users_async ------------------------------------------------------
+
+
+def _users_config(count: int, **member) -> ComputorDeploymentConfig:
+    return ComputorDeploymentConfig(users=[
+        {
+            "user": {
+                "given_name": "Student",
+                "family_name": str(i),
+                "email": f"student{i}@example.com",
+                "username": f"student{i}",
+            },
+            "accounts": [{"provider": "gitlab", "type": "oauth", "provider_account_id": f"student{i}"}],
+            "course_members": [{
+                "organization": "kit", "course_family": "prog", "course": "prog1",
+                "role": "_student", "group": "g1", **member,
+            }],
+        }
+        for i in range(count)
+    ])
+
+
+@pytest.fixture
+def api():
+    api = StubAPI()
+    org = SimpleNamespace(id="org", path="kit")
+    family = SimpleNamespace(id="fam", path="prog", organization_id="org")
+    course = SimpleNamespace(id="course", path="prog1", course_family_id="fam")
+    api.organizations.items.append(org)
+    api.course_families.items.append(family)
+    api.courses.items.append(course)
+    return api
+
+
+def test_deploy_users_shares_lookups_between_users(api):
+    config = _users_config(6)
+
+    processed, failed = asyncio.run(_deploy_users_async(config, api, max_concurrency=3))
+
+    assert len(processed) == 6 and failed == []
+    assert len(api.users.items) == 6 and len(api.accounts.items) == 6
+    assert len(api.course_members.items) == 6
+    # The course path and the course group resolve once for all users
+    assert api.count("list", "organizations") == 1
+    assert api.count("list", "course_families") == 1
+    assert api.count("list", "courses") == 1
+    assert api.count("create", "course_groups") == 1
+    assert {m.course_group_id for m in api.course_members.items} == {api.course_groups.items[0].id}
+
+
+def test_deploy_users_reapply_creates_nothing(api):
+    config = _users_config(4)
+    asyncio.run(_deploy_users_async(config, api, max_concurrency=4))
+    api.calls.clear()
+
+    processed, failed = asyncio.run(_deploy_users_async(config, api, max_concurrency=4))
+
+    assert len(processed) == 4 and failed == []
+    assert not [call for call in api.calls if call[0] in ("create", "update")]
+
+
+def test_deploy_users_reports_failed_users(api):
+    api.users.fail_create.add("student1")
+
+    processed, failed = asyncio.run(_deploy_users_async(_users_config(3), api, max_concurrency=2))
+
+    assert sorted(u.username for u in processed) == ["student0", "student2"]
+    assert [u.username for u in failed] == ["student1"]
+    assert len(api.course_members.items) == 2
+
+
+# -- example uploads ----------------------------------------------------------
+
+
+def test_fetch_example_hashes_follows_cursor(api):
+    for i in range(250):
+        api.examples.add(f"ex{i:03d}", None if i == 7 else f"hash{i}")
+
+    hashes = asyncio.run(_fetch_example_hashes(api, "repo", max_concurrency=4))
+
+    assert len(hashes) == 250
+    assert hashes["ex007"] is None and hashes["ex123"] == "hash123"
+    pages = [after for kind, after in api.calls if kind == "page"]
+    assert pages == ["", "ex-ex099", "ex-ex199"]
+
+
+def _write_example(root: Path, name: str, slug: str, deps=(), body: str = "print(1)\n") -> None:
+    directory = root / name
+    directory.mkdir(parents=True, exist_ok=True)
+    meta = {"title": name, "slug": slug, "properties": {"testDependencies": list(deps)}}
+    (directory / "meta.yaml").write_text(yaml.safe_dump(meta))
+    (directory / "main.py").write_text(body)
+
+
+@pytest.fixture
+def examples_dir(tmp_path, api, monkeypatch):
+    async def get_client(auth):
+        return api
+
+    monkeypatch.setattr(deployment, "get_computor_client", get_client)
+    monkeypatch.setattr(deployment, "_ensure_example_repository", lambda name, auth: SimpleNamespace(id="repo"))
+    monkeypatch.setattr(deployment, "run_async", asyncio.run)
+
+    root = tmp_path / "examples"
+    _write_example(root, "base", "course.base")
+    _write_example(root, "child", "course.child", deps=["course.base"])
+    _write_example(root, "other", "course.other")
+    return root
+
+
+def _apply(examples_dir: Path, api: StubAPI) -> None:
+    _upload_examples_from_directory(examples_dir, "repo", auth=None, client=api, max_concurrency=4)
+
+
+def test_unchanged_reapply_uploads_nothing(examples_dir, api):
+    _apply(examples_dir, api)
+    assert sorted(api.examples.uploads()) == ["base", "child", "other"]
+    api.examples.events.clear()
+
+    _apply(examples_dir, api)
+
+    assert api.examples.events == []
+
+
+def test_changed_example_uploads_after_its_dependencies(examples_dir, api):
+    _apply(examples_dir, api)
+    api.examples.events.clear()
+    api.examples.upload_delay = 0.01
+    _write_example(examples_dir, "base", "course.base", body="print(2)\n")
+    _write_example(examples_dir, "child", "course.child", deps=["course.base"], body="print(2)\n")
+
+    _apply(examples_dir, api)
+
+    events = api.examples.events
+    assert sorted(api.examples.uploads()) == ["base", "child"]
+    assert events.index(("end", "base")) < events.index(("start", "child"))
+
+
+def test_failed_upload_does_not_block_independent_examples(examples_dir, api):
+    api.examples.fail_upload.add("base")
+
+    _apply(examples_dir, api)
+
+    # child depends on the failed base and is not attempted; other is uploaded
+    assert api.examples.uploads() == ["other"]
+    assert ("start", "child") not in api.examples.events
@@ -5,8 +5,20 @@ This module provides abstract base classes and mixins for building
 type-safe endpoint clients with standardized CRUD operations.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pydantic import BaseModel
 
@@ -19,6 +31,10 @@ TList = TypeVar("TList", bound=BaseModel)
 TUpdate = TypeVar("TUpdate", bound=BaseModel)
 TQuery = TypeVar("TQuery", bound=BaseModel)
 
+# Response header carrying the keyset cursor for the next page. Present
+# (possibly empty) only when the server honoured cursor pagination.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 class BaseEndpointClient(ABC):
     """
@@ -480,6 +496,82 @@ class TypedEndpointClient(BaseEndpointClient):
             return len(data)
         return 0
 
+    async def iter_all(
+        self,
+        *,
+        query: Optional[BaseModel] = None,
+        batch_size: int = 100,
+        prefetch: bool = True,
+        **kwargs: Any,
+    ) -> AsyncIterator[BaseModel]:
+        """
+        Iterate over all resources matching the query.
+
+        Uses keyset (cursor) pagination: each page's ``X-Next-Cursor``
+        header drives the next request, so deep pages cost the server the
+        same as the first one. When ``prefetch`` is set the next page is
+        requested as soon as the current one arrives, overlapping network
+        latency with the caller's processing.
+
+        Endpoints that ignore the ``after`` parameter (no cursor header in
+        the response) fall back to ``skip``/``limit`` pagination.
+
+        Args:
+            query: Query parameters for filtering
+            batch_size: Number of items to fetch per request
+            prefetch: Fetch the next page while the current one is consumed
+            **kwargs: Additional query parameters
+
+        Yields:
+            Resources in server order
+        """
+        if not self._list_model:
+            raise RuntimeError(f"No list model configured for {self._base_path}")
+
+        base_params: Dict[str, Any] = {"limit": batch_size}
+        if query:
+            base_params.update(self._query_to_params(query))
+        if kwargs:
+            base_params.update({k: v for k, v in kwargs.items() if v is not None})
+
+        async def fetch(after: Optional[str], skip: int) -> Tuple[List[Any], Optional[str]]:
+            params = dict(base_params)
+            if after is not None:
+                params["after"] = after
+            else:
+                params["skip"] = skip
+            response = await self._http.get(self._base_path, params=params)
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            return self._extract_items(response.json()), cursor if isinstance(cursor, str) else None
+
+        # An empty ``after`` asks the server to start a cursor listing.
+        pending = asyncio.ensure_future(fetch("", 0))
+        skip = 0
+        try:
+            while pending is not None:
+                items, cursor = await pending
+                pending = None
+                skip += len(items)
+
+                if cursor is not None:
+                    next_args = (cursor, skip) if cursor else None
+                elif items and len(items) >= batch_size:
+                    next_args = (None, skip)
+                else:
+                    next_args = None
+
+                if next_args is not None and prefetch:
+                    pending = asyncio.ensure_future(fetch(*next_args))
+
+                for item in items:
+                    yield self._list_model.model_validate(item)
+
+                if next_args is not None and pending is None:
+                    pending = asyncio.ensure_future(fetch(*next_args))
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
     async def get_all(
         self,
         *,
@@ -491,7 +583,7 @@ class TypedEndpointClient(BaseEndpointClient):
         Get all resources matching the query (with pagination).
 
         This method automatically handles pagination to retrieve all
-        matching resources.
+        matching resources. See :meth:`iter_all` for the streaming form.
 
         Args:
             query: Query parameters for filtering
@@ -501,21 +593,16 @@ class TypedEndpointClient(BaseEndpointClient):
         Returns:
             List of all matching resources
         """
-        all_items = []
-        skip = 0
-
-        while True:
-            items = await self.list(
-                skip=skip,
-                limit=batch_size,
-                query=query,
-                **kwargs,
-            )
-            if not items:
-                break
-            all_items.extend(items)
-            if len(items) < batch_size:
-                break
-            skip += batch_size
-
-        return all_items
+        return [
+            item
+            async for item in self.iter_all(query=query, batch_size=batch_size, **kwargs)
+        ]
+
+    @staticmethod
+    def _extract_items(data: Any) -> List[Any]:
+        """Normalise a list response body to a list of raw items."""
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict) and "items" in data:
+            return data["items"]
+        return [data]
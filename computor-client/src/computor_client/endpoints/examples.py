@@ -5,7 +5,7 @@ This module is auto-generated from the OpenAPI specification.
 Run `bash generate.sh python-client` to regenerate.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Union
 
 from pydantic import BaseModel
 
@@ -129,6 +129,23 @@ class ExamplesClient:
         response = await self._http.post(f"/examples/upload", json_data=data, params=kwargs)
         return ExampleVersionGet.model_validate(response.json())
 
+    async def upload_archive(
+        self,
+        repository_id: str,
+        directory: str,
+        archive: BinaryIO,
+        filename: str = "example.zip",
+        **kwargs: Any,
+    ) -> ExampleVersionGet:
+        """Upload Example Archive (multipart, streamed from ``archive``)"""
+        response = await self._http.post(
+            f"/examples/upload/archive",
+            data={"repository_id": repository_id, "directory": directory},
+            files={"file": (filename, archive, "application/zip")},
+            params=kwargs,
+        )
+        return ExampleVersionGet.model_validate(response.json())
+
     async def download(
         self,
         example_id: str,
@@ -7,10 +7,12 @@ This module provides a robust async HTTP client built on httpx with:
 - Request/response logging
 - Retry logic with exponential backoff
 - Timeout configuration
+- Conditional GETs (ETag / If-None-Match) with a small response cache
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Type, TypeVar, Union
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, Union
 from urllib.parse import urljoin
 import logging
 
@@ -111,6 +113,7 @@ class AsyncHTTPClient:
     - Authentication header injection
     - Response parsing and error handling
     - Automatic retries for transient failures
+    - Transparent revalidation of GET responses that carry an ``ETag``
     """
 
     def __init__(
@@ -120,6 +123,7 @@ class AsyncHTTPClient:
         timeout: float = 30.0,
         max_retries: int = 3,
         headers: Optional[Dict[str, str]] = None,
+        etag_cache_size: int = 256,
     ):
         """
         Initialize the HTTP client.
@@ -130,6 +134,8 @@ class AsyncHTTPClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             headers: Additional headers to include in all requests
+            etag_cache_size: Number of GET responses kept for ``If-None-Match``
+                revalidation (0 disables conditional requests)
         """
         self.base_url = base_url.rstrip("/")
         self.auth_provider = auth_provider or TokenAuthProvider()
@@ -137,6 +143,8 @@ class AsyncHTTPClient:
         self.max_retries = max_retries
         self._default_headers = headers or {}
         self._client: Optional[httpx.AsyncClient] = None
+        self.etag_cache_size = etag_cache_size
+        self._validators: "OrderedDict[str, Tuple[str, httpx.Response]]" = OrderedDict()
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the underlying httpx client."""
@@ -227,6 +235,7 @@ class AsyncHTTPClient:
         headers: Optional[Dict[str, str]] = None,
         files: Optional[Dict[str, Any]] = None,
         authenticated: bool = True,
+        allow_not_modified: bool = False,
     ) -> httpx.Response:
         """
         Make an HTTP request.
@@ -240,6 +249,8 @@ class AsyncHTTPClient:
             headers: Additional headers
             files: File uploads
             authenticated: Whether to include auth header
+            allow_not_modified: Return ``304`` responses instead of raising
+                (used for conditional GETs)
 
         Returns:
             httpx.Response object
@@ -284,6 +295,8 @@ class AsyncHTTPClient:
                 # Check for successful response
                 if response.is_success:
                     return response
+                if allow_not_modified and response.status_code == 304:
+                    return response
 
                 # Handle 401 with token refresh on first attempt
                 if response.status_code == 401 and attempt == 0 and authenticated:
@@ -316,6 +329,14 @@ class AsyncHTTPClient:
             raise last_exception
         raise NetworkError("Request failed after retries")
 
+    @staticmethod
+    def _validator_key(path: str, params: Optional[Dict[str, Any]]) -> str:
+        """Cache key for a GET request's stored validator."""
+        if not params:
+            return path
+        items = sorted((k, str(v)) for k, v in params.items() if v is not None)
+        return f"{path}?{items}"
+
     async def get(
         self,
         path: str,
@@ -324,15 +345,50 @@ class AsyncHTTPClient:
         headers: Optional[Dict[str, str]] = None,
         authenticated: bool = True,
     ) -> httpx.Response:
-        """Make a GET request."""
-        return await self._request(
+        """Make a GET request.
+
+        Responses carrying an ``ETag`` are remembered; the next GET for the
+        same path and parameters sends ``If-None-Match`` and a ``304`` is
+        answered with the stored response.
+        """
+        if not self.etag_cache_size:
+            return await self._request(
+                "GET",
+                path,
+                params=params,
+                headers=headers,
+                authenticated=authenticated,
+            )
+
+        key = self._validator_key(path, params)
+        stored = self._validators.get(key)
+        if stored is not None:
+            headers = {**(headers or {}), "If-None-Match": stored[0]}
+
+        response = await self._request(
             "GET",
             path,
             params=params,
             headers=headers,
             authenticated=authenticated,
+            allow_not_modified=stored is not None,
         )
 
+        if response.status_code == 304 and stored is not None:
+            self._validators.move_to_end(key)
+            return stored[1]
+
+        etag = response.headers.get("ETag")
+        if isinstance(etag, str) and etag:
+            self._validators[key] = (etag, response)
+            self._validators.move_to_end(key)
+            while len(self._validators) > self.etag_cache_size:
+                self._validators.popitem(last=False)
+        else:
+            self._validators.pop(key, None)
+
+        return response
+
     async def post(
         self,
         path: str,
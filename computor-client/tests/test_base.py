@@ -365,6 +365,29 @@ class TestTypedEndpointClientConvenience:
         assert len(result) == 11
         assert mock_http_client.get.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_iter_all_follows_cursor(self, typed_client, mock_http_client):
+        """Test iter_all drives pagination from the X-Next-Cursor header."""
+        mock_response1 = MagicMock()
+        mock_response1.json.return_value = [{"id": "1", "name": "First"}]
+        mock_response1.headers = {"X-Next-Cursor": "abc"}
+
+        mock_response2 = MagicMock()
+        mock_response2.json.return_value = [{"id": "2", "name": "Second"}]
+        mock_response2.headers = {"X-Next-Cursor": ""}
+
+        mock_http_client.get.side_effect = [mock_response1, mock_response2]
+
+        result = [item async for item in typed_client.iter_all(batch_size=1)]
+
+        assert [item.id for item in result] == ["1", "2"]
+        assert mock_http_client.get.call_count == 2
+        first_params = mock_http_client.get.call_args_list[0].kwargs["params"]
+        second_params = mock_http_client.get.call_args_list[1].kwargs["params"]
+        assert first_params["after"] == ""
+        assert second_params["after"] == "abc"
+        assert "skip" not in second_params
+
     @pytest.mark.asyncio
     async def test_count_with_total(self, typed_client, mock_http_client):
         """Test count when API returns total."""
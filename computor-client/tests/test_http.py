@@ -262,3 +262,37 @@ class TestAsyncHTTPClientMethods:
 
         mock_request.assert_called_once()
         assert result["id"] == "new-123"
+
+    @pytest.mark.asyncio
+    async def test_get_revalidates_with_etag(self, client):
+        """Test GET sends If-None-Match and reuses the stored response on 304."""
+        first = MagicMock()
+        first.status_code = 200
+        first.headers = {"ETag": '"abc"'}
+        first.json.return_value = [{"id": "1"}]
+
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        not_modified.headers = {"ETag": '"abc"'}
+
+        with patch.object(client, "_request", side_effect=[first, not_modified]) as mock_request:
+            assert await client.get("/students/courses") is first
+            assert await client.get("/students/courses") is first
+
+        second_call = mock_request.call_args_list[1]
+        assert second_call.kwargs["headers"]["If-None-Match"] == '"abc"'
+        assert second_call.kwargs["allow_not_modified"] is True
+
+    @pytest.mark.asyncio
+    async def test_get_without_etag_cache(self):
+        """Test conditional requests can be disabled."""
+        client = AsyncHTTPClient(base_url="http://localhost:8000", etag_cache_size=0)
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {"ETag": '"abc"'}
+
+        with patch.object(client, "_request", return_value=response) as mock_request:
+            await client.get("/students/courses")
+            await client.get("/students/courses")
+
+        assert "If-None-Match" not in (mock_request.call_args_list[1].kwargs["headers"] or {})
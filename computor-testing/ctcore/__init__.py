@@ -60,8 +60,10 @@ from .security import (
 
 from .stdio import (
     MatchResult,
+    OutputMatcher,
     normalize_output,
     compare_outputs,
+    compile_matcher,
     match_exact,
     match_contains,
     match_regexp,
@@ -117,8 +119,10 @@ __all__ = [
     "safe_join",
     # Stdio
     "MatchResult",
+    "OutputMatcher",
     "normalize_output",
     "compare_outputs",
+    "compile_matcher",
     "match_exact",
     "match_contains",
     "match_regexp",
@@ -0,0 +1,324 @@
+"""
+Precompiled test-suite artifacts.
+
+Every test run used to parse ``test.yaml`` and ``specification.yaml``,
+validate them into the Pydantic models and resolve property inheritance,
+although the files are identical for all submissions of an assignment.
+The compile step here does that work once and stores the validated,
+inheritance-resolved models as JSON keyed by a hash of:
+
+- the raw bytes of both YAML files
+- the inherited property lists (or none)
+- the schema code (source of ``SCHEMA_MODULES`` and of every module
+  defining a model reachable from the test suite and specification) and
+  the Pydantic version
+
+Loading an artifact is a single JSON validation (no YAML parsing, no
+inheritance pass) that yields fresh model instances, so runs may still
+modify them (e.g. resolve directories). Artifacts are data only: unlike a
+pickle, a planted file cannot execute code in the harness. It can still
+change the tests, so like the compile cache the directory must not be
+writable by the uid student code runs as; it is created with mode 0700.
+
+Layout (``CT_ARTIFACT_CACHE_DIR``, default ``$XDG_CACHE_HOME/computor/testsuites``)::
+
+    <key[:2]>/<key>.json    # {"testsuite": ..., "specification": ...}
+
+Entries are published by an atomic rename. Set ``CT_ARTIFACT_CACHE=0`` to
+always load from YAML. Compile ahead of time with::
+
+    python -m ctcore.artifacts test.yaml specification.yaml
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sys
+import tempfile
+import typing
+from enum import Enum
+from typing import Any, List, Optional, Sequence, Set, Tuple
+
+import pydantic
+import yaml
+
+from .models import ComputorSpecification, ComputorTestSuite
+
+CACHE_DIR_ENV = "CT_ARTIFACT_CACHE_DIR"
+CACHE_ENABLED_ENV = "CT_ARTIFACT_CACHE"
+
+# Bump when the key derivation or artifact format changes
+CACHE_FORMAT = "2"
+
+# Modules whose code defines how test suites and specifications validate
+SCHEMA_MODULES = (
+    "ctcore.models",
+    "computor_types.testing",
+    "computor_types.codeability_meta",
+)
+
+# Properties a test inherits from its collection when unset
+INHERITED_SUB_FIELDS: List[str] = [
+    "qualification",
+    "relativeTolerance",
+    "absoluteTolerance",
+    "allowedOccuranceRange",
+    "occuranceType",
+    "typeCheck",
+    "shapeCheck",
+    "ignoreClass",
+    "verbosity",
+]
+
+# Properties a collection inherits from the suite properties when unset
+INHERITED_MAIN_FIELDS: List[str] = INHERITED_SUB_FIELDS + [
+    "storeGraphicsArtifacts",
+    "competency",
+    "timeout",
+]
+
+Artifact = Tuple[ComputorTestSuite, ComputorSpecification]
+
+
+class _StoredArtifact(pydantic.BaseModel):
+    """On-disk form of an artifact."""
+
+    testsuite: ComputorTestSuite
+    specification: ComputorSpecification
+
+
+_models_fingerprint: Optional[str] = None
+
+
+def schema_modules() -> List[str]:
+    """Names of the modules the artifact schema is defined in."""
+    names: Set[str] = set(SCHEMA_MODULES)
+    seen: Set[Any] = set()
+    stack: List[Any] = [ComputorTestSuite, ComputorSpecification]
+    while stack:
+        tp = stack.pop()
+        if isinstance(tp, type) and issubclass(tp, (pydantic.BaseModel, Enum)):
+            if tp in seen:
+                continue
+            seen.add(tp)
+            for base in tp.__mro__:
+                if not base.__module__.startswith(("pydantic", "builtins", "enum")):
+                    names.add(base.__module__)
+            if issubclass(tp, pydantic.BaseModel):
+                stack.extend(field.annotation for field in tp.model_fields.values())
+        else:
+            stack.extend(typing.get_args(tp))
+    return sorted(names)
+
+
+def _fingerprint() -> str:
+    """Hash of the schema code, so artifacts of older models are never loaded."""
+    global _models_fingerprint
+    if _models_fingerprint is None:
+        digest = hashlib.sha256(pydantic.VERSION.encode())
+        for name in schema_modules():
+            module = importlib.import_module(name)
+            digest.update(name.encode())
+            with open(module.__file__, "rb") as fh:
+                digest.update(fh.read())
+        _models_fingerprint = digest.hexdigest()
+    return _models_fingerprint
+
+
+def resolve_inheritance(
+    testsuite: ComputorTestSuite,
+    main_fields: Sequence[str] = INHERITED_MAIN_FIELDS,
+    sub_fields: Sequence[str] = INHERITED_SUB_FIELDS,
+) -> None:
+    """Fill unset properties of collections and tests from their parents (in place)."""
+
+    def inherit(properties: Sequence[str], child: Any, parent: Any) -> None:
+        for prop in properties:
+            if getattr(child, prop, None) is None:
+                setattr(child, prop, getattr(parent, prop, None))
+
+    for main in testsuite.properties.tests:
+        inherit(main_fields, main, testsuite.properties)
+        for sub in main.tests:
+            inherit(sub_fields, sub, main)
+
+
+def compile_artifact(
+    testsuite_yaml: bytes,
+    specification_yaml: bytes,
+    inherit: Optional[Tuple[Sequence[str], Sequence[str]]] = None,
+) -> Artifact:
+    """
+    Validate a test suite and specification and resolve inheritance.
+
+    Args:
+        testsuite_yaml: Contents of the test suite YAML
+        specification_yaml: Contents of the specification YAML
+        inherit: (main fields, sub fields) to inherit, or None
+
+    Returns:
+        (testsuite, specification)
+    """
+    testsuite = ComputorTestSuite(**yaml.safe_load(testsuite_yaml))
+    specification = ComputorSpecification(**yaml.safe_load(specification_yaml))
+    if inherit is not None:
+        resolve_inheritance(testsuite, *inherit)
+    return testsuite, specification
+
+
+class ArtifactCache:
+    """Filesystem cache of compiled test-suite artifacts."""
+
+    def __init__(self, root: str):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Cache directory (created with mode 0700 if missing)
+        """
+        self.root = root
+        os.makedirs(root, mode=0o700, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Optional["ArtifactCache"]:
+        """Build the cache from environment settings (None when disabled)."""
+        if os.environ.get(CACHE_ENABLED_ENV, "1").lower() in ("0", "false", "off", "no"):
+            return None
+        root = os.environ.get(CACHE_DIR_ENV) or os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+            "computor",
+            "testsuites",
+        )
+        try:
+            return cls(root)
+        except OSError:
+            return None
+
+    @staticmethod
+    def key(
+        testsuite_yaml: bytes,
+        specification_yaml: bytes,
+        inherit: Optional[Tuple[Sequence[str], Sequence[str]]] = None,
+    ) -> str:
+        """Content hash identifying an artifact."""
+        digest = hashlib.sha256()
+        header = {
+            "format": CACHE_FORMAT,
+            "models": _fingerprint(),
+            "inherit": [list(fields) for fields in inherit] if inherit is not None else None,
+            "sizes": [len(testsuite_yaml), len(specification_yaml)],
+        }
+        digest.update(json.dumps(header, sort_keys=True).encode())
+        digest.update(testsuite_yaml)
+        digest.update(specification_yaml)
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}.json")
+
+    def lookup(self, key: str) -> Optional[Artifact]:
+        """Load an artifact, or None if there is none (or it is invalid)."""
+        try:
+            with open(self.path(key), "rb") as fh:
+                stored = _StoredArtifact.model_validate_json(fh.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Truncated or written by incompatible code: recompile
+            return None
+        return stored.testsuite, stored.specification
+
+    def publish(self, key: str, artifact: Artifact) -> str:
+        """Store an artifact atomically and return its path."""
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        stored = _StoredArtifact.model_construct(testsuite=artifact[0], specification=artifact[1])
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                # Unset fields stay unset when the artifact is loaded
+                fh.write(stored.model_dump_json(exclude_unset=True).encode())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return path
+
+
+_default_cache: Optional[ArtifactCache] = None
+_default_cache_loaded = False
+
+
+def get_artifact_cache() -> Optional[ArtifactCache]:
+    """Process-wide cache configured from the environment (None when disabled)."""
+    global _default_cache, _default_cache_loaded
+    if not _default_cache_loaded:
+        _default_cache = ArtifactCache.from_env()
+        _default_cache_loaded = True
+    return _default_cache
+
+
+def load_testsuite_artifact(
+    testsuite_path: str,
+    specification_path: str,
+    inherit: Optional[Tuple[Sequence[str], Sequence[str]]] = None,
+) -> Artifact:
+    """
+    Load the validated test suite and specification for a test run.
+
+    The compiled artifact is used if present; otherwise the YAML files are
+    compiled and the artifact published for later runs.
+
+    Args:
+        testsuite_path: Path to the test suite YAML
+        specification_path: Path to the specification YAML
+        inherit: (main fields, sub fields) to inherit, or None
+
+    Returns:
+        (testsuite, specification), fresh instances owned by the caller
+    """
+    with open(testsuite_path, "rb") as fh:
+        testsuite_yaml = fh.read()
+    with open(specification_path, "rb") as fh:
+        specification_yaml = fh.read()
+
+    cache = get_artifact_cache()
+    if cache is None:
+        return compile_artifact(testsuite_yaml, specification_yaml, inherit)
+
+    key = cache.key(testsuite_yaml, specification_yaml, inherit)
+    artifact = cache.lookup(key)
+    if artifact is None:
+        artifact = compile_artifact(testsuite_yaml, specification_yaml, inherit)
+        try:
+            cache.publish(key, artifact)
+        except OSError:
+            pass
+    return artifact
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile a test suite and specification into a cached artifact")
+    parser.add_argument("testsuite", help="test suite YAML")
+    parser.add_argument("specification", help="specification YAML")
+    parser.add_argument("--no-inherit", action="store_true", help="do not resolve property inheritance")
+    args = parser.parse_args(argv)
+
+    cache = get_artifact_cache()
+    if cache is None:
+        parser.error(f"artifact cache is disabled ({CACHE_ENABLED_ENV})")
+    inherit = None if args.no_inherit else (INHERITED_MAIN_FIELDS, INHERITED_SUB_FIELDS)
+    with open(args.testsuite, "rb") as fh:
+        testsuite_yaml = fh.read()
+    with open(args.specification, "rb") as fh:
+        specification_yaml = fh.read()
+    key = cache.key(testsuite_yaml, specification_yaml, inherit)
+    print(cache.publish(key, compile_artifact(testsuite_yaml, specification_yaml, inherit)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
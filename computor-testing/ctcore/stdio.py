@@ -3,12 +3,46 @@ Computor Testing Core - Standard I/O Testing Utilities
 
 Helper functions for comparing stdout/stderr output with various
 matching strategies (exact, regex, fuzzy, numeric extraction, etc.)
+
+Comparisons run on a streaming engine: a check is compiled once per test
+definition into an ``OutputMatcher`` (normalized expected values, regex
+and number patterns; cached by ``compile_matcher``), which then consumes
+the output in chunks in a single pass and stops as soon as the result is
+known. Output may be a string, bytes, a file object or an iterable of
+chunks, so programs printing megabytes are compared without splitting
+their output into line lists. Failure results keep at most
+``SNIPPET_CHARS`` characters of the actual output.
 """
 
+import codecs
+import functools
 import re
-from typing import Any, List, Optional, Tuple, Union
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple, Union
 from enum import Enum
 
+# Characters read per chunk from strings and file objects
+CHUNK_SIZE = 1 << 16
+
+# Actual output kept for failure messages
+SNIPPET_CHARS = 1000
+
+# Compiled matchers kept by compile_matcher
+MATCHER_CACHE_SIZE = 1024
+
+_NUMBER_PATTERN = re.compile(r'-?\d+\.?\d*(?:[eE][+-]?\d+)?')
+
+# Characters a number match can consist of
+_NUMBER_CHARS = "+-.0123456789eE"
+
+# Qualifications handled by compile_matcher (compare_outputs adds exitCode)
+QUALIFICATIONS = (
+    'matches', 'verifyEqual', 'contains', 'startsWith', 'endsWith',
+    'regexp', 'regexpMultiline', 'matchesLine', 'containsLine',
+    'lineCount', 'numericOutput',
+)
+
+OutputSource = Union[str, bytes, IO, Iterable[Union[str, bytes]], None]
+
 
 class MatchResult:
     """Result of a stdio match operation"""
@@ -90,6 +124,706 @@ def get_lines(text: str, normalize: bool = True) -> List[str]:
     return lines
 
 
+# =============================================================================
+# Streaming
+# =============================================================================
+
+def iter_chunks(source: OutputSource, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Yield output as text chunks.
+
+    Args:
+        source: String, bytes, file object (text or binary) or iterable of
+            str/bytes chunks; bytes are decoded as UTF-8
+        chunk_size: Characters (or bytes) per chunk for strings and files
+
+    Returns:
+        Iterator of non-empty strings
+    """
+    if source is None:
+        return
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+        return
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        source = (view[start:start + chunk_size] for start in range(0, len(view), chunk_size))
+    elif hasattr(source, "read"):
+        source = _read_chunks(source, chunk_size)
+
+    decoder = None
+    for chunk in source:
+        if not isinstance(chunk, str):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    if decoder is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+
+def _read_chunks(stream: IO, chunk_size: int) -> Iterator[Union[str, bytes]]:
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            return
+        yield data
+
+
+def _normalize_newlines(chunks: Iterable[str]) -> Iterator[str]:
+    """Convert \\r\\n and \\r to \\n, also when \\r\\n is split across chunks."""
+    held = ""
+    for chunk in chunks:
+        if held:
+            chunk = held + chunk
+            held = ""
+        if chunk.endswith('\r'):
+            chunk, held = chunk[:-1], '\r'
+        chunk = chunk.replace('\r\n', '\n').replace('\r', '\n')
+        if chunk:
+            yield chunk
+    if held:
+        yield '\n'
+
+
+def _strip(chunks: Iterable[str]) -> Iterator[str]:
+    """Chunk-wise ``str.strip`` of the concatenated chunks."""
+    started = False
+    held = ""
+    for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+        body = chunk.rstrip()
+        if not body:
+            # Whitespace only: inner whitespace if more text follows
+            held += chunk
+            continue
+        if held:
+            yield held
+        yield body
+        held = chunk[len(body):]
+
+
+def _lower(chunks: Iterable[str]) -> Iterator[str]:
+    """Chunk-wise ``str.lower`` of the concatenated chunks."""
+    # Lowercasing depends on the surrounding word (final sigma), so the
+    # last word of a chunk is lowered with the next chunk
+    carry = ""
+    for chunk in chunks:
+        text = carry + chunk if carry else chunk
+        cut = len(text)
+        while cut and not text[cut - 1].isspace():
+            cut -= 1
+        carry = text[cut:]
+        if cut:
+            yield text[:cut].lower()
+    if carry:
+        yield carry.lower()
+
+
+def _normalized_chunks(source: OutputSource, trim: bool = True,
+                       normalize_newlines: bool = True,
+                       ignore_case: bool = False) -> Iterator[str]:
+    """``normalize_output`` as a stream of chunks."""
+    chunks = iter_chunks(source)
+    if normalize_newlines:
+        chunks = _normalize_newlines(chunks)
+    if trim:
+        chunks = _strip(chunks)
+    if ignore_case:
+        chunks = _lower(chunks)
+    return chunks
+
+
+def iter_lines(source: OutputSource) -> Iterator[str]:
+    """
+    Yield the lines of an output incrementally.
+
+    Same lines as ``get_lines`` (newlines normalized, no trailing empty
+    line), without holding the whole output.
+
+    Args:
+        source: Output (see ``iter_chunks``)
+
+    Returns:
+        Iterator of lines
+    """
+    partial: List[str] = []
+    for chunk in _normalize_newlines(iter_chunks(source)):
+        lines = chunk.split('\n')
+        if len(lines) == 1:
+            partial.append(chunk)
+            continue
+        if partial:
+            partial.append(lines[0])
+            lines[0] = "".join(partial)
+            partial = []
+        last = lines.pop()
+        if last:
+            partial.append(last)
+        yield from lines
+    if partial:
+        yield "".join(partial)
+
+
+def iter_numbers(source: OutputSource) -> Iterator[float]:
+    """
+    Yield the numbers of an output incrementally (see ``extract_numbers``).
+
+    Args:
+        source: Output (see ``iter_chunks``)
+
+    Returns:
+        Iterator of float values
+    """
+    carry = ""
+    for chunk in iter_chunks(source):
+        text = carry + chunk if carry else chunk
+        # No number spans a character outside _NUMBER_CHARS: matching up to
+        # the last such character gives the same matches as the whole text
+        head = text.rstrip(_NUMBER_CHARS)
+        carry = text[len(head):]
+        if head:
+            yield from _parse_numbers(head)
+    if carry:
+        yield from _parse_numbers(carry)
+
+
+def _parse_numbers(text: str) -> Iterator[float]:
+    for m in _NUMBER_PATTERN.findall(text):
+        try:
+            yield float(m)
+        except ValueError:
+            pass
+
+
+class _Excerpt:
+    """Leading characters of a stream, kept for failure messages."""
+
+    def __init__(self, limit: int = SNIPPET_CHARS):
+        self.limit = limit
+        self.parts: List[str] = []
+        self.size = 0
+
+    @property
+    def full(self) -> bool:
+        return self.size > self.limit
+
+    def add(self, text: str) -> None:
+        if not self.full:
+            text = text[:self.limit + 1 - self.size]
+            self.parts.append(text)
+            self.size += len(text)
+
+    def text(self) -> str:
+        text = "".join(self.parts)
+        if self.full:
+            return text[:self.limit] + "..."
+        return text
+
+
+def _recorded(chunks: Iterable[str], excerpt: _Excerpt) -> Iterator[str]:
+    for chunk in chunks:
+        excerpt.add(chunk)
+        yield chunk
+
+
+def _excerpt(text: str) -> str:
+    excerpt = _Excerpt()
+    excerpt.add(text)
+    return excerpt.text()
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+# =============================================================================
+# Matchers
+# =============================================================================
+
+class OutputMatcher:
+    """
+    A stdio check compiled for one test definition.
+
+    Expected values and patterns are normalized and compiled once; ``match``
+    may then be called for any number of outputs. Build matchers with
+    ``compile_matcher`` (or the ``match_*`` functions), which cache them.
+
+    Kinds and their arguments:
+
+    - ``exact``: expected, trim, normalize_newlines, ignore_case
+    - ``contains``: text, ignore_case
+    - ``startsWith`` / ``endsWith``: text, trim, ignore_case
+    - ``regexp``: pattern, multiline, ignore_case, full_match
+    - ``line``: expected, line_number, ignore_case, trim
+    - ``lineCount``: count, min_count, max_count
+    - ``numeric``: expected (numbers), tolerance, relative_tolerance
+    - ``linesSubset``: expected (lines), ordered, ignore_case, trim
+    """
+
+    def __init__(self, kind: str, **args: Any):
+        self.kind = kind
+        self.args = args
+        self._match = getattr(self, f"_match_{kind}", None)
+        if self._match is None:
+            raise ValueError(f"Unknown matcher kind: {kind}")
+        getattr(self, f"_compile_{kind}", lambda: None)()
+
+    def __repr__(self):
+        return f"OutputMatcher({self.kind!r}, {self.args!r})"
+
+    def match(self, actual: OutputSource) -> MatchResult:
+        """
+        Match an output in a single pass.
+
+        Args:
+            actual: Output as string, bytes, file object or iterable of chunks
+
+        Returns:
+            MatchResult
+        """
+        return self._match(actual)
+
+    # -- exact ---------------------------------------------------------------
+
+    def _compile_exact(self):
+        a = self.args
+        self.expected = normalize_output(a["expected"], a.get("trim", True),
+                                         a.get("normalize_newlines", True), False,
+                                         a.get("ignore_case", False))
+
+    def _match_exact(self, actual: OutputSource) -> MatchResult:
+        a = self.args
+        expected = self.expected
+        excerpt = _Excerpt()
+        pos = 0
+        offset = None
+        for chunk in _normalized_chunks(actual, a.get("trim", True),
+                                        a.get("normalize_newlines", True),
+                                        a.get("ignore_case", False)):
+            excerpt.add(chunk)
+            if offset is None:
+                if expected.startswith(chunk, pos):
+                    pos += len(chunk)
+                else:
+                    offset = pos + _common_prefix_length(chunk, expected[pos:pos + len(chunk)])
+            if offset is not None and excerpt.full:
+                break
+
+        if offset is None:
+            if pos == len(expected):
+                return MatchResult(True, "Output matches exactly")
+            offset = pos
+
+        return MatchResult(
+            False,
+            "Output does not match",
+            actual=excerpt.text(),
+            expected=expected,
+            details={"offset": offset}
+        )
+
+    # -- contains ------------------------------------------------------------
+
+    def _compile_contains(self):
+        text = self.args["text"]
+        self.needle = text.lower() if self.args.get("ignore_case", False) else text
+
+    def _match_contains(self, actual: OutputSource) -> MatchResult:
+        text = self.args["text"]
+        ignore_case = self.args.get("ignore_case", False)
+        needle = self.needle
+        overlap = len(needle) - 1
+        excerpt = _Excerpt()
+        found = not needle
+        tail = ""
+        if not found:
+            chunks = _recorded(iter_chunks(actual), excerpt)
+            if ignore_case:
+                chunks = _lower(chunks)
+            for chunk in chunks:
+                window = tail + chunk if tail else chunk
+                if needle in window:
+                    found = True
+                    break
+                tail = window[-overlap:] if overlap else ""
+
+        if found:
+            return MatchResult(True, f"Output contains '{text}'")
+
+        return MatchResult(
+            False,
+            f"Output does not contain '{text}'",
+            actual=excerpt.text(),
+            expected=f"Contains: {text}"
+        )
+
+    # -- startsWith / endsWith -----------------------------------------------
+
+    def _compile_startsWith(self):
+        text = self.args["text"]
+        self.affix = text.lower() if self.args.get("ignore_case", False) else text
+
+    _compile_endsWith = _compile_startsWith
+
+    def _match_startsWith(self, actual: OutputSource) -> MatchResult:
+        prefix = self.args["text"]
+        keep = len(self.affix) + 20
+        head: List[str] = []
+        size = 0
+        for chunk in _normalized_chunks(actual, self.args.get("trim", True), True,
+                                        self.args.get("ignore_case", False)):
+            head.append(chunk[:keep - size])
+            size += len(head[-1])
+            if size >= keep:
+                break
+        head_text = "".join(head)
+
+        if head_text.startswith(self.affix):
+            return MatchResult(True, f"Output starts with '{prefix}'")
+
+        return MatchResult(
+            False,
+            f"Output does not start with '{prefix}'",
+            actual=head_text + "...",
+            expected=prefix
+        )
+
+    def _match_endsWith(self, actual: OutputSource) -> MatchResult:
+        suffix = self.args["text"]
+        keep = len(self.affix) + 20
+        tail = ""
+        for chunk in _normalized_chunks(actual, self.args.get("trim", True), True,
+                                        self.args.get("ignore_case", False)):
+            tail = (tail + chunk)[-keep:]
+
+        if tail.endswith(self.affix):
+            return MatchResult(True, f"Output ends with '{suffix}'")
+
+        return MatchResult(
+            False,
+            f"Output does not end with '{suffix}'",
+            actual="..." + tail,
+            expected=suffix
+        )
+
+    # -- regexp --------------------------------------------------------------
+
+    def _compile_regexp(self):
+        flags = 0
+        if self.args.get("multiline", False):
+            flags |= re.MULTILINE | re.DOTALL
+        if self.args.get("ignore_case", False):
+            flags |= re.IGNORECASE
+        try:
+            self.regex, self.error = re.compile(self.args["pattern"], flags), None
+        except re.error as e:
+            self.regex, self.error = None, e
+
+    def _match_regexp(self, actual: OutputSource) -> MatchResult:
+        pattern = self.args["pattern"]
+        if self.error is not None:
+            return MatchResult(
+                False,
+                f"Invalid regex pattern: {self.error}",
+                expected=pattern
+            )
+
+        # A regex may span lines and anchor at the end, so it sees the whole
+        # output; strings are matched in place
+        text = actual if isinstance(actual, str) else "".join(iter_chunks(actual))
+        if self.args.get("full_match", False):
+            match = self.regex.fullmatch(text)
+        else:
+            match = self.regex.search(text)
+
+        if match:
+            return MatchResult(
+                True,
+                f"Output matches pattern '{pattern}'",
+                details={"match": match.group(), "groups": match.groups()}
+            )
+
+        return MatchResult(
+            False,
+            f"Output does not match pattern '{pattern}'",
+            actual=_excerpt(text),
+            expected=f"Pattern: {pattern}"
+        )
+
+    # -- line ----------------------------------------------------------------
+
+    def _compile_line(self):
+        expected = self.args["expected"]
+        if self.args.get("trim", True):
+            expected = expected.strip()
+        if self.args.get("ignore_case", False):
+            expected = expected.lower()
+        self.line = expected
+
+    def _normalize_line(self, line: str) -> str:
+        if self.args.get("trim", True):
+            line = line.strip()
+        if self.args.get("ignore_case", False):
+            line = line.lower()
+        return line
+
+    def _match_line(self, actual: OutputSource) -> MatchResult:
+        expected_line = self.args["expected"]
+        line_number = self.args.get("line_number")
+        lines = iter_lines(actual)
+
+        if line_number is not None:
+            # Check specific line (1-indexed)
+            count = 0
+            if line_number >= 1:
+                for count, line in enumerate(lines, 1):
+                    if count == line_number:
+                        actual_line = self._normalize_line(line)
+                        if actual_line == self.line:
+                            return MatchResult(True, f"Line {line_number} matches")
+                        return MatchResult(
+                            False,
+                            f"Line {line_number} does not match",
+                            actual=actual_line,
+                            expected=self.line
+                        )
+            else:
+                count = sum(1 for _ in lines)
+            return MatchResult(
+                False,
+                f"Line {line_number} does not exist (output has {count} lines)",
+                actual=f"Total lines: {count}",
+                expected=f"Line {line_number}: {expected_line}"
+            )
+
+        # Search for line in any position
+        count = 0
+        trim = self.args.get("trim", True)
+        ignore_case = self.args.get("ignore_case", False)
+        target = self.line
+        for count, line in enumerate(lines, 1):
+            if trim:
+                line = line.strip()
+            if ignore_case:
+                line = line.lower()
+            if line == target:
+                return MatchResult(
+                    True,
+                    f"Found matching line at line {count}",
+                    details={"line_number": count}
+                )
+
+        return MatchResult(
+            False,
+            f"Line not found in output",
+            actual=f"Total lines: {count}",
+            expected=expected_line
+        )
+
+    # -- lineCount -----------------------------------------------------------
+
+    def _match_lineCount(self, actual: OutputSource) -> MatchResult:
+        count = 0
+        last = ""
+        for chunk in _normalize_newlines(iter_chunks(actual)):
+            count += chunk.count('\n')
+            last = chunk[-1]
+        if last and last != '\n':
+            count += 1
+
+        expected_count = self.args.get("count", 0)
+        min_count = self.args.get("min_count")
+        max_count = self.args.get("max_count")
+
+        if min_count is not None and max_count is not None:
+            if min_count <= count <= max_count:
+                return MatchResult(
+                    True,
+                    f"Line count {count} is within range [{min_count}, {max_count}]"
+                )
+            return MatchResult(
+                False,
+                f"Line count {count} is not within range [{min_count}, {max_count}]",
+                actual=str(count),
+                expected=f"[{min_count}, {max_count}]"
+            )
+
+        if min_count is not None:
+            if count >= min_count:
+                return MatchResult(True, f"Line count {count} >= {min_count}")
+            return MatchResult(
+                False,
+                f"Line count {count} < {min_count}",
+                actual=str(count),
+                expected=f">= {min_count}"
+            )
+
+        if max_count is not None:
+            if count <= max_count:
+                return MatchResult(True, f"Line count {count} <= {max_count}")
+            return MatchResult(
+                False,
+                f"Line count {count} > {max_count}",
+                actual=str(count),
+                expected=f"<= {max_count}"
+            )
+
+        if count == expected_count:
+            return MatchResult(True, f"Line count is {expected_count}")
+
+        return MatchResult(
+            False,
+            f"Line count mismatch",
+            actual=str(count),
+            expected=str(expected_count)
+        )
+
+    # -- numeric -------------------------------------------------------------
+
+    def _compile_numeric(self):
+        expected = self.args["expected"]
+        if isinstance(expected, (int, float)):
+            self.numbers = [float(expected)]
+        else:
+            self.numbers = [float(x) for x in expected]
+
+    def _match_numeric(self, actual: OutputSource) -> MatchResult:
+        expected = self.numbers
+        tolerance = self.args.get("tolerance", 1e-6)
+        relative_tolerance = self.args.get("relative_tolerance")
+
+        # Only the leading numbers are compared: stop reading once they are in
+        actual_numbers: List[float] = []
+        if expected:
+            for value in iter_numbers(actual):
+                actual_numbers.append(value)
+                if len(actual_numbers) == len(expected):
+                    break
+
+        if len(actual_numbers) < len(expected):
+            return MatchResult(
+                False,
+                f"Found {len(actual_numbers)} numbers, expected at least {len(expected)}",
+                actual=str(actual_numbers),
+                expected=str(expected)
+            )
+
+        # Try to match expected numbers in order
+        for i, (act_val, exp_val) in enumerate(zip(actual_numbers, expected)):
+            diff = abs(act_val - exp_val)
+
+            # Check absolute tolerance
+            if diff > tolerance:
+                # Check relative tolerance if specified
+                if relative_tolerance is not None and exp_val != 0:
+                    rel_diff = diff / abs(exp_val)
+                    if rel_diff > relative_tolerance:
+                        return MatchResult(
+                            False,
+                            f"Value at index {i} differs: {act_val} vs {exp_val}",
+                            actual=str(act_val),
+                            expected=str(exp_val),
+                            details={"absolute_diff": diff, "relative_diff": rel_diff}
+                        )
+                else:
+                    return MatchResult(
+                        False,
+                        f"Value at index {i} differs: {act_val} vs {exp_val}",
+                        actual=str(act_val),
+                        expected=str(exp_val),
+                        details={"absolute_diff": diff}
+                    )
+
+        return MatchResult(
+            True,
+            f"All {len(expected)} numeric values match within tolerance",
+            details={"actual_numbers": actual_numbers, "expected_numbers": list(expected)}
+        )
+
+    # -- linesSubset ---------------------------------------------------------
+
+    def _compile_linesSubset(self):
+        self.lines = [self._normalize_line(line) for line in self.args["expected"]]
+
+    def _match_linesSubset(self, actual: OutputSource) -> MatchResult:
+        expected_lines = self.lines
+        trim = self.args.get("trim", True)
+        ignore_case = self.args.get("ignore_case", False)
+
+        if self.args.get("ordered", True):
+            # Lines must appear in order (but not necessarily consecutive)
+            idx = 0
+            if expected_lines:
+                for line in iter_lines(actual):
+                    if trim:
+                        line = line.strip()
+                    if ignore_case:
+                        line = line.lower()
+                    if line == expected_lines[idx]:
+                        idx += 1
+                        if idx == len(expected_lines):
+                            break
+
+            if idx < len(expected_lines):
+                return MatchResult(
+                    False,
+                    f"Expected line not found (in order): '{expected_lines[idx]}'",
+                    expected=expected_lines[idx]
+                )
+
+            return MatchResult(True, "All expected lines found in order")
+
+        # Lines can appear in any order
+        pending = set(expected_lines)
+        if pending:
+            for line in iter_lines(actual):
+                if trim:
+                    line = line.strip()
+                if ignore_case:
+                    line = line.lower()
+                if line in pending:
+                    pending.discard(line)
+                    if not pending:
+                        break
+
+        missing = [line for line in expected_lines if line in pending]
+        if missing:
+            return MatchResult(
+                False,
+                f"Missing {len(missing)} expected line(s)",
+                expected=str(missing)
+            )
+
+        return MatchResult(True, "All expected lines found")
+
+
+@functools.lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _cached_matcher(kind: str, args: Tuple[Tuple[str, Any], ...]) -> OutputMatcher:
+    return OutputMatcher(kind, **dict(args))
+
+
+def _matcher(kind: str, **args: Any) -> OutputMatcher:
+    """Compiled matcher, shared between calls with the same arguments."""
+    try:
+        return _cached_matcher(kind, tuple(sorted(args.items())))
+    except TypeError:
+        # Unhashable arguments (e.g. a list of expected numbers)
+        return OutputMatcher(kind, **args)
+
+
 def match_exact(actual: str, expected: str,
                 trim: bool = True,
                 normalize_newlines: bool = True,
@@ -107,18 +841,9 @@ def match_exact(actual: str, expected: str,
     Returns:
         MatchResult indicating success/failure
     """
-    actual_norm = normalize_output(actual, trim, normalize_newlines, False, ignore_case)
-    expected_norm = normalize_output(expected, trim, normalize_newlines, False, ignore_case)
-
-    if actual_norm == expected_norm:
-        return MatchResult(True, "Output matches exactly")
-
-    return MatchResult(
-        False,
-        "Output does not match",
-        actual=actual_norm,
-        expected=expected_norm
-    )
+    return _matcher("exact", expected=expected, trim=trim,
+                    normalize_newlines=normalize_newlines,
+                    ignore_case=ignore_case).match(actual)
 
 
 def match_contains(actual: str, pattern: str,
@@ -134,18 +859,7 @@ def match_contains(actual: str, pattern: str,
     Returns:
         MatchResult indicating success/failure
     """
-    actual_search = actual.lower() if ignore_case else actual
-    pattern_search = pattern.lower() if ignore_case else pattern
-
-    if pattern_search in actual_search:
-        return MatchResult(True, f"Output contains '{pattern}'")
-
-    return MatchResult(
-        False,
-        f"Output does not contain '{pattern}'",
-        actual=actual,
-        expected=f"Contains: {pattern}"
-    )
+    return _matcher("contains", text=pattern, ignore_case=ignore_case).match(actual)
 
 
 def match_starts_with(actual: str, prefix: str,
@@ -154,18 +868,8 @@ def match_starts_with(actual: str, prefix: str,
     """
     Check if actual output starts with prefix.
     """
-    actual_norm = normalize_output(actual, trim, True, False, ignore_case)
-    prefix_norm = prefix.lower() if ignore_case else prefix
-
-    if actual_norm.startswith(prefix_norm):
-        return MatchResult(True, f"Output starts with '{prefix}'")
-
-    return MatchResult(
-        False,
-        f"Output does not start with '{prefix}'",
-        actual=actual_norm[:len(prefix_norm) + 20] + "...",
-        expected=prefix
-    )
+    return _matcher("startsWith", text=prefix, trim=trim,
+                    ignore_case=ignore_case).match(actual)
 
 
 def match_ends_with(actual: str, suffix: str,
@@ -174,18 +878,8 @@ def match_ends_with(actual: str, suffix: str,
     """
     Check if actual output ends with suffix.
     """
-    actual_norm = normalize_output(actual, trim, True, False, ignore_case)
-    suffix_norm = suffix.lower() if ignore_case else suffix
-
-    if actual_norm.endswith(suffix_norm):
-        return MatchResult(True, f"Output ends with '{suffix}'")
-
-    return MatchResult(
-        False,
-        f"Output does not end with '{suffix}'",
-        actual="..." + actual_norm[-(len(suffix_norm) + 20):],
-        expected=suffix
-    )
+    return _matcher("endsWith", text=suffix, trim=trim,
+                    ignore_case=ignore_case).match(actual)
 
 
 def match_regexp(actual: str, pattern: str,
@@ -205,38 +899,8 @@ def match_regexp(actual: str, pattern: str,
     Returns:
         MatchResult with match details
     """
-    flags = 0
-    if multiline:
-        flags |= re.MULTILINE | re.DOTALL
-    if ignore_case:
-        flags |= re.IGNORECASE
-
-    try:
-        if full_match:
-            match = re.fullmatch(pattern, actual, flags)
-        else:
-            match = re.search(pattern, actual, flags)
-
-        if match:
-            return MatchResult(
-                True,
-                f"Output matches pattern '{pattern}'",
-                details={"match": match.group(), "groups": match.groups()}
-            )
-
-        return MatchResult(
-            False,
-            f"Output does not match pattern '{pattern}'",
-            actual=actual,
-            expected=f"Pattern: {pattern}"
-        )
-
-    except re.error as e:
-        return MatchResult(
-            False,
-            f"Invalid regex pattern: {e}",
-            expected=pattern
-        )
+    return _matcher("regexp", pattern=pattern, multiline=multiline,
+                    ignore_case=ignore_case, full_match=full_match).match(actual)
 
 
 def match_line(actual: str, expected_line: str,
@@ -256,58 +920,8 @@ def match_line(actual: str, expected_line: str,
     Returns:
         MatchResult
     """
-    lines = get_lines(actual)
-
-    if line_number is not None:
-        # Check specific line (1-indexed)
-        idx = line_number - 1
-        if idx < 0 or idx >= len(lines):
-            return MatchResult(
-                False,
-                f"Line {line_number} does not exist (output has {len(lines)} lines)",
-                actual=f"Total lines: {len(lines)}",
-                expected=f"Line {line_number}: {expected_line}"
-            )
-
-        actual_line = lines[idx]
-        if trim:
-            actual_line = actual_line.strip()
-            expected_line = expected_line.strip()
-        if ignore_case:
-            actual_line = actual_line.lower()
-            expected_line = expected_line.lower()
-
-        if actual_line == expected_line:
-            return MatchResult(True, f"Line {line_number} matches")
-
-        return MatchResult(
-            False,
-            f"Line {line_number} does not match",
-            actual=actual_line,
-            expected=expected_line
-        )
-
-    # Search for line in any position
-    for i, line in enumerate(lines):
-        check_line = line.strip() if trim else line
-        check_expected = expected_line.strip() if trim else expected_line
-        if ignore_case:
-            check_line = check_line.lower()
-            check_expected = check_expected.lower()
-
-        if check_line == check_expected:
-            return MatchResult(
-                True,
-                f"Found matching line at line {i + 1}",
-                details={"line_number": i + 1}
-            )
-
-    return MatchResult(
-        False,
-        f"Line not found in output",
-        actual=f"Total lines: {len(lines)}",
-        expected=expected_line
-    )
+    return _matcher("line", expected=expected_line, line_number=line_number,
+                    ignore_case=ignore_case, trim=trim).match(actual)
 
 
 def match_line_count(actual: str, expected_count: int,
@@ -325,51 +939,8 @@ def match_line_count(actual: str, expected_count: int,
     Returns:
         MatchResult
     """
-    lines = get_lines(actual)
-    count = len(lines)
-
-    if min_count is not None and max_count is not None:
-        if min_count <= count <= max_count:
-            return MatchResult(
-                True,
-                f"Line count {count} is within range [{min_count}, {max_count}]"
-            )
-        return MatchResult(
-            False,
-            f"Line count {count} is not within range [{min_count}, {max_count}]",
-            actual=str(count),
-            expected=f"[{min_count}, {max_count}]"
-        )
-
-    if min_count is not None:
-        if count >= min_count:
-            return MatchResult(True, f"Line count {count} >= {min_count}")
-        return MatchResult(
-            False,
-            f"Line count {count} < {min_count}",
-            actual=str(count),
-            expected=f">= {min_count}"
-        )
-
-    if max_count is not None:
-        if count <= max_count:
-            return MatchResult(True, f"Line count {count} <= {max_count}")
-        return MatchResult(
-            False,
-            f"Line count {count} > {max_count}",
-            actual=str(count),
-            expected=f"<= {max_count}"
-        )
-
-    if count == expected_count:
-        return MatchResult(True, f"Line count is {expected_count}")
-
-    return MatchResult(
-        False,
-        f"Line count mismatch",
-        actual=str(count),
-        expected=str(expected_count)
-    )
+    return _matcher("lineCount", count=expected_count, min_count=min_count,
+                    max_count=max_count).match(actual)
 
 
 def extract_numbers(text: str) -> List[float]:
@@ -383,17 +954,7 @@ def extract_numbers(text: str) -> List[float]:
         List of extracted float values
     """
     # Match integers, decimals, scientific notation
-    pattern = r'-?\d+\.?\d*(?:[eE][+-]?\d+)?'
-    matches = re.findall(pattern, text)
-
-    numbers = []
-    for m in matches:
-        try:
-            numbers.append(float(m))
-        except ValueError:
-            pass
-
-    return numbers
+    return list(_parse_numbers(text))
 
 
 def match_numeric_output(actual: str, expected: Union[float, List[float]],
@@ -402,6 +963,9 @@ def match_numeric_output(actual: str, expected: Union[float, List[float]],
     """
     Extract numbers from output and compare with expected values.
 
+    Only the leading ``len(expected)`` numbers are read; on success
+    ``details["actual_numbers"]`` holds those.
+
     Args:
         actual: Actual output
         expected: Expected number(s)
@@ -411,61 +975,10 @@ def match_numeric_output(actual: str, expected: Union[float, List[float]],
     Returns:
         MatchResult
     """
-    actual_numbers = extract_numbers(actual)
-
-    if isinstance(expected, (int, float)):
-        expected = [float(expected)]
-    else:
-        expected = [float(x) for x in expected]
-
-    if len(actual_numbers) < len(expected):
-        return MatchResult(
-            False,
-            f"Found {len(actual_numbers)} numbers, expected at least {len(expected)}",
-            actual=str(actual_numbers),
-            expected=str(expected)
-        )
-
-    # Try to match expected numbers in order
-    for i, exp_val in enumerate(expected):
-        if i >= len(actual_numbers):
-            return MatchResult(
-                False,
-                f"Missing expected value at index {i}",
-                actual=str(actual_numbers),
-                expected=str(expected)
-            )
-
-        act_val = actual_numbers[i]
-        diff = abs(act_val - exp_val)
-
-        # Check absolute tolerance
-        if diff > tolerance:
-            # Check relative tolerance if specified
-            if relative_tolerance is not None and exp_val != 0:
-                rel_diff = diff / abs(exp_val)
-                if rel_diff > relative_tolerance:
-                    return MatchResult(
-                        False,
-                        f"Value at index {i} differs: {act_val} vs {exp_val}",
-                        actual=str(act_val),
-                        expected=str(exp_val),
-                        details={"absolute_diff": diff, "relative_diff": rel_diff}
-                    )
-            else:
-                return MatchResult(
-                    False,
-                    f"Value at index {i} differs: {act_val} vs {exp_val}",
-                    actual=str(act_val),
-                    expected=str(exp_val),
-                    details={"absolute_diff": diff}
-                )
-
-    return MatchResult(
-        True,
-        f"All {len(expected)} numeric values match within tolerance",
-        details={"actual_numbers": actual_numbers, "expected_numbers": expected}
-    )
+    if not isinstance(expected, (int, float)):
+        expected = tuple(expected)
+    return _matcher("numeric", expected=expected, tolerance=tolerance,
+                    relative_tolerance=relative_tolerance).match(actual)
 
 
 def match_exit_code(actual: int, expected: int) -> MatchResult:
@@ -507,72 +1020,31 @@ def match_lines_subset(actual: str, expected_lines: List[str],
     Returns:
         MatchResult
     """
-    actual_lines = get_lines(actual)
-
-    # Normalize lines
-    if trim:
-        actual_lines = [l.strip() for l in actual_lines]
-        expected_lines = [l.strip() for l in expected_lines]
-    if ignore_case:
-        actual_lines = [l.lower() for l in actual_lines]
-        expected_lines = [l.lower() for l in expected_lines]
-
-    if ordered:
-        # Lines must appear in order (but not necessarily consecutive)
-        actual_idx = 0
-        for exp_line in expected_lines:
-            found = False
-            while actual_idx < len(actual_lines):
-                if actual_lines[actual_idx] == exp_line:
-                    found = True
-                    actual_idx += 1
-                    break
-                actual_idx += 1
-
-            if not found:
-                return MatchResult(
-                    False,
-                    f"Expected line not found (in order): '{exp_line}'",
-                    expected=exp_line
-                )
-
-        return MatchResult(True, "All expected lines found in order")
-
-    else:
-        # Lines can appear in any order
-        missing = []
-        for exp_line in expected_lines:
-            if exp_line not in actual_lines:
-                missing.append(exp_line)
-
-        if missing:
-            return MatchResult(
-                False,
-                f"Missing {len(missing)} expected line(s)",
-                expected=str(missing)
-            )
-
-        return MatchResult(True, "All expected lines found")
+    return _matcher("linesSubset", expected=tuple(expected_lines), ordered=ordered,
+                    ignore_case=ignore_case, trim=trim).match(actual)
 
 
-def compare_outputs(actual: str, expected: str,
-                    qualification: str,
+def compile_matcher(qualification: str, expected: Any = "",
                     pattern: Optional[str] = None,
-                    **options) -> MatchResult:
+                    **options) -> OutputMatcher:
     """
-    Compare actual output with expected using the specified qualification.
+    Compile the matcher for a stdio test definition.
 
-    This is the main entry point for stdio comparison.
+    Matchers are cached, so repeated runs of a test definition reuse the
+    normalized expected values and compiled patterns.
 
     Args:
-        actual: Actual output
+        qualification: Comparison type (matches, contains, regexp, etc.;
+            not exitCode)
         expected: Expected output (may be unused depending on qualification)
-        qualification: Comparison type (matches, contains, regexp, etc.)
         pattern: Pattern for pattern-based qualifications
-        **options: Additional options (ignore_case, trim, etc.)
+        **options: Additional options (see ``compare_outputs``)
 
     Returns:
-        MatchResult
+        OutputMatcher
+
+    Raises:
+        ValueError: Unknown qualification
     """
     # Extract common options
     ignore_case = options.get('ignore_case', False)
@@ -580,58 +1052,78 @@ def compare_outputs(actual: str, expected: str,
     normalize_newlines = options.get('normalize_newlines', True)
 
     if qualification in ('matches', 'verifyEqual'):
-        return match_exact(actual, expected, trim, normalize_newlines, ignore_case)
+        return _matcher("exact", expected=expected, trim=trim,
+                        normalize_newlines=normalize_newlines, ignore_case=ignore_case)
 
     elif qualification == 'contains':
-        search_pattern = pattern if pattern else expected
-        return match_contains(actual, search_pattern, ignore_case)
-
-    elif qualification == 'startsWith':
-        prefix = pattern if pattern else expected
-        return match_starts_with(actual, prefix, trim, ignore_case)
-
-    elif qualification == 'endsWith':
-        suffix = pattern if pattern else expected
-        return match_ends_with(actual, suffix, trim, ignore_case)
+        return _matcher("contains", text=pattern if pattern else expected,
+                        ignore_case=ignore_case)
 
-    elif qualification == 'regexp':
-        regex = pattern if pattern else expected
-        return match_regexp(actual, regex, multiline=False, ignore_case=ignore_case)
+    elif qualification in ('startsWith', 'endsWith'):
+        return _matcher(qualification, text=pattern if pattern else expected,
+                        trim=trim, ignore_case=ignore_case)
 
-    elif qualification == 'regexpMultiline':
-        regex = pattern if pattern else expected
-        return match_regexp(actual, regex, multiline=True, ignore_case=ignore_case)
+    elif qualification in ('regexp', 'regexpMultiline'):
+        return _matcher("regexp", pattern=pattern if pattern else expected,
+                        multiline=qualification == 'regexpMultiline',
+                        ignore_case=ignore_case, full_match=False)
 
     elif qualification == 'matchesLine':
-        line_number = options.get('line_number')
-        return match_line(actual, expected, line_number, ignore_case, trim)
+        return _matcher("line", expected=expected, line_number=options.get('line_number'),
+                        ignore_case=ignore_case, trim=trim)
 
     elif qualification == 'containsLine':
-        return match_line(actual, expected, None, ignore_case, trim)
+        return _matcher("line", expected=expected, line_number=None,
+                        ignore_case=ignore_case, trim=trim)
 
     elif qualification == 'lineCount':
         count = int(expected) if expected else options.get('count', 0)
-        min_count = options.get('min_count')
-        max_count = options.get('max_count')
-        return match_line_count(actual, count, min_count, max_count)
+        return _matcher("lineCount", count=count, min_count=options.get('min_count'),
+                        max_count=options.get('max_count'))
 
     elif qualification == 'numericOutput':
-        tolerance = options.get('tolerance', 1e-6)
-        rel_tol = options.get('relative_tolerance')
         # Parse expected as number(s)
         if isinstance(expected, str):
-            expected_nums = extract_numbers(expected)
-        else:
+            expected_nums = tuple(extract_numbers(expected))
+        elif isinstance(expected, (int, float)):
             expected_nums = expected
-        return match_numeric_output(actual, expected_nums, tolerance, rel_tol)
+        else:
+            expected_nums = tuple(expected)
+        return _matcher("numeric", expected=expected_nums,
+                        tolerance=options.get('tolerance', 1e-6),
+                        relative_tolerance=options.get('relative_tolerance'))
+
+    raise ValueError(f"Unknown qualification type: {qualification}")
+
+
+def compare_outputs(actual: OutputSource, expected: str,
+                    qualification: str,
+                    pattern: Optional[str] = None,
+                    **options) -> MatchResult:
+    """
+    Compare actual output with expected using the specified qualification.
+
+    This is the main entry point for stdio comparison.
 
-    elif qualification == 'exitCode':
+    Args:
+        actual: Actual output (string, bytes, file object or iterable of chunks)
+        expected: Expected output (may be unused depending on qualification)
+        qualification: Comparison type (matches, contains, regexp, etc.)
+        pattern: Pattern for pattern-based qualifications
+        **options: Additional options (ignore_case, trim, etc.)
+
+    Returns:
+        MatchResult
+    """
+    if qualification == 'exitCode':
         actual_code = options.get('exit_code', 0)
         expected_code = int(expected) if expected else 0
         return match_exit_code(actual_code, expected_code)
 
-    else:
+    if qualification not in QUALIFICATIONS:
         return MatchResult(
             False,
             f"Unknown qualification type: {qualification}"
         )
+
+    return compile_matcher(qualification, expected, pattern, **options).match(actual)
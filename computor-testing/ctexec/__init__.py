@@ -32,6 +32,8 @@ from .runtime import (
     RuntimeType,
     RuntimeInfo,
     RUNTIMES,
+    RuntimeRegistry,
+    get_runtime_registry,
     check_runtime_installed,
     get_runtime_info,
     list_available_runtimes,
@@ -52,6 +54,11 @@ from .compiled import (
     CompiledExecutor,
 )
 
+from .compile_cache import (
+    CompileCache,
+    get_compile_cache,
+)
+
 from .resources import (
     ResourceLimits,
     set_resource_limits,
@@ -76,6 +83,8 @@ __all__ = [
     "RuntimeType",
     "RuntimeInfo",
     "RUNTIMES",
+    "RuntimeRegistry",
+    "get_runtime_registry",
     "check_runtime_installed",
     "get_runtime_info",
     "list_available_runtimes",
@@ -88,6 +97,8 @@ __all__ = [
     # Compiled
     "CompilationResult",
     "CompiledExecutor",
+    "CompileCache",
+    "get_compile_cache",
     # Resources
     "ResourceLimits",
     "set_resource_limits",
@@ -0,0 +1,370 @@
+"""
+Content-addressed cache for compiled executables.
+
+Compiling the reference solution and identical student resubmissions over
+and over dominates the wall time of C/C++/Fortran tests. This cache keys a
+compilation by a hash of everything that determines its output:
+
+- language, compiler identity (resolved path + ``--version`` output),
+  compiler and linker flags, output name
+- contents (and relative names) of the sources and of every header-like
+  file under the source and ``-I`` directories
+- compiler-relevant environment variables (``CPATH``, ``LIBRARY_PATH``, ...)
+
+An entry holds the executable (if any) and the compiler diagnostics, so
+failed compilations are served from cache as well.
+
+Layout (``CT_COMPILE_CACHE_DIR``)::
+
+    entries/<k[:2]>/<key>/result.json   # CompilationResult fields + binary digest
+    entries/<k[:2]>/<key>/binary        # executable (successful compiles)
+    locks/<key>.lock                    # flock() between workers
+    tmp/                                # staging area for atomic publish
+
+Entries are published by renaming a fully written staging directory, so
+readers never see partial entries. Workers compiling the same key wait on
+the key's lock and then hit. The cache is trimmed to
+``CT_COMPILE_CACHE_MAX_BYTES`` (least recently used first). Set
+``CT_COMPILE_CACHE=0`` to disable it.
+
+Submissions run the executable they are given, so a cache entry must never
+be writable through it: hits copy the binary into the job's directory
+(never a hard link sharing the entry's inode), entries are read-only, and
+the binary's SHA-256 recorded at publish time is checked on every hit (a
+mismatching entry is discarded). There is no default location: the cache
+is only enabled when ``CT_COMPILE_CACHE_DIR`` names a directory that the
+uid submissions run as cannot write to. It is created with mode 0700.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from .runtime import get_runtime_registry
+
+CACHE_DIR_ENV = "CT_COMPILE_CACHE_DIR"
+CACHE_MAX_BYTES_ENV = "CT_COMPILE_CACHE_MAX_BYTES"
+CACHE_ENABLED_ENV = "CT_COMPILE_CACHE"
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Bump when the key derivation or entry format changes
+CACHE_FORMAT = "1"
+
+# Files that may be pulled in by #include / INCLUDE and therefore affect output
+DEPENDENCY_EXTENSIONS = {
+    ".h", ".hh", ".hpp", ".hxx", ".inc", ".ipp", ".tpp",
+    ".c", ".cc", ".cpp", ".cxx",
+    ".f", ".for", ".f77", ".f90", ".f95", ".f03", ".f08", ".fi", ".fh",
+}
+
+# Above this many candidate files the key is not worth computing; compile uncached
+MAX_DEPENDENCY_FILES = 2000
+
+# Environment variables read by gcc/gfortran and the linker
+COMPILER_ENV_VARS = (
+    "CPATH", "C_INCLUDE_PATH", "CPLUS_INCLUDE_PATH", "OBJC_INCLUDE_PATH",
+    "LIBRARY_PATH", "GCC_EXEC_PREFIX", "COMPILER_PATH", "SOURCE_DATE_EPOCH",
+)
+
+RESULT_FIELDS = ("success", "stdout", "stderr", "return_code", "duration", "warnings", "errors")
+
+# Modes of published entries (directory, executable, result)
+ENTRY_DIR_MODE = 0o555
+BINARY_MODE = 0o555
+RESULT_MODE = 0o444
+
+# Mode of the executable copied into the job directory
+EXECUTABLE_MODE = 0o755
+
+def _compiler_identity(compiler: str) -> Optional[str]:
+    """Resolved path plus ``--version`` output (probed once per binary file)."""
+    try:
+        probe = get_runtime_registry().probe(compiler, "--version", timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if probe is None:
+        return None
+    return f"{os.path.realpath(probe['path'])}\n{probe['stdout']}"
+
+
+def _include_dirs(flags: List[str], working_dir: str) -> List[str]:
+    dirs = []
+    for i, flag in enumerate(flags):
+        if flag == "-I" and i + 1 < len(flags):
+            value = flags[i + 1]
+        elif flag.startswith("-I") and len(flag) > 2:
+            value = flag[2:]
+        else:
+            continue
+        dirs.append(value if os.path.isabs(value) else os.path.join(working_dir, value))
+    return dirs
+
+
+def _dependency_files(directories: List[str]) -> Optional[List[str]]:
+    files = set()
+    for directory in dict.fromkeys(os.path.abspath(d) for d in directories):
+        for root, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                if os.path.splitext(name)[1].lower() in DEPENDENCY_EXTENSIONS:
+                    files.add(os.path.join(root, name))
+                    if len(files) > MAX_DEPENDENCY_FILES:
+                        return None
+    return sorted(files)
+
+
+def _hash_file(digest, path: str) -> None:
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 16), b""):
+            digest.update(block)
+
+
+class CompileCache:
+    """Filesystem-backed compile cache shared by all workers on a host."""
+
+    def __init__(self, root: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Cache directory (created with mode 0700 if missing)
+            max_bytes: Size limit enforced after each new entry
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(root, mode=0o700, exist_ok=True)
+        for sub in ("entries", "locks", "tmp"):
+            os.makedirs(os.path.join(root, sub), mode=0o700, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Optional["CompileCache"]:
+        """Build the cache from environment settings (None when disabled or unset)."""
+        if os.environ.get(CACHE_ENABLED_ENV, "1").lower() in ("0", "false", "off", "no"):
+            return None
+        # No default under the home directory: jobs usually run as that uid
+        root = os.environ.get(CACHE_DIR_ENV)
+        if not root:
+            return None
+        try:
+            max_bytes = int(os.environ.get(CACHE_MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+            return cls(root, max_bytes)
+        except (OSError, ValueError):
+            return None
+
+    def key(
+        self,
+        language: str,
+        compiler: str,
+        flags: List[str],
+        linker_flags: List[str],
+        sources: List[str],
+        working_dir: str,
+        output_name: str,
+    ) -> Optional[str]:
+        """
+        Compute the cache key of a compilation.
+
+        Args:
+            language: Executor language
+            compiler: Compiler command
+            flags: Compiler flags
+            linker_flags: Linker flags
+            sources: Absolute source paths
+            working_dir: Compilation working directory
+            output_name: Executable name
+
+        Returns:
+            Hex digest, or None if the compilation should not be cached
+        """
+        identity = _compiler_identity(compiler)
+        if identity is None:
+            return None
+
+        directories = [os.path.dirname(src) for src in sources]
+        directories += _include_dirs(flags, working_dir)
+        dependencies = _dependency_files(directories)
+        if dependencies is None:
+            return None
+
+        digest = hashlib.sha256()
+        header = {
+            "format": CACHE_FORMAT,
+            "language": language,
+            "compiler": identity,
+            "flags": list(flags),
+            "linker_flags": list(linker_flags),
+            "output_name": output_name,
+            "sources": [self._display_path(src, working_dir) for src in sources],
+            "env": {var: os.environ.get(var) for var in COMPILER_ENV_VARS},
+        }
+        digest.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+        for path in dict.fromkeys(sources + dependencies):
+            digest.update(b"\0" + self._display_path(path, working_dir).encode("utf-8") + b"\0")
+            try:
+                _hash_file(digest, path)
+            except OSError:
+                return None
+        return digest.hexdigest()
+
+    @staticmethod
+    def _display_path(path: str, working_dir: str) -> str:
+        rel = os.path.relpath(path, working_dir)
+        return path if rel.startswith("..") else rel
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.root, "entries", key[:2], key)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold the key's cross-process lock (blocks while another worker compiles it)."""
+        with open(os.path.join(self.root, "locks", f"{key}.lock"), "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def lookup(self, key: str, executable_path: str) -> Optional[Dict]:
+        """
+        Fetch an entry and materialize its executable.
+
+        Args:
+            key: Cache key
+            executable_path: Where the cached executable should appear
+
+        Returns:
+            Stored CompilationResult fields, or None on a miss
+        """
+        entry = self._entry_dir(key)
+        try:
+            with open(os.path.join(entry, "result.json"), encoding="utf-8") as fh:
+                stored = json.load(fh)
+            result = {name: stored[name] for name in RESULT_FIELDS}
+            if result["success"] and not self._materialize(
+                os.path.join(entry, "binary"), executable_path, stored["binary_sha256"]
+            ):
+                # Modified after publishing: never hand it out again
+                self._discard(entry)
+                return None
+            os.utime(os.path.join(entry, "result.json"))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return result
+
+    @staticmethod
+    def _materialize(cached: str, target: str, sha256: str) -> bool:
+        """Copy the cached executable to ``target`` if it still has its digest."""
+        # A private copy: the job may write to its executable, which must
+        # not reach the entry. Hashing while copying checks the bytes copied.
+        digest = hashlib.sha256()
+        with open(cached, "rb") as src, open(target, "wb") as dst:
+            for block in iter(lambda: src.read(1 << 16), b""):
+                digest.update(block)
+                dst.write(block)
+        if digest.hexdigest() != sha256:
+            os.unlink(target)
+            return False
+        os.chmod(target, EXECUTABLE_MODE)
+        return True
+
+    def _discard(self, path: str) -> None:
+        """Remove an entry directory (renamed away first, so lookups never see it half-deleted)."""
+        doomed = tempfile.mkdtemp(prefix="evict.", dir=os.path.join(self.root, "tmp"))
+        try:
+            os.chmod(path, 0o700)
+            os.rename(path, os.path.join(doomed, os.path.basename(path)))
+        except OSError:
+            pass
+        shutil.rmtree(doomed, ignore_errors=True)
+
+    def publish(self, key: str, result: Dict, executable_path: Optional[str]) -> None:
+        """
+        Store a compilation outcome atomically.
+
+        Args:
+            key: Cache key
+            result: CompilationResult fields (see ``RESULT_FIELDS``)
+            executable_path: Executable to store (successful compiles only)
+        """
+        entry = self._entry_dir(key)
+        if os.path.exists(entry):
+            return
+
+        staging = tempfile.mkdtemp(prefix=f"{key[:12]}.", dir=os.path.join(self.root, "tmp"))
+        try:
+            stored = {name: result[name] for name in RESULT_FIELDS}
+            stored["binary_sha256"] = None
+            if result["success"]:
+                binary = os.path.join(staging, "binary")
+                shutil.copy2(executable_path, binary)
+                digest = hashlib.sha256()
+                _hash_file(digest, binary)
+                stored["binary_sha256"] = digest.hexdigest()
+                os.chmod(binary, BINARY_MODE)
+            with open(os.path.join(staging, "result.json"), "w", encoding="utf-8") as fh:
+                json.dump(stored, fh)
+            os.chmod(os.path.join(staging, "result.json"), RESULT_MODE)
+            os.makedirs(os.path.dirname(entry), mode=0o700, exist_ok=True)
+            os.rename(staging, entry)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        # Read-only only once in place: moving a directory needs write access to it
+        os.chmod(entry, ENTRY_DIR_MODE)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits ``max_bytes``."""
+        entries = []
+        total = 0
+        entries_root = os.path.join(self.root, "entries")
+        for shard in os.scandir(entries_root):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                    used = os.stat(os.path.join(entry.path, "result.json")).st_mtime
+                except OSError:
+                    continue
+                entries.append((used, size, entry.name, entry.path))
+                total += size
+
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * 0.9)
+        for _, size, key, path in sorted(entries):
+            if total <= target:
+                break
+            with open(os.path.join(self.root, "locks", f"{key}.lock"), "a") as fh:
+                try:
+                    fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    continue  # in use right now
+                try:
+                    self._discard(path)
+                    total -= size
+                finally:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+_default_cache: Optional[CompileCache] = None
+_default_cache_loaded = False
+
+
+def get_compile_cache() -> Optional[CompileCache]:
+    """Process-wide cache configured from the environment (None when disabled)."""
+    global _default_cache, _default_cache_loaded
+    if not _default_cache_loaded:
+        _default_cache = CompileCache.from_env()
+        _default_cache_loaded = True
+    return _default_cache
@@ -15,6 +15,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from .base import BaseExecutor, ExecutorResult
+from .compile_cache import RESULT_FIELDS, get_compile_cache
 from .environment import get_safe_env, filter_env
 from .exceptions import CompilationError, ExecutionError, ExecutionTimeoutError
 from .resources import make_preexec_fn
@@ -32,6 +33,7 @@ class CompilationResult:
     duration: float = 0.0
     warnings: List[str] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
+    cached: bool = False
 
     def __bool__(self) -> bool:
         return self.success
@@ -64,6 +66,7 @@ class CompiledExecutor(BaseExecutor):
         use_safe_env: bool = True,
         check_runtime: bool = True,
         resource_limits=None,
+        use_compile_cache: bool = True,
     ):
         """
         Initialize the compiled language executor.
@@ -75,6 +78,9 @@ class CompiledExecutor(BaseExecutor):
             use_safe_env: Use safe environment variables
             check_runtime: Check if compiler is available on init
             resource_limits: Optional resource limits (CPU, memory, etc.)
+            use_compile_cache: Reuse results of identical compilations
+                (see ``compile_cache``; enabled by CT_COMPILE_CACHE_DIR,
+                disabled globally by CT_COMPILE_CACHE=0)
         """
         # Set run timeout as the main timeout
         if timeout is None:
@@ -86,6 +92,7 @@ class CompiledExecutor(BaseExecutor):
             if compile_timeout is not None
             else self.default_compile_timeout
         )
+        self.use_compile_cache = use_compile_cache
 
         # State
         self.temp_dir: Optional[str] = None
@@ -172,20 +179,83 @@ class CompiledExecutor(BaseExecutor):
 
         # Set up temp directory
         self.temp_dir = tempfile.mkdtemp(prefix=f"{self.language}exec_")
-        self.executable_path = os.path.join(self.temp_dir, output_name or "a.out")
+        output_name = output_name or "a.out"
+        self.executable_path = os.path.join(self.temp_dir, output_name)
 
         # Build compiler command
         actual_compiler = compiler or self._get_default_compiler()
         actual_flags = flags if flags is not None else self._get_default_flags()
+        actual_linker_flags = list(linker_flags or [])
+
+        cache = get_compile_cache() if self.use_compile_cache else None
+        key = None
+        if cache is not None:
+            key = cache.key(
+                self.language, actual_compiler, actual_flags, actual_linker_flags,
+                resolved, self.working_dir, output_name,
+            )
+
+        if key is None:
+            self.last_compilation = self._run_compiler(
+                actual_compiler, actual_flags, actual_linker_flags, resolved
+            )
+            return self.last_compilation
+
+        # Hold the key's lock across lookup and compile so concurrent workers
+        # compiling the same submission wait for one compiler run and then hit
+        with cache.lock(key):
+            cached = cache.lookup(key, self.executable_path)
+            if cached is not None:
+                self.last_compilation = CompilationResult(
+                    executable_path=self.executable_path if cached["success"] else None,
+                    cached=True,
+                    **cached,
+                )
+                return self.last_compilation
+
+            self.last_compilation = self._run_compiler(
+                actual_compiler, actual_flags, actual_linker_flags, resolved
+            )
+            # Only genuine compiler verdicts are cacheable (not timeouts or
+            # missing compilers, which say nothing about the sources)
+            if self.last_compilation.return_code >= 0:
+                cache.publish(
+                    key,
+                    {name: getattr(self.last_compilation, name) for name in RESULT_FIELDS},
+                    self.last_compilation.executable_path,
+                )
+
+        return self.last_compilation
+
+    def _run_compiler(
+        self,
+        compiler: str,
+        flags: List[str],
+        linker_flags: List[str],
+        sources: List[str],
+    ) -> CompilationResult:
+        """
+        Invoke the compiler and collect its result.
+
+        Args:
+            compiler: Compiler command
+            flags: Compiler flags
+            linker_flags: Linker flags
+            sources: Absolute source paths
 
-        cmd = [actual_compiler]
-        cmd.extend(actual_flags)
-        cmd.extend(resolved)
+        Returns:
+            CompilationResult with success status and details
+        """
+        # Sources inside the working directory are passed relative to it, so
+        # diagnostics do not depend on where the submission was unpacked
+        cmd = [compiler]
+        cmd.extend(flags)
+        for src in sources:
+            rel = os.path.relpath(src, self.working_dir)
+            cmd.append(src if rel.startswith("..") else rel)
         cmd.extend(["-o", self.executable_path])
-        if linker_flags:
-            cmd.extend(linker_flags)
+        cmd.extend(linker_flags)
 
-        # Run compilation
         start_time = time.perf_counter()
         try:
             result = subprocess.run(
@@ -199,7 +269,7 @@ class CompiledExecutor(BaseExecutor):
 
             warnings, errors = self._parse_compiler_output(result.stderr)
 
-            self.last_compilation = CompilationResult(
+            return CompilationResult(
                 success=(result.returncode == 0),
                 executable_path=self.executable_path if result.returncode == 0 else None,
                 stdout=result.stdout,
@@ -212,7 +282,7 @@ class CompiledExecutor(BaseExecutor):
 
         except subprocess.TimeoutExpired:
             duration = time.perf_counter() - start_time
-            self.last_compilation = CompilationResult(
+            return CompilationResult(
                 success=False,
                 stderr=f"Compilation timed out after {self.compile_timeout}s",
                 return_code=-1,
@@ -220,19 +290,17 @@ class CompiledExecutor(BaseExecutor):
             )
 
         except FileNotFoundError:
-            self.last_compilation = CompilationResult(
+            return CompilationResult(
                 success=False,
-                stderr=f"Compiler not found: {actual_compiler}",
+                stderr=f"Compiler not found: {compiler}",
                 return_code=-1,
             )
 
         except Exception as e:
-            self.last_compilation = CompilationResult(
+            return CompilationResult(
                 success=False, stderr=f"Compilation error: {str(e)}", return_code=-1
             )
 
-        return self.last_compilation
-
     def run(
         self,
         args: Optional[List[str]] = None,
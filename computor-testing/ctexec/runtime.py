@@ -3,14 +3,39 @@ Unified runtime/compiler detection for all languages.
 
 Provides a single interface to check if language runtimes
 and compilers are installed and get their version information.
+
+Version probes (``<binary> --version``) are memoized by the
+``RuntimeRegistry``: a binary is probed once per resolved path and file
+identity (device, inode, mtime, size), so an upgraded interpreter is
+probed again but an unchanged one never is. Only successful probes are
+remembered; they are persisted in a small JSON file shared by all harness
+processes on a host.
+
+Layout (``CT_RUNTIME_CACHE_FILE``, default ``$XDG_CACHE_HOME/computor/runtimes.json``)::
+
+    runtimes.json         # {"format": ..., "probes": {<identity key>: {returncode, stdout, stderr}}}
+    runtimes.json.lock    # flock() around read-modify-write
+
+Set ``CT_RUNTIME_CACHE=0`` to keep probe results in memory only.
 """
 
+import fcntl
+import json
 import os
+import shutil
 import subprocess
+import tempfile
+import threading
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
+CACHE_FILE_ENV = "CT_RUNTIME_CACHE_FILE"
+CACHE_ENABLED_ENV = "CT_RUNTIME_CACHE"
+
+# Bump when the key derivation or entry format changes
+CACHE_FORMAT = "1"
+
 
 class RuntimeType(Enum):
     """Type of language runtime."""
@@ -99,6 +124,158 @@ RUNTIMES: Dict[str, RuntimeInfo] = {
 }
 
 
+Probe = Dict[str, object]
+
+
+class RuntimeRegistry:
+    """Memoized ``--version`` probes, keyed by binary path and file identity."""
+
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            cache_file: JSON file shared between processes (None: memory only)
+        """
+        self.cache_file = cache_file
+        self._probes: Dict[str, Probe] = {}
+        self._lock = threading.Lock()
+        self.spawned = 0  # Probe subprocesses started by this registry
+
+    @classmethod
+    def from_env(cls) -> "RuntimeRegistry":
+        """Build the registry from environment settings."""
+        if os.environ.get(CACHE_ENABLED_ENV, "1").lower() in ("0", "false", "off", "no"):
+            return cls()
+        cache_file = os.environ.get(CACHE_FILE_ENV) or os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+            "computor",
+            "runtimes.json",
+        )
+        return cls(cache_file)
+
+    @staticmethod
+    def identity(binary: str) -> Optional[Tuple[str, str]]:
+        """
+        Resolved path of ``binary`` and its identity key.
+
+        Returns:
+            (resolved path, "<realpath>|<dev>|<ino>|<mtime_ns>|<size>"), or
+            None if the binary is not found on ``PATH``
+        """
+        path = shutil.which(binary)
+        if not path:
+            return None
+        real = os.path.realpath(path)
+        try:
+            st = os.stat(real)
+        except OSError:
+            return None
+        return path, f"{real}|{st.st_dev}|{st.st_ino}|{st.st_mtime_ns}|{st.st_size}"
+
+    def _load(self) -> Dict[str, Probe]:
+        try:
+            with open(self.cache_file) as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT:
+            return {}
+        probes = data.get("probes")
+        return probes if isinstance(probes, dict) else {}
+
+    def _persist(self, key: str, probe: Probe) -> None:
+        directory = os.path.dirname(self.cache_file) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(self.cache_file + ".lock", "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    probes = self._load()
+                    # Drop probes of earlier versions of the same binary
+                    prefix = key.split("|", 1)[0] + "|"
+                    flag = key.rsplit("|", 1)[1]
+                    probes = {
+                        k: v for k, v in probes.items()
+                        if not (k.startswith(prefix) and k.rsplit("|", 1)[1] == flag)
+                    }
+                    probes[key] = probe
+                    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                    with os.fdopen(fd, "w") as fh:
+                        json.dump({"format": CACHE_FORMAT, "probes": probes}, fh)
+                    os.replace(tmp_path, self.cache_file)
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+        except OSError:
+            pass
+
+    def probe(self, binary: str, version_flag: str = "--version", timeout: float = 10.0) -> Optional[Probe]:
+        """
+        Run (or recall) ``binary version_flag``.
+
+        Args:
+            binary: Binary name or path
+            version_flag: Flag to pass for version info
+            timeout: Timeout in seconds for a new probe
+
+        Returns:
+            Dict with ``path``, ``returncode``, ``stdout`` and ``stderr``, or
+            None if the binary is not found. Only probes that exit with 0
+            are remembered.
+
+        Raises:
+            subprocess.TimeoutExpired: If a new probe times out (not cached)
+            OSError: If the binary cannot be executed (not cached)
+        """
+        resolved = self.identity(binary)
+        if resolved is None:
+            return None
+        path, file_key = resolved
+        key = f"{file_key}|{version_flag}"
+
+        with self._lock:
+            probe = self._probes.get(key)
+        if probe is None and self.cache_file:
+            probe = self._load().get(key)
+            if probe is not None:
+                with self._lock:
+                    self._probes[key] = probe
+        if probe is None:
+            with self._lock:
+                self.spawned += 1
+            result = subprocess.run(
+                [path, version_flag],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            probe = {"returncode": result.returncode, "stdout": result.stdout, "stderr": result.stderr}
+            if result.returncode != 0:
+                # Like timeouts, failures may be transient (e.g. a broken install being fixed)
+                return dict(probe, path=path)
+            with self._lock:
+                self._probes[key] = probe
+            if self.cache_file:
+                self._persist(key, probe)
+        return dict(probe, path=path)
+
+    def clear(self) -> None:
+        """Forget all probes held in memory (the shared file is kept)."""
+        with self._lock:
+            self._probes.clear()
+
+
+_default_registry: Optional[RuntimeRegistry] = None
+
+
+def get_runtime_registry() -> RuntimeRegistry:
+    """Process-wide runtime registry configured from the environment."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = RuntimeRegistry.from_env()
+    return _default_registry
+
+
 def check_runtime_installed(
     language: str,
     binary: Optional[str] = None,
@@ -153,6 +330,8 @@ def _check_binary(
     """
     Check if a specific binary is available.
 
+    The version probe is memoized by the runtime registry.
+
     Args:
         binary: Binary name to check
         version_flag: Flag to pass for version info
@@ -163,25 +342,22 @@ def _check_binary(
         Tuple of (is_installed, version_or_error)
     """
     try:
-        result = subprocess.run(
-            [binary, version_flag],
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
+        result = get_runtime_registry().probe(binary, version_flag, timeout)
+        if result is None:
+            return False, f"Binary not found: {binary}"
 
-        if result.returncode == 0:
+        if result["returncode"] == 0:
             # Parse version based on output location
             if version_output == "stderr":
-                output = result.stderr.strip()
+                output = result["stderr"].strip()
             elif version_output == "first_line":
-                output = (result.stdout or result.stderr).split("\n")[0].strip()
+                output = (result["stdout"] or result["stderr"]).split("\n")[0].strip()
             else:
-                output = result.stdout.strip()
+                output = result["stdout"].strip()
 
             return True, f"{output} ({binary})"
 
-        return False, f"{binary} returned exit code {result.returncode}"
+        return False, f"{binary} returned exit code {result['returncode']}"
 
     except FileNotFoundError:
         return False, f"Binary not found: {binary}"
@@ -210,6 +386,9 @@ def list_available_runtimes() -> Dict[str, Tuple[bool, str]]:
     """
     Check all supported runtimes and return their status.
 
+    Runtimes probed before (by this or another harness process on the
+    host) are answered from the runtime registry without a subprocess.
+
     Returns:
         Dictionary mapping language -> (is_installed, version_or_error)
     """
@@ -227,8 +406,6 @@ def get_binary_path(language: str, binary: Optional[str] = None) -> Optional[str
     Returns:
         Full path to binary or None if not found
     """
-    import shutil
-
     lang_lower = language.lower()
     if lang_lower not in RUNTIMES:
         return None
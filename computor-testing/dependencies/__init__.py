@@ -15,6 +15,10 @@ from .models import (
     OctavePackage,
     SystemDependencies,
 )
+from .cache import (
+    EnvironmentCache,
+    EnvironmentBuildError,
+)
 
 __all__ = [
     "Dependencies",
@@ -25,4 +29,6 @@ __all__ = [
     "OctaveDependencies",
     "OctavePackage",
     "SystemDependencies",
+    "EnvironmentCache",
+    "EnvironmentBuildError",
 ]
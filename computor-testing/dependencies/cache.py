@@ -0,0 +1,371 @@
+"""
+Computor Framework - Dependency Environment Cache
+
+Builds each distinct dependency set once and reuses it across test runs.
+
+An environment is a *layer* on top of a base runtime:
+
+- Python: a ``pip install --target`` directory resolved in a single pip
+  call with the base interpreter, used via ``PYTHONPATH``
+- R: a library directory installed by a single Rscript run, used via ``R_LIBS``
+
+Layers are keyed by a hash of the normalized dependency spec and the base
+runtime identity, built in a staging directory, published by an atomic
+rename and then made read-only. Workers building the same layer serialize
+on a per-key file lock, so a layer is built at most once per cache.
+
+The read-only bits are advisory: whoever owns a layer can chmod it back
+and modify it for every later job. Layers are only protected from test
+jobs when the jobs run as a different uid than the layer owner. Either
+build the cache as a separate user, hand finished layers to one with
+``CT_ENV_CACHE_OWNER=uid[:gid]`` (needs ``CAP_CHOWN``), or mount the cache
+read-only into the sandbox.
+
+Octave packages are not cached as layers yet; ``deps-installer install``
+still installs them per run.
+
+Layout (``CT_ENV_CACHE_DIR``, default ``$XDG_CACHE_HOME/computor/envs``)::
+
+    python/<key>/site-packages/   # published layer
+    python/<key>/meta.json        # spec and build time
+    r/<key>/library/
+    locks/<key>.lock
+    tmp/                          # staging area
+
+Usage:
+    cache = EnvironmentCache()
+    env = cache.activation_env(Dependencies.from_yaml("dependencies.yaml"))
+    # -> {"PYTHONPATH": ".../site-packages:...", "R_LIBS": ".../library:..."}
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import re
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .models import Dependencies, RDependencies
+
+CACHE_DIR_ENV = "CT_ENV_CACHE_DIR"
+CACHE_OWNER_ENV = "CT_ENV_CACHE_OWNER"
+
+# Bump when the layer layout or key derivation changes
+CACHE_FORMAT = "1"
+
+_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(\[[^\]]*\])?\s*(.*)$")
+
+
+class EnvironmentBuildError(RuntimeError):
+    """Raised when installing a dependency layer fails."""
+
+
+def normalize_requirement(requirement: str) -> str:
+    """
+    Normalize a pip requirement string for hashing.
+
+    Project names are compared case-insensitively with ``-``, ``_`` and ``.``
+    equivalent (PEP 503); extras are sorted and whitespace is dropped. URLs
+    and paths are kept verbatim.
+    """
+    requirement = requirement.strip()
+    if "://" in requirement or requirement.startswith((".", "/", "git+")):
+        return requirement
+    match = _NAME_RE.match(requirement)
+    if not match:
+        return requirement
+    name, extras, rest = match.groups()
+    name = re.sub(r"[-_.]+", "-", name).lower()
+    if extras:
+        extras = "[" + ",".join(sorted(e.strip().lower() for e in extras[1:-1].split(",") if e.strip())) + "]"
+    return name + (extras or "") + re.sub(r"\s+", "", rest)
+
+
+def normalize_requirements(requirements: Iterable[str]) -> List[str]:
+    """Normalized, de-duplicated and sorted requirement list."""
+    return sorted({normalize_requirement(r) for r in requirements if r and r.strip()})
+
+
+def _runtime_identity(cmd: List[str]) -> str:
+    """Resolved executable plus its version output, so a runtime upgrade misses."""
+    exe = shutil.which(cmd[0]) or cmd[0]
+    try:
+        out = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        version = (out.stdout + out.stderr).strip()
+    except (OSError, subprocess.SubprocessError):
+        version = ""
+    return f"{os.path.realpath(exe)}\n{version}"
+
+
+def parse_owner(value: str) -> Tuple[int, int]:
+    """Parse ``uid[:gid]`` (gid defaults to uid)."""
+    uid, _, gid = value.partition(":")
+    try:
+        return int(uid), int(gid or uid)
+    except ValueError:
+        raise ValueError(f"Invalid layer owner {value!r}, expected uid[:gid]") from None
+
+
+def _seal(path: str, owner: Optional[Tuple[int, int]]) -> None:
+    """Clear the write bits of one entry and optionally hand it to ``owner``."""
+    if owner is not None:
+        os.lchown(path, *owner)
+    if not os.path.islink(path):
+        write_bits = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+        os.chmod(path, os.stat(path).st_mode & ~write_bits)
+
+
+def _make_read_only(path: str, owner: Optional[Tuple[int, int]] = None) -> None:
+    for root, dirs, files in os.walk(path):
+        for name in dirs + files:
+            _seal(os.path.join(root, name), owner)
+    _seal(path, owner)
+
+
+def _make_writable(path: str) -> None:
+    for root, dirs, _ in os.walk(path):
+        os.chmod(root, os.stat(root).st_mode | stat.S_IWUSR)
+        for name in dirs:
+            full = os.path.join(root, name)
+            if not os.path.islink(full):
+                os.chmod(full, os.stat(full).st_mode | stat.S_IWUSR)
+
+
+class EnvironmentCache:
+    """Content-addressed store of read-only dependency layers."""
+
+    def __init__(self, root: Optional[str] = None, owner: Optional[Tuple[int, int]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Cache directory (default: $CT_ENV_CACHE_DIR or ~/.cache/computor/envs)
+            owner: (uid, gid) that published layers are handed to
+                (default: $CT_ENV_CACHE_OWNER, else the building user)
+        """
+        if owner is None and os.environ.get(CACHE_OWNER_ENV):
+            owner = parse_owner(os.environ[CACHE_OWNER_ENV])
+        self.owner = owner
+        self.root = root or os.environ.get(CACHE_DIR_ENV) or os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+            "computor",
+            "envs",
+        )
+        for sub in ("python", "r", "locks", "tmp"):
+            os.makedirs(os.path.join(self.root, sub), exist_ok=True)
+
+    @staticmethod
+    def spec_key(kind: str, spec: Dict) -> str:
+        """Hash of a normalized layer spec."""
+        payload = json.dumps({"format": CACHE_FORMAT, "kind": kind, **spec}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _lock(self, key: str) -> Iterator[None]:
+        with open(os.path.join(self.root, "locks", f"{key}.lock"), "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _layer(self, kind: str, spec: Dict, content: str, build) -> str:
+        """
+        Return the published layer for a spec, building it first if needed.
+
+        Args:
+            kind: Layer kind ("python" or "r")
+            spec: Normalized spec (hashed into the key and stored in meta.json)
+            content: Name of the layer's content directory
+            build: Callable(content_dir) installing into the staging directory
+
+        Returns:
+            Path of the read-only content directory
+
+        Raises:
+            EnvironmentBuildError: If the layer cannot be handed to ``owner``
+        """
+        key = self.spec_key(kind, spec)
+        layer_dir = os.path.join(self.root, kind, key)
+        content_dir = os.path.join(layer_dir, content)
+        if os.path.isdir(content_dir):
+            return content_dir
+
+        with self._lock(key):
+            if os.path.isdir(content_dir):
+                return content_dir
+
+            staging = tempfile.mkdtemp(prefix=f"{kind}-{key[:12]}.", dir=os.path.join(self.root, "tmp"))
+            try:
+                staged_content = os.path.join(staging, content)
+                os.makedirs(staged_content)
+                start = time.perf_counter()
+                build(staged_content)
+                with open(os.path.join(staging, "meta.json"), "w") as f:
+                    json.dump({
+                        "spec": spec,
+                        "built_at": time.time(),
+                        "build_seconds": round(time.perf_counter() - start, 3),
+                    }, f, indent=2)
+                try:
+                    _make_read_only(staged_content, self.owner)
+                except PermissionError as e:
+                    raise EnvironmentBuildError(
+                        f"Cannot hand {kind} layer to owner {self.owner}: {e}"
+                    ) from e
+                os.rename(staging, layer_dir)
+            except BaseException:
+                _make_writable(staging)
+                shutil.rmtree(staging, ignore_errors=True)
+                raise
+            # Renaming a directory needs write access to it, so the layer
+            # directory itself is sealed once it is in place.
+            _seal(os.path.join(layer_dir, "meta.json"), self.owner)
+            _seal(layer_dir, self.owner)
+
+        return content_dir
+
+    def python_layer(
+        self,
+        requirements: Iterable[str],
+        python: Optional[str] = None,
+        index_url: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Get the site-packages layer for a set of pip requirements.
+
+        Args:
+            requirements: pip requirement strings
+            python: Base interpreter the layer is built for (default: this one)
+            index_url: Optional package index URL
+
+        Returns:
+            Layer directory to put on PYTHONPATH, or None for no requirements
+
+        Raises:
+            EnvironmentBuildError: If pip fails
+        """
+        requirements = normalize_requirements(requirements)
+        if not requirements:
+            return None
+        python = python or sys.executable
+        spec = {
+            "runtime": _runtime_identity([python, "--version"]),
+            "index_url": index_url,
+            "requirements": requirements,
+        }
+
+        def build(target: str) -> None:
+            # One resolver run for the whole set
+            cmd = [python, "-m", "pip", "install", "--no-input", "--disable-pip-version-check",
+                   "--no-warn-script-location", "--target", target]
+            if index_url:
+                cmd.extend(["--index-url", index_url])
+            cmd.extend(requirements)
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise EnvironmentBuildError(
+                    f"pip install failed for {requirements}:\n{result.stderr[-2000:]}"
+                )
+
+        return self._layer("python", spec, "site-packages", build)
+
+    def r_layer(self, deps: RDependencies, rscript: str = "Rscript") -> Optional[str]:
+        """
+        Get the library layer for a set of R packages.
+
+        Args:
+            deps: R dependencies section
+            rscript: Rscript executable of the base R installation
+
+        Returns:
+            Library directory to put on R_LIBS, or None for no packages
+
+        Raises:
+            EnvironmentBuildError: If any package fails to install
+        """
+        packages = sorted(
+            (p.model_dump(exclude_none=True) for p in deps.get_packages()),
+            key=lambda p: json.dumps(p, sort_keys=True),
+        )
+        if not packages:
+            return None
+        spec = {
+            "runtime": _runtime_identity([rscript, "--version"]),
+            "cran_mirror": deps.cran_mirror,
+            "packages": packages,
+        }
+
+        def build(library: str) -> None:
+            script = deps.model_copy(update={"lib_path": library}).to_install_script()
+            names = ", ".join(f"'{p.name}'" for p in deps.get_packages())
+            # install.packages() only warns on failure; verify explicitly
+            script += (
+                f"\nfor (p in c({names})) if (!requireNamespace(p, lib.loc = '{library}', quietly = TRUE))"
+                " { message('missing package: ', p); quit(status = 1) }\n"
+            )
+            with tempfile.NamedTemporaryFile(mode="w", suffix=".R", delete=False) as f:
+                f.write(script)
+                script_path = f.name
+            try:
+                env = dict(os.environ, R_LIBS=os.pathsep.join(filter(None, [library, os.environ.get("R_LIBS")])))
+                result = subprocess.run([rscript, script_path], capture_output=True, text=True, env=env)
+            finally:
+                os.unlink(script_path)
+            if result.returncode != 0:
+                raise EnvironmentBuildError(f"R package installation failed:\n{result.stderr[-2000:]}")
+
+        return self._layer("r", spec, "library", build)
+
+    def activation_env(
+        self,
+        deps: Dependencies,
+        python: Optional[str] = None,
+        index_url: Optional[str] = None,
+        rscript: str = "Rscript",
+        base_env: Optional[Mapping[str, str]] = None,
+    ) -> Dict[str, str]:
+        """
+        Build (or reuse) all layers for a dependency file and return the
+        environment variables that activate them on top of ``base_env``.
+
+        Args:
+            deps: Parsed dependencies.yaml
+            python: Base Python interpreter (default: this one)
+            index_url: Optional package index URL
+            rscript: Rscript executable
+            base_env: Environment to extend (default: os.environ)
+
+        Returns:
+            Dict with PYTHONPATH and/or R_LIBS (empty if nothing to activate)
+        """
+        base_env = os.environ if base_env is None else base_env
+        env: Dict[str, str] = {}
+
+        if deps.python:
+            layer = self.python_layer(deps.python.to_pip_list(), python=python, index_url=index_url)
+            if layer:
+                env["PYTHONPATH"] = os.pathsep.join(filter(None, [layer, base_env.get("PYTHONPATH")]))
+
+        if deps.r:
+            layer = self.r_layer(deps.r, rscript=rscript)
+            if layer:
+                env["R_LIBS"] = os.pathsep.join(filter(None, [layer, base_env.get("R_LIBS")]))
+
+        return env
+
+
+__all__ = [
+    "EnvironmentCache",
+    "EnvironmentBuildError",
+    "normalize_requirement",
+    "normalize_requirements",
+    "parse_owner",
+]
@@ -5,24 +5,27 @@ Command-line tool for installing dependencies from dependencies.yaml.
 Can be used locally or in Docker build process.
 """
 
+import json
 import os
+import shlex
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
 
 import click
 import yaml
 
+from .cache import EnvironmentCache, EnvironmentBuildError
 from .models import Dependencies
 
 
-def run_command(cmd: str, dry_run: bool = False, shell: bool = True) -> int:
-    """Execute a shell command"""
-    click.echo(f"  $ {cmd}")
+def run_command(cmd: Union[str, List[str]], dry_run: bool = False, shell: bool = True) -> int:
+    """Execute a command (argument lists run without a shell)"""
+    click.echo(f"  $ {cmd if isinstance(cmd, str) else shlex.join(cmd)}")
     if dry_run:
         return 0
-    result = subprocess.run(cmd, shell=shell)
+    result = subprocess.run(cmd, shell=shell and isinstance(cmd, str))
     return result.returncode
 
 
@@ -67,10 +70,10 @@ def install(deps_file: str, python: bool, install_r: bool, octave: bool,
         click.secho("\n=== Installing Python Packages ===", fg="green", bold=True)
         click.echo(f"Python version requirement: {deps.python.version}")
 
-        for pkg_str in deps.python.to_pip_list():
-            cmd = f"pip install '{pkg_str}'"
-            if run_command(cmd, dry_run) != 0:
-                errors.append(f"Python: {pkg_str}")
+        # One pip call so the resolver sees the whole set at once
+        pip_pkgs = deps.python.to_pip_list()
+        if pip_pkgs and run_command(["pip", "install", *pip_pkgs], dry_run) != 0:
+            errors.append(f"Python: {', '.join(pip_pkgs)}")
 
     # R packages
     if install_r and deps.r:
@@ -95,10 +98,10 @@ def install(deps_file: str, python: bool, install_r: bool, octave: bool,
             if lib_path:
                 env['R_LIBS_USER'] = os.path.expanduser(lib_path)
 
-            cmd = f"Rscript {script_path}"
-            click.echo(f"  $ {cmd}")
+            cmd = ["Rscript", script_path]
+            click.echo(f"  $ {shlex.join(cmd)}")
             if not dry_run:
-                result = subprocess.run(cmd, shell=True, env=env)
+                result = subprocess.run(cmd, env=env)
                 if result.returncode != 0:
                     errors.append("R packages")
         finally:
@@ -113,7 +116,7 @@ def install(deps_file: str, python: bool, install_r: bool, octave: bool,
         script = deps.octave.to_install_script()
 
         for pkg in deps.octave.get_packages():
-            cmd = f"octave --eval \"{pkg.to_install_command(deps.octave.forge)}\""
+            cmd = ["octave", "--eval", pkg.to_install_command(deps.octave.forge)]
             if run_command(cmd, dry_run) != 0:
                 errors.append(f"Octave: {pkg.name}")
 
@@ -128,6 +131,45 @@ def install(deps_file: str, python: bool, install_r: bool, octave: bool,
         click.secho("All dependencies installed successfully!", fg="green", bold=True)
 
 
+@cli.command()
+@click.option("--file", "-f", "deps_file", type=click.Path(exists=True),
+              default="dependencies.yaml", help="Path to dependencies.yaml")
+@click.option("--cache-dir", type=click.Path(), default=None,
+              help="Environment cache directory (default: $CT_ENV_CACHE_DIR)")
+@click.option("--python-exe", default=None, help="Base Python interpreter for the Python layer")
+@click.option("--index-url", default=None, help="Python package index URL")
+@click.option("--json", "as_json", is_flag=True, help="Print variables as JSON instead of exports")
+def env(deps_file: str, cache_dir: Optional[str], python_exe: Optional[str],
+        index_url: Optional[str], as_json: bool):
+    """Build or reuse cached environment layers and print how to activate them
+
+    Each distinct dependency set is installed once into a read-only layer;
+    later calls with the same set return immediately. The read-only bits
+    only protect layers from jobs running as another uid; set
+    $CT_ENV_CACHE_OWNER=uid[:gid] to hand layers to a separate user.
+
+    Example:
+        eval "$(deps-installer env -f dependencies.yaml)"
+    """
+    deps = Dependencies.from_yaml(deps_file)
+    cache = EnvironmentCache(cache_dir)
+
+    try:
+        variables = cache.activation_env(deps, python=python_exe, index_url=index_url)
+    except EnvironmentBuildError as e:
+        click.secho(str(e), fg="red", err=True)
+        sys.exit(1)
+
+    if deps.octave or deps.julia or deps.system:
+        click.secho("Note: only Python and R dependencies are cached as layers", fg="yellow", err=True)
+
+    if as_json:
+        click.echo(json.dumps(variables))
+    else:
+        for key, value in variables.items():
+            click.echo(f"export {key}={shlex.quote(value)}")
+
+
 @cli.command()
 @click.option("--file", "-f", "deps_file", type=click.Path(exists=True),
               default="dependencies.yaml", help="Path to dependencies.yaml")
@@ -12,6 +12,7 @@ Configuration:
     export CT_RUNNER_BACKEND=docker
     export CT_RUNNER_TIMEOUT=30
     export CT_RUNNER_MEMORY_MB=256
+    export CT_RUNNER_DOCKER_POOL_SIZE=4   # reuse warm containers
 
     # Via Python API
     from sandbox import configure, run
@@ -55,6 +56,9 @@ from .backends import (
     Runner,
     LocalRunner,
     DockerRunner,
+    DockerContainerPool,
+    get_container_pool,
+    shutdown_container_pools,
     get_runner,
 )
 
@@ -112,6 +116,9 @@ __all__ = [
     "Runner",
     "LocalRunner",
     "DockerRunner",
+    "DockerContainerPool",
+    "get_container_pool",
+    "shutdown_container_pools",
     "get_runner",
 
     # Legacy executor
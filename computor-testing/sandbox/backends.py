@@ -1,12 +1,22 @@
 """
 Runner Backend Implementations
 
-Provides local and Docker execution backends.
+Provides local and Docker execution backends. The Docker backend either
+starts one container per command or, with ``docker_pool_size > 0``, runs
+commands in a pool of warm containers (see ``DockerContainerPool``).
 """
 
+import atexit
+import errno
 import os
+import shutil
+import stat
 import subprocess
-from typing import List, Dict, Any, Optional
+import tempfile
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 
 from .config import RunnerSettings, RunnerBackend
@@ -99,6 +109,30 @@ class LocalRunner(Runner):
             }
 
 
+def _docker_security_args(settings: RunnerSettings) -> List[str]:
+    """Isolation flags shared by per-command and pooled containers."""
+    args = [
+        "--user", "1000:1000",
+        "--read-only",
+        "--tmpfs", "/tmp:size=100M,mode=1777",
+        f"--memory={settings.memory_mb}m",
+        f"--memory-swap={settings.memory_mb}m",
+        "--cpus=1",
+        f"--pids-limit={settings.max_processes}",
+        f"--ulimit=cpu={settings.cpu_seconds}:{settings.cpu_seconds}",
+        f"--ulimit=nofile={settings.max_files}:{settings.max_files}",
+        f"--ulimit=fsize={settings.max_file_size_mb * 1024 * 1024}",
+        "--cap-drop=ALL",
+        "--security-opt=no-new-privileges:true",
+    ]
+
+    # Network
+    if not settings.network_enabled:
+        args.append("--network=none")
+
+    return args
+
+
 class DockerRunner(Runner):
     """Docker container execution."""
 
@@ -107,26 +141,16 @@ class DockerRunner(Runner):
             cwd: Optional[str] = None,
             env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
 
+        if self.settings.docker_pool_size > 0:
+            return get_container_pool(self.settings).run(
+                cmd, self._get_safe_env(env), stdin=stdin, cwd=cwd
+            )
+
         actual_env = self._get_safe_env(env)
 
         # Build docker command
-        docker_cmd = [
-            "docker", "run",
-            "--rm",
-            "--user", "1000:1000",
-            "--read-only",
-            "--tmpfs", "/tmp:size=100M,mode=1777",
-            f"--memory={self.settings.memory_mb}m",
-            f"--memory-swap={self.settings.memory_mb}m",
-            "--cpus=1",
-            f"--pids-limit={self.settings.max_processes}",
-            "--cap-drop=ALL",
-            "--security-opt=no-new-privileges:true",
-        ]
-
-        # Network
-        if not self.settings.network_enabled:
-            docker_cmd.append("--network=none")
+        docker_cmd = ["docker", "run", "--rm"]
+        docker_cmd.extend(_docker_security_args(self.settings))
 
         # Environment variables
         for key, value in actual_env.items():
@@ -176,6 +200,341 @@ class DockerRunner(Runner):
             }
 
 
+# Empties the job directory and /tmp, then prints the number of live processes
+# so leftovers of the previous job (background children) can be detected.
+_RESET_SCRIPT = (
+    "rm -rf /sandbox/..?* /sandbox/.[!.]* /sandbox/* /tmp/..?* /tmp/.[!.]* /tmp/* 2>/dev/null; "
+    "n=0; for p in /proc/[0-9]*; do n=$((n+1)); done; echo $n"
+)
+
+# Exit status of a process killed by SIGKILL (OOM killer, pids limit, ...)
+_KILLED_RETURN_CODE = 137
+
+
+@dataclass
+class _PooledContainer:
+    name: str
+    slot_dir: str
+    uses: int = 0
+    baseline_procs: Optional[int] = None
+
+
+class DockerContainerPool:
+    """
+    Bounded set of pre-started, locked-down containers for one image and
+    settings combination.
+
+    Each container runs an idle process with the same isolation flags as the
+    per-command ``docker run`` and has a private host directory mounted at
+    ``/sandbox``. A job copies its working directory into that slot, runs via
+    ``docker exec``, and copies changed files back while the container is
+    paused, so processes the job left running cannot swap files for links
+    during the copy. Afterwards the slot and ``/tmp`` are wiped from inside
+    the container. A container is replaced
+    after ``max_uses`` jobs or on any anomaly: timeout, killed process,
+    failed reset, or processes left behind by the job.
+    """
+
+    def __init__(self, settings: RunnerSettings, size: int, max_uses: int = 50,
+                 root: Optional[str] = None):
+        self.settings = settings
+        self.size = size
+        self.max_uses = max_uses
+        self.root = root or tempfile.mkdtemp(prefix="ct-pool-")
+        self._idle: List[_PooledContainer] = []
+        self._total = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def warm(self) -> None:
+        """Start all containers of the pool up front."""
+        with self._cond:
+            missing = self.size - self._total
+            self._total += missing
+        started = []
+        threads = [threading.Thread(target=lambda: started.append(self._start_container()))
+                   for _ in range(missing)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with self._cond:
+            for container in started:
+                if container is None:
+                    self._total -= 1
+                else:
+                    self._idle.append(container)
+            self._cond.notify_all()
+
+    def _start_container(self) -> Optional[_PooledContainer]:
+        name = f"ct-pool-{uuid.uuid4().hex[:12]}"
+        slot_dir = os.path.join(self.root, name)
+        os.makedirs(slot_dir)
+        # The sandbox user (uid 1000) must be able to write and wipe the slot
+        os.chmod(slot_dir, 0o777)
+
+        docker_cmd = ["docker", "run", "-d", "--init", "--name", name,
+                      "--label", "computor.sandbox.pool=1"]
+        docker_cmd.extend(_docker_security_args(self.settings))
+        docker_cmd.extend(["-v", f"{slot_dir}:/sandbox:rw", "-w", "/sandbox"])
+        docker_cmd.extend([self.settings.docker_image, "sleep", "infinity"])
+
+        try:
+            result = subprocess.run(docker_cmd, capture_output=True, text=True, timeout=60)
+        except Exception:
+            result = None
+        if result is None or result.returncode != 0:
+            self._remove(_PooledContainer(name, slot_dir))
+            return None
+
+        container = _PooledContainer(name, slot_dir)
+        if not self._reset(container):
+            self._remove(container)
+            return None
+        return container
+
+    def _acquire(self) -> _PooledContainer:
+        while True:
+            with self._cond:
+                while not self._idle and self._total >= self.size:
+                    self._cond.wait()
+                if self._idle:
+                    return self._idle.pop()
+                self._total += 1
+
+            container = self._start_container()
+            if container is not None:
+                return container
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise RuntimeError(f"Could not start sandbox container from {self.settings.docker_image}")
+
+    def _release(self, container: _PooledContainer, healthy: bool) -> None:
+        container.uses += 1
+        if healthy and container.uses < self.max_uses and self._reset(container):
+            with self._cond:
+                if not self._closed:
+                    self._idle.append(container)
+                    self._cond.notify()
+                    return
+
+        self._remove(container)
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
+
+    def _reset(self, container: _PooledContainer) -> bool:
+        try:
+            result = subprocess.run(
+                ["docker", "exec", container.name, "sh", "-c", _RESET_SCRIPT],
+                capture_output=True, text=True, timeout=30,
+            )
+            procs = int(result.stdout.strip())
+        except Exception:
+            return False
+        if result.returncode != 0:
+            return False
+        if container.baseline_procs is None:
+            container.baseline_procs = procs
+        return procs == container.baseline_procs
+
+    def _copy_out_paused(self, container: _PooledContainer, dest: str,
+                         snapshot: Dict[str, Tuple[int, int]]) -> None:
+        """Freeze the container's processes while its slot is copied back."""
+        pause = subprocess.run(["docker", "pause", container.name],
+                               capture_output=True, text=True, timeout=30)
+        if pause.returncode != 0:
+            raise RuntimeError(f"Could not pause sandbox container: {pause.stderr.strip()}")
+        try:
+            _copy_out(container.slot_dir, dest, snapshot)
+        finally:
+            subprocess.run(["docker", "unpause", container.name],
+                           capture_output=True, text=True, timeout=30)
+
+    def _remove(self, container: _PooledContainer) -> None:
+        try:
+            subprocess.run(["docker", "rm", "-f", container.name],
+                           capture_output=True, timeout=30)
+        except Exception:
+            pass
+        shutil.rmtree(container.slot_dir, ignore_errors=True)
+
+    def run(self, cmd: List[str], env: Dict[str, str],
+            stdin: Optional[str] = None,
+            cwd: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run a command in a pooled container.
+
+        Returns:
+            Dict with stdout, stderr, return_code, timed_out, success
+        """
+        try:
+            container = self._acquire()
+        except Exception as e:
+            return {
+                'stdout': '',
+                'stderr': str(e),
+                'return_code': -1,
+                'timed_out': False,
+                'success': False,
+            }
+
+        healthy = False
+        try:
+            snapshot = _copy_in(cwd, container.slot_dir) if cwd else {}
+
+            docker_cmd = ["docker", "exec", "-i", "-w", "/sandbox"]
+            for key, value in env.items():
+                docker_cmd.extend(["-e", f"{key}={value}"])
+            docker_cmd.append(container.name)
+            docker_cmd.extend(cmd)
+
+            try:
+                result = subprocess.run(
+                    docker_cmd,
+                    input=stdin or "",
+                    capture_output=True,
+                    text=True,
+                    timeout=self.settings.timeout + 1,
+                )
+            except subprocess.TimeoutExpired as e:
+                return {
+                    'stdout': e.stdout.decode() if e.stdout else '',
+                    'stderr': e.stderr.decode() if e.stderr else '',
+                    'return_code': -1,
+                    'timed_out': True,
+                    'success': False,
+                }
+
+            if cwd:
+                self._copy_out_paused(container, cwd, snapshot)
+            healthy = result.returncode != _KILLED_RETURN_CODE
+            return {
+                'stdout': result.stdout,
+                'stderr': result.stderr,
+                'return_code': result.returncode,
+                'timed_out': False,
+                'success': True,
+            }
+        except Exception as e:
+            return {
+                'stdout': '',
+                'stderr': str(e),
+                'return_code': -1,
+                'timed_out': False,
+                'success': False,
+            }
+        finally:
+            self._release(container, healthy)
+
+    def shutdown(self) -> None:
+        """Remove all idle containers; busy ones are removed when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+        for container in idle:
+            self._remove(container)
+
+
+def _copy_in(src: str, slot_dir: str) -> Dict[str, Tuple[int, int]]:
+    """Copy a job directory into a slot; returns (size, mtime) per copied file."""
+    snapshot = {}
+    for root, dirs, files in os.walk(src):
+        rel_root = os.path.relpath(root, src)
+        target_root = os.path.normpath(os.path.join(slot_dir, rel_root))
+        for name in dirs:
+            path = os.path.join(target_root, name)
+            os.makedirs(path, exist_ok=True)
+            os.chmod(path, 0o777)
+        for name in files:
+            target = os.path.join(target_root, name)
+            shutil.copy2(os.path.join(root, name), target)
+            os.chmod(target, 0o666 | (os.stat(target).st_mode & 0o111))
+            st = os.stat(target)
+            snapshot[os.path.normpath(os.path.join(rel_root, name))] = (st.st_size, st.st_mtime_ns)
+    return snapshot
+
+
+def _open_regular(path: str, flags: int, mode: int = 0o666) -> Optional[int]:
+    """Open ``path`` without following a final symlink; None if it is not a regular file."""
+    try:
+        fd = os.open(path, flags | os.O_NOFOLLOW | os.O_NONBLOCK, mode)
+    except OSError as e:
+        if e.errno in (errno.ELOOP, errno.ENXIO, errno.EISDIR):
+            return None
+        raise
+    if not stat.S_ISREG(os.fstat(fd).st_mode):
+        os.close(fd)
+        return None
+    return fd
+
+
+def _copy_out(slot_dir: str, dest: str, snapshot: Dict[str, Tuple[int, int]]) -> None:
+    """Copy files created or modified by the job back to its working directory.
+
+    Links planted by the job are never followed, on either side: both files
+    are opened with ``O_NOFOLLOW`` and checked to be regular files.
+    """
+    for root, _, files in os.walk(slot_dir):
+        rel_root = os.path.relpath(root, slot_dir)
+        for name in files:
+            rel = os.path.normpath(os.path.join(rel_root, name))
+            src_fd = _open_regular(os.path.join(root, name), os.O_RDONLY)
+            if src_fd is None:
+                continue
+            with os.fdopen(src_fd, "rb") as src:
+                st = os.fstat(src.fileno())
+                if snapshot.get(rel) == (st.st_size, st.st_mtime_ns):
+                    continue
+                target = os.path.join(dest, rel)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                dst_fd = _open_regular(target, os.O_WRONLY | os.O_CREAT)
+                if dst_fd is None:
+                    continue
+                with os.fdopen(dst_fd, "wb") as dst:
+                    dst.truncate()
+                    shutil.copyfileobj(src, dst)
+
+
+_pools: Dict[Tuple, DockerContainerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_container_pool(settings: RunnerSettings) -> DockerContainerPool:
+    """Get (and warm up) the shared pool for the container-relevant settings.
+
+    Pools are keyed on the full set of isolation flags, so settings that
+    differ in any limit never share containers.
+    """
+    key = (settings.docker_image, tuple(_docker_security_args(settings)),
+           settings.docker_pool_size, settings.docker_pool_max_uses)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = DockerContainerPool(settings, settings.docker_pool_size,
+                                       settings.docker_pool_max_uses)
+            _pools[key] = pool
+            created = True
+        else:
+            created = False
+    if created:
+        pool.warm()
+    return pool
+
+
+@atexit.register
+def shutdown_container_pools() -> None:
+    """Remove all pooled containers."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
+        shutil.rmtree(pool.root, ignore_errors=True)
+
+
 def get_runner(settings: RunnerSettings) -> Runner:
     """Get the appropriate runner for the configured backend."""
     runners = {
@@ -4,7 +4,11 @@ Runner CLI
 Command-line interface for runner configuration and testing.
 """
 
+import dataclasses
+import statistics
 import sys
+import tempfile
+import time
 import click
 
 from .config import (
@@ -16,7 +20,7 @@ from .config import (
     get_settings,
     configure,
 )
-from .backends import get_runner
+from .backends import get_runner, shutdown_container_pools
 
 
 @click.group()
@@ -243,6 +247,60 @@ def test_runner(backend):
         sys.exit(1)
 
 
+@cli.command("bench")
+@click.option("-n", "--runs", type=int, default=20, show_default=True, help="Commands per mode")
+@click.option("-p", "--pool-size", type=int, default=2, show_default=True, help="Warm containers")
+@click.argument("command", nargs=-1)
+def bench_docker(runs, pool_size, command):
+    """Compare per-command Docker containers with the warm container pool.
+
+    Runs COMMAND (default: python3 -c pass) RUNS times in a scratch working
+    directory with both modes and prints latency statistics.
+
+    Examples:
+
+        sandbox bench
+        sandbox bench -n 50 -p 4 python3 -c "print(1)"
+    """
+    available, message = check_backend_available(RunnerBackend.DOCKER)
+    if not available:
+        click.echo(click.style(f"Error: {message}", fg="red"), err=True)
+        sys.exit(1)
+
+    cmd = list(command) or ["python3", "-c", "pass"]
+    base = dataclasses.replace(get_settings(), backend=RunnerBackend.DOCKER)
+    modes = [
+        ("per-command", dataclasses.replace(base, docker_pool_size=0)),
+        (f"pool ({pool_size})", dataclasses.replace(base, docker_pool_size=pool_size)),
+    ]
+
+    try:
+        for label, settings in modes:
+            runner = get_runner(settings)
+            with tempfile.TemporaryDirectory() as workdir:
+                # Untimed first run: pulls layers / warms the pool
+                runner.run(cmd, cwd=workdir)
+                timings = []
+                failures = 0
+                for _ in range(runs):
+                    start = time.perf_counter()
+                    result = runner.run(cmd, cwd=workdir)
+                    timings.append((time.perf_counter() - start) * 1000)
+                    failures += not result['success'] or result['return_code'] != 0
+
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            click.echo(
+                f"{click.style(label.ljust(14), bold=True)} "
+                f"mean {statistics.mean(timings):8.1f} ms   "
+                f"p50 {statistics.median(timings):8.1f} ms   "
+                f"p95 {p95:8.1f} ms   "
+                f"failures {failures}"
+            )
+    finally:
+        shutdown_container_pools()
+
+
 @cli.command("env")
 def show_env_config():
     """Show environment variable configuration.
@@ -260,6 +318,8 @@ def show_env_config():
         ("CT_RUNNER_NETWORK", "Enable network (1/0)", "0"),
         ("CT_RUNNER_CLEAN_ENV", "Clean environment (1/0)", "1"),
         ("CT_RUNNER_DOCKER_IMAGE", "Docker image name", "ct-sandbox:latest"),
+        ("CT_RUNNER_DOCKER_POOL_SIZE", "Warm containers kept per image (0 = off)", "0"),
+        ("CT_RUNNER_DOCKER_POOL_MAX_USES", "Commands per pooled container before recycling", "50"),
     ]
 
     for var, desc, default in vars_info:
@@ -53,6 +53,10 @@ class RunnerSettings:
     # Docker-specific options
     docker_image: str = "ct-sandbox:latest"
 
+    # Warm container pool (0 = one fresh container per command)
+    docker_pool_size: int = 0
+    docker_pool_max_uses: int = 50
+
     @classmethod
     def from_environment(cls) -> "RunnerSettings":
         """Load settings from environment variables."""
@@ -112,6 +116,12 @@ class RunnerSettings:
         elif "CT_SANDBOX_DOCKER_IMAGE" in os.environ:
             settings.docker_image = os.environ["CT_SANDBOX_DOCKER_IMAGE"]
 
+        if "CT_RUNNER_DOCKER_POOL_SIZE" in os.environ:
+            settings.docker_pool_size = int(os.environ["CT_RUNNER_DOCKER_POOL_SIZE"])
+
+        if "CT_RUNNER_DOCKER_POOL_MAX_USES" in os.environ:
+            settings.docker_pool_max_uses = int(os.environ["CT_RUNNER_DOCKER_POOL_MAX_USES"])
+
         return settings
 
     @classmethod
@@ -132,7 +142,8 @@ class RunnerSettings:
         # Simple fields
         for field_name in ["timeout", "memory_mb", "cpu_seconds", "max_processes",
                           "max_files", "max_file_size_mb", "network_enabled",
-                          "clean_environment", "docker_image"]:
+                          "clean_environment", "docker_image",
+                          "docker_pool_size", "docker_pool_max_uses"]:
             if field_name in data:
                 setattr(settings, field_name, data[field_name])
 
@@ -155,6 +166,8 @@ class RunnerSettings:
             "clean_environment": self.clean_environment,
             "env_whitelist": self.env_whitelist,
             "docker_image": self.docker_image,
+            "docker_pool_size": self.docker_pool_size,
+            "docker_pool_max_uses": self.docker_pool_max_uses,
         }
 
 
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Parallel Test-Collection Benchmark
+
+Runs a generated Python suite of ``--collections`` independent collections
+through the CLI (``computor-test python run``), once sequentially and once
+with ``--workers`` workers, and checks that both reports match without
+their timings. Each collection's set-up waits ``--sleep`` seconds, standing
+in for student code that keeps a core busy; on a single-CPU host the
+workers' own start-up competes with the run.
+
+Usage:
+    python scripts/bench_parallel_collections.py [--collections 4] [--workers 2] [--sleep 2.5]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOLUTION = "x = 1\ny = 2\n"
+
+
+def write_suite(root: str, collections: int, sleep: float) -> None:
+    for where in ("student", "reference"):
+        os.makedirs(os.path.join(root, where))
+        with open(os.path.join(root, where, "solution.py"), "w") as fh:
+            fh.write(SOLUTION)
+    tests = [
+        {
+            "type": "variable", "name": f"c{i}", "id": f"c{i}", "entryPoint": "solution.py",
+            "setUpCode": [f"import time; time.sleep({sleep})"],
+            "tests": [{"name": "x"}, {"name": "y"}],
+        }
+        for i in range(collections)
+    ]
+    with open(os.path.join(root, "test.yaml"), "w") as fh:
+        yaml.safe_dump({"type": "python", "name": "Benchmark suite", "properties": {"tests": tests}}, fh)
+    with open(os.path.join(root, "specification.yaml"), "w") as fh:
+        fh.write("studentDirectory: student\nreferenceDirectory: reference\n")
+
+
+def run(root: str, workers: int) -> tuple:
+    command = [sys.executable, "-m", "testers.cli", "python", "run", "-T", "test.yaml", "-s", "specification.yaml",
+               "-w", str(workers)]
+    env = dict(os.environ, PYTHONPATH=ROOT, CT_ARTIFACT_CACHE_DIR=os.path.join(root, "artifacts"))
+    start = time.perf_counter()
+    subprocess.run(command, cwd=root, env=env, capture_output=True, text=True)
+    seconds = time.perf_counter() - start
+    summary = os.path.join(root, "output", "testSummary.json")
+    with open(summary) as fh:
+        report = json.load(fh)
+    os.remove(summary)
+    return seconds, report
+
+
+def without_timings(report: dict) -> dict:
+    for entry in [report, *report["tests"]]:
+        for key in ("timestamp", "duration", "executionDuration", "debug"):
+            entry.pop(key, None)
+    report.pop("environment", None)
+    report["properties"].pop("specification", None)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sequential against parallel test collections")
+    parser.add_argument("--collections", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--sleep", type=float, default=2.5, help="set-up wait per collection and solution")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        write_suite(root, args.collections, args.sleep)
+        sequential_seconds, sequential = run(root, 1)
+        seconds, parallel = run(root, args.workers)
+
+    same = without_timings(parallel) == without_timings(sequential)
+    print(f"{args.collections} collections waiting {args.sleep}s (reports equal: {same})")
+    print(f"  sequential: {sequential_seconds:8.2f} s")
+    print(f"  {args.workers} workers:  {seconds:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
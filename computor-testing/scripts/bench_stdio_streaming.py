@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Stdio Matcher Benchmark
+
+Matches a generated simulation log of ``--lines`` lines (about 10 MB by
+default) with the streaming matchers in ``ctcore.stdio`` and with
+whole-text matching built on ``get_lines``, ``normalize_output`` and
+``extract_numbers`` (the matchers before streaming). Reports time and
+traced peak memory per qualification.
+
+Usage:
+    python scripts/bench_stdio_streaming.py [--lines 190000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from ctcore.stdio import compare_outputs, extract_numbers, get_lines, match_lines_subset, normalize_output
+
+
+def whole_text_numeric(actual, expected, tolerance=1e-6):
+    numbers = extract_numbers(actual)
+    return len(numbers) >= len(expected) and all(
+        abs(a - e) <= tolerance for a, e in zip(numbers, expected)
+    )
+
+
+def whole_text_line(actual, expected_line, line_number=None):
+    lines = get_lines(actual)
+    if line_number is not None:
+        return 0 < line_number <= len(lines) and lines[line_number - 1].strip() == expected_line.strip()
+    return any(line.strip() == expected_line.strip() for line in lines)
+
+
+def whole_text_line_count(actual, count):
+    return len(get_lines(actual)) == count
+
+
+def whole_text_lines_unordered(actual, expected_lines):
+    actual_lines = [line.strip() for line in get_lines(actual)]
+    return not [line for line in expected_lines if line.strip() not in actual_lines]
+
+
+def whole_text_exact(actual, expected):
+    return normalize_output(actual) == normalize_output(expected)
+
+
+def measure(check):
+    start = time.perf_counter()
+    result = check()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        check()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming stdio matchers against whole-text matching")
+    parser.add_argument("--lines", type=int, default=190000)
+    args = parser.parse_args()
+
+    lines = [f"step {i:7d}: energy = {i * 0.001:.6f}  residual = {1.0 / (i + 1):.3e}" for i in range(args.lines)]
+    output = "\n".join(lines) + "\n"
+    sampled = lines[::500]
+
+    checks = {
+        "numericOutput": (
+            lambda: whole_text_numeric(output, [0, 0.0, 1.0]),
+            lambda: compare_outputs(output, "0 0.0 1.0", "numericOutput").success,
+        ),
+        "matchesLine": (
+            lambda: whole_text_line(output, lines[10], 11),
+            lambda: compare_outputs(output, lines[10], "matchesLine", line_number=11).success,
+        ),
+        "containsLine": (
+            lambda: whole_text_line(output, lines[-1]),
+            lambda: compare_outputs(output, lines[-1], "containsLine").success,
+        ),
+        "lineCount": (
+            lambda: whole_text_line_count(output, len(lines)),
+            lambda: compare_outputs(output, str(len(lines)), "lineCount").success,
+        ),
+        "linesSubset": (
+            lambda: whole_text_lines_unordered(output, sampled),
+            lambda: match_lines_subset(output, sampled, ordered=False).success,
+        ),
+        "matches": (
+            lambda: whole_text_exact(output, output),
+            lambda: compare_outputs(output, output, "matches").success,
+        ),
+    }
+
+    print(f"{len(output) / 10**6:.1f} MB output, {len(lines)} lines")
+    totals = [0.0, 0.0]
+    for name, (whole_text, streaming) in checks.items():
+        whole_text_result, whole_text_seconds, whole_text_peak = measure(whole_text)
+        result, seconds, peak = measure(streaming)
+        totals[0] += whole_text_seconds
+        totals[1] += seconds
+        agree = "" if whole_text_result == result else "  (results differ)"
+        print(f"  {name:14s} whole-text {whole_text_seconds * 1000:7.1f} ms {whole_text_peak / 2**20:6.1f} MiB, "
+              f"streaming {seconds * 1000:7.1f} ms {peak / 2**20:6.2f} MiB{agree}")
+    print(f"  {'total':14s} whole-text {totals[0] * 1000:7.1f} ms, streaming {totals[1] * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
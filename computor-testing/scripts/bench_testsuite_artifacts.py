@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test Suite Artifact Benchmark
+
+Loads a generated test suite ``--loads`` times the way every test run used
+to (``read_ca_file`` for both YAML files plus property inheritance) and
+from its compiled artifact (``ctcore.artifacts.load_testsuite_artifact``,
+after one compile that is not counted). The artifact cache is a throwaway
+directory.
+
+Usage:
+    python scripts/bench_testsuite_artifacts.py [--collections 200] [--tests 10] [--loads 5]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import yaml
+
+from ctcore import artifacts
+from ctcore.artifacts import (
+    INHERITED_MAIN_FIELDS,
+    INHERITED_SUB_FIELDS,
+    ArtifactCache,
+    load_testsuite_artifact,
+    resolve_inheritance,
+)
+from ctcore.models import ComputorSpecification, ComputorTestSuite, read_ca_file
+
+INHERIT = (INHERITED_MAIN_FIELDS, INHERITED_SUB_FIELDS)
+
+
+def write_suite(root: str, collections: int, tests: int) -> tuple:
+    data = {
+        "name": "Large suite",
+        "type": "python",
+        "properties": {
+            "relativeTolerance": 1.0e-9,
+            "tests": [
+                {
+                    "type": "variable",
+                    "name": f"Collection {c}",
+                    "id": f"c{c}",
+                    "setUpCode": [f"x{c} = compute({c})"],
+                    "tests": [{"name": f"x{c}_{t}", "value": [t, t + 1, t + 2]} for t in range(tests)],
+                }
+                for c in range(collections)
+            ],
+        },
+    }
+    testsuite_path = os.path.join(root, "test.yaml")
+    specification_path = os.path.join(root, "specification.yaml")
+    with open(testsuite_path, "w") as fh:
+        yaml.safe_dump(data, fh)
+    with open(specification_path, "w") as fh:
+        fh.write("studentDirectory: submission\ntestVersion: v2\n")
+    return testsuite_path, specification_path
+
+
+def yaml_load(testsuite_path: str, specification_path: str) -> tuple:
+    testsuite = read_ca_file(ComputorTestSuite, testsuite_path)
+    specification = read_ca_file(ComputorSpecification, specification_path)
+    resolve_inheritance(testsuite)
+    return testsuite, specification
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark test suite loading from YAML and artifacts")
+    parser.add_argument("--collections", type=int, default=200)
+    parser.add_argument("--tests", type=int, default=10, help="tests per collection")
+    parser.add_argument("--loads", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        suite = write_suite(root, args.collections, args.tests)
+        artifacts._default_cache = ArtifactCache(os.path.join(root, "cache"))
+        artifacts._default_cache_loaded = True
+
+        start = time.perf_counter()
+        for _ in range(args.loads):
+            expected = yaml_load(*suite)
+        yaml_seconds = time.perf_counter() - start
+
+        load_testsuite_artifact(*suite, inherit=INHERIT)
+        start = time.perf_counter()
+        for _ in range(args.loads):
+            loaded = load_testsuite_artifact(*suite, inherit=INHERIT)
+        artifact_seconds = time.perf_counter() - start
+
+    same = [m.model_dump() for m in loaded] == [m.model_dump() for m in expected]
+    print(f"{args.loads} loads of a {args.collections * args.tests}-test suite (results equal: {same})")
+    print(f"  YAML + validation: {yaml_seconds / args.loads * 1000:8.1f} ms/load")
+    print(f"  artifact:          {artifact_seconds / args.loads * 1000:8.1f} ms/load")
+
+
+if __name__ == "__main__":
+    main()
@@ -116,6 +116,7 @@ class BaseTester(ABC):
         specification: Optional[str] = None,
         pytestflags: str = "",
         verbosity: int = 0,
+        workers: Optional[int] = None,
     ) -> int:
         """
         Run tests using pytest.
@@ -126,6 +127,8 @@ class BaseTester(ABC):
             specification: Path to specification.yaml
             pytestflags: Additional pytest flags
             verbosity: Verbosity level (0-3)
+            workers: Worker processes for independent test collections
+                (0: one per CPU, None: $CT_TEST_WORKERS or sequential)
 
         Returns:
             Exit code from pytest
@@ -175,6 +178,9 @@ class BaseTester(ABC):
                 f"{self.verbosity_flag}={verbosity}",
             ]
 
+            if workers is not None:
+                pytest_args.append(f"--ctworkers={workers}")
+
             if pytestflags:
                 pytest_args.extend(pytestflags.split())
 
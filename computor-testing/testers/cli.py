@@ -10,6 +10,7 @@ Usage:
     computor-test check --all
 """
 
+import os
 import sys
 import click
 
@@ -50,7 +51,9 @@ def create_language_cli(language: str):
                   help="Additional flags to pass to pytest")
     @click.option("--verbosity", "-v", default=0, type=int,
                   help="Verbosity level (0-3)")
-    def run(target, testsuite, specification, pytestflags, verbosity):
+    @click.option("--workers", "-w", default=None, type=int,
+                  help="Worker processes for independent test collections (0: one per CPU)")
+    def run(target, testsuite, specification, pytestflags, verbosity, workers):
         """Run tests on target directory."""
         tester_class = get_tester(language)
         if not tester_class:
@@ -67,6 +70,7 @@ def create_language_cli(language: str):
             specification=specification,
             pytestflags=pytestflags,
             verbosity=verbosity,
+            workers=workers,
         )
         sys.exit(exit_code)
 
@@ -176,6 +180,47 @@ def list_cmd():
             click.echo(f"  ? {lang:10} - No executor")
 
 
+@cli.command()
+@click.option("--socket", "-S", "socket_path", default=None,
+              help="Unix socket to listen on (default: $CT_TEST_SERVER_SOCKET or /tmp/computor-test.sock)")
+@click.option("--language", "-l", "languages", multiple=True,
+              help="Language whose conftest is preloaded (repeatable, default: all)")
+@click.option("--max-jobs", "-j", default=4, type=int,
+              help="Maximum number of concurrently running jobs")
+def serve(socket_path, languages, max_jobs):
+    """Serve test jobs from a pre-forked harness process.
+
+    Imports pytest, numpy and the testers once and forks a fresh child per
+    job, removing the interpreter and import start-up from every run.
+
+    Examples:
+        computor-test serve
+        computor-test serve -S /run/computor-test.sock -l python -l c -j 8
+    """
+    from .server import DEFAULT_SOCKET, serve as serve_jobs
+
+    socket_path = socket_path or os.environ.get("CT_TEST_SERVER_SOCKET", DEFAULT_SOCKET)
+    try:
+        serve_jobs(socket_path, languages=list(languages) or None, max_jobs=max_jobs, log=click.echo)
+    except KeyboardInterrupt:
+        click.echo("Stopped.")
+
+
+@cli.command("startup-profile")
+@click.option("--language", "-l", "languages", multiple=True,
+              help="Language whose conftest is included (repeatable, default: all)")
+def startup_profile_cmd(languages):
+    """Show where a cold test run spends its start-up time.
+
+    Examples:
+        computor-test startup-profile
+        computor-test startup-profile -l python
+    """
+    from .server import format_profile, startup_profile
+
+    click.echo(format_profile(startup_profile(list(languages) or None)))
+
+
 # Language-specific CLI entry points
 def pytester_cli():
     """Python tester CLI."""
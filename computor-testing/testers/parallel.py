@@ -0,0 +1,488 @@
+"""
+Parallel Test-Collection Execution
+
+Splits one harness run across worker processes. The unit of work is the
+test collection: its test cases share one execution of the student and
+reference code, so they always run together. Collections are grouped with
+the collections they declare dependencies on (``successDependency``,
+``setUpCodeDependency``), and the groups are spread over the workers by
+test-case count. Each worker runs its collections in suite order.
+
+``exist`` collections at the start of the suite record the submitted
+files that later collections refer to (token exchange), so they are shared
+setup: every worker runs them first, and the parent's results for them
+are reported. An ``exist`` collection after other collections may check
+files those write, so it stays with all of them.
+
+Student and reference programs write to the directories they run in, and
+collections used to run one after another. So every worker gets a private
+working root (``--ctworkdir``): copies of the student and reference
+directories, next to links to their siblings (e.g. staged test
+dependencies), so relative paths resolve as before. Paths into the copies
+are mapped back in the harness diagnostics of the worker's results (linting
+errors, execution error messages); test messages, which may quote program
+output, are reported as produced. The parent runs in the original
+directories.
+
+The parent pytest session runs the first partition itself and starts one
+``pytest`` process per further partition (``--ctcollections``,
+``--ctpartial``). Instead of a report, a worker writes the results of its
+collections (report entries, execution summaries, durations) to a partial
+file. Before finalizing, the parent merges them by collection index, so
+the report has the same format and order as a sequential run.
+
+The number of workers comes from ``--ctworkers`` (``computor-test <lang>
+run --workers``) or ``CT_TEST_WORKERS``; 0 means one per CPU, and 1 (the
+default) runs sequentially.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pytest
+
+from ctcore.models import (
+    ComputorReportMain,
+    ComputorTestSuite,
+    ResultEnum,
+    StatusEnum,
+    TypeEnum,
+)
+from ctcore.helpers import get_property_as_list
+
+from .tests.test_base import main_idx_by_dependency
+
+WORKERS_ENV = "CT_TEST_WORKERS"
+
+# Execution summary fields a worker hands back per solution
+SOLUTION_FIELDS = ("status", "errormsg", "errors", "exectime")
+
+# Execution summary fields holding harness diagnostics that name solution paths
+SOLUTION_PATH_FIELDS = ("errormsg", "errors")
+
+# Exit statuses that do not indicate a problem with the run
+_CLEAN_EXIT = (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED)
+
+
+def resolve_workers(workers: Optional[int] = None) -> int:
+    """
+    Number of worker processes to use.
+
+    Args:
+        workers: Requested number (None: ``CT_TEST_WORKERS``, 0: one per CPU)
+
+    Returns:
+        At least 1
+    """
+    if workers is None:
+        try:
+            workers = int(os.environ.get(WORKERS_ENV, "1"))
+        except ValueError:
+            workers = 1
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    return max(workers, 1)
+
+
+def collection_groups(testsuite: ComputorTestSuite) -> Tuple[List[int], List[List[int]]]:
+    """
+    Group test collections that must run in the same process.
+
+    Returns:
+        (shared collections run by every worker, groups of dependent collections)
+    """
+    mains = testsuite.properties.tests
+    shared = []
+    for idx, main in enumerate(mains):
+        if main.type != TypeEnum.exist:
+            break
+        shared.append(idx)
+    parent = list(range(len(mains)))
+
+    def find(idx: int) -> int:
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    for idx, main in enumerate(mains):
+        dependencies = get_property_as_list(main.successDependency)
+        if main.setUpCodeDependency:
+            dependencies.append(main.setUpCodeDependency)
+        for dependency in dependencies:
+            dep_idx = main_idx_by_dependency(testsuite, dependency)
+            if dep_idx is None or dep_idx in shared:
+                continue
+            parent[find(idx)] = find(dep_idx)
+        if main.type == TypeEnum.exist and idx not in shared:
+            # May check files written by any earlier collection
+            for earlier in range(len(shared), idx):
+                parent[find(earlier)] = find(idx)
+
+    groups: Dict[int, List[int]] = {}
+    for idx in range(len(mains)):
+        if idx not in shared:
+            groups.setdefault(find(idx), []).append(idx)
+    return shared, sorted(groups.values())
+
+
+def partition_collections(testsuite: ComputorTestSuite, workers: int) -> List[List[int]]:
+    """
+    Split the collections of a suite into at most ``workers`` partitions.
+
+    Groups are assigned largest first to the least loaded partition, so the
+    result only depends on the suite. Every partition includes the shared
+    collections and lists its collections in suite order.
+
+    Returns:
+        Collection indices per partition; a single partition means sequential
+    """
+    mains = testsuite.properties.tests
+    shared, groups = collection_groups(testsuite)
+    if workers <= 1 or len(groups) <= 1:
+        return [list(range(len(mains)))]
+
+    weights = {id(group): max(sum(len(mains[idx].tests) for idx in group), 1) for group in groups}
+    bins: List[List[int]] = [[] for _ in range(min(workers, len(groups)))]
+    loads = [0] * len(bins)
+    for group in sorted(groups, key=lambda g: (-weights[id(g)], g[0])):
+        target = min(range(len(bins)), key=lambda b: (loads[b], b))
+        bins[target].extend(group)
+        loads[target] += weights[id(group)]
+
+    return [sorted(shared + collections) for collections in bins]
+
+
+def add_parallel_options(parser: pytest.Parser) -> None:
+    """Add the command-line options for parallel runs."""
+    parser.addoption(
+        "--ctworkers",
+        default=None,
+        type=int,
+        help=f"worker processes for independent test collections (0: one per CPU, default: ${WORKERS_ENV} or 1)",
+    )
+    parser.addoption(
+        "--ctcollections",
+        default="",
+        help="run only these test collections (comma separated indices; set by the parent run)",
+    )
+    parser.addoption(
+        "--ctpartial",
+        default="",
+        help="write collection results to this file instead of the report (set by the parent run)",
+    )
+    parser.addoption(
+        "--ctworkdir",
+        default="",
+        help="private working root holding copies of the solution directories (set by the parent run)",
+    )
+
+
+class ParallelRun:
+    """Worker processes of a parent session."""
+
+    def __init__(self, partitions: List[List[int]], shared: List[int]):
+        self.partitions = partitions
+        self.shared = shared
+        self.tmpdir: Optional[str] = None
+        self.processes: List[subprocess.Popen] = []
+
+    def owned(self, partition: int) -> List[int]:
+        """Collections whose results are taken from a partition."""
+        if partition == 0:
+            return self.partitions[0]
+        return [idx for idx in self.partitions[partition] if idx not in self.shared]
+
+    def partial_path(self, partition: int) -> str:
+        return os.path.join(self.tmpdir, f"partial-{partition}.json")
+
+    def log_path(self, partition: int) -> str:
+        return os.path.join(self.tmpdir, f"worker-{partition}.log")
+
+    def workdir(self, partition: int) -> str:
+        return os.path.join(self.tmpdir, f"root-{partition}")
+
+
+def worker_directories(workdir: str, specification: Any) -> Dict[str, str]:
+    """
+    Where a worker's copies of the solution directories live.
+
+    Returns:
+        Original (absolute) student/reference directory -> copy in ``workdir``
+    """
+    parents: List[str] = []
+    directories = {}
+    for directory in (specification.studentDirectory, specification.referenceDirectory):
+        if not directory:
+            continue
+        directory = os.path.abspath(directory)
+        parent = os.path.dirname(directory)
+        if parent not in parents:
+            parents.append(parent)
+        directories[directory] = os.path.join(workdir, str(parents.index(parent)), os.path.basename(directory))
+    return directories
+
+
+def prepare_worker_root(workdir: str, specification: Any) -> None:
+    """Copy the solution directories into a worker's working root."""
+    directories = worker_directories(workdir, specification)
+    for original, copy in directories.items():
+        parent = os.path.dirname(copy)
+        if not os.path.isdir(parent):
+            os.makedirs(parent)
+            # Siblings are shared (read through links), only the directories
+            # programs run in are private
+            original_parent = os.path.dirname(original)
+            copied = {os.path.basename(o) for o in directories if os.path.dirname(o) == original_parent}
+            for entry in os.scandir(original_parent):
+                if entry.name not in copied:
+                    os.symlink(entry.path, os.path.join(parent, entry.name))
+        if os.path.isdir(original):
+            shutil.copytree(original, copy, symlinks=True)
+        else:
+            os.makedirs(copy)
+
+
+def _use_worker_root(report_data: Dict[str, Any], workdir: str) -> None:
+    specification = report_data["specification"]
+    directories = worker_directories(workdir, specification)
+    for field in ("studentDirectory", "referenceDirectory"):
+        directory = getattr(specification, field)
+        if directory:
+            setattr(specification, field, directories[os.path.abspath(directory)])
+    report_data["worker_directories"] = directories
+
+
+def plan_parallel_session(config: pytest.Config, report_data: Dict[str, Any]) -> None:
+    """
+    Decide which collections this session runs (call after configuring).
+
+    Sets ``collections`` (and ``partial`` in workers, ``parallel`` in the
+    parent) in the session's report data.
+    """
+    collections = config.getoption("--ctcollections")
+    if collections:
+        report_data["collections"] = {int(idx) for idx in collections.split(",")}
+        report_data["partial"] = config.getoption("--ctpartial")
+        workdir = config.getoption("--ctworkdir")
+        if workdir:
+            _use_worker_root(report_data, workdir)
+        return
+
+    workers = resolve_workers(config.getoption("--ctworkers"))
+    if workers <= 1:
+        return
+    testsuite: ComputorTestSuite = report_data["testsuite"]
+    partitions = partition_collections(testsuite, workers)
+    if len(partitions) <= 1:
+        return
+    shared, _ = collection_groups(testsuite)
+    report_data["collections"] = set(partitions[0])
+    report_data["parallel"] = ParallelRun(partitions, shared)
+
+
+def selected_testcases(report_data: Dict[str, Any], testcases: Sequence[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """The (main, sub) test cases this session runs."""
+    collections = report_data.get("collections")
+    if collections is None:
+        return list(testcases)
+    return [case for case in testcases if case[0] in collections]
+
+
+def _worker_args(args: Sequence[str]) -> List[str]:
+    """The parent's pytest arguments without its worker count."""
+    result = []
+    skip = False
+    for arg in args:
+        if skip:
+            skip = False
+        elif arg == "--ctworkers":
+            skip = True
+        elif not arg.startswith("--ctworkers="):
+            result.append(arg)
+    return result
+
+
+def start_workers(config: pytest.Config, report_data: Dict[str, Any]) -> None:
+    """Start the worker processes of a parent session (call at session start)."""
+    run: Optional[ParallelRun] = report_data.get("parallel")
+    if run is None:
+        return
+
+    run.tmpdir = tempfile.mkdtemp(prefix="ct-workers-")
+    args = _worker_args(config.invocation_params.args)
+    env = dict(os.environ, **{WORKERS_ENV: "1"})
+    for partition in range(1, len(run.partitions)):
+        prepare_worker_root(run.workdir(partition), report_data["specification"])
+        command = [
+            sys.executable, "-m", "pytest", *args,
+            "-p", "no:cacheprovider",
+            f"--ctcollections={','.join(str(idx) for idx in run.partitions[partition])}",
+            f"--ctpartial={run.partial_path(partition)}",
+            f"--ctworkdir={run.workdir(partition)}",
+        ]
+        with open(run.log_path(partition), "wb") as log:
+            run.processes.append(subprocess.Popen(
+                command, cwd=str(config.invocation_params.dir), env=env,
+                stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+            ))
+
+
+def _durations(report_data: Dict[str, Any], collections: Sequence[int]) -> Dict[int, float]:
+    """Wall time of each collection, as the sequential finalization derives it."""
+    report = report_data["report"]
+    durations = {}
+    started = report_data.get("started") or time.time()
+    for idx in collections:
+        ended = float(report.tests[idx].timestamp or started)
+        durations[idx] = max(ended - started, 0.0)
+        started = max(ended, started)
+    return durations
+
+
+def _original_paths(value: Any, copies: Sequence[Tuple[str, str]]) -> Any:
+    """Map paths into a worker's copies back in a string or list of strings.
+
+    ``copies`` are ``(original, copy)`` pairs, longest copy first.
+    """
+    if isinstance(value, list):
+        return [_original_paths(item, copies) for item in value]
+    if not isinstance(value, str):
+        return value
+    for original, copy in copies:
+        # Whole path components only: the copy itself or a path below it
+        value = re.sub(rf"(?<![\w./-]){re.escape(copy)}(?![\w.-])", lambda m: original, value)
+    return value
+
+
+def write_partial_results(report_data: Dict[str, Any], exitstatus: int) -> None:
+    """Write this worker's collection results (call instead of finalizing)."""
+    report = report_data["report"]
+    solutions = report_data["solutions"]
+    collections = sorted(report_data["collections"])
+    durations = _durations(report_data, collections)
+
+    results = {}
+    for idx in collections:
+        results[str(idx)] = {
+            "report": report.tests[idx].model_dump(mode="json"),
+            "duration": durations[idx],
+            "solutions": {
+                getattr(where, "value", where): {key: solution[key] for key in SOLUTION_FIELDS if key in solution}
+                for where, solution in solutions.get(str(idx), {}).items()
+            },
+        }
+
+    # Report the original directories, as a sequential run would
+    copies = sorted(report_data.get("worker_directories", {}).items(), key=lambda item: -len(item[1]))
+    if copies:
+        for result in results.values():
+            debug = result["report"].get("debug") or {}
+            if debug.get("lintingErrors"):
+                debug["lintingErrors"] = _original_paths(debug["lintingErrors"], copies)
+            for solution in result["solutions"].values():
+                for key in SOLUTION_PATH_FIELDS:
+                    if key in solution:
+                        solution[key] = _original_paths(solution[key], copies)
+    text = json.dumps({"exitstatus": int(exitstatus), "collections": results}, default=str)
+
+    path = report_data["partial"]
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        fh.write(text)
+    os.replace(tmp_path, path)
+
+
+def _fail_collections(report_data: Dict[str, Any], collections: Sequence[int], message: str) -> None:
+    for idx in collections:
+        main = report_data["report"].tests[idx]
+        for sub in main.tests:
+            sub.status = StatusEnum.failed
+            sub.result = ResultEnum.failed
+            sub.resultMessage = message
+        main.summary.passed = main.summary.skipped = 0
+        main.summary.failed = len(main.tests)
+        report_data["solutions"][str(idx)] = {
+            "student": {"status": StatusEnum.failed, "errormsg": message, "errors": [message], "exectime": 0},
+        }
+
+
+def finish_parallel_run(report_data: Dict[str, Any], exitstatus: int) -> int:
+    """
+    Wait for the workers and merge their results into the session's report
+    data (call before finalizing).
+
+    Returns:
+        Exit status of the whole run
+    """
+    run: Optional[ParallelRun] = report_data.get("parallel")
+    if run is None:
+        return exitstatus
+
+    durations = _durations(report_data, run.partitions[0])
+    status = exitstatus
+    try:
+        for partition, process in enumerate(run.processes, 1):
+            returncode = process.wait()
+            owned = run.owned(partition)
+            try:
+                with open(run.partial_path(partition), encoding="utf-8") as fh:
+                    partial = json.load(fh)
+            except (OSError, ValueError):
+                with open(run.log_path(partition), encoding="utf-8", errors="replace") as fh:
+                    output = fh.read()
+                print(f"Test worker {partition} failed (exit code {returncode}):\n{output[-4000:]}", file=sys.stderr)
+                _fail_collections(report_data, owned, f"Test worker failed (exit code {returncode})")
+                for idx in owned:
+                    durations[idx] = 0.0
+                partial = {"exitstatus": pytest.ExitCode.INTERNAL_ERROR, "collections": {}}
+
+            for idx in owned:
+                result = partial["collections"].get(str(idx))
+                if result is None:
+                    continue
+                report_data["report"].tests[idx] = ComputorReportMain.model_validate(result["report"])
+                report_data["solutions"][str(idx)] = {
+                    where: dict(solution, status=StatusEnum(solution["status"])) if "status" in solution else solution
+                    for where, solution in result["solutions"].items()
+                }
+                durations[idx] = result["duration"]
+
+            if status in _CLEAN_EXIT and partial["exitstatus"] not in _CLEAN_EXIT:
+                status = partial["exitstatus"]
+            elif status == pytest.ExitCode.NO_TESTS_COLLECTED:
+                status = partial["exitstatus"]
+    finally:
+        shutil.rmtree(run.tmpdir, ignore_errors=True)
+
+    # Rebase the collection end times so the finalization derives each
+    # collection's own duration, in suite order
+    ended = report_data.get("started") or time.time()
+    for idx, main in enumerate(report_data["report"].tests):
+        ended += durations.get(idx, 0.0)
+        main.timestamp = ended
+
+    return pytest.ExitCode(status)
+
+
+__all__ = [
+    "WORKERS_ENV",
+    "resolve_workers",
+    "collection_groups",
+    "partition_collections",
+    "add_parallel_options",
+    "worker_directories",
+    "prepare_worker_root",
+    "plan_parallel_session",
+    "selected_testcases",
+    "start_workers",
+    "write_partial_results",
+    "finish_parallel_run",
+]
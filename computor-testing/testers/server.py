@@ -0,0 +1,362 @@
+"""
+Pre-forked Test Server
+
+A long-lived harness process that imports pytest, numpy, the testers and
+the language conftests once, then serves test jobs over a Unix socket.
+Every job runs in a freshly forked child (copy-on-write), so jobs are as
+isolated from each other as separate ``computor-test`` invocations but
+skip the interpreter and import start-up. Each child leads its own process
+group, so a job that times out is killed together with its subprocesses.
+The socket is created with mode 0660 (via the umask, so it is never
+reachable by others in between).
+
+Protocol (one job per connection):
+    request:  one JSON object, terminated by a newline
+              {"language", "testsuite", "target"?, "specification"?,
+               "pytestflags"?, "verbosity"?, "workers"?, "cwd"?, "timeout"?}
+    response: one JSON object, then the server closes the connection
+              {"exit_code", "stdout", "stderr", "duration"}
+
+Usage:
+    computor-test serve --socket /run/computor-test.sock
+    computor-test startup-profile
+"""
+
+import importlib
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_SOCKET = "/tmp/computor-test.sock"
+
+# Modules imported once by the server, in start-up order
+PRELOAD_MODULES = [
+    "yaml",
+    "pydantic",
+    "numpy",
+    "pytest",
+    "ctcore",
+    "ctexec",
+    "blocks.models",
+    "testers",
+    "testers.tests.conftest_base",
+    "testers.tests.test_base",
+]
+
+MAX_REQUEST_BYTES = 1024 * 1024
+
+# Exit code reported for jobs killed by their timeout (as coreutils `timeout`)
+TIMEOUT_EXIT_CODE = 124
+
+
+def language_modules(languages: Iterable[str]) -> List[str]:
+    """Per-language conftest modules that pytest would import for a job."""
+    return [f"testers.tests.{language}.conftest" for language in languages]
+
+
+def preload(modules: Iterable[str]) -> List[Tuple[str, float, Optional[str]]]:
+    """
+    Import modules and time each import.
+
+    Args:
+        modules: Module names, imported in order
+
+    Returns:
+        List of (module, seconds, error) — error is None on success
+    """
+    timings = []
+    for name in modules:
+        start = time.perf_counter()
+        error = None
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        timings.append((name, time.perf_counter() - start, error))
+    return timings
+
+
+# Runs in a fresh interpreter so that nothing is imported before the first module
+_PROFILE_SCRIPT = """
+import importlib, json, sys, time
+timings = []
+for name in sys.argv[1:]:
+    start = time.perf_counter()
+    error = None
+    try:
+        importlib.import_module(name)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    timings.append((name, time.perf_counter() - start, error))
+print(json.dumps(timings))
+"""
+
+
+def startup_profile(languages: Optional[Iterable[str]] = None) -> List[Tuple[str, float, Optional[str]]]:
+    """
+    Measure what a cold ``computor-test`` run spends before touching student code.
+
+    Imports the preload modules one after another in a fresh interpreter, so
+    each entry is the incremental cost on top of the previous ones. The bare
+    interpreter start-up is reported as ``<interpreter>``.
+
+    Args:
+        languages: Languages whose conftests are included (default: all)
+
+    Returns:
+        List of (module, seconds, error)
+    """
+    from . import list_testers
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    interpreter = time.perf_counter() - start
+
+    modules = PRELOAD_MODULES + language_modules(languages or list_testers())
+    env = dict(os.environ)
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-c", _PROFILE_SCRIPT, *modules],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    timings = [tuple(entry) for entry in json.loads(result.stdout.strip().splitlines()[-1])]
+    return [("<interpreter>", interpreter, None)] + timings
+
+
+def format_profile(timings: List[Tuple[str, float, Optional[str]]]) -> str:
+    """Render preload timings as a table (slowest first)."""
+    total = sum(seconds for _, seconds, _ in timings)
+    lines = [f"{'module':40} {'ms':>9} {'share':>6}"]
+    for name, seconds, error in sorted(timings, key=lambda t: -t[1]):
+        share = seconds / total * 100 if total else 0.0
+        suffix = f"  ({error})" if error else ""
+        lines.append(f"{name:40} {seconds * 1000:9.1f} {share:5.1f}%{suffix}")
+    lines.append(f"{'total':40} {total * 1000:9.1f}")
+    return "\n".join(lines)
+
+
+def _run_job(request: Dict[str, Any]) -> int:
+    """Run one test job in the current (forked) process."""
+    from . import normalize_language
+    from .base import get_tester
+
+    language = normalize_language(request.get("language", "")) or ""
+    tester_class = get_tester(language)
+    if not tester_class:
+        print(f"Error: No tester for language: {request.get('language')}", file=sys.stderr)
+        return 1
+
+    if request.get("cwd"):
+        os.chdir(request["cwd"])
+
+    testsuite = request["testsuite"]
+    testroot = os.path.dirname(os.path.abspath(testsuite))
+    tester = tester_class(testroot=testroot)
+    return tester.run(
+        target=request.get("target"),
+        testsuite=testsuite,
+        specification=request.get("specification"),
+        pytestflags=request.get("pytestflags", ""),
+        verbosity=int(request.get("verbosity", 0)),
+        workers=request.get("workers"),
+    )
+
+
+def _read_request(conn: socket.socket) -> Dict[str, Any]:
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+        if len(data) > MAX_REQUEST_BYTES:
+            raise ValueError("Request too large")
+    return json.loads(data)
+
+
+def _serve_connection(conn: socket.socket) -> None:
+    """Child side: read the request, run it with captured output, reply, exit."""
+    start = time.perf_counter()
+    out = tempfile.TemporaryFile()
+    err = tempfile.TemporaryFile()
+
+    def reply(exit_code: int) -> None:
+        out.seek(0)
+        err.seek(0)
+        response = {
+            "exit_code": int(exit_code),
+            "stdout": out.read().decode("utf-8", errors="replace"),
+            "stderr": err.read().decode("utf-8", errors="replace"),
+            "duration": time.perf_counter() - start,
+        }
+        conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+        conn.close()
+
+    def on_timeout(signum, frame):
+        err.write(b"Error: test job timed out\n")
+        reply(TIMEOUT_EXIT_CODE)
+        # The job's process group: this child and every subprocess it started
+        os.killpg(os.getpgrp(), signal.SIGKILL)
+
+    try:
+        request = _read_request(conn)
+    except Exception as e:
+        err.write(f"Error: invalid request: {e}\n".encode())
+        reply(1)
+        return
+
+    if request.get("timeout"):
+        signal.signal(signal.SIGALRM, on_timeout)
+        signal.alarm(max(1, int(request["timeout"])))
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(out.fileno(), 1)
+    os.dup2(err.fileno(), 2)
+    try:
+        exit_code = _run_job(request)
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        print(f"Error: {type(e).__name__}: {e}", file=sys.stderr)
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+    signal.alarm(0)
+    reply(exit_code)
+
+
+def serve(
+    socket_path: str = DEFAULT_SOCKET,
+    languages: Optional[Iterable[str]] = None,
+    max_jobs: int = 4,
+    log=print,
+) -> None:
+    """
+    Preload the harness and serve test jobs until interrupted.
+
+    Args:
+        socket_path: Unix socket to listen on (replaced if it exists)
+        languages: Languages whose conftests are preloaded (default: all)
+        max_jobs: Maximum number of concurrently running jobs
+        log: Callable receiving status lines
+    """
+    from . import list_testers
+
+    timings = preload(PRELOAD_MODULES + language_modules(languages or list_testers()))
+    for name, _, error in timings:
+        if error:
+            log(f"Warning: could not preload {name}: {error}")
+    log(f"Preloaded {len(timings)} modules in {sum(t[1] for t in timings) * 1000:.0f} ms")
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o117)
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(umask)
+    server.listen(max_jobs * 4)
+    server.settimeout(1.0)
+    log(f"Serving test jobs on {socket_path} (max {max_jobs} concurrent)")
+
+    running = set()
+
+    def reap(block: bool) -> None:
+        while running:
+            try:
+                pid, _ = os.waitpid(-1, 0 if block else os.WNOHANG)
+            except ChildProcessError:
+                running.clear()
+                return
+            if pid == 0:
+                return
+            running.discard(pid)
+            if block:
+                return
+
+    try:
+        while True:
+            reap(block=False)
+            while len(running) >= max_jobs:
+                reap(block=True)
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                os.setpgid(0, 0)
+                server.close()
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                try:
+                    conn.settimeout(None)
+                    _serve_connection(conn)
+                finally:
+                    os._exit(0)
+            conn.close()
+            running.add(pid)
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def request_job(
+    socket_path: str,
+    job: Dict[str, Any],
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Submit a job to a running server and wait for its result.
+
+    Args:
+        socket_path: Server socket
+        job: Request fields (see module docstring)
+        timeout: Seconds to wait for the result
+
+    Returns:
+        Response dict with exit_code, stdout, stderr, duration
+
+    Raises:
+        OSError: If the server is unreachable or closes the connection early
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(socket_path)
+        conn.sendall(json.dumps(job).encode("utf-8") + b"\n")
+        data = b""
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    if not data:
+        raise ConnectionError("Test server closed the connection without a result")
+    return json.loads(data)
+
+
+__all__ = [
+    "DEFAULT_SOCKET",
+    "TIMEOUT_EXIT_CODE",
+    "PRELOAD_MODULES",
+    "preload",
+    "startup_profile",
+    "format_profile",
+    "serve",
+    "request_job",
+]
@@ -39,11 +39,20 @@ from ctcore.models import (
     StatusEnum,
     ResultEnum,
     load_config,
-    read_ca_file,
 )
+from ctcore.artifacts import INHERITED_MAIN_FIELDS, INHERITED_SUB_FIELDS, load_testsuite_artifact
 from ctcore.helpers import get_property_as_list
 from ctcore.security import validate_path_in_root, validate_filename, validate_absolute_path, PathValidationError
 
+from ..parallel import (
+    add_parallel_options,
+    finish_parallel_run,
+    plan_parallel_session,
+    selected_testcases,
+    start_workers,
+    write_partial_results,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,22 +104,8 @@ class BaseTesterConfig(ABC):
     has_report_header: bool = True
 
     # Property inheritance fields (used when has_property_inheritance=True)
-    sub_fields: List[str] = [
-        "qualification",
-        "relativeTolerance",
-        "absoluteTolerance",
-        "allowedOccuranceRange",
-        "occuranceType",
-        "typeCheck",
-        "shapeCheck",
-        "ignoreClass",
-        "verbosity",
-    ]
-    main_fields: List[str] = sub_fields + [
-        "storeGraphicsArtifacts",
-        "competency",
-        "timeout",
-    ]
+    sub_fields: List[str] = list(INHERITED_SUB_FIELDS)
+    main_fields: List[str] = list(INHERITED_MAIN_FIELDS)
 
     def __init__(self):
         """Initialize the configuration."""
@@ -141,6 +136,7 @@ class BaseTesterConfig(ABC):
             self._configure_with_inheritance(config)
         else:
             configure_test_session(config, language=self.language)
+        plan_parallel_session(config, config.stash[report_key])
 
     def generate_tests(self, metafunc: pytest.Metafunc) -> None:
         """Generate test cases. Override for custom test generation."""
@@ -154,6 +150,7 @@ class BaseTesterConfig(ABC):
         """Handle session start. Override for custom startup logic."""
         _report = session.config.stash[report_key]
         _report["started"] = _report.get("created", time.time())
+        start_workers(session.config, _report)
 
     def session_finish(self, session: pytest.Session, exitstatus: int) -> None:
         """
@@ -161,7 +158,15 @@ class BaseTesterConfig(ABC):
 
         Override for custom finalization logic.
         Default uses finalize_session() unless has_custom_session_finish is True.
+        Workers of a parallel run hand their results to the parent instead.
         """
+        _report = session.config.stash[report_key]
+        if _report.get("partial"):
+            write_partial_results(_report, exitstatus)
+            return
+        if _report.get("parallel"):
+            exitstatus = session.exitstatus = finish_parallel_run(_report, exitstatus)
+
         if self.has_custom_session_finish:
             self._custom_session_finish(session, exitstatus)
         else:
@@ -201,11 +206,9 @@ class BaseTesterConfig(ABC):
         verbosity_level = int(config.getoption("--ctverbosity") or 0)
         pytestflags = config.getoption("--pytestflags")
 
-        specification: ComputorSpecification = read_ca_file(
-            ComputorSpecification, specyamlfile
-        )
-        testsuite: ComputorTestSuite = read_ca_file(
-            ComputorTestSuite, testyamlfile
+        # Validated and inheritance-resolved once per (testsuite, specification)
+        testsuite, specification = load_testsuite_artifact(
+            testyamlfile, specyamlfile, inherit=(self.main_fields, self.sub_fields)
         )
 
         # Root directory
@@ -252,21 +255,13 @@ class BaseTesterConfig(ABC):
 
         os.makedirs(os.path.dirname(reportfile), exist_ok=True)
 
-        # Build test case indices with property inheritance
+        # Build test case indices (properties are already inherited)
         testcases = []
         main_tests: List[ComputorReportMain] = []
 
-        def inherit_properties(properties: List[str], child: Any, parent: Any) -> None:
-            """Inherit None properties from parent."""
-            for prop in properties:
-                if getattr(child, prop, None) is None:
-                    setattr(child, prop, getattr(parent, prop, None))
-
         for idx_main, main in enumerate(testsuite.properties.tests):
-            inherit_properties(self.main_fields, main, testsuite.properties)
             sub_tests: List[ComputorReportSub] = []
             for idx_sub, sub in enumerate(main.tests):
-                inherit_properties(self.sub_fields, sub, main)
                 testcases.append((idx_main, idx_sub))
                 sub_tests.append(ComputorReportSub(name=sub.name))
 
@@ -699,6 +694,7 @@ def add_common_options(parser: pytest.Parser) -> None:
         default="",
         help="additional pytest flags",
     )
+    add_parallel_options(parser)
 
 
 def configure_test_session(
@@ -727,13 +723,8 @@ def configure_test_session(
     verbosity_level = int(config.getoption("--ctverbosity") or 0)
     pytestflags = config.getoption("--pytestflags")
 
-    # Load test suite and specification
-    specification: ComputorSpecification = read_ca_file(
-        ComputorSpecification, specyamlfile
-    )
-    testsuite: ComputorTestSuite = read_ca_file(
-        ComputorTestSuite, testyamlfile
-    )
+    # Load test suite and specification (precompiled artifact when available)
+    testsuite, specification = load_testsuite_artifact(testyamlfile, specyamlfile)
 
     # Determine root directory
     root = os.path.abspath(testroot) if testroot and testroot != "." else os.path.abspath(os.path.dirname(testyamlfile))
@@ -855,7 +846,8 @@ def generate_test_cases(metafunc: pytest.Metafunc) -> None:
     """
     Generate test cases from test suite.
 
-    Parametrizes tests with (main_idx, sub_idx) tuples.
+    Parametrizes tests with (main_idx, sub_idx) tuples, restricted to the
+    collections this session runs (see testers.parallel).
 
     Args:
         metafunc: pytest metafunc object
@@ -867,10 +859,10 @@ def generate_test_cases(metafunc: pytest.Metafunc) -> None:
         test_ids = []
         test_params = []
 
-        for main_idx, main in enumerate(testsuite.properties.tests):
-            for sub_idx, sub in enumerate(main.tests):
-                test_ids.append(f"{main.name}\\{sub.name}")
-                test_params.append((main_idx, sub_idx))
+        for main_idx, sub_idx in selected_testcases(_report, _report["testcases"]):
+            main = testsuite.properties.tests[main_idx]
+            test_ids.append(f"{main.name}\\{main.tests[sub_idx].name}")
+            test_params.append((main_idx, sub_idx))
 
         metafunc.parametrize("testcases", test_params, ids=test_ids)
 
@@ -24,11 +24,19 @@ from ctcore.models import (
     StatusEnum, ResultEnum,
     ComputorReport, ComputorReportMain,
     ComputorReportSub, ComputorReportSummary,
-    read_ca_file,
 )
+from ctcore.artifacts import INHERITED_MAIN_FIELDS, INHERITED_SUB_FIELDS, load_testsuite_artifact
 from ctcore.helpers import get_property_as_list
 from ctcore.security import validate_path_in_root, validate_filename, PathValidationError
 
+from ...parallel import (
+    finish_parallel_run,
+    plan_parallel_session,
+    selected_testcases,
+    start_workers,
+    write_partial_results,
+)
+
 from ..conftest_base import (
     Solution,
     metadata_key,
@@ -74,11 +82,9 @@ def pytest_configure(config: pytest.Config) -> None:
     verbosity_level = int(config.getoption("--ctverbosity") or 0)
     pytestflags = config.getoption("--pytestflags")
 
-    specification: ComputorSpecification = read_ca_file(
-        ComputorSpecification, specyamlfile
-    )
-    testsuite: ComputorTestSuite = read_ca_file(
-        ComputorTestSuite, testyamlfile
+    # Validated and inheritance-resolved once per (testsuite, specification)
+    testsuite, specification = load_testsuite_artifact(
+        testyamlfile, specyamlfile, inherit=(INHERITED_MAIN_FIELDS, INHERITED_SUB_FIELDS)
     )
 
     # Root directory from option or fallback to testsuite location
@@ -119,39 +125,13 @@ def pytest_configure(config: pytest.Config) -> None:
 
     os.makedirs(os.path.dirname(reportfile), exist_ok=True)
 
-    # Build test case indices with property inheritance
+    # Build test case indices (properties are already inherited)
     testcases = []
     main_tests: List[ComputorReportMain] = []
 
-    subfields = [
-        "qualification",
-        "relativeTolerance",
-        "absoluteTolerance",
-        "allowedOccuranceRange",
-        "occuranceType",
-        "typeCheck",
-        "shapeCheck",
-        "ignoreClass",
-        "verbosity",
-    ]
-    mainfields = subfields.copy()
-    mainfields.extend([
-        "storeGraphicsArtifacts",
-        "competency",
-        "timeout",
-    ])
-
-    def parent_property(properties, this, parent):
-        """Inherit None properties from parent."""
-        for prop in properties:
-            if getattr(this, prop) is None:
-                setattr(this, prop, getattr(parent, prop))
-
     for idx_main, main in enumerate(testsuite.properties.tests):
-        parent_property(mainfields, main, testsuite.properties)
         sub_tests: List[ComputorReportSub] = []
         for idx_sub, sub in enumerate(main.tests):
-            parent_property(subfields, sub, main)
             testcases.append((idx_main, idx_sub))
             sub_tests.append(ComputorReportSub(name=sub.name))
 
@@ -207,12 +187,13 @@ def pytest_configure(config: pytest.Config) -> None:
         "reference_command_list": [],
     }
     config.stash[report_key] = report_data
+    plan_parallel_session(config, report_data)
 
 
 def pytest_generate_tests(metafunc: pytest.Metafunc):
     """Generate parametrized test cases."""
     report = metafunc.config.stash[report_key]
-    metafunc.parametrize("testcases", report["testcases"])
+    metafunc.parametrize("testcases", selected_testcases(report, report["testcases"]))
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -254,13 +235,20 @@ def pytest_sessionstart(session: pytest.Session):
     """Record session start time."""
     _report = session.config.stash[report_key]
     _report["started"] = time.time()
+    start_workers(session.config, _report)
 
 
 def pytest_sessionfinish(session: pytest.Session):
     """Generate final report on session finish."""
+    _report = session.config.stash[report_key]
+    if _report.get("partial"):
+        write_partial_results(_report, session.exitstatus)
+        return
+    if _report.get("parallel"):
+        session.exitstatus = finish_parallel_run(_report, session.exitstatus)
+
     exitcode = session.exitstatus
     environment = session.config.stash[metadata_key]
-    _report = session.config.stash[report_key]
     testyamlfile = _report["testyamlfile"]
     specyamlfile = _report["specyamlfile"]
     pytestflags = _report["pytestflags"]
@@ -0,0 +1,174 @@
+"""Unit tests for the content-addressed compile cache in ``ctexec.compile_cache``.
+
+They compile tiny C programs with the real ``gcc`` and check that identical
+compilations are served from the cache (successes and failures alike), that
+any change to the inputs misses, and that eviction keeps the size bound.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import stat
+import subprocess
+from unittest import mock
+
+import pytest
+
+from ctexec import compile_cache
+from ctexec.compile_cache import CompileCache
+from ctexec.compiled import CompiledExecutor
+
+pytestmark = pytest.mark.skipif(shutil.which("gcc") is None, reason="gcc not installed")
+
+
+class _GccExecutor(CompiledExecutor):
+    language = "c"
+
+    def _get_default_compiler(self):
+        return "gcc"
+
+    def _get_default_flags(self):
+        return ["-O0"]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CompileCache(str(tmp_path / "cache"))
+    with mock.patch.object(compile_cache, "_default_cache", cache), \
+            mock.patch.object(compile_cache, "_default_cache_loaded", True):
+        yield cache
+
+
+def _submission(tmp_path, name, source, header="#define ANSWER 42\n"):
+    work = tmp_path / name
+    work.mkdir()
+    (work / "main.c").write_text(source)
+    (work / "answer.h").write_text(header)
+    return str(work)
+
+
+GOOD = '#include <stdio.h>\n#include "answer.h"\nint main(void) { printf("%d\\n", ANSWER); return 0; }\n'
+BROKEN = "int main(void) { return undefined_symbol; }\n"
+
+
+def _compile(work):
+    executor = _GccExecutor(working_dir=work, check_runtime=False)
+    return executor, executor.compile(["main.c"])
+
+
+def test_identical_submission_skips_compiler(tmp_path, cache):
+    executor, first = _compile(_submission(tmp_path, "a", GOOD))
+    assert first.success and not first.cached
+
+    with mock.patch("ctexec.compiled.subprocess.run", wraps=subprocess.run) as run:
+        executor, second = _compile(_submission(tmp_path, "b", GOOD))
+
+    assert second.success and second.cached
+    assert not [c for c in run.call_args_list if c.args[0][0] == "gcc" and "--version" not in c.args[0]]
+    assert executor.run().stdout == "42\n"
+    executor.cleanup()
+
+
+def test_header_change_misses(tmp_path, cache):
+    _compile(_submission(tmp_path, "a", GOOD))
+    executor, result = _compile(_submission(tmp_path, "b", GOOD, header="#define ANSWER 7\n"))
+
+    assert result.success and not result.cached
+    assert executor.run().stdout == "7\n"
+
+
+def test_compile_errors_are_cached(tmp_path, cache):
+    _, first = _compile(_submission(tmp_path, "a", BROKEN))
+    _, second = _compile(_submission(tmp_path, "b", BROKEN))
+
+    assert not first.success and not first.cached
+    assert not second.success and second.cached
+    assert second.stderr == first.stderr
+    assert "undefined_symbol" in second.stderr
+    assert str(tmp_path) not in second.stderr
+
+
+def test_missing_compiler_is_not_cached(tmp_path, cache):
+    work = _submission(tmp_path, "a", GOOD)
+    executor = _GccExecutor(working_dir=work, check_runtime=False)
+
+    result = executor.compile(["main.c"], compiler="no-such-compiler")
+
+    assert not result.success
+    assert not os.listdir(os.path.join(cache.root, "entries"))
+
+
+def test_eviction_keeps_size_bound(tmp_path, cache):
+    for i in range(3):
+        _compile(_submission(tmp_path, f"s{i}", GOOD, header=f"#define ANSWER {i}\n"))
+    entries = [
+        os.path.join(shard.path, entry)
+        for shard in os.scandir(os.path.join(cache.root, "entries"))
+        for entry in os.listdir(shard.path)
+    ]
+    entry_size = max(
+        sum(os.path.getsize(os.path.join(e, f)) for f in os.listdir(e)) for e in entries
+    )
+
+    cache.max_bytes = int(entry_size * 1.5)
+    cache.evict()
+
+    remaining = sum(len(os.listdir(s.path)) for s in os.scandir(os.path.join(cache.root, "entries")))
+    assert remaining == 1
+
+
+def _entry(cache):
+    (shard,) = os.scandir(os.path.join(cache.root, "entries"))
+    (entry,) = os.scandir(shard.path)
+    return entry.path
+
+
+def test_job_writes_do_not_reach_the_entry(tmp_path, cache):
+    _compile(_submission(tmp_path, "a", GOOD))
+    executor, hit = _compile(_submission(tmp_path, "b", GOOD))
+    assert hit.cached
+
+    # The submission overwrites its own executable
+    with open(executor.executable_path, "r+b") as fh:
+        fh.write(b"#!/bin/sh\necho poisoned\n")
+    assert not os.path.samefile(executor.executable_path, os.path.join(_entry(cache), "binary"))
+
+    executor, again = _compile(_submission(tmp_path, "c", GOOD))
+    assert again.cached
+    assert executor.run().stdout == "42\n"
+
+
+def test_entries_are_read_only(tmp_path, cache):
+    _compile(_submission(tmp_path, "a", GOOD))
+    entry = _entry(cache)
+
+    assert stat.S_IMODE(os.stat(entry).st_mode) == compile_cache.ENTRY_DIR_MODE
+    assert stat.S_IMODE(os.stat(os.path.join(entry, "binary")).st_mode) == compile_cache.BINARY_MODE
+    assert stat.S_IMODE(os.stat(os.path.join(entry, "result.json")).st_mode) == compile_cache.RESULT_MODE
+    assert stat.S_IMODE(os.stat(cache.root).st_mode) == 0o700
+
+
+def test_modified_entry_is_discarded(tmp_path, cache):
+    _compile(_submission(tmp_path, "a", GOOD))
+    binary = os.path.join(_entry(cache), "binary")
+    os.chmod(binary, 0o755)
+    with open(binary, "r+b") as fh:
+        fh.write(b"#!/bin/sh\necho poisoned\n")
+
+    executor, result = _compile(_submission(tmp_path, "b", GOOD))
+
+    assert result.success and not result.cached
+    assert executor.run().stdout == "42\n"
+    # Republished from the fresh compile
+    _, hit = _compile(_submission(tmp_path, "c", GOOD))
+    assert hit.cached
+
+
+def test_cache_needs_an_explicit_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv("CT_COMPILE_CACHE", raising=False)
+    monkeypatch.delenv("CT_COMPILE_CACHE_DIR", raising=False)
+    assert CompileCache.from_env() is None
+
+    monkeypatch.setenv("CT_COMPILE_CACHE_DIR", str(tmp_path / "harness-cache"))
+    assert CompileCache.from_env().root == str(tmp_path / "harness-cache")
@@ -0,0 +1,178 @@
+"""Unit tests for the warm container pool in ``sandbox.backends``.
+
+``docker`` is replaced by a fake ``subprocess.run`` that records commands,
+so these tests check the pool's bookkeeping (reuse, recycling, copying the
+working directory in and out) without a Docker daemon.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from sandbox import backends
+from sandbox.backends import DockerContainerPool, DockerRunner, get_container_pool
+from sandbox.config import RunnerBackend, RunnerSettings
+
+
+class FakeDocker:
+    def __init__(self):
+        self.started = []
+        self.run_cmds = []
+        self.removed = []
+        self.execs = []
+        self.paused = set()
+        self.procs = 3
+        self.exec_result = SimpleNamespace(returncode=0, stdout="ok\n", stderr="")
+
+    def __call__(self, cmd, **kwargs):
+        if cmd[:2] == ["docker", "run"]:
+            self.run_cmds.append(cmd)
+            self.started.append(cmd[cmd.index("--name") + 1])
+            return SimpleNamespace(returncode=0, stdout="id\n", stderr="")
+        if cmd[:3] == ["docker", "rm", "-f"]:
+            self.removed.append(cmd[3])
+            return SimpleNamespace(returncode=0, stdout="", stderr="")
+        if cmd[:2] == ["docker", "pause"]:
+            self.paused.add(cmd[2])
+            return SimpleNamespace(returncode=0, stdout="", stderr="")
+        if cmd[:2] == ["docker", "unpause"]:
+            self.paused.discard(cmd[2])
+            return SimpleNamespace(returncode=0, stdout="", stderr="")
+        if cmd[:2] == ["docker", "exec"] and cmd[-3:-1] == ["sh", "-c"]:
+            return SimpleNamespace(returncode=0, stdout=f"{self.procs}\n", stderr="")
+        self.execs.append(cmd)
+        if callable(self.exec_result):
+            return self.exec_result(cmd, **kwargs)
+        return self.exec_result
+
+
+@pytest.fixture
+def docker():
+    fake = FakeDocker()
+    with mock.patch("sandbox.backends.subprocess.run", side_effect=fake):
+        yield fake
+
+
+def _pool(tmp_path, size=1, max_uses=50):
+    settings = RunnerSettings(backend=RunnerBackend.DOCKER, docker_pool_size=size)
+    return DockerContainerPool(settings, size, max_uses, root=str(tmp_path / "pool"))
+
+
+def test_containers_are_reused_with_the_same_isolation(tmp_path, docker):
+    pool = _pool(tmp_path)
+    pool.warm()
+
+    for _ in range(3):
+        assert pool.run(["echo", "ok"], {"PATH": "/usr/bin"})["stdout"] == "ok\n"
+
+    assert len(docker.started) == 1
+    assert all(docker.started[0] in cmd for cmd in docker.execs)
+
+
+def test_recycled_after_max_uses(tmp_path, docker):
+    pool = _pool(tmp_path, max_uses=2)
+
+    for _ in range(3):
+        pool.run(["true"], {})
+
+    assert len(docker.started) == 2
+    assert docker.removed == docker.started[:1]
+
+
+def test_timeout_and_leftover_processes_recycle(tmp_path, docker):
+    pool = _pool(tmp_path)
+
+    def timeout(cmd, **kwargs):
+        raise subprocess.TimeoutExpired(cmd, 1)
+
+    docker.exec_result = timeout
+    assert pool.run(["sleep", "99"], {})["timed_out"] is True
+    assert len(docker.removed) == 1
+
+    docker.exec_result = SimpleNamespace(returncode=0, stdout="", stderr="")
+    pool.run(["true"], {})
+    docker.procs = 4  # the job left a background process behind
+    pool.run(["true"], {})
+
+    assert len(docker.removed) == 2
+
+
+def test_working_directory_round_trip(tmp_path, docker):
+    work = tmp_path / "work"
+    work.mkdir()
+    (work / "main.py").write_text("print(1)")
+    pool = _pool(tmp_path)
+
+    def write_output(cmd, **kwargs):
+        container = docker.started[-1]
+        slot = os.path.join(pool.root, container)
+        assert open(os.path.join(slot, "main.py")).read() == "print(1)"
+        with open(os.path.join(slot, "out.txt"), "w") as fh:
+            fh.write("result")
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    docker.exec_result = write_output
+    pool.run(["python3", "main.py"], {}, cwd=str(work))
+
+    assert (work / "out.txt").read_text() == "result"
+
+
+def test_copy_out_runs_paused_and_ignores_links(tmp_path, docker):
+    work = tmp_path / "work"
+    work.mkdir()
+    secret = tmp_path / "secret.txt"
+    secret.write_text("host secret")
+    victim = tmp_path / "victim.txt"
+    victim.write_text("host file")
+    (work / "report.txt").symlink_to(victim)
+    pool = _pool(tmp_path)
+    copied = []
+
+    def plant_links(cmd, **kwargs):
+        slot = os.path.join(pool.root, docker.started[-1])
+        os.symlink(secret, os.path.join(slot, "leak.txt"))
+        with open(os.path.join(slot, "report.txt"), "w") as fh:
+            fh.write("overwritten")
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    def copy_out(*args):
+        copied.append(set(docker.paused))
+        real_copy_out(*args)
+
+    real_copy_out = backends._copy_out
+    docker.exec_result = plant_links
+    with mock.patch("sandbox.backends._copy_out", side_effect=copy_out):
+        pool.run(["sh", "job.sh"], {}, cwd=str(work))
+
+    assert copied == [{docker.started[0]}]
+    assert not docker.paused
+    assert not (work / "leak.txt").exists()
+    assert victim.read_text() == "host file"
+
+
+def test_pools_are_keyed_on_all_limits(tmp_path, docker):
+    settings = RunnerSettings(backend=RunnerBackend.DOCKER, docker_pool_size=1)
+    other = RunnerSettings(backend=RunnerBackend.DOCKER, docker_pool_size=1, cpu_seconds=5)
+
+    with mock.patch.dict(backends._pools, clear=True):
+        assert get_container_pool(settings) is get_container_pool(settings)
+        assert get_container_pool(other) is not get_container_pool(settings)
+        backends.shutdown_container_pools()
+
+    assert any("--ulimit=cpu=5:5" in cmd for cmd in docker.run_cmds)
+
+
+def test_runner_uses_pool_when_configured(tmp_path, docker):
+    settings = RunnerSettings(backend=RunnerBackend.DOCKER, docker_pool_size=1)
+    pool = _pool(tmp_path)
+
+    with mock.patch("sandbox.backends.get_container_pool", return_value=pool) as get_pool:
+        DockerRunner(settings).run(["true"])
+
+    get_pool.assert_called_once_with(settings)
+    assert docker.execs and docker.execs[0][:2] == ["docker", "exec"]
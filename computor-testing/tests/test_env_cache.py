@@ -0,0 +1,91 @@
+"""Unit tests for the dependency environment cache in ``dependencies.cache``."""
+
+from __future__ import annotations
+
+import os
+from unittest import mock
+
+import pytest
+
+from dependencies.cache import (
+    EnvironmentBuildError,
+    EnvironmentCache,
+    normalize_requirement,
+    normalize_requirements,
+    parse_owner,
+)
+
+
+def test_requirement_normalization():
+    assert normalize_requirement("Scikit_Learn >= 1.0") == "scikit-learn>=1.0"
+    assert normalize_requirement("requests[socks, Security]") == "requests[security,socks]"
+    assert normalize_requirement("git+https://x/Repo.git") == "git+https://x/Repo.git"
+    assert normalize_requirements(["numpy", "NumPy", " ", "pandas"]) == ["numpy", "pandas"]
+
+
+def _fake_pip(calls):
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        if "--target" in cmd:
+            target = cmd[cmd.index("--target") + 1]
+            with open(os.path.join(target, "fakepkg.py"), "w") as fh:
+                fh.write("VALUE = 1\n")
+        return mock.Mock(returncode=0, stdout="Python 3.x", stderr="")
+    return run
+
+
+def test_python_layer_built_once_and_read_only(tmp_path):
+    cache = EnvironmentCache(str(tmp_path))
+    calls = []
+
+    with mock.patch("dependencies.cache.subprocess.run", side_effect=_fake_pip(calls)):
+        first = cache.python_layer(["pandas", "NumPy"])
+        second = cache.python_layer(["numpy", "pandas", "numpy"])
+
+    installs = [c for c in calls if "install" in c]
+    assert first == second
+    assert len(installs) == 1
+    assert installs[0][-2:] == ["numpy", "pandas"]  # one batched resolver call
+    assert os.path.exists(os.path.join(first, "fakepkg.py"))
+    assert not os.access(first, os.W_OK) or os.geteuid() == 0
+    assert os.listdir(os.path.join(str(tmp_path), "tmp")) == []
+
+
+@pytest.mark.skipif(os.geteuid() != 0, reason="handing layers to another uid needs CAP_CHOWN")
+def test_layer_handed_to_owner(tmp_path):
+    cache = EnvironmentCache(str(tmp_path), owner=(4242, 4343))
+
+    with mock.patch("dependencies.cache.subprocess.run", side_effect=_fake_pip([])):
+        layer = cache.python_layer(["numpy"])
+
+    layer_dir = os.path.dirname(layer)
+    for path in (layer_dir, layer, os.path.join(layer, "fakepkg.py"), os.path.join(layer_dir, "meta.json")):
+        st = os.stat(path)
+        assert (st.st_uid, st.st_gid) == (4242, 4343)
+        assert not st.st_mode & 0o222
+
+
+def test_owner_from_environment(tmp_path):
+    with mock.patch.dict(os.environ, {"CT_ENV_CACHE_OWNER": "1001"}):
+        assert EnvironmentCache(str(tmp_path)).owner == (1001, 1001)
+    assert parse_owner("1001:50") == (1001, 50)
+    with pytest.raises(ValueError):
+        parse_owner("nobody")
+
+
+def test_failed_build_publishes_nothing(tmp_path):
+    cache = EnvironmentCache(str(tmp_path))
+
+    def fail(cmd, **kwargs):
+        return mock.Mock(returncode=1, stdout="", stderr="No matching distribution")
+
+    with mock.patch("dependencies.cache.subprocess.run", side_effect=fail):
+        with pytest.raises(EnvironmentBuildError, match="No matching distribution"):
+            cache.python_layer(["does-not-exist"])
+
+    assert os.listdir(os.path.join(str(tmp_path), "python")) == []
+    assert os.listdir(os.path.join(str(tmp_path), "tmp")) == []
+
+
+def test_no_requirements_no_layer(tmp_path):
+    assert EnvironmentCache(str(tmp_path)).python_layer([]) is None
@@ -0,0 +1,246 @@
+"""Tests for parallel test-collection execution (``testers.parallel``).
+
+The end-to-end tests run the Python tester through the CLI on a generated
+suite (an ``exist`` collection, dependent collections and independent
+ones), once sequentially and once with workers, and compare the reports
+without their timings. ``scripts/bench_parallel_collections.py`` times
+independent collections whose set-up waits, sequentially and with workers.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from ctcore.models import (
+    ComputorReport,
+    ComputorReportMain,
+    ComputorReportSub,
+    ComputorReportSummary,
+    ComputorTestSuite,
+)
+from testers.parallel import (
+    ParallelRun,
+    _worker_args,
+    collection_groups,
+    finish_parallel_run,
+    partition_collections,
+    prepare_worker_root,
+    resolve_workers,
+    worker_directories,
+    write_partial_results,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOLUTION = "x = 1\ny = 2\nwrong = {wrong}\n"
+
+
+def _suite(collections: list) -> ComputorTestSuite:
+    return ComputorTestSuite(**{"type": "python", "name": "suite", "properties": {"tests": collections}})
+
+
+def _collection(name: str, tests: list, **properties) -> dict:
+    return {"type": "variable", "name": name, "id": name, "tests": [{"name": t} for t in tests], **properties}
+
+
+def _dependent_suite() -> list:
+    return [
+        {"type": "exist", "name": "files", "id": "files", "tests": [{"name": "solution.py"}]},
+        _collection("base", ["x"], entryPoint="solution.py", setUpCode=["z = x + y"], successDependency=["files"]),
+        _collection("derived", ["z"], entryPoint="solution.py", setUpCodeDependency="base"),
+        _collection("failing", ["wrong"], entryPoint="solution.py"),
+        _collection("dependent", ["x"], entryPoint="solution.py", successDependency=["failing"]),
+        *(_collection(f"independent{i}", ["x", "y"], entryPoint="solution.py") for i in range(4)),
+    ]
+
+
+def _write_suite(tmp_path, collections: list) -> tuple:
+    for where, wrong in (("student", 0), ("reference", 1)):
+        (tmp_path / where).mkdir(exist_ok=True)
+        (tmp_path / where / "solution.py").write_text(SOLUTION.format(wrong=wrong))
+    (tmp_path / "test.yaml").write_text(yaml.safe_dump(
+        {"type": "python", "name": "Generated suite", "properties": {"tests": collections}}
+    ))
+    (tmp_path / "specification.yaml").write_text("studentDirectory: student\nreferenceDirectory: reference\n")
+    return str(tmp_path / "test.yaml"), str(tmp_path / "specification.yaml")
+
+
+def _run(tmp_path, workers=None) -> tuple:
+    command = [sys.executable, "-m", "testers.cli", "python", "run", "-T", "test.yaml", "-s", "specification.yaml"]
+    if workers is not None:
+        command += ["-w", str(workers)]
+    env = dict(os.environ, PYTHONPATH=ROOT, CT_ARTIFACT_CACHE_DIR=str(tmp_path / "artifacts"))
+    output = subprocess.run(command, cwd=str(tmp_path), env=env, capture_output=True, text=True)
+    with open(tmp_path / "output" / "testSummary.json") as fh:
+        report = json.load(fh)
+    os.remove(tmp_path / "output" / "testSummary.json")
+    return output, report
+
+
+def _without_timings(report: dict) -> dict:
+    for entry in [report, *report["tests"]]:
+        for key in ("timestamp", "duration", "executionDuration", "debug"):
+            entry.pop(key, None)
+    report.pop("environment", None)
+    report["properties"].pop("specification", None)
+    return report
+
+
+def test_groups_follow_declared_dependencies():
+    shared, groups = collection_groups(_suite(_dependent_suite()))
+
+    assert shared == [0]
+    assert groups == [[1, 2], [3, 4], [5], [6], [7], [8]]
+
+
+def test_late_exist_collection_stays_with_earlier_collections():
+    collections = _dependent_suite()
+    collections.insert(7, {"type": "exist", "name": "outputs", "id": "outputs", "tests": [{"name": "out.txt"}]})
+
+    shared, groups = collection_groups(_suite(collections))
+
+    assert shared == [0]
+    assert groups == [[1, 2, 3, 4, 5, 6, 7], [8], [9]]
+
+
+def test_worker_root_copies_solution_directories(tmp_path):
+    job = tmp_path / "job"
+    for name in ("student", "reference", "helpers"):
+        (job / name).mkdir(parents=True)
+        (job / name / "file.txt").write_text(name)
+    specification = SimpleNamespace(studentDirectory=str(job / "student"), referenceDirectory=str(job / "reference"))
+    workdir = str(tmp_path / "root")
+
+    prepare_worker_root(workdir, specification)
+    copies = worker_directories(workdir, specification)
+
+    student = copies[str(job / "student")]
+    assert (os.path.dirname(student), os.path.basename(student)) == (os.path.join(workdir, "0"), "student")
+    assert not os.path.islink(student) and open(os.path.join(student, "file.txt")).read() == "student"
+    assert os.path.islink(os.path.join(workdir, "0", "helpers"))
+    with open(os.path.join(student, "..", "helpers", "file.txt")) as fh:
+        assert fh.read() == "helpers"
+    with open(os.path.join(student, "file.txt"), "w") as fh:
+        fh.write("changed")
+    assert (job / "student" / "file.txt").read_text() == "student"
+
+
+def test_partitions_are_balanced_and_deterministic():
+    collections = _dependent_suite()
+    collections[5]["tests"] *= 3
+    suite = _suite(collections)
+
+    partitions = partition_collections(suite, 3)
+
+    assert partitions == partition_collections(suite, 3)
+    assert partitions == [[0, 5], [0, 1, 2, 6, 8], [0, 3, 4, 7]]
+    assert sorted(idx for p in partitions for idx in p if idx) == list(range(1, 9))
+    assert partition_collections(suite, 1) == [list(range(9))]
+    assert len(partition_collections(suite, 50)) == 6
+
+
+def test_worker_count(monkeypatch):
+    monkeypatch.delenv("CT_TEST_WORKERS", raising=False)
+    assert resolve_workers() == 1
+    monkeypatch.setenv("CT_TEST_WORKERS", "3")
+    assert resolve_workers() == 3
+    assert resolve_workers(0) == (os.cpu_count() or 1)
+    assert _worker_args(["t.py", "--ctworkers=4", "--ctworkers", "2", "-q"]) == ["t.py", "-q"]
+
+
+def test_parallel_report_matches_sequential(tmp_path):
+    _write_suite(tmp_path, _dependent_suite())
+    sequential_output, sequential = _run(tmp_path)
+    output, parallel = _run(tmp_path, workers=3)
+
+    assert output.returncode == sequential_output.returncode == 1, output.stdout + output.stderr
+    assert _without_timings(parallel) == _without_timings(sequential)
+    results = {main["name"]: main["result"] for main in parallel["tests"]}
+    assert results["derived"] == "PASSED"
+    assert (results["failing"], results["dependent"]) == ("FAILED", "SKIPPED")
+    # Worker output and partial results are not left behind
+    assert os.listdir(tmp_path / "output") == []
+
+
+def test_collections_writing_the_same_file(tmp_path):
+    """Two collections write and read back shared.txt in the solution directory."""
+    collections = [
+        {"type": "variable", "name": name, "id": name, "entryPoint": "solution.py",
+         "setUpCode": [f"open('shared.txt', 'w').write('{name}'); import time; time.sleep(3); "
+                       f"seen = open('shared.txt').read()"],
+         "tests": [{"name": "seen", "value": name}]}
+        for name in ("first", "second")
+    ]
+    _write_suite(tmp_path, collections)
+
+    output, parallel = _run(tmp_path, workers=2)
+
+    assert output.returncode == 0, output.stdout + output.stderr
+    assert [main["result"] for main in parallel["tests"]] == ["PASSED", "PASSED"]
+    assert (tmp_path / "student" / "shared.txt").read_text() == "first"
+
+
+def test_failed_worker_is_reported(tmp_path, capsys):
+    suite = _suite(_dependent_suite())
+    report_data = {
+        "report": ComputorReport(name="suite", tests=[
+            ComputorReportMain(name=main.name, summary=ComputorReportSummary(total=len(main.tests)),
+                               tests=[ComputorReportSub(name=sub.name) for sub in main.tests])
+            for main in suite.properties.tests
+        ]),
+        "solutions": {},
+        "started": time.time(),
+    }
+    run = ParallelRun(partition_collections(suite, 2), shared=[0])
+    run.tmpdir = str(tmp_path)
+    (tmp_path / "worker-1.log").write_text("ImportError: no module named numpy")
+    run.processes = [subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])]
+    report_data["parallel"] = run
+
+    status = finish_parallel_run(report_data, pytest.ExitCode.OK)
+
+    assert status == pytest.ExitCode.INTERNAL_ERROR
+    failed = [idx for idx, main in enumerate(report_data["report"].tests) if main.summary.failed]
+    assert failed == run.owned(1) and 0 not in failed
+    assert report_data["report"].tests[failed[0]].tests[0].resultMessage == "Test worker failed (exit code 3)"
+    assert "no module named numpy" in capsys.readouterr().err
+    assert not tmp_path.exists()
+
+
+def test_partial_results_map_only_diagnostic_paths(tmp_path):
+    original, copy = str(tmp_path / "student"), str(tmp_path / "work" / "root-1" / "0" / "student")
+    printed = f"cwd is {copy}"
+    report = ComputorReport(name="suite", tests=[ComputorReportMain(
+        name="c0", debug={"lintingErrors": [f"File not found: {copy}/missing.py"]},
+        tests=[ComputorReportSub(name="x", resultMessage=printed)],
+    )])
+    report_data = {
+        "report": report,
+        "solutions": {"0": {"student": {
+            "status": "FAILED",
+            "errormsg": f"Python script not found: {copy}/missing.py",
+            "errors": [f"{copy}2/other.py", copy],
+        }}},
+        "collections": [0],
+        "started": time.time(),
+        "partial": str(tmp_path / "partial.json"),
+        "worker_directories": {original: copy},
+    }
+
+    write_partial_results(report_data, 0)
+
+    with open(tmp_path / "partial.json") as fh:
+        result = json.load(fh)["collections"]["0"]
+    assert result["report"]["debug"]["lintingErrors"] == [f"File not found: {original}/missing.py"]
+    assert result["solutions"]["student"]["errormsg"] == f"Python script not found: {original}/missing.py"
+    assert result["solutions"]["student"]["errors"] == [f"{copy}2/other.py", original]
+    # Test messages may quote program output and are left as they are
+    assert result["report"]["tests"][0]["resultMessage"] == printed
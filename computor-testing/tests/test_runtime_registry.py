@@ -0,0 +1,157 @@
+"""Unit tests for memoized runtime probing (``ctexec.runtime.RuntimeRegistry``).
+
+A fake versioned binary (a shell script that appends to a call log)
+stands in for interpreters and compilers, so every spawned probe is
+counted.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+from ctexec import compile_cache, runtime
+from ctexec.runtime import RuntimeRegistry, check_runtime_installed, list_available_runtimes
+from testers.executors.c import CExecutor
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = RuntimeRegistry(str(tmp_path / "cache" / "runtimes.json"))
+    with mock.patch.object(runtime, "_default_registry", registry):
+        yield registry
+
+
+def _fake_binary(tmp_path, version="1.0", name="fakec"):
+    calls = tmp_path / f"{name}.calls"
+    path = tmp_path / "bin" / name
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(f'#!/bin/sh\necho x >> "{calls}"\necho "fakec {version}"\n')
+    path.chmod(0o755)
+    return str(path), calls
+
+
+def _calls(calls) -> int:
+    return len(calls.read_text().splitlines()) if calls.exists() else 0
+
+
+def test_probe_runs_once_per_binary(tmp_path, registry):
+    binary, calls = _fake_binary(tmp_path)
+
+    for _ in range(5):
+        assert check_runtime_installed("c", binary=binary) == (True, f"fakec 1.0 ({binary})")
+
+    assert _calls(calls) == 1
+    assert registry.spawned == 1
+
+
+def test_probes_are_shared_through_the_cache_file(tmp_path, registry):
+    binary, calls = _fake_binary(tmp_path)
+    registry.probe(binary)
+
+    other = RuntimeRegistry(registry.cache_file)
+    assert other.probe(binary)["stdout"] == "fakec 1.0\n"
+    assert other.spawned == 0
+
+    # Another harness process on the host
+    env = dict(os.environ, CT_RUNTIME_CACHE_FILE=registry.cache_file)
+    script = (
+        "from ctexec.runtime import check_runtime_installed, get_runtime_registry\n"
+        f"print(check_runtime_installed('c', binary={binary!r})[0], get_runtime_registry().spawned)\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert output.stdout.split() == ["True", "0"], output.stderr
+    assert _calls(calls) == 1
+
+
+def test_changed_binary_is_probed_again(tmp_path, registry):
+    binary, calls = _fake_binary(tmp_path)
+    assert "1.0" in check_runtime_installed("c", binary=binary)[1]
+
+    # Upgrade in place: new inode, content and size
+    os.remove(binary)
+    _fake_binary(tmp_path, version="2.0.1")
+
+    assert "2.0.1" in check_runtime_installed("c", binary=binary)[1]
+    assert _calls(calls) == 2
+    with open(registry.cache_file) as fh:
+        probes = json.load(fh)["probes"]
+    # The stale probe of the old binary is dropped
+    assert [p["stdout"] for p in probes.values()] == ["fakec 2.0.1\n"]
+
+
+def test_missing_binary_and_failures(tmp_path, registry):
+    assert check_runtime_installed("c", binary="no-such-compiler") == (False, "GCC (C) not found (tried: no-such-compiler)")
+    assert registry.probe("no-such-compiler") is None
+
+    slow = tmp_path / "bin" / "slow"
+    slow.parent.mkdir(exist_ok=True)
+    slow.write_text("#!/bin/sh\nsleep 5\n")
+    slow.chmod(0o755)
+    with pytest.raises(subprocess.TimeoutExpired):
+        registry.probe(str(slow), timeout=0.2)
+    # Timeouts are not remembered
+    assert not os.path.exists(registry.cache_file)
+
+
+def test_failed_probe_is_not_remembered(tmp_path, registry):
+    broken = tmp_path / "bin" / "broken"
+    broken.parent.mkdir(exist_ok=True)
+    broken.write_text("#!/bin/sh\necho 'libfoo.so: not found' >&2\nexit 127\n")
+    broken.chmod(0o755)
+
+    assert registry.probe(str(broken))["returncode"] == 127
+    assert registry.probe(str(broken))["returncode"] == 127
+
+    assert registry.spawned == 2
+    assert not os.path.exists(registry.cache_file)
+
+
+def test_disabled_disk_cache_keeps_memory_memo(tmp_path, monkeypatch):
+    monkeypatch.setenv("CT_RUNTIME_CACHE", "0")
+    registry = RuntimeRegistry.from_env()
+    binary, calls = _fake_binary(tmp_path)
+
+    registry.probe(binary)
+    registry.probe(binary)
+
+    assert registry.cache_file is None
+    assert _calls(calls) == 1
+
+
+def test_compiler_identity_uses_the_registry(tmp_path, registry):
+    binary, calls = _fake_binary(tmp_path)
+    check_runtime_installed("c", binary=binary)
+
+    identity = compile_cache._compiler_identity(binary)
+
+    assert identity == f"{os.path.realpath(binary)}\nfakec 1.0\n"
+    assert _calls(calls) == 1
+
+
+@pytest.mark.skipif(shutil.which("gcc") is None, reason="gcc not installed")
+def test_executor_construction_probes_once(tmp_path, registry):
+    """Construct 50 C executors (each checks for gcc) and list all runtimes 5 times."""
+    rounds = 50
+
+    def run():
+        for _ in range(rounds):
+            CExecutor(working_dir=str(tmp_path))
+        for _ in range(5):
+            list_available_runtimes()
+
+    with mock.patch.object(runtime, "_default_registry", RuntimeRegistry()) as legacy:
+        # Previous behaviour: every check spawns its probe
+        with mock.patch.object(legacy, "_probes", mock.MagicMock(get=lambda key: None)):
+            run()
+
+    run()
+
+    assert registry.spawned * 10 < legacy.spawned
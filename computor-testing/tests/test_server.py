@@ -0,0 +1,107 @@
+"""Tests for the pre-forked harness server in ``testers.server``."""
+
+from __future__ import annotations
+
+import os
+import signal
+import stat
+import subprocess
+import sys
+import time
+
+import pytest
+
+from testers import server as test_server
+from testers.server import TIMEOUT_EXIT_CODE, format_profile, request_job
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def server(tmp_path):
+    socket_path = str(tmp_path / "ct.sock")
+    env = dict(os.environ, PYTHONPATH=PACKAGE_ROOT)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "testers.cli", "serve", "-S", socket_path, "-l", "python", "-j", "2"],
+        env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+    )
+    deadline = time.monotonic() + 30
+    while not os.path.exists(socket_path):
+        if proc.poll() is not None or time.monotonic() > deadline:
+            proc.kill()
+            pytest.fail(f"server did not start: {proc.stdout.read().decode()}")
+        time.sleep(0.05)
+    yield socket_path
+    proc.terminate()
+    proc.wait(timeout=10)
+
+
+def test_jobs_run_in_forked_children(server):
+    # Each job gets a fresh child: a failed job does not affect the next one
+    for _ in range(2):
+        response = request_job(server, {"language": "cobol", "testsuite": "x"}, timeout=30)
+        assert response["exit_code"] == 1
+        assert "No tester for language: cobol" in response["stderr"]
+
+
+def test_invalid_request_is_reported(server):
+    response = request_job(server, {"language": "python"}, timeout=30)
+
+    assert response["exit_code"] == 1
+    assert "testsuite" in response["stderr"]
+
+
+def test_socket_is_not_world_accessible(server):
+    assert stat.S_IMODE(os.stat(server).st_mode) == 0o660
+
+
+def _alive(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat") as fh:
+            return fh.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def test_timeout_kills_job_subprocesses(tmp_path):
+    socket_path = str(tmp_path / "ct.sock")
+    pid_file = tmp_path / "child.pid"
+
+    def job(request):
+        child = subprocess.Popen(["sleep", "60"])
+        pid_file.write_text(str(child.pid))
+        time.sleep(60)
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            test_server.PRELOAD_MODULES = []
+            test_server._run_job = job
+            test_server.serve(socket_path, languages=[], max_jobs=1, log=lambda line: None)
+        finally:
+            os._exit(0)
+    try:
+        deadline = time.monotonic() + 30
+        while not os.path.exists(socket_path) and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        response = request_job(socket_path, {"language": "python", "testsuite": "x", "timeout": 1}, timeout=30)
+        assert response["exit_code"] == TIMEOUT_EXIT_CODE
+
+        child = int(pid_file.read_text())
+        deadline = time.monotonic() + 5
+        while _alive(child) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not _alive(child)
+    finally:
+        os.kill(pid, signal.SIGTERM)
+        os.waitpid(pid, 0)
+
+
+def test_format_profile_sorts_by_cost():
+    report = format_profile([("fast", 0.001, None), ("slow", 0.1, None), ("broken", 0.0, "ImportError: x")])
+    lines = report.splitlines()
+
+    assert lines[1].startswith("slow")
+    assert "ImportError: x" in report
+    assert lines[-1].startswith("total")
@@ -0,0 +1,170 @@
+"""Tests for the streaming stdio matchers (``ctcore.stdio``).
+
+Every output is matched as one string and split into small str/bytes
+chunks or a file object, which must give the same result.
+``scripts/bench_stdio_streaming.py`` compares the streaming matchers with
+whole-text matching on a 10 MB simulation log.
+"""
+
+from __future__ import annotations
+
+import io
+import subprocess
+import sys
+
+import pytest
+
+from ctcore.stdio import (
+    SNIPPET_CHARS,
+    compare_outputs,
+    compile_matcher,
+    extract_numbers,
+    get_lines,
+    iter_lines,
+    iter_numbers,
+    match_lines_subset,
+    normalize_output,
+)
+
+OUTPUTS = [
+    "",
+    "\n",
+    "hello\n",
+    "  Hello World  \r\n\r\nline 2\rline 3\n\n",
+    "x = 1.5e3, y = -2.\nz=7\n",
+    "ΣΑΣ ΟΔΟΣ\nΣ\n",
+    "\t\n  \n",
+]
+
+CASES = [
+    ("matches", "Hello World\n\nline 2\nline 3", None, {}),
+    ("matches", "hello world", None, {"ignore_case": True}),
+    ("matches", "x = 1.5e3, y = -2.\r\nz=7", None, {"normalize_newlines": False}),
+    ("contains", "World  \r\n", None, {}),
+    ("contains", "", "ΟΔΟΣ", {"ignore_case": True}),
+    ("startsWith", "hello", None, {"ignore_case": True}),
+    ("endsWith", "line 3", None, {}),
+    ("regexp", "", r"line \d$", {}),
+    ("regexpMultiline", "", r"^line \d$", {}),
+    ("matchesLine", "line 2", None, {"line_number": 3}),
+    ("matchesLine", "z=7", None, {"line_number": 9}),
+    ("containsLine", "LINE 3", None, {"ignore_case": True}),
+    ("containsLine", "  ", None, {"trim": False}),
+    ("lineCount", "4", None, {}),
+    ("lineCount", "", None, {"min_count": 1, "max_count": 2}),
+    ("numericOutput", "1500 -2 7", None, {}),
+    ("numericOutput", "1500 -2 7 8", None, {}),
+]
+
+
+def _chunked(text: str, size: int) -> list:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _sources(text: str):
+    yield text
+    yield _chunked(text, 1)
+    yield _chunked(text, 3)
+    data = text.encode()
+    yield [data[i:i + 1] for i in range(len(data))]
+    yield io.StringIO(text)
+    yield io.BytesIO(data)
+
+
+def _summary(result):
+    return result.success, result.message, result.actual, result.expected, result.details
+
+
+@pytest.mark.parametrize("qualification,expected,pattern,options", CASES)
+def test_chunked_output_matches_like_text(qualification, expected, pattern, options):
+    for output in OUTPUTS:
+        reference = _summary(compare_outputs(output, expected, qualification, pattern, **options))
+        for source in _sources(output):
+            result = compare_outputs(source, expected, qualification, pattern, **options)
+            assert _summary(result) == reference, (output, source)
+
+
+@pytest.mark.parametrize("output", OUTPUTS)
+def test_streams_follow_text_helpers(output):
+    for source in _sources(output):
+        assert list(iter_lines(source)) == get_lines(output)
+    for source in _sources(output):
+        assert list(iter_numbers(source)) == extract_numbers(output)
+
+    normalized = normalize_output(output, ignore_case=True)
+    assert compare_outputs(_chunked(output, 1), normalized, "matches", ignore_case=True)
+    normalized = normalize_output(output)
+    assert compare_outputs(output, normalized + "!", "matches").details == {"offset": len(normalized)}
+
+
+def test_lines_subset():
+    output = "b\r\n  a\nc\nb\n"
+    for source in _sources(output):
+        assert match_lines_subset(source, ["a", "b"])
+    assert not match_lines_subset(output, ["A", "b", "a"], ignore_case=True)
+    assert match_lines_subset(output, ["A", "b", "a"], ordered=False, ignore_case=True)
+
+    result = match_lines_subset(output, ["d", "c", "e", "d"], ordered=False)
+    assert (result.message, result.expected) == ("Missing 3 expected line(s)", "['d', 'e', 'd']")
+
+
+def test_matchers_are_compiled_once():
+    options = {"ignore_case": True, "trim": True, "line_number": None}
+    matcher = compile_matcher("regexp", "", r"step \d+", **options)
+
+    assert compile_matcher("regexp", "", r"step \d+", **options) is matcher
+    assert compile_matcher("regexp", "", r"step \d+", ignore_case=False) is not matcher
+    assert compile_matcher("numericOutput", [1, 2]).match("1 2")
+    assert not compare_outputs("x", "", "regexp", "(")
+    assert compare_outputs("x", "", "unknown").message == "Unknown qualification type: unknown"
+    with pytest.raises(ValueError):
+        compile_matcher("exitCode", "0")
+
+
+def _guarded(lines: list, limit: int):
+    """Output chunks that fail the test if more than ``limit`` are read."""
+    for n, line in enumerate(lines):
+        if n == limit:
+            raise AssertionError(f"read past chunk {limit}")
+        yield line + "\n"
+
+
+def test_reading_stops_when_the_result_is_known():
+    lines = [f"{n} {n * 0.5}" for n in range(1000)]
+
+    assert compare_outputs(_guarded(lines, 3), "0 0 1 0.5", "numericOutput")
+    assert compare_outputs(_guarded(lines, 5), "4 2.0", "matchesLine", line_number=5)
+    assert not compare_outputs(_guarded(lines, 5), "4 2", "matchesLine", line_number=5)
+    assert compare_outputs(_guarded(lines, 11), "10 5.0", "containsLine")
+    assert compare_outputs(_guarded(lines, 6), "0 0.0\n1 0.5", "startsWith")
+    assert match_lines_subset(_guarded(lines, 8), ["7 3.5", "2 1.0"], ordered=False)
+    result = compare_outputs(_guarded(lines, 2 + SNIPPET_CHARS // 4), "0 0.0\n1 0.0", "matches")
+    assert (result.success, result.details) == (False, {"offset": 10})
+
+
+def test_failure_keeps_bounded_actual_output():
+    output = "value\n" * 100000
+
+    results = [
+        compare_outputs(output, "other", "matches"),
+        compare_outputs(output, "other", "contains"),
+        compare_outputs(output, "", "regexp", "other"),
+    ]
+
+    for result in results:
+        assert not result.success
+        assert result.actual == (output[:SNIPPET_CHARS] + "...")
+    assert compare_outputs("short\n", "other", "contains").actual == "short\n"
+
+
+def test_matches_process_output_while_it_runs():
+    script = "for i in range(20000): print(f'step {i}: {i * 0.25}')"
+    proc = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE)
+    try:
+        result = compare_outputs(proc.stdout, "step 19999: 4999.75", "containsLine")
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+    assert result.details == {"line_number": 20000}
+
@@ -0,0 +1,229 @@
+"""Unit tests for precompiled test-suite artifacts (``ctcore.artifacts``).
+
+The artifact cache is pointed at a tmp dir and the loader is compared
+against the previous conftest behaviour (``read_ca_file`` for both YAML
+files plus property inheritance). ``scripts/bench_testsuite_artifacts.py``
+times both on a large generated suite.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import stat
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+import yaml
+
+from ctcore import artifacts
+from ctcore.artifacts import (
+    INHERITED_MAIN_FIELDS,
+    INHERITED_SUB_FIELDS,
+    ArtifactCache,
+    load_testsuite_artifact,
+    resolve_inheritance,
+    schema_modules,
+)
+from ctcore.models import ComputorSpecification, ComputorTestSuite, read_ca_file
+
+EXAMPLE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "examples", "itpcp.pgph.oct", "itpcp.pgph.oct.simple_computations", "test.yaml",
+)
+INHERIT = (INHERITED_MAIN_FIELDS, INHERITED_SUB_FIELDS)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ArtifactCache(str(tmp_path / "cache"))
+    with mock.patch.object(artifacts, "_default_cache", cache), \
+            mock.patch.object(artifacts, "_default_cache_loaded", True):
+        yield cache
+
+
+@pytest.fixture
+def suite(tmp_path):
+    specification = tmp_path / "specification.yaml"
+    specification.write_text("studentDirectory: submission\ntestVersion: v2\n")
+    return EXAMPLE, str(specification)
+
+
+def _legacy_load(testsuite_path, specification_path):
+    testsuite = read_ca_file(ComputorTestSuite, testsuite_path)
+    specification = read_ca_file(ComputorSpecification, specification_path)
+    resolve_inheritance(testsuite)
+    return testsuite, specification
+
+
+def _artifacts(cache):
+    return [f for _, _, files in os.walk(cache.root) for f in files]
+
+
+def _artifact_path(cache):
+    (dirpath, _, files), = [entry for entry in os.walk(cache.root) if entry[2]]
+    return os.path.relpath(dirpath, cache.root), files[0]
+
+
+def test_artifact_matches_yaml_load(cache, suite):
+    expected = _legacy_load(*suite)
+
+    compiled = load_testsuite_artifact(*suite, inherit=INHERIT)
+    loaded = load_testsuite_artifact(*suite, inherit=INHERIT)
+
+    assert len(_artifacts(cache)) == 1
+    for models in (compiled, loaded):
+        assert [m.model_dump() for m in models] == [m.model_dump() for m in expected]
+    # Inheritance is resolved: the suite tolerance reaches tests that do not set one
+    assert {t.relativeTolerance for t in loaded[0].properties.tests[1].tests} == {1.0e-12}
+    assert loaded[1].studentDirectory == "submission"
+
+
+def test_second_load_skips_yaml(cache, suite):
+    load_testsuite_artifact(*suite)
+
+    with mock.patch.object(artifacts.yaml, "safe_load", side_effect=AssertionError("parsed YAML")):
+        testsuite, _ = load_testsuite_artifact(*suite)
+
+    assert testsuite.name == "Simple Computations (Octave)"
+
+
+def test_loads_return_fresh_instances(cache, suite):
+    first, _ = load_testsuite_artifact(*suite)
+    first.properties.tests[0].name = "modified by a run"
+
+    second, _ = load_testsuite_artifact(*suite)
+
+    assert second.properties.tests[0].name != "modified by a run"
+
+
+def test_key_covers_content_and_inheritance(cache, suite, tmp_path):
+    load_testsuite_artifact(*suite)
+    load_testsuite_artifact(*suite, inherit=INHERIT)
+    assert len(_artifacts(cache)) == 2
+
+    changed = tmp_path / "test.yaml"
+    changed.write_bytes(open(EXAMPLE, "rb").read().replace(b"1.0e-12", b"1.0e-6"))
+    testsuite, _ = load_testsuite_artifact(str(changed), suite[1])
+
+    assert testsuite.properties.relativeTolerance == 1.0e-6
+    assert len(_artifacts(cache)) == 3
+
+
+def test_unreadable_artifact_is_recompiled(cache, suite):
+    load_testsuite_artifact(*suite)
+    path = os.path.join(cache.root, *_artifact_path(cache))
+    with open(path, "wb") as fh:
+        fh.write(b"\x80\x05truncated")
+
+    testsuite, _ = load_testsuite_artifact(*suite)
+
+    assert testsuite.name == "Simple Computations (Octave)"
+    assert cache.lookup(os.path.basename(path)[:-len(".json")]) is not None
+
+
+class _Payload:
+    def __init__(self, marker):
+        self.marker = marker
+
+    def __reduce__(self):
+        return (open, (self.marker, "w"))
+
+
+def test_planted_pickle_is_not_executed(cache, suite, tmp_path):
+    load_testsuite_artifact(*suite)
+    path = os.path.join(cache.root, *_artifact_path(cache))
+    marker = tmp_path / "executed"
+    with open(path, "wb") as fh:
+        pickle.dump((_Payload(str(marker)), None), fh)
+
+    testsuite, _ = load_testsuite_artifact(*suite)
+
+    assert not marker.exists()
+    assert testsuite.name == "Simple Computations (Octave)"
+    with open(path, "rb") as fh:
+        assert json.loads(fh.read())["testsuite"]["name"] == testsuite.name
+
+
+def test_cache_directories_are_private(cache, suite):
+    load_testsuite_artifact(*suite)
+    subdir, _ = _artifact_path(cache)
+
+    assert stat.S_IMODE(os.stat(cache.root).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(os.path.join(cache.root, subdir)).st_mode) == 0o700
+
+
+def test_fingerprint_covers_schema_modules():
+    modules = schema_modules()
+
+    assert {"ctcore.models", "computor_types.testing", "computor_types.codeability_meta"} <= set(modules)
+    assert ComputorTestSuite.__module__ in modules and ComputorSpecification.__module__ in modules
+
+
+def test_invalid_yaml_raises_and_publishes_nothing(cache, tmp_path, suite):
+    broken = tmp_path / "test.yaml"
+    broken.write_text("name: broken\nproperties:\n  tests: 3\n")
+
+    with pytest.raises(Exception):
+        load_testsuite_artifact(str(broken), suite[1])
+    assert _artifacts(cache) == []
+
+
+def test_disabled_cache(tmp_path, monkeypatch, suite):
+    monkeypatch.setenv("CT_ARTIFACT_CACHE", "0")
+    assert ArtifactCache.from_env() is None
+
+    monkeypatch.setenv("CT_ARTIFACT_CACHE", "1")
+    monkeypatch.setenv("CT_ARTIFACT_CACHE_DIR", str(tmp_path / "env-cache"))
+    assert ArtifactCache.from_env().root == str(tmp_path / "env-cache")
+
+
+def test_compile_ahead_of_time(tmp_path, suite):
+    env = dict(os.environ, CT_ARTIFACT_CACHE_DIR=str(tmp_path / "cache"))
+    output = subprocess.run(
+        [sys.executable, "-m", "ctcore.artifacts", *suite],
+        env=env, capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    assert output.returncode == 0, output.stderr
+
+    cache = ArtifactCache(str(tmp_path / "cache"))
+    with mock.patch.object(artifacts, "_default_cache", cache), \
+            mock.patch.object(artifacts, "_default_cache_loaded", True), \
+            mock.patch.object(artifacts, "compile_artifact", side_effect=AssertionError("compiled")):
+        testsuite, _ = load_testsuite_artifact(*suite, inherit=INHERIT)
+    assert output.stdout.strip() == cache.path(cache.key(*(open(p, "rb").read() for p in suite), INHERIT))
+    assert testsuite.properties.tests[1].tests[0].relativeTolerance == 1.0e-12
+
+
+def test_generated_suite_matches_yaml_load(cache, tmp_path, suite):
+    """A generated multi-collection suite loads the same from its artifact."""
+    collections = 20
+    data = {
+        "name": "Large suite",
+        "type": "python",
+        "properties": {
+            "relativeTolerance": 1.0e-9,
+            "tests": [
+                {
+                    "type": "variable",
+                    "name": f"Collection {c}",
+                    "id": f"c{c}",
+                    "setUpCode": [f"x{c} = compute({c})"],
+                    "tests": [{"name": f"x{c}_{t}", "value": [t, t + 1, t + 2]} for t in range(10)],
+                }
+                for c in range(collections)
+            ],
+        },
+    }
+    testsuite_path = tmp_path / "large.yaml"
+    testsuite_path.write_text(yaml.safe_dump(data))
+    expected = _legacy_load(str(testsuite_path), suite[1])
+
+    load_testsuite_artifact(str(testsuite_path), suite[1], inherit=INHERIT)
+    loaded = load_testsuite_artifact(str(testsuite_path), suite[1], inherit=INHERIT)
+
+    assert loaded[0].model_dump() == expected[0].model_dump()
@@ -1,11 +1,21 @@
 from abc import ABC
 from datetime import datetime
-from typing import List, Optional, Any
+from typing import List, Literal, Optional, Any
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
+CountMode = Literal["exact", "estimated", "none"]
+
+
 class ListQuery(BaseModel):
     skip: Optional[int] = 0
     limit: Optional[int] = 100
+    # Keyset pagination: an opaque cursor taken from the ``X-Next-Cursor``
+    # response header. Pass an empty string to start a cursor-driven
+    # listing; ``skip`` is ignored while a cursor is in use.
+    after: Optional[str] = None
+    # How ``X-Total-Count`` is computed: ``exact`` (COUNT(*), default),
+    # ``estimated`` (planner row estimate) or ``none`` (header omitted).
+    count: Optional[CountMode] = None
 
 # ACTIONS constant - used by backend for permission generation
 ACTIONS = {
@@ -22,6 +22,7 @@ class ForceLevel(str, Enum):
 
 class EntityDeleteCount(BaseModel):
     """Count of deleted entities by type."""
+    organizations: int = 0
     courses: int = 0
     course_families: int = 0
     course_members: int = 0
@@ -77,6 +78,9 @@ class CascadeDeleteResult(BaseModel):
         default_factory=list,
         description="Errors encountered during deletion"
     )
+    workflow_id: Optional[str] = Field(
+        None, description="Background deletion task ID; counts are reported by the task when set"
+    )
 
 
 class ExampleDeletePreview(BaseModel):
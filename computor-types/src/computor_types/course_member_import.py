@@ -1,5 +1,6 @@
 """DTOs for course member import functionality."""
-from typing import Optional
+from enum import Enum
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -20,3 +21,34 @@ class CourseMemberImportResponse(BaseModel):
     course_member: Optional[dict] = Field(None, description="Created/updated course member")
     created_group: Optional[dict] = Field(None, description="Created course group if new")
     workflow_id: Optional[str] = Field(None, description="Workflow ID for repository creation task (use GET /tasks/{workflow_id}/status to check progress)")
+
+
+class ImportStatus(str, Enum):
+    """Outcome of a single roster row in a bulk import."""
+    CREATED = "created"
+    UPDATED = "updated"
+    FAILED = "failed"
+
+
+class CourseMemberBulkImportRequest(BaseModel):
+    """Roster for a bulk course member import (JSON form; CSV uses the same columns)."""
+    members: List[CourseMemberImportRequest] = Field(..., description="Roster rows in import order")
+
+
+class CourseMemberImportRowResult(BaseModel):
+    """Result for one roster row, streamed as a line of NDJSON."""
+    row: int = Field(..., description="Zero-based position of the row in the roster")
+    email: Optional[str] = Field(None, description="Email address from the row")
+    status: ImportStatus = Field(..., description="Row outcome")
+    message: Optional[str] = Field(None, description="Success or error message")
+    course_member_id: Optional[str] = Field(None, description="Created/updated course member ID")
+    created_group: Optional[str] = Field(None, description="Title of the course group created for this row")
+
+
+class CourseMemberBulkImportSummary(BaseModel):
+    """Final NDJSON line of a bulk import."""
+    total: int = Field(0, description="Number of roster rows processed")
+    created: int = Field(0, description="Rows that created a course member")
+    updated: int = Field(0, description="Rows that updated an existing course member")
+    failed: int = Field(0, description="Rows that failed")
+    workflow_id: Optional[str] = Field(None, description="Workflow ID of the batched repository creation task")
@@ -174,6 +174,7 @@ class ExampleVersionGet(BaseEntityGet):
         None,
         description="Resolved Service.id derived from properties.executionBackend.slug",
     )
+    content_hash: Optional[str] = Field(None, description="SHA-256 of the version's files")
     created_at: datetime
     created_by: Optional[str] = None
 
@@ -187,6 +188,7 @@ class ExampleVersionList(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     testing_service_id: Optional[str] = None
+    content_hash: Optional[str] = None
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
@@ -3,6 +3,7 @@
 __version__ = "0.1.0"
 
 from .vsix_utils import parse_vsix_metadata
+from .example_hash import compute_example_content_hash, compute_example_content_hash_from_digests
 from .deployment_mapping import (
     DeploymentMapper,
     DeploymentMappingConfig,
@@ -11,6 +12,8 @@ from .deployment_mapping import (
 
 __all__ = [
     "parse_vsix_metadata",
+    "compute_example_content_hash",
+    "compute_example_content_hash_from_digests",
     "DeploymentMapper",
     "DeploymentMappingConfig",
     "FieldTransformer",
@@ -0,0 +1,50 @@
+"""Content hashing for example uploads."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Mapping
+
+
+def compute_example_content_hash(files: Mapping[str, bytes]) -> str:
+    """Return a stable SHA-256 over an example's files.
+
+    The hash covers every ``(filename, content)`` pair in filename order, so
+    it does not depend on upload order or archive metadata (timestamps,
+    compression). Container ``.zip`` entries are ignored because the
+    upload endpoint never stores them.
+
+    Args:
+        files: Mapping of relative POSIX path to file content.
+
+    Returns:
+        Hex-encoded SHA-256 digest.
+    """
+
+    return compute_example_content_hash_from_digests(
+        {name: hashlib.sha256(content).digest() for name, content in files.items()}
+    )
+
+
+def compute_example_content_hash_from_digests(digests: Mapping[str, bytes]) -> str:
+    """Return the example content hash from precomputed per-file digests.
+
+    Same result as :func:`compute_example_content_hash`, for callers that
+    hash files while streaming them and never hold their content in memory.
+
+    Args:
+        digests: Mapping of relative POSIX path to the raw SHA-256 digest
+            of the file content.
+
+    Returns:
+        Hex-encoded SHA-256 digest.
+    """
+
+    digest = hashlib.sha256()
+    for name in sorted(digests):
+        if name.lower().endswith(".zip"):
+            continue
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(digests[name])
+    return digest.hexdigest()
@@ -20,6 +20,7 @@ from typing import Any, Dict, List, Optional
 
 from computor_types.services import ServiceGet
 from computor_client.http import AsyncHTTPClient
+from dependencies import EnvironmentCache, EnvironmentBuildError, RDependencies
 
 
 # =============================================================================
@@ -116,6 +117,13 @@ def get_service_language(service_config: Optional[ServiceGet], config: Dict[str,
 # Language-specific Environment Setup
 # =============================================================================
 
+def prepend_env_path(key: str, path: str) -> None:
+    """Put a cached dependency layer in front of a search-path variable."""
+    current = os.environ.get(key)
+    os.environ[key] = f"{path}{os.pathsep}{current}" if current else path
+    print(f"  ✓ Set {key}={os.environ[key]}")
+
+
 def setup_python_environment(config: Dict[str, Any], framework_package_path: str) -> None:
     """
     Set up Python test execution environment.
@@ -181,20 +189,20 @@ def setup_python_environment(config: Dict[str, Any], framework_package_path: str
     if numpy_check.returncode == 0:
         print(f"  ✓ numpy available: {numpy_check.stdout.strip()}")
 
-    # Install additional requirements from API config (if any)
+    # Additional requirements from API config (if any) live in a cached,
+    # read-only layer on top of the base venv: built once per distinct set
     if requirements_list:
-        print(f"  Installing additional requirements: {requirements_list}")
-        pip_cmd_base = f"{test_venv_path}/bin/pip"
-        if pip_index_url:
-            pip_cmd_base += f" --index-url {pip_index_url}"
-        pip_install_extra = subprocess.run(
-            f"{pip_cmd_base} install {' '.join(requirements_list)}",
-            shell=True
-        )
-        if pip_install_extra.returncode == 0:
-            print("  ✓ Additional requirements installed")
-        else:
-            print("  ⚠ Failed to install some additional requirements")
+        print(f"  Preparing additional requirements: {requirements_list}")
+        try:
+            layer = EnvironmentCache().python_layer(
+                requirements_list,
+                python=f"{test_venv_path}/bin/python",
+                index_url=pip_index_url,
+            )
+            prepend_env_path("PYTHONPATH", layer)
+            print(f"  ✓ Additional requirements available from {layer}")
+        except EnvironmentBuildError as e:
+            print(f"  ⚠ Failed to install some additional requirements: {e}")
     else:
         print("  ✓ Using pre-built test venv (no additional requirements)")
 
@@ -258,22 +266,14 @@ def setup_r_environment(config: Dict[str, Any]) -> None:
     print(f"  R packages to install: {packages if packages else '(none)'}")
 
     if packages:
-        # Ensure R library directory exists
-        r_libs = os.environ.get("R_LIBS_USER", "/home/worker/.local/lib/R/library")
-        os.makedirs(r_libs, exist_ok=True)
-
-        for package in packages:
-            print(f"  Installing R package: {package}")
-            result = subprocess.run(
-                f"Rscript -e \"install.packages('{package}', repos='{cran_mirror}', lib='{r_libs}')\"",
-                shell=True,
-                capture_output=True,
-                text=True
+        try:
+            library = EnvironmentCache().r_layer(
+                RDependencies(packages=packages, cran_mirror=cran_mirror)
             )
-            if result.returncode == 0:
-                print(f"  ✓ Installed {package}")
-            else:
-                print(f"  ⚠ Failed to install {package}: {result.stderr[:200]}")
+            prepend_env_path("R_LIBS", library)
+            print(f"  ✓ R packages available from {library}")
+        except EnvironmentBuildError as e:
+            print(f"  ⚠ Failed to install R packages: {str(e)[:200]}")
 
     # Verify R is available
     r_check = subprocess.run(
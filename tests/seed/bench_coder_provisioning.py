@@ -0,0 +1,92 @@
+"""Provision a lab session's Coder workspaces one by one vs. in bulk.
+
+Runs against the in-process fake Coder (``computor_backend.tests.fake_coder``)
+with a fixed per-request latency, so the numbers only reflect request
+counts and concurrency:
+
+* ``serial`` -- ``provision_workspace`` per student with the template cache
+  disabled (the previous behaviour: one template listing per workspace)
+* ``bulk``   -- ``provision_workspaces`` with bounded concurrency
+
+Usage:
+    python tests/seed/bench_coder_provisioning.py [--count 40] [--latency 0.01] [--concurrency 10]
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from computor_backend.coder.client import CoderClient
+from computor_backend.coder.config import CoderSettings
+from computor_backend.coder.schemas import BulkProvisionItem
+from computor_backend.tests.fake_coder import FakeCoder
+
+
+def make_client(fake: FakeCoder, **settings) -> CoderClient:
+    client = CoderClient(CoderSettings(
+        url="http://coder.test",
+        admin_email="admin@example.com",
+        admin_password="secret",
+        **settings,
+    ))
+    client._client = httpx.AsyncClient(
+        base_url="http://coder.test",
+        transport=httpx.ASGITransport(app=fake.app),
+    )
+    return client
+
+
+def items(count: int, prefix: str) -> list[BulkProvisionItem]:
+    return [
+        BulkProvisionItem(user_email=f"{prefix}{i}@example.com", username=f"{prefix}{i}", computor_auth_token="t")
+        for i in range(count)
+    ]
+
+
+async def serial(fake: FakeCoder, count: int) -> float:
+    client = make_client(fake, template_cache_ttl=0)
+    start = time.monotonic()
+    try:
+        for item in items(count, "serial"):
+            await client.provision_workspace(item.user_email, item.username, template=item.template)
+    finally:
+        await client.close()
+    return time.monotonic() - start
+
+
+async def bulk(fake: FakeCoder, count: int, concurrency: int) -> float:
+    client = make_client(fake)
+    start = time.monotonic()
+    try:
+        outcomes = await client.provision_workspaces(items(count, "bulk"), max_concurrency=concurrency)
+    finally:
+        await client.close()
+    failed = [o for o in outcomes if o.error]
+    if failed:
+        raise SystemExit(f"{len(failed)} workspaces failed: {failed[0].error}")
+    return time.monotonic() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    fake = FakeCoder(latency=args.latency)
+    fake.add_template("python-workspace")
+
+    serial_seconds = asyncio.run(serial(fake, args.count))
+    serial_requests = len(fake.requests)
+    fake.requests.clear()
+    bulk_seconds = asyncio.run(bulk(fake, args.count, args.concurrency))
+
+    print(f"{args.count} workspaces")
+    print(f"  serial: {serial_seconds:6.2f}s ({args.count / serial_seconds:6.1f}/s), {serial_requests} requests")
+    print(f"  bulk:   {bulk_seconds:6.2f}s ({args.count / bulk_seconds:6.1f}/s), {len(fake.requests)} requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Time a class listing one lecture folder at once through the documents API.
+
+Calls ``api.documents.list_documents_directory`` in-process at the system
+scope, with ``DOCUMENTS_ROOT`` pointed at a throwaway folder of ``--files``
+entries. ``--students`` listings arrive in bursts of ``--burst``; a
+heartbeat task measures how long the event loop is stalled. Each run is
+done twice:
+
+* ``rescan`` -- the listing cache is dropped before every burst
+* ``cached`` -- bursts after the first are served from the listing cache
+
+Usage:
+    python tests/seed/bench_documents_listing.py [--students 300] [--files 300] [--burst 30]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from computor_backend.api import documents as api
+from computor_backend.business_logic import documents as bl
+from computor_backend.permissions.principal import Principal
+
+
+async def measure(folder: Path, students: int, burst: int, rescan: bool):
+    stall = 0.0
+    done = False
+
+    async def heartbeat():
+        nonlocal stall
+        while not done:
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stall = max(stall, time.perf_counter() - before - 0.001)
+
+    async def list_folder():
+        return await api.list_documents_directory(
+            permissions=Principal(user_id="student"), scope="system", path=folder.name,
+            if_none_match=None, db=MagicMock(),
+        )
+
+    beat = asyncio.ensure_future(heartbeat())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    for _ in range(students // burst):
+        if rescan:
+            api.listing_cache.invalidate(folder)
+        await asyncio.gather(*(list_folder() for _ in range(burst)))
+    elapsed = time.perf_counter() - start
+    done = True
+    await beat
+    return elapsed, stall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=300)
+    parser.add_argument("--files", type=int, default=300)
+    parser.add_argument("--burst", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        bl.settings.DOCUMENTS_ROOT = root
+        folder = Path(root) / "lecture"
+        folder.mkdir()
+        for i in range(args.files):
+            (folder / f"unit{i:03d}.pdf").write_bytes(b"%PDF" * (i + 1))
+        # Listings of just-changed directories are not reused
+        past = time.time() - 10
+        os.utime(folder, (past, past))
+
+        print(f"{args.students} listings of a {args.files}-entry folder in bursts of {args.burst}")
+        for label, rescan in (("rescan", True), ("cached", False)):
+            seconds, stall = asyncio.run(measure(folder, args.students, args.burst, rescan))
+            print(f"  {label}: {seconds * 1000:8.1f} ms total, {stall * 1000:6.1f} ms max event loop stall")
+
+
+if __name__ == "__main__":
+    main()
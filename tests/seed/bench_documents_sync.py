@@ -0,0 +1,74 @@
+"""Time a documents sync after a one-file push to a lecture-notes repository.
+
+Builds a throwaway bare "remote" with ``--chapters`` x ``--sections``
+markdown files, syncs it once, pushes a one-file change and then syncs it
+the way the documents sync activity used to (fresh clone, filtered copy of
+the whole tree, walk to count) and incrementally through ``DocumentsSync``.
+
+Usage:
+    python tests/seed/bench_documents_sync.py [--chapters 20] [--sections 100]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from git import Repo
+
+from computor_backend.services.documents_sync import DocumentsSync, copy_tree_filtered
+from computor_backend.services.git_mirror import GitMirrorCache
+
+
+def commit(repo: Repo, files: dict, message: str) -> None:
+    for name, content in files.items():
+        path = os.path.join(repo.working_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fh:
+            fh.write(content)
+    repo.git.add(A=True)
+    repo.git.commit("-m", message)
+    repo.git.push("-q", "origin", "main")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chapters", type=int, default=20)
+    parser.add_argument("--sections", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        bare = os.path.join(root, "documents.git")
+        Repo.init(bare, bare=True, initial_branch="main")
+        work = Repo.clone_from(bare, os.path.join(root, "upstream"))
+        work.git.config("user.name", "Bench")
+        work.git.config("user.email", "bench@example.com")
+        work.git.checkout("-b", "main")
+        commit(work, {
+            f"chapter{c:02d}/section{s:03d}.md": f"# Chapter {c} section {s}\n" + "Lorem ipsum dolor sit amet. " * 150
+            for c in range(args.chapters) for s in range(args.sections)
+        }, "lecture notes")
+
+        syncer = DocumentsSync(GitMirrorCache(os.path.join(root, "mirrors")), os.path.join(root, "state"))
+        target = os.path.join(root, "served")
+        syncer.sync(bare, target)
+        commit(work, {"chapter00/section000.md": "# Rewritten\n"}, "fix typo")
+
+        start = time.perf_counter()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            clone = os.path.join(temp_dir, "documents")
+            Repo.clone_from(bare, clone).close()
+            copy_tree_filtered(clone, os.path.join(root, "legacy"))
+        legacy_files = sum(len(files) for _, _, files in os.walk(os.path.join(root, "legacy")))
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = syncer.sync(bare, target)
+        seconds = time.perf_counter() - start
+
+    print(f"one-file push to a {result.files}-file repository")
+    print(f"  clone + copy: {legacy_seconds * 1000:8.1f} ms ({legacy_files} files)")
+    print(f"  incremental:  {seconds * 1000:8.1f} ms ({result.written} written)")
+
+
+if __name__ == "__main__":
+    main()
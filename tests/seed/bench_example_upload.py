@@ -0,0 +1,118 @@
+"""Upload a large example as base64 JSON vs. as a streamed multipart archive.
+
+Both requests go through ``api.examples`` in a minimal in-process app with
+an in-memory object store; the database part of the upload
+(``_store_example_version``) is replaced by a stub that only stores the
+files. Prints wall time and the tracemalloc peak for each endpoint.
+
+Usage:
+    python tests/seed/bench_example_upload.py [--files 10] [--file-mb 5]
+"""
+import argparse
+import asyncio
+import base64
+import os
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from datetime import datetime, timezone
+
+import httpx
+from fastapi import FastAPI
+
+from computor_backend.api import examples
+from computor_backend.database import get_db
+from computor_backend.permissions.auth import get_current_principal
+from computor_backend.services.storage_service import get_storage_service
+from computor_backend.tests.test_example_upload import FakeStorage
+from computor_utils import compute_example_content_hash_from_digests
+
+
+def make_app(storage: FakeStorage) -> FastAPI:
+    async def store(db, permissions, storage_service, repository, directory, files):
+        content_hash = compute_example_content_hash_from_digests({n: f.sha256 for n, f in files.items()})
+        await examples._sync_version_files(storage_service, "bucket", f"examples/{directory}/v1", files, None)
+        now = datetime.now(timezone.utc)
+        return {
+            "id": "version",
+            "example_id": "example",
+            "version_tag": "1.0.0",
+            "version_number": 1,
+            "storage_path": f"examples/{directory}/v1",
+            "content_hash": content_hash,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    examples._get_upload_repository = lambda db, permissions, repository_id: None
+    examples._store_example_version = store
+
+    app = FastAPI()
+    app.include_router(examples.examples_router)
+    app.dependency_overrides[get_db] = lambda: None
+    app.dependency_overrides[get_current_principal] = lambda: None
+    app.dependency_overrides[get_storage_service] = lambda: storage
+    return app
+
+
+def measure(app: FastAPI, upload) -> tuple:
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await upload(client)
+
+    tracemalloc.start()
+    start = time.monotonic()
+    try:
+        response = asyncio.run(run())
+        elapsed = time.monotonic() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    if response.status_code != 200:
+        raise SystemExit(f"upload failed: {response.status_code} {response.text}")
+    return response.json()["content_hash"], elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=10)
+    parser.add_argument("--file-mb", type=int, default=5)
+    args = parser.parse_args()
+
+    mb = 1024 * 1024
+    storage = FakeStorage()
+    app = make_app(storage)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive_path = os.path.join(tmp, "example.zip")
+        with zipfile.ZipFile(archive_path, "w") as zf:
+            zf.writestr("meta.yaml", "title: Large\n")
+            for i in range(args.files):
+                zf.writestr(f"data/{i}.bin", os.urandom(args.file_mb * mb))
+
+        async def json_upload(client: httpx.AsyncClient) -> httpx.Response:
+            with open(archive_path, "rb") as archive:
+                encoded = base64.b64encode(archive.read()).decode("ascii")
+            payload = {"repository_id": "repo", "directory": "large", "files": {"large.zip": encoded}}
+            return await client.post("/examples/upload", json=payload)
+
+        async def archive_upload(client: httpx.AsyncClient) -> httpx.Response:
+            with open(archive_path, "rb") as archive:
+                return await client.post(
+                    "/examples/upload/archive",
+                    data={"repository_id": "repo", "directory": "large"},
+                    files={"file": ("large.zip", archive, "application/zip")},
+                )
+
+        json_hash, json_seconds, json_peak = measure(app, json_upload)
+        storage.objects.clear()
+        archive_hash, archive_seconds, archive_peak = measure(app, archive_upload)
+
+    print(f"{args.files * args.file_mb} MB example ({'same' if json_hash == archive_hash else 'DIFFERENT'} content hash)")
+    print(f"  JSON/base64:       {json_seconds:6.2f}s, peak {json_peak / mb:6.0f} MB")
+    print(f"  multipart archive: {archive_seconds:6.2f}s, peak {archive_peak / mb:6.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Time repeated checkouts from the git mirror cache against full clones.
+
+Builds a throwaway bare "remote" with a larger history, then checks it out
+``--runs`` times with ``git clone`` and ``--runs`` times through
+``GitMirrorCache.checkout`` (after one warm-up fetch that is not counted).
+``file://`` makes git use the pack transport, as for a real remote, instead
+of hardlinking objects from a local path.
+
+Usage:
+    python tests/seed/bench_git_mirror.py [--commits 40] [--runs 5]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from git import Repo
+
+from computor_backend.services.git_mirror import GitMirrorCache
+
+
+def commit(repo: Repo, files: dict, message: str) -> None:
+    for name, content in files.items():
+        path = os.path.join(repo.working_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fh:
+            fh.write(content)
+    repo.git.add(A=True)
+    repo.git.commit("-m", message)
+
+
+def build_remote(root: str, commits: int) -> str:
+    bare = os.path.join(root, "remote.git")
+    Repo.init(bare, bare=True, initial_branch="main")
+    work = Repo.clone_from(bare, os.path.join(root, "upstream"))
+    work.git.config("user.name", "Bench")
+    work.git.config("user.email", "bench@example.com")
+    work.git.checkout("-b", "main")
+    commit(work, {"README.md": "# Template\n"}, "initial")
+    for i in range(commits):
+        commit(work, {f"a{i}/data.bin": os.urandom(50000).hex()}, f"commit {i}")
+    work.git.push("origin", "main")
+    return f"file://{bare}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commits", type=int, default=40)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        url = build_remote(root, args.commits)
+
+        start = time.perf_counter()
+        for i in range(args.runs):
+            Repo.clone_from(url, os.path.join(root, f"clone{i}")).close()
+        clone_seconds = time.perf_counter() - start
+
+        cache = GitMirrorCache(os.path.join(root, "mirrors"))
+        with cache.checkout(url, os.path.join(root, "warm")):
+            pass
+        start = time.perf_counter()
+        for i in range(args.runs):
+            with cache.checkout(url, os.path.join(root, f"wt{i}")):
+                pass
+        mirror_seconds = time.perf_counter() - start
+
+    print(f"full clone:              {clone_seconds / args.runs * 1000:8.1f} ms/run")
+    print(f"mirror fetch + worktree: {mirror_seconds / args.runs * 1000:8.1f} ms/run")
+
+
+if __name__ == "__main__":
+    main()
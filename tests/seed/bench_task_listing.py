@@ -0,0 +1,91 @@
+"""Time a deep page of a student's tasks in a busy Temporal namespace.
+
+Redis is ``computor_backend.tests.fake_redis.FakeRedis`` and Temporal is the
+``FakeTemporal`` of ``test_task_listing`` with a fixed per-call latency.
+The page is read three ways:
+
+* ``visibility + filter`` -- the previous ``GET /tasks``: list visibility up
+  to offset + limit, then keep the accessible IDs (returns a wrong page)
+* ``visibility walk``     -- walk visibility until the page is filled
+* ``tracker index``       -- ``tasks.listing.list_accessible_task_page``
+
+Usage:
+    python tests/seed/bench_task_listing.py [--workflows 4000] [--own-every 40] [--latency-ms 2]
+"""
+import argparse
+import asyncio
+import time
+from datetime import timedelta
+
+from computor_backend.permissions.principal import Principal
+from computor_backend.task_tracker import TaskTracker
+from computor_backend.tasks import listing, temporal_executor
+from computor_backend.tasks.temporal_executor import TemporalTaskExecutor
+from computor_backend.tests.fake_redis import FakeRedis
+from computor_backend.tests.test_task_listing import START, FakeTemporal, _track
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=4000)
+    parser.add_argument("--own-every", type=int, default=40)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--offset", type=int, default=80)
+    parser.add_argument("--latency-ms", type=float, default=2)
+    args = parser.parse_args()
+    limit, offset = args.limit, args.offset
+
+    temporal = FakeTemporal(latency=args.latency_ms / 1000)
+
+    async def get_client():
+        return temporal
+
+    temporal_executor.get_temporal_client = get_client
+
+    async def visibility_filter(tracker, executor, principal):
+        accessible_ids = await tracker.get_accessible_task_ids(principal)
+        result = await executor.list_tasks(limit=limit, offset=offset)
+        tasks = [t for t in result["tasks"] if t["task_id"] in accessible_ids]
+        return tasks[offset:offset + limit]
+
+    async def visibility_walk(tracker, executor, principal):
+        accessible_ids = await tracker.get_accessible_task_ids(principal)
+        tasks = []
+        async for workflow in temporal.list_workflows(page_size=100):
+            if workflow.id in accessible_ids:
+                tasks.append(executor._task_dict(workflow))
+                if len(tasks) == offset + limit:
+                    break
+        return tasks[offset:]
+
+    async def tracker_index(tracker, executor, principal):
+        page = await listing.list_accessible_task_page(tracker, executor, principal, limit=limit, offset=offset)
+        return page["tasks"]
+
+    async def run(page_fn):
+        tracker, executor = TaskTracker(FakeRedis()), TemporalTaskExecutor()
+        for i in range(args.workflows):
+            created = START + timedelta(seconds=i)
+            if i % args.own_every == 0:
+                await _track(tracker, temporal, f"own-{i}", created)
+            else:
+                temporal.add(f"other-{i}", start=created)
+        temporal.describes = temporal.listed = 0
+        start = time.monotonic()
+        tasks = await page_fn(tracker, executor, Principal(user_id="student"))
+        return time.monotonic() - start, len(tasks), temporal.describes + temporal.listed
+
+    print(f"page {offset // limit + 1} of {args.workflows // args.own_every} own tasks "
+          f"among {args.workflows} workflows")
+    for label, page_fn in (
+        ("visibility + filter", visibility_filter),
+        ("visibility walk", visibility_walk),
+        ("tracker index", tracker_index),
+    ):
+        temporal.workflows.clear()
+        seconds, count, rows = asyncio.run(run(page_fn))
+        print(f"  {label:20s}: {seconds * 1000:8.1f} ms, {count:3d} tasks, {rows:5d} rows read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Time listing a lecturer's newest tasks from short and long task histories.
+
+Uses ``computor_backend.tests.fake_redis.FakeRedis`` with a fixed latency
+per round trip (a command or a pipeline execute) and compares
+``TaskTracker.list_accessible_tasks`` with the previous listing, which read
+the whole index and fetched and sorted every entry.
+
+Usage:
+    python tests/seed/bench_task_tracker_index.py [--courses 5] [--page 20] [--latency-ms 0.2]
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from computor_backend.permissions.principal import Principal
+from computor_backend.task_tracker import TaskTracker
+from computor_backend.tests.fake_redis import FakeRedis
+from computor_backend.tests.test_task_tracker_index import _track
+
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+async def previous_listing(tracker: TaskTracker, principal: Principal, page: int):
+    ids = await tracker.get_accessible_task_ids(principal)
+    entries = [await tracker.get_task_entry(wf_id) for wf_id in ids]
+    entries.sort(key=lambda e: e.created_at, reverse=True)
+    return entries[:page]
+
+
+async def indexed_listing(tracker: TaskTracker, principal: Principal, page: int):
+    return await tracker.list_accessible_tasks(principal, limit=page)
+
+
+def measure(lister, history: int, courses: int, page: int, latency: float) -> tuple:
+    async def run():
+        redis = FakeRedis()
+        tracker = TaskTracker(redis)
+        for c in range(courses):
+            await _track(tracker, history // courses, user_id=f"s{c}", course_id=f"c{c}", prefix=f"c{c}-",
+                         start=START + timedelta(milliseconds=c))
+        principal = Principal(
+            user_id="lecturer",
+            claims={"dependent": {"course": {f"c{c}": ["_lecturer"] for c in range(courses)}}},
+        )
+        redis.latency = latency
+        redis.round_trips = 0
+        start = time.monotonic()
+        await lister(tracker, principal, page)
+        return time.monotonic() - start, redis.round_trips
+
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--courses", type=int, default=5)
+    parser.add_argument("--page", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.2)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    print(f"newest {args.page} tasks of {args.courses} course indexes, {args.latency_ms}ms per round trip")
+    for history in (200, 2000):
+        for name, lister in (("indexed", indexed_listing), ("previous", previous_listing)):
+            seconds, round_trips = measure(lister, history, args.courses, args.page, latency)
+            print(f"  {history:5d} tasks, {name:8s}: {seconds * 1000:8.1f} ms, {round_trips:5d} round trips")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Poll a view endpoint with and without ETag revalidation; print bytes + CPU per poll.
+
+Simulates the VS Code extension polling a student/tutor/lecturer view.
+Each mode runs the same number of polls against a running API server:
+
+* ``plain``       -- no validators, full payload every time
+* ``conditional`` -- ``If-None-Match`` from the previous response (304s)
+
+Bytes on the wire are the response body plus header bytes as received.
+Server CPU per poll is read from ``/proc/<pid>/stat`` (utime + stime) when
+``--server-pid`` points at the uvicorn worker; otherwise only client-side
+latency is reported.
+
+Usage:
+    python tests/seed/bench_view_polling.py \\
+        --token <bearer> --path /students/course-contents?course_id=<id> \\
+        [--base-url http://localhost:8000] [--polls 200] [--server-pid <pid>]
+"""
+import argparse
+import os
+import statistics
+import time
+from typing import Optional
+
+import httpx
+
+
+def read_cpu_seconds(pid: Optional[int]) -> Optional[float]:
+    if pid is None:
+        return None
+    with open(f"/proc/{pid}/stat") as fh:
+        fields = fh.read().rsplit(")", 1)[1].split()
+    # fields[11], fields[12] are utime and stime (0-based after the comm field)
+    ticks = int(fields[11]) + int(fields[12])
+    return ticks / os.sysconf(os.sysconf_names["SC_CLK_TCK"])
+
+
+def wire_bytes(response: httpx.Response) -> int:
+    header_bytes = sum(len(k) + len(v) + 4 for k, v in response.headers.raw)
+    return len(response.content) + header_bytes
+
+
+def run(client: httpx.Client, path: str, polls: int, conditional: bool, pid: Optional[int]):
+    etag = None
+    latencies, sizes, statuses = [], [], {}
+
+    cpu_before = read_cpu_seconds(pid)
+    for _ in range(polls):
+        headers = {"If-None-Match": etag} if conditional and etag else {}
+        t0 = time.perf_counter()
+        response = client.get(path, headers=headers)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        sizes.append(wire_bytes(response))
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        etag = response.headers.get("ETag", etag)
+    cpu_after = read_cpu_seconds(pid)
+
+    cpu_ms = None
+    if cpu_before is not None and cpu_after is not None:
+        cpu_ms = (cpu_after - cpu_before) * 1000 / polls
+
+    return {
+        "statuses": statuses,
+        "bytes_per_poll": statistics.mean(sizes),
+        "latency_p50_ms": statistics.median(latencies),
+        "latency_p95_ms": sorted(latencies)[int(len(latencies) * 0.95) - 1],
+        "server_cpu_ms_per_poll": cpu_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--path", required=True)
+    parser.add_argument("--polls", type=int, default=200)
+    parser.add_argument("--server-pid", type=int, default=None)
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {args.token}"}
+    with httpx.Client(base_url=args.base_url, headers=headers, timeout=30) as client:
+        # Warm the view cache so both modes measure steady-state polling.
+        client.get(args.path).raise_for_status()
+
+        for mode in ("plain", "conditional"):
+            stats = run(client, args.path, args.polls, mode == "conditional", args.server_pid)
+            cpu = stats["server_cpu_ms_per_poll"]
+            print(f"{mode:12s} statuses={stats['statuses']} "
+                  f"bytes/poll={stats['bytes_per_poll']:.0f} "
+                  f"p50={stats['latency_p50_ms']:.2f}ms p95={stats['latency_p95_ms']:.2f}ms "
+                  f"server_cpu/poll={'n/a' if cpu is None else f'{cpu:.3f}ms'}")
+
+
+if __name__ == "__main__":
+    main()
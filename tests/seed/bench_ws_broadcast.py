@@ -0,0 +1,76 @@
+"""Delivery latency of a broadcast burst to healthy clients while one client is slow.
+
+Replays a burst the way the pub/sub listener delivers it (one handler call
+at a time) to ``--clients`` fake WebSockets, one of which takes
+``--stall-ms`` per send, and reports when the last healthy client received
+the last event:
+
+* ``awaited`` -- the previous fan-out, which awaited every send before
+  handling the next event
+* ``queued``  -- ``ConnectionManager._handle_pubsub_message`` with
+  per-connection send queues
+
+Usage:
+    python tests/seed/bench_ws_broadcast.py [--clients 100] [--events 20] [--stall-ms 50]
+"""
+import argparse
+import asyncio
+import time
+
+from computor_backend.websocket.connection_manager import ConnectionManager
+from computor_backend.tests.test_ws_send_queue import FakeWebSocket, _connect, _event
+
+
+async def awaited_fanout(manager: ConnectionManager, channel: str, data: dict):
+    async def send(conn):
+        try:
+            await asyncio.wait_for(conn.websocket.send_json(data), timeout=10)
+        except asyncio.TimeoutError:
+            pass
+
+    await asyncio.gather(*(
+        send(conn)
+        for user_id in manager._channel_subscribers[channel]
+        for conn in manager._connections[user_id]
+    ))
+
+
+async def last_delivery(fanout, clients: int, events: int, stall: float) -> float:
+    manager = ConnectionManager()
+    sockets = [FakeWebSocket() for _ in range(clients - 1)]
+    for i, ws in enumerate(sockets):
+        _connect(manager, f"u{i}", ws, max_size=64)
+    _connect(manager, "slow", FakeWebSocket(delay=stall), max_size=64)
+
+    start = time.monotonic()
+    for i in range(events):
+        await fanout(manager, "course:c1", _event("message:new", id=i))
+    deadline = time.monotonic() + 30
+    while any(len(ws.sent) < events for ws in sockets) and time.monotonic() < deadline:
+        await asyncio.sleep(0.001)
+
+    latencies = [received - start for ws in sockets for received in ws.received_at]
+    for conns in manager._connections.values():
+        for conn in conns:
+            await conn.send_queue.close()
+    return max(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--stall-ms", type=float, default=50)
+    args = parser.parse_args()
+    stall = args.stall_ms / 1000
+
+    awaited = asyncio.run(last_delivery(awaited_fanout, args.clients, args.events, stall))
+    queued = asyncio.run(last_delivery(ConnectionManager._handle_pubsub_message, args.clients, args.events, stall))
+
+    print(f"{args.clients} clients, {args.events} events, one client {args.stall_ms:.0f}ms/send")
+    print(f"  last delivery to healthy clients, awaited sends: {awaited * 1000:8.1f} ms")
+    print(f"  last delivery to healthy clients, queued sends:  {queued * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()